@@ -45,6 +45,13 @@ from sqlalchemy.orm import Session
 from backend.api.routers import metrics, breakdowns, creatives, export, auth, google_auth, ai, actions, insights, reports, users, sync, accounts, mutations, admin, stripe, activity, public_chat, business_profile, recommendations, pixel_router, feedback
 from backend.models import create_schema
 from backend.utils.db_utils import get_db_engine
+from backend.utils.event_buffer import stop_event_buffers
+from backend.utils.graph_client import close_graph_clients
+from backend.utils.sheets_client import close_sheets_clients
+from backend.utils.media_upload import stop_media_uploads
+from backend.utils.targeting_search_cache import save_targeting_search_seed
+from backend.utils.account_catalog_cache import stop_catalog_refresh
+from backend.api.services.export_job_service import shutdown_export_workers
 from backend.utils.logging_utils import setup_logging, get_logger
 from backend.config.base_config import settings
 
@@ -418,6 +425,27 @@ async def shutdown_event():
     """
     logger.info(f"🛑 {settings.APP_NAME} Shutting Down")
 
+    # Write out queued page views / audit events
+    stop_event_buffers()
+
+    # Close pooled Graph API connections
+    close_graph_clients()
+
+    # Stop the export job worker pool
+    shutdown_export_workers()
+
+    # Close cached Google Sheets clients
+    close_sheets_clients()
+
+    # Fail in-progress media uploads and stop their transfer workers
+    stop_media_uploads()
+
+    # Keep popular targeting searches for the next start
+    save_targeting_search_seed()
+
+    # Stop background account catalog refreshes
+    stop_catalog_refresh()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
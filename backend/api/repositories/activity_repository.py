@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 
 from backend.models.user_schema import PageView
 from backend.models.schema import AuditLog
+from backend.utils.event_buffer import record_event
 
 
 class ActivityRepository:
@@ -25,19 +26,17 @@ class ActivityRepository:
         referrer: str = None,
         session_id: str = None,
         user_agent: str = None
-    ) -> PageView:
-        """Log a page view"""
-        page_view = PageView(
-            user_id=user_id,
-            page_path=page_path,
-            page_title=page_title,
-            referrer=referrer,
-            session_id=session_id,
-            user_agent=user_agent
-        )
-        self.db.add(page_view)
-        self.db.commit()
-        return page_view
+    ):
+        """Log a page view (written in the background by the event buffer)"""
+        record_event(self.db, PageView.__table__, {
+            "user_id": user_id,
+            "page_path": page_path,
+            "page_title": page_title,
+            "referrer": referrer,
+            "session_id": session_id,
+            "user_agent": user_agent,
+            "created_at": datetime.utcnow()
+        })
 
     def get_user_page_views(self, user_id: int, limit: int = 100) -> List[Dict[str, Any]]:
         """Get page views for a specific user"""
@@ -1,7 +1,7 @@
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
 
 class AdRepository(BaseRepository):
     """Repository for ad metrics."""
@@ -61,7 +61,6 @@ class AdRepository(BaseRepository):
                 SUM(f.purchases) as purchases,
                 SUM(f.purchase_value) as purchase_value
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
             LEFT JOIN dim_campaign c ON f.campaign_id = c.campaign_id
             LEFT JOIN dim_adset a ON f.adset_id = a.adset_id
@@ -71,10 +70,8 @@ class AdRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -82,8 +79,7 @@ class AdRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {campaign_sql}
                 {adset_sql}
                 {search_filter}
@@ -157,7 +153,6 @@ class AdRepository(BaseRepository):
                 COALESCE(SUM(conv.action_count), 0) as conversions,
                 COALESCE(SUM(conv.action_value), 0) as conversion_value
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
@@ -165,10 +160,8 @@ class AdRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -176,8 +169,7 @@ class AdRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND f.adset_id = :adset_id
                 {account_filter}
             GROUP BY ad.ad_id, ad.ad_name, ad.ad_status
@@ -4,10 +4,21 @@ Admin Repository - SQL queries for admin analytics dashboard.
 
 from sqlalchemy.orm import Session
 from sqlalchemy import text, func
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+import json
+import logging
+from backend.config.base_config import settings
 from backend.models.user_schema import User, UserAdAccount
-from backend.models.schema import AuditLog
+from backend.models.schema import AuditLog, AdminMetricsSnapshot
+from backend.api.repositories.base_repository import date_id_since, date_id_of
+
+logger = logging.getLogger(__name__)
+
+# admin_metrics_snapshot keys (period_days 0 = not period based)
+ACCOUNT_HEALTH_METRIC = 'account_health'
+TOTAL_SPEND_METRIC = 'total_spend'
+FEATURE_USAGE_METRIC = 'feature_usage'
 
 
 class AdminRepository:
@@ -341,34 +352,25 @@ class AdminRepository:
     # ==================== Account Health Metrics ====================
 
     def get_account_health_overview(self) -> Dict[str, Any]:
-        """Get overview of account health metrics"""
-        # Total linked accounts
-        total = self.db.execute(text("""
-            SELECT COUNT(DISTINCT account_id) FROM user_ad_account
-        """)).scalar() or 0
-
-        # Accounts with recent data (last 7 days)
-        active = self.db.execute(text("""
-            SELECT COUNT(DISTINCT f.account_id)
-            FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
-            WHERE d.date >= CURRENT_DATE - INTERVAL '7 days'
-        """)).scalar() or 0
-
-        # Stale accounts (no data in 7+ days but have historical data)
-        stale = self.db.execute(text("""
-            SELECT COUNT(DISTINCT ua.account_id)
+        """Get overview of account health metrics (snapshot, live fallback)"""
+        health = self.get_metrics_snapshot(ACCOUNT_HEALTH_METRIC)
+        if health is None:
+            health = self.compute_account_health_overview()
+        return health
+
+    def compute_account_health_overview(self) -> Dict[str, Any]:
+        """Account health from account_data_freshness (one row per account, no fact scan)"""
+        row = self.db.execute(text(f"""
+            SELECT
+                COUNT(DISTINCT ua.account_id),
+                COUNT(DISTINCT ua.account_id) FILTER (WHERE {date_id_since(7, 'fr.last_date_id')}),
+                COUNT(DISTINCT ua.account_id) FILTER (WHERE NOT ({date_id_since(7, 'fr.last_date_id')}))
             FROM user_ad_account ua
-            WHERE ua.account_id IN (
-                SELECT DISTINCT account_id FROM fact_core_metrics
-            )
-            AND ua.account_id NOT IN (
-                SELECT DISTINCT f.account_id
-                FROM fact_core_metrics f
-                JOIN dim_date d ON f.date_id = d.date_id
-                WHERE d.date >= CURRENT_DATE - INTERVAL '7 days'
-            )
-        """)).scalar() or 0
+            LEFT JOIN account_data_freshness fr ON fr.account_id = ua.account_id
+        """)).fetchone()
+
+        # Active: data in the last 7 days; stale: historical data only
+        total, active, stale = (row[0] or 0, row[1] or 0, row[2] or 0) if row else (0, 0, 0)
 
         return {
             "total_accounts": total,
@@ -378,28 +380,33 @@ class AdminRepository:
         }
 
     def get_total_spend(self, days: int = 30) -> float:
-        """Get total spend across all accounts for period"""
-        result = self.db.execute(text("""
+        """Get total spend across all accounts for period (snapshot, live fallback)"""
+        total = self.get_metrics_snapshot(TOTAL_SPEND_METRIC, days)
+        if total is None:
+            total = self.compute_total_spend(days)
+        return float(total)
+
+    def compute_total_spend(self, days: int = 30) -> float:
+        """Sum of spend over the last N days (date_id range scan)"""
+        result = self.db.execute(text(f"""
             SELECT COALESCE(SUM(f.spend), 0)
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
-            WHERE d.date >= CURRENT_DATE - INTERVAL :days DAY
+            WHERE f.date_id >= {date_id_of('CURRENT_DATE - CAST(:days AS INTEGER)')}
         """), {"days": days})
         return float(result.scalar() or 0)
 
     def get_account_last_sync_dates(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get last data date for each account"""
+        """Get last data date for each account (from the freshness rows written at load time)"""
         result = self.db.execute(text("""
             SELECT
                 ua.account_id,
                 a.account_name,
-                MAX(d.date) as last_data_date
-            FROM user_ad_account ua
+                to_date(CAST(fr.last_date_id AS TEXT), 'YYYYMMDD') as last_data_date,
+                fr.last_loaded_at
+            FROM (SELECT DISTINCT account_id FROM user_ad_account) ua
             LEFT JOIN dim_account a ON ua.account_id = a.account_id
-            LEFT JOIN fact_core_metrics f ON ua.account_id = f.account_id
-            LEFT JOIN dim_date d ON f.date_id = d.date_id
-            GROUP BY ua.account_id, a.account_name
-            ORDER BY last_data_date DESC NULLS LAST
+            LEFT JOIN account_data_freshness fr ON ua.account_id = fr.account_id
+            ORDER BY fr.last_date_id DESC NULLS LAST
             LIMIT :limit
         """), {"limit": limit})
 
@@ -407,7 +414,8 @@ class AdminRepository:
             {
                 "account_id": row[0],
                 "account_name": row[1] or "Unknown",
-                "last_data_date": str(row[2]) if row[2] else None
+                "last_data_date": str(row[2]) if row[2] else None,
+                "last_loaded_at": row[3].isoformat() if row[3] else None
             }
             for row in result
         ]
@@ -415,7 +423,14 @@ class AdminRepository:
     # ==================== Feature Adoption Metrics ====================
 
     def get_feature_usage_stats(self, days: int = 30) -> List[Dict[str, Any]]:
-        """Get feature usage statistics from page views"""
+        """Get feature usage statistics from page views (snapshot, live fallback)"""
+        features = self.get_metrics_snapshot(FEATURE_USAGE_METRIC, days)
+        if features is None:
+            features = self.compute_feature_usage_stats(days)
+        return features
+
+    def compute_feature_usage_stats(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Feature usage from page_view rows in the period"""
         cutoff = datetime.utcnow() - timedelta(days=days)
 
         # Map page paths to features
@@ -458,6 +473,40 @@ class AdminRepository:
             if row[0] != 'other'
         ]
 
+    # ==================== Metrics Snapshot ====================
+
+    def get_metrics_snapshot(self, metric_key: str, period_days: int = 0) -> Optional[Any]:
+        """
+        Precomputed value of an admin metric, or None when it is missing or older
+        than ADMIN_METRICS_MAX_AGE_MINUTES (callers then compute it live).
+        """
+        row = self.db.query(AdminMetricsSnapshot).filter(
+            AdminMetricsSnapshot.metric_key == metric_key,
+            AdminMetricsSnapshot.period_days == period_days
+        ).first()
+
+        max_age = timedelta(minutes=settings.ADMIN_METRICS_MAX_AGE_MINUTES)
+        if not row or row.refreshed_at < datetime.utcnow() - max_age:
+            return None
+
+        try:
+            return json.loads(row.value_json)
+        except (TypeError, ValueError):
+            logger.warning(f"Corrupt admin metrics snapshot {metric_key}/{period_days}")
+            return None
+
+    def save_metrics_snapshot(self, values: Dict[Tuple[str, int], Any]) -> None:
+        """Upsert snapshot rows keyed by (metric_key, period_days) in one transaction"""
+        refreshed_at = datetime.utcnow()
+        for (metric_key, period_days), value in values.items():
+            self.db.merge(AdminMetricsSnapshot(
+                metric_key=metric_key,
+                period_days=period_days,
+                value_json=json.dumps(value, default=str),
+                refreshed_at=refreshed_at
+            ))
+        self.db.commit()
+
     # ==================== Error Trends ====================
 
     def get_error_trends(self, days: int = 30) -> List[Dict[str, Any]]:
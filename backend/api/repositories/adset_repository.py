@@ -1,7 +1,8 @@
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
+from backend.api.repositories.query_filters import QueryFilters
 
 class AdSetRepository(BaseRepository):
     """Repository for adset metrics."""
@@ -19,33 +20,13 @@ class AdSetRepository(BaseRepository):
         """
         Get adset-level metrics and targeting info.
         """
-        campaign_filter = ""
-        if campaign_id is not None:
-            campaign_filter = "AND f.campaign_id = :campaign_id"
-
-        # Build status filter
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
-
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids:
-            placeholders, param_account_ids = self.build_in_clause(account_ids, 'account_id')
-            account_filter = f"AND f.account_id IN ({placeholders})"
-            
-        # Build search filter - search by campaign name (not adset name)
-        search_filter = ""
-        if search_query:
-            search_filter = "AND LOWER(c.campaign_name) LIKE :search_query"
-
-        # Build campaign_ids filter
-        campaign_ids_filter = ""
-        if campaign_ids is not None and len(campaign_ids) > 0:
-            placeholders = ', '.join([f":campaign_ids_{i}" for i in range(len(campaign_ids))])
-            campaign_ids_filter = f"AND f.campaign_id IN ({placeholders})"
+        # Search is by campaign name (not adset name)
+        filters = (QueryFilters(start_date, end_date)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .search('c.campaign_name', search_query)
+                   .any_id('f.campaign_id', 'campaign_ids', campaign_ids))
 
         query = text(f"""
             SELECT
@@ -64,7 +45,6 @@ class AdSetRepository(BaseRepository):
                 SUM(f.lead_website) as lead_website,
                 SUM(f.lead_form) as lead_form
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_adset a ON f.adset_id = a.adset_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id
             LEFT JOIN (
@@ -73,10 +53,8 @@ class AdSetRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -84,40 +62,13 @@ class AdSetRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {campaign_filter}
-                {status_filter}
-                {account_filter}
-                {search_filter}
-                {campaign_ids_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY a.adset_id, a.adset_name, a.adset_status, a.targeting_type, a.targeting_summary
             ORDER BY spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            **param_account_ids
-        }
-
-        if campaign_id is not None:
-            params['campaign_id'] = campaign_id
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        # Add status params
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        # Add campaign_ids params
-        if campaign_ids:
-            for i, cid in enumerate(campaign_ids):
-                params[f'campaign_ids_{i}'] = cid
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         adsets = []
         for row in results:
@@ -179,17 +130,9 @@ class AdSetRepository(BaseRepository):
         Returns:
             Dict mapping adset_id to metrics dict
         """
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids:
-            placeholders = ', '.join([f":acc_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-            for i, acc_id in enumerate(account_ids):
-                param_account_ids[f'acc_id_{i}'] = acc_id
-
-        # Build adset filter
-        adset_placeholders = ', '.join([f":adset_id_{i}" for i in range(len(adset_ids))])
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.adset_id', 'adset_ids', adset_ids)
+                   .any_id('f.account_id', 'account_ids', account_ids))
 
         query = text(f"""
             SELECT
@@ -200,17 +143,14 @@ class AdSetRepository(BaseRepository):
                 COALESCE(SUM(conv.action_count), 0) as conversions,
                 COALESCE(SUM(conv.action_value), 0) as conversion_value
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
                        SUM(fam.action_count) as action_count,
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -218,24 +158,12 @@ class AdSetRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                AND f.adset_id IN ({adset_placeholders})
-                {account_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY f.adset_id
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            **param_account_ids
-        }
-
-        # Add adset ID params
-        for i, adset_id in enumerate(adset_ids):
-            params[f'adset_id_{i}'] = adset_id
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         # Build result dict
         comparison_data = {}
@@ -261,12 +189,9 @@ class AdSetRepository(BaseRepository):
         Get ad sets for a specific campaign with metrics.
         Used for hierarchy view in Manage page.
         """
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids:
-            placeholders, param_account_ids = self.build_in_clause(account_ids, 'acc_id')
-            account_filter = f"AND f.account_id IN ({placeholders})"
+        filters = (QueryFilters(start_date, end_date)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id)
+                   .any_id('f.account_id', 'account_ids', account_ids))
 
         query = text(f"""
             SELECT
@@ -279,7 +204,6 @@ class AdSetRepository(BaseRepository):
                 COALESCE(SUM(conv.action_count), 0) as conversions,
                 COALESCE(SUM(conv.action_value), 0) as conversion_value
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_adset a ON f.adset_id = a.adset_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
@@ -287,10 +211,8 @@ class AdSetRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -298,22 +220,13 @@ class AdSetRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                AND f.campaign_id = :campaign_id
-                {account_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY a.adset_id, a.adset_name, a.adset_status
             ORDER BY spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            'campaign_id': campaign_id,
-            **param_account_ids
-        }
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         adsets = []
         for row in results:
@@ -1,18 +1,45 @@
 from sqlalchemy.orm import Session
 from typing import List, Tuple, Dict, Any
 
+
+def date_id_of(date_sql: str) -> str:
+    """SQL expression turning a DATE expression into its YYYYMMDD date_id"""
+    return f"CAST(to_char({date_sql}, 'YYYYMMDD') AS BIGINT)"
+
+
+def date_id_between(column: str = 'f.date_id', start_param: str = 'start_date', end_param: str = 'end_date') -> str:
+    """
+    Date range predicate on a fact table's date_id.
+
+    Filtering the fact table directly (instead of joining dim_date and filtering
+    d.date) lets the planner range-scan the (account_id, date_id) / date_id
+    indexes. Join dim_date only when calendar attributes (date, week, day_of_week)
+    are selected or grouped on.
+
+    Requires :start_date and :end_date (or the given parameter names) to be bound.
+    """
+    return (
+        f"{column} BETWEEN {date_id_of(f'CAST(:{start_param} AS DATE)')} "
+        f"AND {date_id_of(f'CAST(:{end_param} AS DATE)')}"
+    )
+
+
+def date_id_since(lookback_days: int, column: str = 'f.date_id') -> str:
+    """Predicate for the last `lookback_days` days on a fact table's date_id"""
+    since = f"CURRENT_DATE - INTERVAL '{int(lookback_days)} days'"
+    return f"{column} >= {date_id_of(since)}"
+
+
 # Shared SQL fragment for conversion metrics subquery
 # Used by multiple repositories to aggregate conversion data from fact_action_metrics
-CONVERSION_SUBQUERY = """
+CONVERSION_SUBQUERY = f"""
     SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
            SUM(action_count) as action_count,
            SUM(action_value) as action_value
     FROM fact_action_metrics fam
     JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-    JOIN dim_date d2 ON fam.date_id = d2.date_id
     WHERE dat.is_conversion = TRUE
-        AND d2.date >= :start_date
-        AND d2.date <= :end_date
+        AND {date_id_between('fam.date_id')}
     GROUP BY 1, 2, 3, 4, 5, 6
 """
 
@@ -27,6 +54,9 @@ class BaseRepository:
         """
         Build SQL IN clause with parameterized placeholders.
 
+        The statement text changes with len(values); prefer QueryFilters.any_of
+        (one array parameter) for queries that run often.
+
         Args:
             values: List of values for the IN clause
             param_prefix: Prefix for parameter names (e.g., 'acc_id')
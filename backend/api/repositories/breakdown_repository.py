@@ -1,7 +1,8 @@
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
+from backend.api.repositories.query_filters import QueryFilters
 
 class BreakdownRepository(BaseRepository):
     """Repository for breakdown metrics (demographics, placement, platform, country)."""
@@ -22,43 +23,16 @@ class BreakdownRepository(BaseRepository):
         Get age and gender breakdown metrics.
         Aggregates in Python to ensure stability and reusability.
         """
-        campaign_filter = ""
-        if campaign_id is not None:
-            campaign_filter = "AND f.campaign_id = :campaign_id"
-
-        creative_filter = ""
-        param_creative_ids = {}
-        if creative_ids is not None and len(creative_ids) > 0:
-            placeholders, param_creative_ids = self.build_in_clause(creative_ids, 'creative_id')
-            creative_filter = f"AND f.creative_id IN ({placeholders})"
-
-        # Build status filter
-        status_filter = ""
-        param_status = {}
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders, param_status = self.build_in_clause(campaign_status, 'status')
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
-
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders, param_account_ids = self.build_in_clause(account_ids, 'account_id')
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        # Build search filter
-        search_filter = ""
-        if search_query:
-            search_filter = "AND LOWER(c.campaign_name) LIKE :search_query"
-
-        # Build campaign_ids filter
-        campaign_ids_filter = ""
-        param_campaign_ids = {}
-        if campaign_ids is not None and len(campaign_ids) > 0:
-            placeholders, param_campaign_ids = self.build_in_clause(campaign_ids, 'campaign_ids')
-            campaign_ids_filter = f"AND f.campaign_id IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
+
+        filters = (QueryFilters(start_date, end_date)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id)
+                   .any_id('f.creative_id', 'creative_ids', creative_ids)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .search('c.campaign_name', search_query)
+                   .any_id('f.campaign_id', 'campaign_ids', campaign_ids))
 
         # Always fetch both dimensions from DB
         query = text(f"""
@@ -69,38 +43,16 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_age_gender_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_age a ON f.age_id = a.age_id
             JOIN dim_gender g ON f.gender_id = g.gender_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {campaign_filter}
-                {creative_filter}
-                {status_filter}
-                {account_filter}
-                {search_filter}
-                {campaign_ids_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY a.age_group, g.gender
             ORDER BY spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            **param_creative_ids,
-            **param_status,
-            **param_account_ids,
-            **param_campaign_ids
-        }
-
-        if campaign_id is not None:
-            params['campaign_id'] = campaign_id
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         # Process and Aggregate in Python
         processed_data = {} # Key: (age_group, gender)
@@ -181,39 +133,16 @@ class BreakdownRepository(BaseRepository):
         """
         Get placement breakdown metrics.
         """
-        campaign_filter = ""
-        if campaign_id is not None:
-            campaign_filter = "AND f.campaign_id = :campaign_id"
-
-        creative_filter = ""
-        if creative_ids is not None and len(creative_ids) > 0:
-            placeholders = ', '.join([f":creative_id_{i}" for i in range(len(creative_ids))])
-            creative_filter = f"AND f.creative_id IN ({placeholders})"
-
-        # Build status filter
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
-            
-        # Build account filter
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-             
-        # Build search filter
-        search_filter = ""
-        if search_query:
-            search_filter = "AND LOWER(c.campaign_name) LIKE :search_query"
-
-        # Build campaign_ids filter
-        campaign_ids_filter = ""
-        if campaign_ids is not None and len(campaign_ids) > 0:
-            placeholders = ', '.join([f":campaign_ids_{i}" for i in range(len(campaign_ids))])
-            campaign_ids_filter = f"AND f.campaign_id IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
+
+        filters = (QueryFilters(start_date, end_date)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id)
+                   .any_id('f.creative_id', 'creative_ids', creative_ids)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .search('c.campaign_name', search_query)
+                   .any_id('f.campaign_id', 'campaign_ids', campaign_ids))
 
         query = text(f"""
             SELECT
@@ -222,53 +151,20 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_placement_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_placement p ON f.placement_id = p.placement_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {campaign_filter}
-                {creative_filter}
-                {status_filter}
-                {account_filter}
-                {search_filter}
-                {campaign_ids_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY p.placement_name
             ORDER BY spend DESC
             LIMIT :limit
         """)
 
         params = {
-            'start_date': start_date,
-            'end_date': end_date,
+            **filters.params,
             'limit': limit
         }
 
-        if campaign_id is not None:
-            params['campaign_id'] = campaign_id
-
-        if creative_ids:
-            for i, cid in enumerate(creative_ids):
-                params[f'creative_id_{i}'] = cid
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        # Add status params
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        # Add account params
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        # Add campaign_ids params
-        if campaign_ids:
-            for i, cid in enumerate(campaign_ids):
-                params[f'campaign_ids_{i}'] = cid
-
         results = self.db.execute(query, params).fetchall()
 
         breakdowns = []
@@ -305,34 +201,16 @@ class BreakdownRepository(BaseRepository):
         """
         Get platform breakdown metrics (derived from placement_name).
         """
-        campaign_filter = ""
-        if campaign_id is not None:
-            campaign_filter = "AND f.campaign_id = :campaign_id"
-
-        # Build status filter
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
             
-        # Build account filter
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        # Build search filter
-        search_filter = ""
-        if search_query:
-            search_filter = "AND LOWER(c.campaign_name) LIKE :search_query"
-
-        # Build campaign_ids filter
-        campaign_ids_filter = ""
-        if campaign_ids is not None and len(campaign_ids) > 0:
-            placeholders = ', '.join([f":campaign_ids_{i}" for i in range(len(campaign_ids))])
-            campaign_ids_filter = f"AND f.campaign_id IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
+
+        filters = (QueryFilters(start_date, end_date)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .search('c.campaign_name', search_query)
+                   .any_id('f.campaign_id', 'campaign_ids', campaign_ids))
 
         # Use placement_name and aggregate in Python to avoid DB-specific string functions
         query = text(f"""
@@ -342,47 +220,15 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_placement_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_placement p ON f.placement_id = p.placement_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {campaign_filter}
-                {status_filter}
-                {account_filter}
-                {search_filter}
-                {campaign_ids_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY p.placement_name
             ORDER BY spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date
-        }
-
-        if campaign_id is not None:
-            params['campaign_id'] = campaign_id
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        # Add status params
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        # Add account params
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        # Add campaign_ids params
-        if campaign_ids:
-            for i, cid in enumerate(campaign_ids):
-                params[f'campaign_ids_{i}'] = cid
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         # Aggregate by platform in Python
         platform_metrics = {}
@@ -444,39 +290,16 @@ class BreakdownRepository(BaseRepository):
         """
         Get country breakdown metrics.
         """
-        campaign_filter = ""
-        if campaign_id is not None:
-            campaign_filter = "AND f.campaign_id = :campaign_id"
-
-        creative_filter = ""
-        if creative_ids is not None and len(creative_ids) > 0:
-            placeholders = ', '.join([f":creative_id_{i}" for i in range(len(creative_ids))])
-            creative_filter = f"AND f.creative_id IN ({placeholders})"
-
-        # Build status filter
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
-            
-        # Build account filter
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        # Build search filter
-        search_filter = ""
-        if search_query:
-            search_filter = "AND LOWER(c.campaign_name) LIKE :search_query"
-
-        # Build campaign_ids filter
-        campaign_ids_filter = ""
-        if campaign_ids is not None and len(campaign_ids) > 0:
-            placeholders = ', '.join([f":campaign_ids_{i}" for i in range(len(campaign_ids))])
-            campaign_ids_filter = f"AND f.campaign_id IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
+
+        filters = (QueryFilters(start_date, end_date)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id)
+                   .any_id('f.creative_id', 'creative_ids', creative_ids)
+                   .campaign_status('cmp.campaign_status', campaign_status)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .search('cmp.campaign_name', search_query)
+                   .any_id('f.campaign_id', 'campaign_ids', campaign_ids))
 
         query = text(f"""
             SELECT
@@ -485,53 +308,20 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_country_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_country c ON f.country_id = c.country_id
             JOIN dim_campaign cmp ON f.campaign_id = cmp.campaign_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {campaign_filter}
-                {creative_filter}
-                {status_filter.replace('c.', 'cmp.')}
-                {account_filter}
-                {search_filter.replace('c.', 'cmp.')}
-                {campaign_ids_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY c.country
             ORDER BY spend DESC
             LIMIT :top_n
         """)
 
         params = {
-            'start_date': start_date,
-            'end_date': end_date,
+            **filters.params,
             'top_n': top_n
         }
 
-        if campaign_id is not None:
-            params['campaign_id'] = campaign_id
-
-        if creative_ids:
-            for i, cid in enumerate(creative_ids):
-                params[f'creative_id_{i}'] = cid
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        # Add status params
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        # Add account params
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        # Add campaign_ids params
-        if campaign_ids:
-            for i, cid in enumerate(campaign_ids):
-                params[f'campaign_ids_{i}'] = cid
-
         results = self.db.execute(query, params).fetchall()
 
         breakdowns = []
@@ -595,22 +385,13 @@ class BreakdownRepository(BaseRepository):
         else:
             return []
 
-        # Build filters
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
 
-        search_filter = ""
-        if search_query:
-            search_filter = f"AND LOWER({entity_group}) LIKE :search_query"
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .search(entity_group, search_query))
 
         query = text(f"""
             SELECT
@@ -620,35 +401,15 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_placement_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_placement p ON f.placement_id = p.placement_id
             {entity_join}
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {account_filter}
-                {status_filter}
-                {search_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY {entity_group}, p.placement_name
             ORDER BY {entity_group}, spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date
-        }
-
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         breakdowns = []
         for row in results:
@@ -710,22 +471,13 @@ class BreakdownRepository(BaseRepository):
         else:
             return []
 
-        # Build filters
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
 
-        search_filter = ""
-        if search_query:
-            search_filter = f"AND LOWER({entity_group}) LIKE :search_query"
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .search(entity_group, search_query))
 
         # Get placement data first, then aggregate by platform in Python
         query = text(f"""
@@ -736,35 +488,15 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_placement_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_placement p ON f.placement_id = p.placement_id
             {entity_join}
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {account_filter}
-                {status_filter}
-                {search_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY {entity_group}, p.placement_name
             ORDER BY {entity_group}, spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date
-        }
-
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         # Aggregate by entity + platform
         entity_platform_metrics = {}
@@ -850,21 +582,13 @@ class BreakdownRepository(BaseRepository):
         else:
             return []
 
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
 
-        search_filter = ""
-        if search_query:
-            search_filter = f"AND LOWER({entity_group}) LIKE :search_query"
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .search(entity_group, search_query))
 
         # Build demographic select, group, and joins based on group_by parameter
         if group_by == 'age':
@@ -889,35 +613,15 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_age_gender_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             {demo_joins}
             {entity_join}
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {account_filter}
-                {status_filter}
-                {search_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY {entity_group}, {demo_group}
             ORDER BY {entity_group}, spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date
-        }
-
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         breakdowns = []
         for row in results:
@@ -978,21 +682,13 @@ class BreakdownRepository(BaseRepository):
         else:
             return []
 
-        account_filter = ""
-        if account_ids is not None:
-            if len(account_ids) == 0:
-                return []
-            placeholders = ', '.join([f":account_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-
-        status_filter = ""
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders = ', '.join([f":status_{i}" for i in range(len(campaign_status))])
-            status_filter = f"AND cmp.campaign_status IN ({placeholders})"
+        if account_ids is not None and len(account_ids) == 0:
+            return []
 
-        search_filter = ""
-        if search_query:
-            search_filter = f"AND LOWER({entity_group}) LIKE :search_query"
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .campaign_status('cmp.campaign_status', campaign_status)
+                   .search(entity_group, search_query))
 
         query = text(f"""
             SELECT
@@ -1002,35 +698,15 @@ class BreakdownRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_country_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_country c ON f.country_id = c.country_id
             {entity_join}
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {account_filter}
-                {status_filter}
-                {search_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY {entity_group}, c.country
             ORDER BY {entity_group}, spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date
-        }
-
-        if account_ids:
-            for i, aid in enumerate(account_ids):
-                params[f'account_id_{i}'] = aid
-
-        if campaign_status and campaign_status != ['ALL']:
-            for i, status in enumerate(campaign_status):
-                params[f'status_{i}'] = status
-
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         breakdowns = []
         for row in results:
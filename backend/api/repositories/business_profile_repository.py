@@ -55,7 +55,7 @@ class BusinessProfileRepository:
             BusinessProfile.account_id == account_id
         ).first()
 
-    def update_analysis(self, account_id: int, analysis_data: Dict) -> Optional[BusinessProfile]:
+    def update_analysis(self, account_id: int, analysis_data: Dict, mark_completed: bool = True) -> Optional[BusinessProfile]:
         """Update business profile with AI analysis results."""
         profile = self.get_by_account_id(account_id)
         if not profile:
@@ -75,7 +75,8 @@ class BusinessProfileRepository:
                 setattr(profile, field, value)
 
         profile.profile_json = json.dumps(analysis_data)
-        profile.analysis_status = 'completed'
+        if mark_completed:
+            profile.analysis_status = 'completed'
         profile.website_analyzed_at = datetime.now(timezone.utc)
 
         self.db.commit()
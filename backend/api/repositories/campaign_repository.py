@@ -2,7 +2,8 @@ import logging
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
+from backend.api.repositories.query_filters import QueryFilters
 
 logger = logging.getLogger(__name__)
 
@@ -23,27 +24,11 @@ class CampaignRepository(BaseRepository):
         """
         Get campaign-level metrics breakdown.
         """
-        # Build status filter
-        status_filter = ""
-        status_params = {}
-        if campaign_status and campaign_status != ['ALL']:
-            placeholders, status_params = self.build_in_clause(campaign_status, 'status')
-            status_filter = f"AND c.campaign_status IN ({placeholders})"
-            
-        # Build search filter
-        search_filter = ""
-        if search_query:
-            search_filter = "AND LOWER(c.campaign_name) LIKE :search_query"
-
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids:
-            placeholders, param_account_ids = self.build_in_clause(account_ids, 'acc_id')
-            account_filter = f"AND f.account_id IN ({placeholders})"
-            logger.debug(f"[CampaignRepository.get_campaign_breakdown] account_filter: {account_filter}")
-        else:
-            logger.debug(f"[CampaignRepository.get_campaign_breakdown] No account_ids provided")
+        filters = (QueryFilters(start_date, end_date)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .search('c.campaign_name', search_query)
+                   .any_id('f.account_id', 'account_ids', account_ids))
+        logger.debug(f"[CampaignRepository.get_campaign_breakdown] filters: {filters.sql or 'none'}")
 
         # Validate sort column
         valid_sort_cols = ['spend', 'impressions', 'clicks', 'purchases', 'purchase_value']
@@ -72,7 +57,6 @@ class CampaignRepository(BaseRepository):
                 SUM(f.lead_website) as lead_website,
                 SUM(f.lead_form) as lead_form
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id AND f.account_id = c.account_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
@@ -80,10 +64,8 @@ class CampaignRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -91,27 +73,18 @@ class CampaignRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {status_filter}
-                {search_filter}
-                {account_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY c.campaign_id, c.account_id, c.campaign_name, c.campaign_status
             ORDER BY {sort_by} {sort_direction}
             LIMIT :limit
         """)
 
         params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            'limit': limit,
-            **param_account_ids,
-            **status_params
+            **filters.params,
+            'limit': limit
         }
 
-        if search_query:
-            params['search_query'] = f"%{search_query.lower()}%"
-
         results = self.db.execute(query, params).fetchall()
 
         campaigns = []
@@ -171,17 +144,9 @@ class CampaignRepository(BaseRepository):
         Returns:
             Dict mapping campaign_id to metrics dict
         """
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids:
-            placeholders = ', '.join([f":acc_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-            for i, acc_id in enumerate(account_ids):
-                param_account_ids[f'acc_id_{i}'] = acc_id
-
-        # Build campaign filter
-        campaign_placeholders = ', '.join([f":campaign_id_{i}" for i in range(len(campaign_ids))])
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.campaign_id', 'campaign_ids', campaign_ids)
+                   .any_id('f.account_id', 'account_ids', account_ids))
 
         query = text(f"""
             SELECT
@@ -192,17 +157,14 @@ class CampaignRepository(BaseRepository):
                 COALESCE(SUM(conv.action_count), 0) as conversions,
                 COALESCE(SUM(conv.action_value), 0) as conversion_value
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
                        SUM(fam.action_count) as action_count,
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -210,24 +172,12 @@ class CampaignRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                AND f.campaign_id IN ({campaign_placeholders})
-                {account_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY f.campaign_id
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            **param_account_ids
-        }
-
-        # Add campaign ID params
-        for i, campaign_id in enumerate(campaign_ids):
-            params[f'campaign_id_{i}'] = campaign_id
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         # Build result dict
         comparison_data = {}
@@ -252,14 +202,7 @@ class CampaignRepository(BaseRepository):
         Get all campaigns with metrics for the Manage page hierarchy view.
         Returns campaigns with calculated metrics (CTR, CPC, CPA, Conv Rate).
         """
-        # Build account filter
-        account_filter = ""
-        param_account_ids = {}
-        if account_ids:
-            placeholders = ', '.join([f":acc_id_{i}" for i in range(len(account_ids))])
-            account_filter = f"AND f.account_id IN ({placeholders})"
-            for i, acc_id in enumerate(account_ids):
-                param_account_ids[f'acc_id_{i}'] = acc_id
+        filters = QueryFilters(start_date, end_date).any_id('f.account_id', 'account_ids', account_ids)
 
         query = text(f"""
             SELECT
@@ -272,7 +215,6 @@ class CampaignRepository(BaseRepository):
                 COALESCE(SUM(conv.action_count), 0) as conversions,
                 COALESCE(SUM(conv.action_value), 0) as conversion_value
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id AND f.account_id = c.account_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
@@ -280,10 +222,8 @@ class CampaignRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id
                   AND f.account_id = conv.account_id
@@ -291,20 +231,13 @@ class CampaignRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
-                {account_filter}
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
             GROUP BY c.campaign_id, c.account_id, c.campaign_name, c.campaign_status
             ORDER BY spend DESC
         """)
 
-        params = {
-            'start_date': start_date,
-            'end_date': end_date,
-            **param_account_ids
-        }
-
-        results = self.db.execute(query, params).fetchall()
+        results = self.db.execute(query, filters.params).fetchall()
 
         campaigns = []
         for row in results:
@@ -6,7 +6,7 @@ import logging
 from datetime import date, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +41,8 @@ class CaptainRecommendationsRepository(BaseRepository):
                      THEN SUM(f.clicks)::float / SUM(f.impressions) * 100
                      ELSE 0 END as ctr
             FROM fact_age_gender_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_age a ON f.age_id = a.age_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND f.account_id IN ({placeholders})
             GROUP BY a.age_group
             HAVING SUM(f.spend) > 0
@@ -97,10 +95,8 @@ class CaptainRecommendationsRepository(BaseRepository):
                 SUM(f.impressions) as impressions,
                 SUM(f.clicks) as clicks
             FROM fact_country_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_country c ON f.country_id = c.country_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND f.account_id IN ({placeholders})
             GROUP BY c.country, c.country_code
             HAVING SUM(f.spend) > 0
@@ -157,10 +153,8 @@ class CaptainRecommendationsRepository(BaseRepository):
                      THEN SUM(f.clicks)::float / SUM(f.impressions) * 100
                      ELSE 0 END as ctr
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND f.account_id IN ({placeholders})
                 AND cr.call_to_action_type IS NOT NULL
                 AND cr.call_to_action_type != ''
@@ -223,10 +217,8 @@ class CaptainRecommendationsRepository(BaseRepository):
                      THEN SUM(f.purchase_value) / SUM(f.spend)
                      ELSE 0 END as roas
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id AND f.account_id = c.account_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND f.account_id IN ({placeholders})
             GROUP BY c.campaign_id, c.campaign_name, c.objective, c.campaign_status
             HAVING SUM(f.spend) > 10
@@ -296,11 +288,9 @@ class CaptainRecommendationsRepository(BaseRepository):
                      THEN SUM(f.clicks)::float / SUM(f.impressions) * 100
                      ELSE 0 END as ctr
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND f.account_id IN ({placeholders})
                 AND (cr.title IS NOT NULL OR cr.body IS NOT NULL)
             GROUP BY ad.ad_id, ad.ad_name, cr.title, cr.body, cr.call_to_action_type, cr.image_url, cr.is_video
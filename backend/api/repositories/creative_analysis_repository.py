@@ -8,7 +8,7 @@ ad fatigue detection, and creative performance patterns.
 from datetime import date, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between, date_id_since
 
 
 class CreativeAnalysisRepository(BaseRepository):
@@ -84,7 +84,6 @@ class CreativeAnalysisRepository(BaseRepository):
             FROM dim_creative cr
             JOIN fact_core_metrics f ON cr.creative_id = f.creative_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN (
                 SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
                        SUM(action_count) as action_count,
@@ -99,8 +98,7 @@ class CreativeAnalysisRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {campaign_filter}
                 {account_filter}
             GROUP BY cr.creative_id, ad.ad_name, cr.title, cr.body, cr.call_to_action_type,
@@ -195,7 +193,6 @@ class CreativeAnalysisRepository(BaseRepository):
                          ELSE 0 END) as avg_cpa
             FROM dim_creative cr
             JOIN fact_core_metrics f ON cr.creative_id = f.creative_id
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN (
                 SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
                        SUM(action_count) as action_count
@@ -209,8 +206,7 @@ class CreativeAnalysisRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND cr.call_to_action_type IS NOT NULL
                 AND cr.call_to_action_type != ''
                 {account_filter}
@@ -271,7 +267,7 @@ class CreativeAnalysisRepository(BaseRepository):
                 FROM fact_core_metrics f
                 JOIN dim_date d ON f.date_id = d.date_id
                 WHERE f.creative_id = :creative_id
-                    AND d.date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
+                    AND {date_id_since(lookback_days, 'f.date_id')}
                 GROUP BY d.date
             ),
             ctr_with_avg AS (
@@ -370,10 +366,9 @@ class CreativeAnalysisRepository(BaseRepository):
                 cr.call_to_action_type,
                 SUM(f.impressions) as total_impressions
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
-            WHERE d.date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
+            WHERE {date_id_since(lookback_days, 'f.date_id')}
                 {account_filter}
             GROUP BY f.creative_id, ad.ad_name, cr.title, cr.body, cr.call_to_action_type
             HAVING SUM(f.impressions) >= :min_impressions
@@ -456,7 +451,6 @@ class CreativeAnalysisRepository(BaseRepository):
                      ELSE 0 END as avg_completion_rate
             FROM dim_creative cr
             JOIN fact_core_metrics f ON cr.creative_id = f.creative_id
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN (
                 SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
                        SUM(action_count) as action_count
@@ -470,8 +464,7 @@ class CreativeAnalysisRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {account_filter}
             GROUP BY format_type
             ORDER BY total_spend DESC
@@ -1,7 +1,7 @@
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
 
 class CreativeRepository(BaseRepository):
     """Repository for creative-level metrics."""
@@ -107,7 +107,6 @@ class CreativeRepository(BaseRepository):
                     ELSE COALESCE(ad.ad_status, 'UNKNOWN')
                 END as effective_status
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
             JOIN dim_adset adset ON ad.adset_id = adset.adset_id
@@ -126,8 +125,7 @@ class CreativeRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {video_filter}
                 {search_filter}
                 {status_filter}
@@ -210,7 +208,6 @@ class CreativeRepository(BaseRepository):
                      THEN SUM(f.video_avg_time_watched * f.video_plays) / SUM(f.video_plays) 
                      ELSE 0 END as video_avg_time_watched
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
             LEFT JOIN (
                 SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
@@ -227,8 +224,7 @@ class CreativeRepository(BaseRepository):
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
             WHERE cr.creative_id = :creative_id
-                AND d.date >= :start_date
-                AND d.date <= :end_date
+                AND {date_id_between('f.date_id')}
                 {account_filter}
             GROUP BY cr.creative_id, cr.title, cr.body, cr.is_video, cr.is_carousel,
                      cr.video_length_seconds, cr.image_url, cr.video_url,
@@ -281,14 +277,13 @@ class CreativeRepository(BaseRepository):
                   AND f.account_id = conv.account_id 
                   AND f.creative_id = conv.creative_id
             WHERE f.creative_id = :creative_id
-                AND d.date >= :start_date
-                AND d.date <= :end_date
+                AND {date_range}
                 {account_filter}
             GROUP BY d.date
             ORDER BY d.date ASC
         """)
 
-        trend_results = self.db.execute(trend_query.format(account_filter=account_filter), params).fetchall()
+        trend_results = self.db.execute(trend_query.format(account_filter=account_filter, date_range=date_id_between('f.date_id')), params).fetchall()
 
         trend = []
         for row in trend_results:
@@ -379,7 +374,6 @@ class CreativeRepository(BaseRepository):
                      THEN SUM(f.video_avg_time_watched * f.video_plays) / SUM(f.video_plays)
                      ELSE 0 END as video_avg_time_watched
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
             LEFT JOIN (
                 SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
@@ -396,8 +390,7 @@ class CreativeRepository(BaseRepository):
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
             WHERE cr.creative_id IN ({placeholders})
-                AND d.date >= :start_date
-                AND d.date <= :end_date
+                AND {date_id_between('f.date_id')}
                 {account_filter}
             GROUP BY cr.creative_id, cr.title, cr.is_video
             ORDER BY spend DESC
@@ -463,10 +456,8 @@ class CreativeRepository(BaseRepository):
                     THEN f.video_avg_time_watched
                     ELSE 0 END) as avg_video_time
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND cr.is_video = true
                 AND f.video_plays > 0
                 {account_filter}
@@ -491,10 +482,8 @@ class CreativeRepository(BaseRepository):
                     THEN (SUM(f.video_p100_watched)::float / SUM(f.video_plays)) * 100
                     ELSE 0 END as completion_rate
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND cr.is_video = true
                 AND f.video_plays > 0
                 {account_filter}
@@ -8,7 +8,7 @@ and historical performance patterns over extended time periods (30/60/90 days).
 from datetime import date, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between, date_id_since
 
 
 class HistoricalRepository(BaseRepository):
@@ -76,7 +76,7 @@ class HistoricalRepository(BaseRepository):
                       AND f.adset_id = conv.adset_id
                       AND f.ad_id = conv.ad_id
                       AND f.creative_id = conv.creative_id
-                WHERE d.date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
+                WHERE {date_id_since(lookback_days, 'f.date_id')}
                     {campaign_filter}
                     {account_filter}
                 GROUP BY week_start
@@ -203,7 +203,7 @@ class HistoricalRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
+            WHERE {date_id_since(lookback_days, 'f.date_id')}
                 {campaign_filter}
                 {account_filter}
             GROUP BY d.day_of_week
@@ -296,7 +296,7 @@ class HistoricalRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date BETWEEN :start_date AND :end_date
+            WHERE {date_id_between('f.date_id')}
                 {account_filter}
             GROUP BY d.day_of_week
             ORDER BY
@@ -385,7 +385,7 @@ class HistoricalRepository(BaseRepository):
                       AND f.ad_id = conv.ad_id
                       AND f.creative_id = conv.creative_id
                 WHERE f.campaign_id = :campaign_id
-                    AND d.date >= CURRENT_DATE - INTERVAL '{lookback_days} days'
+                    AND {date_id_since(lookback_days, 'f.date_id')}
                     {account_filter}
                 GROUP BY d.date
             )
@@ -0,0 +1,81 @@
+"""
+Insight snapshot repository.
+
+Stores precomputed summary/overview insight payloads in dim_insight_history so
+default dashboard windows can be served without hitting Gemini.
+"""
+
+from sqlalchemy.orm import Session
+from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+import json
+import logging
+
+from backend.models.schema import DimInsightHistory
+
+logger = logging.getLogger(__name__)
+
+# insight_type used for snapshot rows (kept out of the proactive insights feed)
+SNAPSHOT_INSIGHT_TYPE = 'snapshot'
+
+
+class InsightSnapshotRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_snapshot(self, account_id: int, kind: str, snapshot_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the latest snapshot payload for an account.
+
+        Args:
+            account_id: Ad account ID
+            kind: 'summary' or 'overview'
+            snapshot_key: Window/context/locale key (see InsightsService._snapshot_key)
+        """
+        row = self.db.query(DimInsightHistory).filter(
+            DimInsightHistory.account_id == account_id,
+            DimInsightHistory.insight_type == SNAPSHOT_INSIGHT_TYPE,
+            DimInsightHistory.category == kind,
+            DimInsightHistory.title == snapshot_key
+        ).order_by(DimInsightHistory.generated_at.desc()).first()
+
+        if not row or not row.data_json:
+            return None
+
+        try:
+            return json.loads(row.data_json)
+        except (TypeError, ValueError):
+            logger.warning(f"Corrupt insight snapshot {row.insight_id} for account {account_id}")
+            return None
+
+    def save_snapshot(self, account_id: int, kind: str, snapshot_key: str, payload: Dict[str, Any]) -> None:
+        """Replace any existing snapshot for (account, kind, key) with a new payload."""
+        self.db.query(DimInsightHistory).filter(
+            DimInsightHistory.account_id == account_id,
+            DimInsightHistory.insight_type == SNAPSHOT_INSIGHT_TYPE,
+            DimInsightHistory.category == kind,
+            DimInsightHistory.title == snapshot_key
+        ).delete(synchronize_session=False)
+
+        self.db.add(DimInsightHistory(
+            account_id=account_id,
+            generated_at=datetime.now(timezone.utc),
+            insight_type=SNAPSHOT_INSIGHT_TYPE,
+            priority='info',
+            category=kind,
+            title=snapshot_key,
+            message=f"Precomputed {kind} insights",
+            data_json=json.dumps(payload, default=str, ensure_ascii=False),
+            is_read=True
+        ))
+        self.db.commit()
+
+    def delete_stale_snapshots(self, account_id: int, before: datetime) -> int:
+        """Remove snapshots generated before a cutoff (older windows no longer match today's keys)."""
+        deleted = self.db.query(DimInsightHistory).filter(
+            DimInsightHistory.account_id == account_id,
+            DimInsightHistory.insight_type == SNAPSHOT_INSIGHT_TYPE,
+            DimInsightHistory.generated_at < before
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
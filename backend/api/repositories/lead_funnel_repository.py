@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
-from typing import Optional, Dict, List
-from backend.models.schema import LeadFunnelStages, LeadStageAssignment
+from sqlalchemy import text
+from typing import Optional, Dict, Iterator, List, Any, Tuple
+from datetime import date, datetime, timedelta
+from backend.models.schema import LeadFunnelStages, LeadStageAssignment, LeadFormSyncState
 import json
 
 
@@ -94,16 +96,116 @@ class LeadFunnelRepository:
         self.db.commit()
         return stage_index
 
-    def get_stage_counts(self, account_id: int, lead_form_id: str) -> Dict[int, int]:
-        """Get count of leads per stage for a form. Returns {stage_index: count}."""
-        from sqlalchemy import func
+    # ==================== LEADS (local copy) ====================
 
-        results = self.db.query(
-            LeadStageAssignment.stage_index,
-            func.count(LeadStageAssignment.id)
-        ).filter(
-            LeadStageAssignment.account_id == account_id,
-            LeadStageAssignment.lead_form_id == lead_form_id
-        ).group_by(LeadStageAssignment.stage_index).all()
+    def get_lead_sync_cursor(self, lead_form_id: str) -> Optional[datetime]:
+        """Newest created_time already stored for a form (None = never synced)"""
+        record = self.db.query(LeadFormSyncState).filter(
+            LeadFormSyncState.lead_form_id == lead_form_id
+        ).first()
+        return record.last_created_time if record else None
+
+    def save_leads(self, lead_form_id: str, account_id: Optional[int], leads: List[Dict[str, Any]]) -> int:
+        """
+        Insert synced leads (already stored ones are skipped) and advance the form's cursor.
+
+        Args:
+            leads: [{"id": fb lead id, "created_time": UTC datetime, "fields": {name: value}}]
+        Returns:
+            Number of new leads stored
+        """
+        inserted = 0
+        if leads:
+            result = self.db.execute(text("""
+                INSERT INTO form_leads (fb_lead_id, lead_form_id, account_id, created_time, field_data, synced_at)
+                VALUES (:fb_lead_id, :lead_form_id, :account_id, :created_time, :field_data, :synced_at)
+                ON CONFLICT (fb_lead_id) DO NOTHING
+            """), [
+                {
+                    "fb_lead_id": lead["id"],
+                    "lead_form_id": lead_form_id,
+                    "account_id": account_id,
+                    "created_time": lead["created_time"],
+                    "field_data": json.dumps(lead["fields"], ensure_ascii=False),
+                    "synced_at": datetime.utcnow(),
+                }
+                for lead in leads
+            ])
+            inserted = result.rowcount
+
+        newest = max((lead["created_time"] for lead in leads), default=None)
+        self.db.execute(text("""
+            INSERT INTO lead_form_sync_state (lead_form_id, last_created_time, last_synced_at)
+            VALUES (:lead_form_id, :newest, :now)
+            ON CONFLICT (lead_form_id) DO UPDATE SET
+                last_created_time = GREATEST(lead_form_sync_state.last_created_time, EXCLUDED.last_created_time),
+                last_synced_at = EXCLUDED.last_synced_at
+        """), {"lead_form_id": lead_form_id, "newest": newest, "now": datetime.utcnow()})
 
-        return {stage_idx: count for stage_idx, count in results}
+        self.db.commit()
+        return inserted
+
+    @staticmethod
+    def _lead_filters(lead_form_id: str, start_date: Optional[date],
+                      end_date: Optional[date]) -> Tuple[str, Dict[str, Any]]:
+        """WHERE clause for a form's leads in a UTC date range (end_date inclusive)"""
+        conditions = ["lead_form_id = :lead_form_id"]
+        params: Dict[str, Any] = {"lead_form_id": lead_form_id}
+        if start_date:
+            conditions.append("created_time >= :start_time")
+            params["start_time"] = datetime.combine(start_date, datetime.min.time())
+        if end_date:
+            conditions.append("created_time < :end_time")
+            params["end_time"] = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+        return ' AND '.join(conditions), params
+
+    def get_leads(self, lead_form_id: str, start_date: Optional[date] = None,
+                  end_date: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Stored leads of a form, newest first, flattened like the Graph response
+        ({"id", "created_time", <question name>: <answer>, ...}).
+        Dates are UTC days; end_date is inclusive.
+        """
+        return list(self.iter_leads(lead_form_id, start_date, end_date))
+
+    def iter_leads(self, lead_form_id: str, start_date: Optional[date] = None,
+                   end_date: Optional[date] = None, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Same rows as get_leads, read through a server-side cursor batch_size rows
+        at a time (exports stream any number of leads with flat memory).
+        The session must stay open until the iterator is exhausted.
+        """
+        where, params = self._lead_filters(lead_form_id, start_date, end_date)
+        result = self.db.execute(text(f"""
+            SELECT fb_lead_id, created_time, field_data
+            FROM form_leads
+            WHERE {where}
+            ORDER BY created_time DESC
+        """), params, execution_options={"stream_results": True, "yield_per": batch_size})
+
+        for fb_lead_id, created_time, field_data in result:
+            lead = {"id": fb_lead_id, "created_time": created_time.strftime('%Y-%m-%dT%H:%M:%S+0000')}
+            lead.update(json.loads(field_data or '{}'))
+            yield lead
+
+    def get_lead_field_names(self, lead_form_id: str, start_date: Optional[date] = None,
+                             end_date: Optional[date] = None) -> Optional[List[str]]:
+        """
+        Question names used by the form's leads in the range (CSV header before streaming rows).
+        Returns None when there are no leads in the range.
+        """
+        where, params = self._lead_filters(lead_form_id, start_date, end_date)
+        row = self.db.execute(text(f"""
+            SELECT COUNT(*) AS lead_count,
+                   ARRAY(
+                       SELECT DISTINCT jsonb_object_keys(field_data::jsonb)
+                       FROM form_leads
+                       WHERE {where}
+                   ) AS field_names
+            FROM form_leads
+            WHERE {where}
+        """), params).fetchone()
+
+        if not row or not row.lead_count:
+            return None
+        return sorted(row.field_names or [])
@@ -6,9 +6,10 @@ Uses SQLAlchemy Core for raw SQL queries with proper parameter binding.
 """
 
 from datetime import date
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
+from backend.api.repositories.query_filters import QueryFilters
 
 class MetricsRepository(BaseRepository):
     """Repository for core metrics data access"""
@@ -104,7 +105,6 @@ class MetricsRepository(BaseRepository):
                      THEN SUM(f.video_avg_time_watched * f.video_plays) / SUM(f.video_plays) 
                      ELSE 0 END as video_avg_time_watched
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN dim_campaign c ON f.campaign_id = c.campaign_id
             LEFT JOIN (
                 SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
@@ -112,10 +112,8 @@ class MetricsRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id 
                   AND f.account_id = conv.account_id 
@@ -123,8 +121,7 @@ class MetricsRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {status_filter}
                 {account_filter}
         """)
@@ -185,3 +182,63 @@ class MetricsRepository(BaseRepository):
             'video_p100_watched': 0,
             'video_avg_time_watched': 0.0
         }
+
+    def iter_ad_daily_metrics(
+        self,
+        start_date: date,
+        end_date: date,
+        account_ids: Optional[List[int]] = None,
+        campaign_id: Optional[int] = None,
+        batch_size: int = 5000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Ad-level daily rows (one per date/ad) for bulk exports.
+
+        Read through a server-side cursor batch_size rows at a time, so a year of
+        ad-level data never sits in memory at once. The session must stay open
+        until the iterator is exhausted.
+        """
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .equals('f.campaign_id', 'campaign_id', campaign_id))
+
+        query = text(f"""
+            SELECT
+                d.date,
+                f.account_id,
+                f.campaign_id,
+                c.campaign_name,
+                f.adset_id,
+                s.adset_name,
+                f.ad_id,
+                a.ad_name,
+                SUM(f.spend) as spend,
+                SUM(f.impressions) as impressions,
+                SUM(f.clicks) as clicks,
+                SUM(f.purchases) as purchases,
+                SUM(f.purchase_value) as purchase_value,
+                SUM(f.leads) as leads,
+                SUM(f.add_to_cart) as add_to_cart,
+                SUM(f.video_plays) as video_plays
+            FROM fact_core_metrics f
+            JOIN dim_date d ON f.date_id = d.date_id
+            LEFT JOIN dim_campaign c ON f.campaign_id = c.campaign_id
+            LEFT JOIN dim_adset s ON f.adset_id = s.adset_id
+            LEFT JOIN dim_ad a ON f.ad_id = a.ad_id
+            WHERE {date_id_between('f.date_id')}
+                {filters.sql}
+            GROUP BY d.date, f.account_id, f.campaign_id, c.campaign_name,
+                     f.adset_id, s.adset_name, f.ad_id, a.ad_name
+            ORDER BY d.date, f.account_id, f.ad_id
+        """)
+
+        result = self.db.execute(
+            query, filters.params,
+            execution_options={"stream_results": True, "yield_per": batch_size}
+        )
+        for row in result.mappings():
+            yield {
+                **row,
+                'spend': float(row['spend'] or 0),
+                'purchase_value': float(row['purchase_value'] or 0)
+            }
@@ -0,0 +1,75 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class QueryFilters:
+    """
+    Composable WHERE conditions for repository queries.
+
+    List filters bind a single array parameter (`col = ANY(:param)`) instead of
+    one placeholder per value, so the SQL text only depends on which filters
+    are set - not on how many IDs were passed. Identical statement text lets
+    SQLAlchemy's compiled cache and server-side prepared statements be reused.
+
+    Usage:
+        filters = (QueryFilters(start_date, end_date)
+                   .any_id('f.account_id', 'account_ids', account_ids)
+                   .campaign_status('c.campaign_status', campaign_status)
+                   .search('c.campaign_name', search_query))
+        query = text(f"... WHERE {date_id_between('f.date_id')} {filters.sql} ...")
+        self.db.execute(query, {**filters.params, 'limit': limit})
+    """
+
+    def __init__(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
+        self.conditions: List[str] = []
+        self.params: Dict[str, Any] = {}
+        if start_date is not None:
+            self.params['start_date'] = start_date
+        if end_date is not None:
+            self.params['end_date'] = end_date
+
+    @property
+    def sql(self) -> str:
+        """Conditions as 'AND ...' fragments, to follow an existing WHERE clause"""
+        return ' '.join(f"AND {condition}" for condition in self.conditions)
+
+    def where(self, condition: str, **params) -> 'QueryFilters':
+        """Add a raw condition with its bound parameters"""
+        self.conditions.append(condition)
+        self.params.update(params)
+        return self
+
+    def equals(self, column: str, param: str, value: Any) -> 'QueryFilters':
+        """column = :param (skipped when value is None)"""
+        if value is None:
+            return self
+        return self.where(f"{column} = :{param}", **{param: value})
+
+    def any_of(self, column: str, param: str, values: Optional[Sequence[Any]]) -> 'QueryFilters':
+        """column = ANY(:param) with the values bound as one array (skipped when empty)"""
+        if not values:
+            return self
+        return self.where(f"{column} = ANY(:{param})", **{param: list(values)})
+
+    def any_id(self, column: str, param: str, ids: Optional[Sequence[Any]]) -> 'QueryFilters':
+        """
+        BIGINT id column = ANY(:param) (skipped when empty).
+        IDs may come in as strings (route params); an uncast text[] array would
+        fail with 'operator does not exist: bigint = text', so values are bound
+        as ints and the array is cast explicitly.
+        """
+        if not ids:
+            return self
+        return self.where(f"{column} = ANY(CAST(:{param} AS BIGINT[]))", **{param: [int(i) for i in ids]})
+
+    def campaign_status(self, column: str, statuses: Optional[Sequence[str]]) -> 'QueryFilters':
+        """Status list filter; ['ALL'] means no filter"""
+        if not statuses or list(statuses) == ['ALL']:
+            return self
+        return self.any_of(column, 'campaign_status', statuses)
+
+    def search(self, column: str, search_query: Optional[str]) -> 'QueryFilters':
+        """Case-insensitive substring match"""
+        if not search_query:
+            return self
+        return self.where(f"LOWER({column}) LIKE :search_query", search_query=f"%{search_query.lower()}%")
@@ -1,7 +1,7 @@
 from datetime import date
 from typing import List, Dict, Any, Optional
 from sqlalchemy import text
-from backend.api.repositories.base_repository import BaseRepository
+from backend.api.repositories.base_repository import BaseRepository, date_id_between
 
 class TimeSeriesRepository(BaseRepository):
     """Repository for time series metrics."""
@@ -73,10 +73,8 @@ class TimeSeriesRepository(BaseRepository):
                        SUM(fam.action_value) as action_value
                 FROM fact_action_metrics fam
                 JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                JOIN dim_date d2 ON fam.date_id = d2.date_id
                 WHERE dat.is_conversion = TRUE
-                    AND d2.date >= :start_date
-                    AND d2.date <= :end_date
+                    AND {date_id_between('fam.date_id')}
                 GROUP BY 1, 2, 3, 4, 5, 6
             ) conv ON f.date_id = conv.date_id 
                   AND f.account_id = conv.account_id 
@@ -84,8 +82,7 @@ class TimeSeriesRepository(BaseRepository):
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {campaign_filter}
                 {account_filter}
                 {creative_filter}
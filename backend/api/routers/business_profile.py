@@ -36,29 +36,13 @@ async def _run_analysis(db_session_factory, account_id: int, website_url: Option
     try:
         service = BusinessProfileService(db)
 
-        # Fetch social posts if page_id available
-        fb_posts = []
-        ig_posts = []
-        if page_id and access_token:
-            try:
-                from backend.api.services.ad_mutation_service import AdMutationService
-                mutation_service = AdMutationService(access_token)
-                fb_posts = mutation_service.get_page_posts(page_id, limit=25)
-            except Exception:
-                pass
-            try:
-                from backend.api.services.ad_mutation_service import AdMutationService
-                mutation_service = AdMutationService(access_token)
-                ig_posts = mutation_service.get_instagram_posts(page_id, limit=25)
-            except Exception:
-                pass
-
+        # Website crawl, FB/IG post fetches and both analyses run concurrently
         await service.build_full_profile(
             account_id=account_id,
             website_url=website_url,
             business_description=business_description,
-            fb_posts=fb_posts,
-            ig_posts=ig_posts,
+            page_id=page_id,
+            access_token=access_token,
         )
     finally:
         db.close()
@@ -1,23 +1,23 @@
 """
 Export API router.
 
-This module defines FastAPI endpoints for exporting data to Google Sheets and Excel.
+This module defines FastAPI endpoints for exporting data to Google Sheets and Excel,
+and the export job API (submit, poll, download) for exports too large for a request.
 """
 
 import os
-from datetime import date
 from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Body
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Body, status
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
 
 import logging
 from backend.api.dependencies import get_db, get_current_user
-from backend.api.services.metrics_service import MetricsService
-from backend.api.services.export_service import ExportService
-from backend.api.schemas.requests import GoogleSheetsExportRequest, ExcelExportRequest, DataType
-from backend.api.schemas.responses import GoogleSheetsExportResponse, ExcelExportResponse
+from backend.api.services.export_service import ExportService, XLSX_MEDIA_TYPE, get_export_data
+from backend.api.services.export_job_service import ExportJobService, MEDIA_TYPES
+from backend.api.schemas.requests import GoogleSheetsExportRequest, ExcelExportRequest, ExportJobRequest, ExportJobFormat
+from backend.api.schemas.responses import GoogleSheetsExportResponse, ExportJobResponse
 
 logger = logging.getLogger(__name__)
 
@@ -28,105 +28,6 @@ router = APIRouter(
 )
 
 
-def _get_data_for_export(
-    db: Session,
-    user_id: int,
-    data_type: DataType,
-    start_date: date,
-    end_date: date,
-    filters: Dict[str, Any] = None
-) -> List[Dict[str, Any]]:
-    """
-    Fetch data from database based on data type.
-
-    Args:
-        db: Database session
-        user_id: Current user ID for filtering
-        data_type: Type of data to export
-        start_date: Start date
-        end_date: End date
-        filters: Additional filters
-
-    Returns:
-        List of dictionaries containing the data
-    """
-    service = MetricsService(db, user_id)
-    filters = filters or {}
-
-    if data_type == DataType.CORE_METRICS:
-        # Get overview metrics
-        result = service.get_overview_metrics(
-            start_date=start_date,
-            end_date=end_date,
-            compare_to_previous=False
-        )
-        return [{
-            "metric": "Overall Performance",
-            "spend": result.current_period.spend,
-            "impressions": result.current_period.impressions,
-            "clicks": result.current_period.clicks,
-            "ctr": result.current_period.ctr,
-            "cpc": result.current_period.cpc,
-            "cpm": result.current_period.cpm,
-            "purchases": result.current_period.purchases,
-            "purchase_value": result.current_period.purchase_value,
-            "roas": result.current_period.roas,
-            "cpa": result.current_period.cpa
-        }]
-
-    elif data_type == DataType.CAMPAIGN_BREAKDOWN:
-        # Get campaign breakdown
-        campaigns = service.get_campaign_breakdown(
-            start_date=start_date,
-            end_date=end_date,
-            sort_by=filters.get("sort_by", "spend"),
-            limit=filters.get("limit", 100)
-        )
-        return [campaign.model_dump() for campaign in campaigns]
-
-    elif data_type == DataType.AGE_GENDER:
-        # Get age/gender breakdown
-        breakdown = service.get_age_gender_breakdown(
-            start_date=start_date,
-            end_date=end_date,
-            campaign_id=filters.get("campaign_id")
-        )
-        return [item.model_dump() for item in breakdown]
-
-    elif data_type == DataType.PLACEMENT:
-        # Get placement breakdown
-        breakdown = service.get_placement_breakdown(
-            start_date=start_date,
-            end_date=end_date,
-            campaign_id=filters.get("campaign_id")
-        )
-        return [item.model_dump() for item in breakdown]
-
-    elif data_type == DataType.COUNTRY:
-        # Get country breakdown
-        breakdown = service.get_country_breakdown(
-            start_date=start_date,
-            end_date=end_date,
-            campaign_id=filters.get("campaign_id"),
-            top_n=filters.get("top_n", 10)
-        )
-        return [item.model_dump() for item in breakdown]
-
-    elif data_type == DataType.CREATIVE_METRICS:
-        # Get creative metrics
-        creatives = service.get_creative_metrics(
-            start_date=start_date,
-            end_date=end_date,
-            is_video=filters.get("is_video"),
-            min_spend=filters.get("min_spend", 100),
-            sort_by=filters.get("sort_by", "spend")
-        )
-        return [creative.model_dump() for creative in creatives]
-
-    else:
-        raise ValueError(f"Unknown data type: {data_type}")
-
-
 @router.post(
     "/google-sheets",
     response_model=GoogleSheetsExportResponse,
@@ -148,7 +49,7 @@ def export_to_google_sheets(
     """
     try:
         # Get data
-        data = _get_data_for_export(
+        data = get_export_data(
             db=db,
             user_id=current_user.id,
             data_type=request.data_type,
@@ -225,8 +126,10 @@ def export_to_excel(
     as a downloadable file.
     """
     try:
-        # Get data
-        data = _get_data_for_export(
+        # Aggregated rows (one per campaign, breakdown member or creative), built
+        # in memory by MetricsService; only the workbook is streamed. Row-level
+        # data (ad_daily) goes through export jobs and a server-side cursor.
+        data = get_export_data(
             db=db,
             user_id=current_user.id,
             data_type=request.data_type,
@@ -244,19 +147,18 @@ def export_to_excel(
         # Initialize export service
         export_service = ExportService()
 
-        # Export to Excel (returns BytesIO)
-        excel_file = export_service.export_to_excel(
-            data=data,
-            filename=request.filename,
+        # Export to Excel (generator of file chunks, written row by row)
+        excel_chunks = export_service.stream_excel(
+            rows=data,
             sheet_name=request.sheet_name
         )
 
-        logger.info(f"Successfully exported {len(data)} rows to Excel: {request.filename}")
+        logger.info(f"Streaming {len(data)} rows to Excel: {request.filename}")
 
         # Return as downloadable file
         return StreamingResponse(
-            excel_file,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            excel_chunks,
+            media_type=XLSX_MEDIA_TYPE,
             headers={
                 "Content-Disposition": f'attachment; filename="{request.filename}"'
             }
@@ -297,19 +199,18 @@ def export_to_excel_generic(
         # Initialize export service
         export_service = ExportService()
 
-        # Export to Excel (returns BytesIO)
-        excel_file = export_service.export_to_excel(
-            data=data,
-            filename=filename,
+        # Export to Excel (generator of file chunks, written row by row)
+        excel_chunks = export_service.stream_excel(
+            rows=data,
             sheet_name=sheet_name
         )
 
-        logger.info(f"Successfully exported {len(data)} rows to generic Excel: {filename}")
+        logger.info(f"Streaming {len(data)} rows to generic Excel: {filename}")
 
         # Return as downloadable file
         return StreamingResponse(
-            excel_file,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            excel_chunks,
+            media_type=XLSX_MEDIA_TYPE,
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
             }
@@ -393,3 +294,97 @@ def export_to_google_sheets_generic(
         logger.error(f"❌ Generic Google Sheets Export Failed: {str(e)}")
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+
+@router.post(
+    "/jobs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit a background export job",
+    description="Queues an export (CSV, XLSX, Parquet or Google Sheets) and returns immediately; poll the job for its result"
+)
+def submit_export_job(
+    request: ExportJobRequest = Body(...),
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Submit an export job.
+
+    Use this for large date ranges and row-level data (data_type=ad_daily):
+    the export runs in a background worker and is not bound by the request timeout.
+    """
+    if request.format == ExportJobFormat.GOOGLE_SHEETS and not current_user.google_access_token:
+        raise HTTPException(
+            status_code=403,
+            detail="Google account not connected. Please connect your Google account in settings."
+        )
+
+    try:
+        service = ExportJobService(db)
+        job = service.submit_job(current_user.id, request)
+        return service.to_response(job)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to submit export job: {e}")
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+
+@router.get(
+    "/jobs",
+    response_model=List[ExportJobResponse],
+    summary="List recent export jobs"
+)
+def list_export_jobs(
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """The current user's 20 most recent export jobs, newest first."""
+    service = ExportJobService(db)
+    return [service.to_response(job) for job in service.list_jobs(current_user.id)]
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=ExportJobResponse,
+    summary="Get export job status"
+)
+def get_export_job(
+    job_id: str,
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Poll an export job (status, rows exported so far, download or spreadsheet URL)."""
+    service = ExportJobService(db)
+    job = service.get_job(current_user.id, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return service.to_response(job)
+
+
+@router.get(
+    "/jobs/{job_id}/download",
+    summary="Download an export job artifact"
+)
+def download_export_job(
+    job_id: str,
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Download the file written by a completed export job."""
+    job = ExportJobService(db).get_job(current_user.id, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status == 'expired':
+        raise HTTPException(status_code=410, detail="Export has expired, please run it again")
+    if job.status != 'completed' or not job.file_path:
+        raise HTTPException(status_code=409, detail=f"Export is not ready (status: {job.status})")
+    if not os.path.exists(job.file_path):
+        raise HTTPException(status_code=404, detail="Export file is no longer available")
+
+    return FileResponse(
+        job.file_path,
+        media_type=MEDIA_TYPES[ExportJobFormat(job.format)],
+        filename=job.filename
+    )
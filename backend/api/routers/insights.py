@@ -72,6 +72,8 @@ def get_insights_summary(
     """
     Get summary insights for mini cards on dashboard pages.
     Returns 2-3 quick, actionable insights with caching (5min with filters, 1-hour without).
+    Unfiltered default windows (last 7/30/90 days) for a single account are served
+    from snapshots precomputed after each ETL run.
 
     Supports filtering by campaign name and breakdown analysis.
     User-specific: Only analyzes accounts linked to the current user.
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Query
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Query, Request
 from typing import Dict, Any, Optional
 
 from datetime import date, timedelta
@@ -9,7 +9,7 @@ from backend.api.repositories.campaign_repository import CampaignRepository
 from backend.api.repositories.adset_repository import AdSetRepository
 from backend.api.repositories.ad_repository import AdRepository
 from backend.api.repositories.metrics_repository import MetricsRepository
-from backend.api.schemas.mutations import SmartCampaignRequest, AddCreativeRequest, StatusUpdateRequest, BudgetUpdateRequest, UpdateAdSetTargetingRequest, UpdateAdCreativeRequest, CreateLeadFormRequest, LeadsResponse, LeadRecord, CreateCustomAudienceRequest, CreatePageEngagementAudienceRequest, CreateLookalikeAudienceRequest, FunnelStagesResponse, UpdateFunnelStagesRequest, LeadStagesResponse, UpdateLeadStageRequest
+from backend.api.schemas.mutations import SmartCampaignRequest, AddCreativeRequest, StatusUpdateRequest, BudgetUpdateRequest, BulkStatusUpdateRequest, BulkBudgetUpdateRequest, UpdateAdSetTargetingRequest, UpdateAdCreativeRequest, CreateLeadFormRequest, LeadsResponse, LeadRecord, CreateCustomAudienceRequest, CreatePageEngagementAudienceRequest, CreateLookalikeAudienceRequest, FunnelStagesResponse, UpdateFunnelStagesRequest, LeadStagesResponse, UpdateLeadStageRequest, StartMediaUploadRequest
 from backend.models.user_schema import User
 from backend.api.services.ad_mutation_service import AdMutationService
 
@@ -41,33 +41,20 @@ def get_campaigns_list(
     # Filter by account (handle string "act_123" or "123")
     clean_acc_id = account_id.replace("act_", "")
     
-    # We fetch last 30 days to ensure we get recent campaigns, or just broad.
-    # The breakdown repository requires dates. Let's use a wide range.
+    try:
+        acc_int = int(clean_acc_id)
+    except ValueError:
+        # Facebook account IDs are numeric; anything else has no campaigns
+        return []
+
+    # The breakdown repository requires dates - use a wide range to get recent campaigns
     campaigns = repo.get_campaign_breakdown(
         start_date=date.today() - timedelta(days=90),
         end_date=date.today(),
         campaign_status=['ACTIVE', 'PAUSED'],
         limit=200,
-        account_ids=[clean_acc_id] # Pass as string, repository might expect int?
-        # Repository expects List[int] usually. Let's check repository.
-        # It expects Optional[List[int]]. I need to cast to int if possible or let repository handle it.
-        # Postgres often handles string-to-int. But let's be safe.
+        account_ids=[acc_int]
     )
-    # The repository logic builds `account_id IN (...)`.
-    # Let's clean and try to parse int.
-    try:
-        acc_int = int(clean_acc_id)
-        # Re-call with clean logic
-        campaigns = repo.get_campaign_breakdown(
-            start_date=date.today() - timedelta(days=90),
-            end_date=date.today(),
-            campaign_status=['ACTIVE', 'PAUSED'],
-            limit=200,
-            account_ids=[acc_int]
-        )
-    except ValueError:
-        # If account_id is not integer (unlikely for FB), return empty or try string
-        return []
 
     return [
         {"id": c['campaign_id'], "name": c['campaign_name'], "status": c['campaign_status']} 
@@ -205,6 +192,7 @@ def get_leads(
     account_id: str = Query(None, description="Ad account ID (optional, helps get page token)"),
     start_date: date = Query(None, description="Filter leads from this date (YYYY-MM-DD)"),
     end_date: date = Query(None, description="Filter leads until this date inclusive (YYYY-MM-DD)"),
+    db: Session = Depends(get_db),
     service: AdMutationService = Depends(get_mutation_service),
     user: User = Depends(get_current_user)
 ):
@@ -218,7 +206,8 @@ def get_leads(
         leads = service.get_leads(
             lead_form_id, page_id, account_id,
             start_date=str(start_date) if start_date else None,
-            end_date=str(end_date) if end_date else None
+            end_date=str(end_date) if end_date else None,
+            db=db
         )
         logger.info(f"Found {len(leads)} leads for form {lead_form_id}")
         return LeadsResponse(
@@ -240,59 +229,52 @@ def export_leads_csv(
     account_id: str = Query(None, description="Ad account ID (optional)"),
     start_date: date = Query(None, description="Filter leads from this date (YYYY-MM-DD)"),
     end_date: date = Query(None, description="Filter leads until this date inclusive (YYYY-MM-DD)"),
+    format: str = Query("csv", regex="^(csv|xlsx)$", description="File format: csv or xlsx"),
+    db: Session = Depends(get_db),
     service: AdMutationService = Depends(get_mutation_service),
     user: User = Depends(get_current_user)
 ):
-    """Export leads as CSV file download."""
+    """Export leads as a CSV (or XLSX) file download, streamed from the local leads table."""
     import logging
-    import csv
-    import io
     from fastapi.responses import StreamingResponse
+    from backend.api.dependencies import SessionLocal
+    from backend.api.repositories.lead_funnel_repository import LeadFunnelRepository
+    from backend.api.services.export_service import ExportService, XLSX_MEDIA_TYPE
 
     logger = logging.getLogger(__name__)
 
     try:
-        logger.info(f"User {user.id} exporting leads CSV for form {lead_form_id}")
-        logger.info(f"CSV export date params: start_date={repr(start_date)}, end_date={repr(end_date)}")
-        leads = service.get_leads(
-            lead_form_id, page_id, account_id,
-            start_date=str(start_date) if start_date else None,
-            end_date=str(end_date) if end_date else None
-        )
+        logger.info(f"User {user.id} exporting leads {format.upper()} for form {lead_form_id}")
+        logger.info(f"Leads export date params: start_date={repr(start_date)}, end_date={repr(end_date)}")
+        service.sync_leads(lead_form_id, page_id, db, account_id)
 
-        if not leads:
+        field_names = LeadFunnelRepository(db).get_lead_field_names(lead_form_id, start_date, end_date)
+        if field_names is None:
             raise HTTPException(status_code=404, detail="No leads found for this form")
 
-        # Build CSV in memory with UTF-8 BOM for Excel Hebrew support
-        output = io.StringIO()
-
-        # Get all field names from leads (they may vary)
-        all_fields = set()
-        for lead in leads:
-            all_fields.update(lead.keys())
-
         # Order fields: id, created_time first, then alphabetically
         priority_fields = ['id', 'created_time']
-        other_fields = sorted([f for f in all_fields if f not in priority_fields])
-        fieldnames = priority_fields + other_fields
-
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(leads)
-
-        # Get CSV content and add UTF-8 BOM for Excel compatibility with Hebrew/Arabic
-        csv_content = output.getvalue()
-        # UTF-8 BOM: \ufeff (tells Excel to use UTF-8 encoding)
-        csv_with_bom = '\ufeff' + csv_content
-        # Encode to bytes for proper streaming
-        csv_bytes = csv_with_bom.encode('utf-8')
-
-        logger.info(f"Exported {len(leads)} leads to CSV for form {lead_form_id}")
+        fieldnames = priority_fields + [f for f in field_names if f not in priority_fields]
+
+        def iter_leads():
+            # The request's session is closed once the endpoint returns, before the
+            # body is sent - the server-side cursor needs a session of its own
+            with SessionLocal() as stream_db:
+                yield from LeadFunnelRepository(stream_db).iter_leads(lead_form_id, start_date, end_date)
+
+        export_service = ExportService()
+        if format == "xlsx":
+            chunks = export_service.stream_excel(iter_leads(), headers=fieldnames, sheet_name="Leads")
+            media_type = XLSX_MEDIA_TYPE
+        else:
+            # UTF-8 BOM is added by stream_csv for Excel compatibility with Hebrew/Arabic
+            chunks = export_service.stream_csv(iter_leads(), fieldnames)
+            media_type = "text/csv; charset=utf-8"
 
         return StreamingResponse(
-            iter([csv_bytes]),
-            media_type="text/csv; charset=utf-8",
-            headers={"Content-Disposition": f"attachment; filename=leads_{lead_form_id}.csv"}
+            chunks,
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename=leads_{lead_form_id}.{format}"}
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -497,18 +479,17 @@ def search_interests(
 
 
 @router.post("/upload")
-async def upload_media(
+def upload_media(
     account_id: str = Form(...),
     is_video: bool = Form(False),
     file: UploadFile = File(...),
     service: AdMutationService = Depends(get_mutation_service)
 ):
-    """Upload media (Image/Video) to Facebook Asset Library."""
+    """Upload media (Image/Video) to Facebook Asset Library (files up to the 10MB request limit)."""
     try:
-        content = await file.read()
         return service.upload_media(
             account_id=account_id,
-            file_content=content,
+            file_obj=file.file,
             filename=file.filename,
             is_video=is_video
         )
@@ -516,6 +497,95 @@ async def upload_media(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/uploads", status_code=status.HTTP_201_CREATED)
+def start_media_upload(
+    request: StartMediaUploadRequest,
+    service: AdMutationService = Depends(get_mutation_service),
+    user: User = Depends(get_current_user)
+):
+    """
+    Start a chunked upload. PUT the file to /uploads/{upload_id}?offset=N in chunks of
+    at most chunk_size bytes; the Graph upload runs in the background as chunks arrive
+    (images once the whole file is in).
+    """
+    from backend.config.base_config import settings
+    from backend.utils.media_upload import media_uploads, UploadLimitExceeded
+
+    if request.file_size > settings.MEDIA_UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size is {settings.MEDIA_UPLOAD_MAX_BYTES // (1024 ** 2)}MB."
+        )
+
+    try:
+        upload = media_uploads.create(user.id, request.account_id, request.filename, request.file_size, request.is_video)
+    except UploadLimitExceeded as e:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e))
+    media_uploads.run(upload, service.transfer_media_upload)
+    return upload.to_dict()
+
+
+@router.put("/uploads/{upload_id}")
+async def upload_media_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0, description="Byte offset of this chunk (must equal bytes_received)"),
+    user: User = Depends(get_current_user)
+):
+    """Append one chunk (raw request body) to a chunked upload, streamed straight to disk."""
+    from starlette.concurrency import run_in_threadpool
+    from backend.config.base_config import settings
+    from backend.utils.media_upload import media_uploads
+
+    upload = media_uploads.get(upload_id, user.id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if upload.status == 'failed':
+        raise HTTPException(status_code=409, detail=f"Upload failed: {upload.error}")
+    if upload.fully_received:
+        return upload.to_dict()
+    if not upload.write_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="Another chunk of this upload is in progress")
+
+    try:
+        if offset != upload.bytes_received:
+            raise HTTPException(status_code=409, detail=f"Expected offset {upload.bytes_received}")
+
+        max_bytes = min(settings.MEDIA_UPLOAD_CHUNK_BYTES, upload.file_size - offset)
+        written = 0
+        # Bytes past bytes_received only count once the whole chunk is on disk;
+        # an interrupted chunk is simply sent again from the same offset
+        with open(upload.path, 'r+b') as spool:
+            spool.seek(offset)
+            async for piece in request.stream():
+                if written + len(piece) > max_bytes:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Chunk larger than {max_bytes} bytes"
+                    )
+                await run_in_threadpool(spool.write, piece)
+                written += len(piece)
+        media_uploads.add_chunk(upload, written)
+    finally:
+        upload.write_lock.release()
+
+    return upload.to_dict()
+
+
+@router.get("/uploads/{upload_id}")
+def get_media_upload(
+    upload_id: str,
+    user: User = Depends(get_current_user)
+):
+    """Poll a chunked upload: bytes received from the client, bytes accepted by Facebook, result."""
+    from backend.utils.media_upload import media_uploads
+
+    upload = media_uploads.get(upload_id, user.id)
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return upload.to_dict()
+
+
 # --- Status & Budget Update Endpoints ---
 
 @router.patch("/campaigns/{campaign_id}/status")
@@ -626,6 +696,44 @@ def update_campaign_budget(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/bulk/status")
+def bulk_update_status(
+    request: BulkStatusUpdateRequest,
+    db: Session = Depends(get_db),
+    service: AdMutationService = Depends(get_mutation_service),
+    user: User = Depends(get_current_user)
+):
+    """Pause or activate several campaigns / ad sets / ads (Graph batch requests, per-ID results)."""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        logger.info(f"User {user.id} bulk updating {len(request.ids)} {request.entity_type}(s) status to {request.status}")
+        return service.bulk_update_status(request.entity_type, request.ids, request.status, db=db)
+    except Exception as e:
+        logger.error(f"User {user.id} failed to bulk update {request.entity_type} status: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bulk/budgets")
+def bulk_update_budgets(
+    request: BulkBudgetUpdateRequest,
+    service: AdMutationService = Depends(get_mutation_service),
+    user: User = Depends(get_current_user)
+):
+    """Update daily budgets of several campaigns (CBO) or ad sets (ABO), in cents."""
+    import logging
+    logger = logging.getLogger(__name__)
+
+    try:
+        logger.info(f"User {user.id} bulk updating {len(request.budgets)} {request.entity_type} budget(s)")
+        budgets = {item.id: item.daily_budget_cents for item in request.budgets}
+        return service.bulk_update_budgets(request.entity_type, budgets)
+    except Exception as e:
+        logger.error(f"User {user.id} failed to bulk update {request.entity_type} budgets: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/budgets/campaigns")
 def get_campaign_budgets(
     campaign_ids: List[str],
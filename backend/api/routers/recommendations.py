@@ -25,6 +25,7 @@ def verify_account_access(account_id: str, user_id: int, db: Session) -> bool:
 @router.get("/{account_id}/recommendations/audience")
 async def get_audience_recommendations(
     account_id: str,
+    locale: str = Query("en", description="Locale for recommendation language (e.g., en, he, fr)"),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -36,7 +37,7 @@ async def get_audience_recommendations(
         raise HTTPException(status_code=403, detail="Access denied to this account")
 
     service = RecommendationService(db)
-    recommendations = service.get_audience_recommendations(int(account_id))
+    recommendations = service.get_audience_recommendations(int(account_id), locale=locale)
 
     if "error" in recommendations:
         raise HTTPException(status_code=400, detail=recommendations["error"])
@@ -48,6 +49,7 @@ async def get_audience_recommendations(
 async def get_ad_copy_recommendations(
     account_id: str,
     objective: Optional[str] = Query("SALES", description="Campaign objective"),
+    locale: str = Query("en", description="Locale for recommendation language (e.g., en, he, fr)"),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -59,7 +61,7 @@ async def get_ad_copy_recommendations(
         raise HTTPException(status_code=403, detail="Access denied to this account")
 
     service = RecommendationService(db)
-    recommendations = service.get_ad_copy_recommendations(int(account_id), objective)
+    recommendations = service.get_ad_copy_recommendations(int(account_id), objective, locale=locale)
 
     if "error" in recommendations:
         raise HTTPException(status_code=400, detail=recommendations["error"])
@@ -70,6 +72,7 @@ async def get_ad_copy_recommendations(
 @router.get("/{account_id}/recommendations/creative-direction")
 async def get_creative_direction(
     account_id: str,
+    locale: str = Query("en", description="Locale for recommendation language (e.g., en, he, fr)"),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -81,7 +84,7 @@ async def get_creative_direction(
         raise HTTPException(status_code=403, detail="Access denied to this account")
 
     service = RecommendationService(db)
-    recommendations = service.get_creative_direction(int(account_id))
+    recommendations = service.get_creative_direction(int(account_id), locale=locale)
 
     if "error" in recommendations:
         raise HTTPException(status_code=400, detail=recommendations["error"])
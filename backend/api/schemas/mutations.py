@@ -107,6 +107,33 @@ class BudgetUpdateRequest(BaseModel):
     daily_budget_cents: int = Field(..., ge=100, description="Daily budget in local currency cents (frontend validates ~$5 USD equivalent)")
 
 
+class BulkStatusUpdateRequest(BaseModel):
+    """Request body for pausing/activating several campaigns, ad sets or ads at once"""
+    entity_type: Literal["campaign", "adset", "ad"] = Field(..., description="Type of the selected objects")
+    ids: List[str] = Field(..., min_length=1, max_length=500, description="Facebook object IDs")
+    status: Literal["ACTIVE", "PAUSED"] = Field(..., description="New status: ACTIVE or PAUSED")
+
+
+class BulkBudgetItem(BaseModel):
+    """New daily budget for one campaign or ad set"""
+    id: str = Field(..., description="Facebook campaign or ad set ID")
+    daily_budget_cents: int = Field(..., ge=100, description="Daily budget in local currency cents (frontend validates ~$5 USD equivalent)")
+
+
+class BulkBudgetUpdateRequest(BaseModel):
+    """Request body for editing several budgets at once"""
+    entity_type: Literal["campaign", "adset"] = Field(..., description="campaign (CBO) or adset (ABO)")
+    budgets: List[BulkBudgetItem] = Field(..., min_length=1, max_length=500)
+
+
+class StartMediaUploadRequest(BaseModel):
+    """Request body for starting a chunked media upload"""
+    account_id: str = Field(..., description="Ad account ID the media is uploaded to")
+    filename: str = Field(..., min_length=1, max_length=255)
+    file_size: int = Field(..., gt=0, description="Total file size in bytes")
+    is_video: bool = Field(False, description="Video (resumable Graph upload) or image")
+
+
 # --- Edit Schemas ---
 
 class UpdateAdSetTargetingRequest(BaseModel):
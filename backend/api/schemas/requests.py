@@ -103,6 +103,7 @@ class DataType(str, Enum):
     PLACEMENT = "placement"
     COUNTRY = "country"
     CREATIVE_METRICS = "creative_metrics"
+    AD_DAILY = "ad_daily"  # Ad-level daily rows - export jobs only
 
 
 class ExportFormat(str, Enum):
@@ -111,6 +112,14 @@ class ExportFormat(str, Enum):
     EXCEL = "excel"
 
 
+class ExportJobFormat(str, Enum):
+    """Output formats for background export jobs"""
+    CSV = "csv"
+    XLSX = "xlsx"
+    PARQUET = "parquet"
+    GOOGLE_SHEETS = "google_sheets"
+
+
 class GoogleSheetsExportRequest(BaseModel):
     """Request parameters for Google Sheets export"""
     data_type: DataType = Field(..., description="Type of data to export")
@@ -132,6 +141,19 @@ class ExcelExportRequest(BaseModel):
     filters: Optional[dict] = Field(None, description="Additional filters (campaign_id, status, etc.)")
 
 
+class ExportJobRequest(BaseModel):
+    """Request parameters for a background export job (large date ranges / row-level data)"""
+    data_type: DataType = Field(..., description="Type of data to export")
+    format: ExportJobFormat = Field(ExportJobFormat.CSV, description="Artifact format, or google_sheets to push to a sheet")
+    start_date: date = Field(..., description="Start date (YYYY-MM-DD)")
+    end_date: date = Field(..., description="End date (YYYY-MM-DD)")
+    filename: Optional[str] = Field(None, description="Download filename (defaults to <data_type>_<start>_<end>.<ext>)")
+    spreadsheet_id: Optional[str] = Field(None, description="Existing spreadsheet ID for google_sheets (creates new if not provided)")
+    sheet_name: str = Field("Facebook Ads Data", description="Sheet tab name (xlsx / google_sheets)")
+    title: str = Field("Facebook Ads Analytics Export", description="Spreadsheet title (for new spreadsheets)")
+    filters: Optional[dict] = Field(None, description="Additional filters (campaign_id, account_ids, etc.)")
+
+
 # ============================================================================
 # USER PROFILE QUIZ SCHEMAS
 # ============================================================================
@@ -5,7 +5,7 @@ These models define the structure of API responses with automatic validation
 and documentation.
 """
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -388,6 +388,21 @@ class ExcelExportResponse(BaseModel):
     download_url: Optional[str] = Field(None, description="Download URL if applicable")
 
 
+class ExportJobResponse(BaseModel):
+    """State of a background export job"""
+    job_id: str = Field(..., description="Export job ID")
+    status: str = Field(..., description="pending, running, completed, failed or expired")
+    data_type: str = Field(..., description="Type of data exported")
+    format: str = Field(..., description="csv, xlsx, parquet or google_sheets")
+    rows_exported: int = Field(0, description="Rows written so far")
+    download_url: Optional[str] = Field(None, description="Artifact download URL (file formats, once completed)")
+    spreadsheet_url: Optional[str] = Field(None, description="Google Sheets URL (google_sheets, once completed)")
+    error: Optional[str] = Field(None, description="Failure reason")
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = Field(None, description="When the artifact is deleted")
+
+
 class ErrorResponse(BaseModel):
     """Standard error response"""
     detail: str
@@ -1,24 +1,41 @@
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Callable, Dict, Any, List, Optional
 from contextlib import contextmanager
-from facebook_business.api import FacebookAdsApi
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.adobjects.campaign import Campaign
 from facebook_business.adobjects.adset import AdSet
 from facebook_business.adobjects.ad import Ad
 from facebook_business.adobjects.adcreative import AdCreative
 from facebook_business.adobjects.adimage import AdImage
+from facebook_business.exceptions import FacebookRequestError
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
 
 from backend.api.schemas.mutations import SmartCampaignRequest
 from backend.config.base_config import settings
+from backend.utils.graph_client import get_graph_client
+from backend.utils.graph_batch import run_graph_batch, batch_get, batch_post
+from backend.utils.page_token_cache import page_token_cache, user_cache_key, is_token_error
+from backend.utils.media_upload import MediaUpload
+from backend.utils.targeting_search_cache import targeting_search_cache
+from backend.utils.dimension_cache import forget_dimension_members
+from backend.utils.account_catalog_cache import account_catalog_cache, PIXELS, PIXEL_FIELDS, CUSTOM_AUDIENCES
 
 logger = logging.getLogger(__name__)
 
+# entity type -> (local dimension table, status column, id column)
+_STATUS_TABLES = {
+    "campaign": ("dim_campaign", "campaign_status", "campaign_id"),
+    "adset": ("dim_adset", "adset_status", "adset_id"),
+    "ad": ("dim_ad", "ad_status", "ad_id"),
+}
+
+# Graph error subcode asking to resend the same video chunk
+VIDEO_CHUNK_RETRY_SUBCODE = 1363037
+
 class AdMutationService:
     def __init__(self, access_token: str):
         self.access_token = access_token
@@ -27,16 +44,19 @@ class AdMutationService:
         self._init_api()
 
     def _init_api(self):
-        FacebookAdsApi.init(self.app_id, self.app_secret, self.access_token)
+        # Pooled per-token client; SDK objects get it explicitly (no global default API)
+        self.graph = get_graph_client(self.access_token)
+        self.api = self.graph.api
 
     @contextmanager
-    def _temp_file_for_upload(self, file_content: bytes, filename: str):
-        """Context manager ensuring temp file cleanup even if upload fails"""
+    def _temp_file_for_upload(self, file_obj: BinaryIO, filename: str):
+        """Context manager copying an upload stream to a temp file in chunks, with cleanup even if upload fails"""
         import tempfile
+        import shutil
         import os
 
         with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(filename)[1]) as tmp:
-            tmp.write(file_content)
+            shutil.copyfileobj(file_obj, tmp, 1024 * 1024)
             tmp.flush()
             tmp_path = tmp.name
 
@@ -49,58 +69,74 @@ class AdMutationService:
     def _get_page_access_token(self, page_id: str, account_id: str = None) -> str:
         """Get Page Access Token for a specific page.
 
-        Tries multiple methods:
-        1. Ad account's promoted pages (if account_id provided)
-        2. /me/accounts (pages user manages directly)
+        Served from page_token_cache when possible. Otherwise tries:
+        1. /me/accounts (pages user manages directly) - caches every listed page
+        2. Ad account's promoted pages (if account_id provided)
         3. Direct /{page_id}?fields=access_token request
         """
-        api = FacebookAdsApi.get_default_api()
-        if not api:
-            raise ValueError("Facebook API not initialized.")
+        user_key = user_cache_key(self.access_token)
+        cached = page_token_cache.get(user_key, page_id)
+        if cached:
+            return cached
+
+        api = self.api
 
-        # Method 1: Try ad account's promoted pages (pages connected to the ad account)
+        # Method 1: /me/accounts (pages user manages) - skipped if listed within the TTL
+        if not page_token_cache.recently_listed(user_key):
+            try:
+                tokens = {}
+                response = api.call('GET', ('me', 'accounts'), {'fields': 'id,name,access_token', 'limit': 100})
+                data = response.json()
+                while True:
+                    for page in data.get('data', []):
+                        tokens[page['id']] = page.get('access_token')
+                    next_url = data.get('paging', {}).get('next')
+                    if not next_url:
+                        break
+                    data = self.graph.http.get(next_url, timeout=15).json()
+
+                page_token_cache.put_many(user_key, tokens, listed=True)
+                if tokens.get(page_id):
+                    logger.info(f"Found page {page_id} in /me/accounts ({len(tokens)} page token(s) cached)")
+                    return tokens[page_id]
+                logger.info(f"Page {page_id} not in /me/accounts. Available: {list(tokens)}")
+            except Exception as e:
+                logger.warning(f"Failed to fetch /me/accounts: {e}")
+
+        # Method 2: Try ad account's promoted pages (pages connected to the ad account)
         if account_id:
             try:
                 clean_id = account_id.replace("act_", "")
-                account = AdAccount(f"act_{clean_id}")
+                account = AdAccount(f"act_{clean_id}", api=self.api)
                 pages = account.get_promote_pages(fields=['id', 'name', 'access_token'])
-                for page in pages:
-                    if page.get('id') == page_id:
-                        token = page.get('access_token')
-                        if token:
-                            logger.info(f"Found page {page_id} in ad account {account_id} promote_pages")
-                            return token
-                logger.info(f"Page {page_id} found in promote_pages but no access_token returned")
+                tokens = {page.get('id'): page.get('access_token') for page in pages}
+                page_token_cache.put_many(user_key, tokens)
+                if tokens.get(page_id):
+                    logger.info(f"Found page {page_id} in ad account {account_id} promote_pages")
+                    return tokens[page_id]
+                logger.info(f"Page {page_id} not returned with an access_token by promote_pages")
             except Exception as e:
                 logger.warning(f"Failed to fetch promote_pages from ad account: {e}")
 
-        # Method 2: Try /me/accounts (pages user manages)
-        try:
-            response = api.call('GET', ('me', 'accounts'), {'fields': 'id,name,access_token'})
-            data = response.json()
-
-            for page in data.get('data', []):
-                if page['id'] == page_id:
-                    logger.info(f"Found page {page_id} in /me/accounts")
-                    return page['access_token']
-
-            available_pages = [(p.get('id'), p.get('name')) for p in data.get('data', [])]
-            logger.info(f"Page {page_id} not in /me/accounts. Available: {available_pages}")
-        except Exception as e:
-            logger.warning(f"Failed to fetch /me/accounts: {e}")
-
         # Method 3: Try direct page token request
         try:
             response = api.call('GET', (page_id,), {'fields': 'access_token'})
             data = response.json()
             if 'access_token' in data:
                 logger.info(f"Got page token via direct /{page_id} request")
+                page_token_cache.put_many(user_key, {page_id: data['access_token']})
                 return data['access_token']
         except Exception as e:
             logger.warning(f"Failed to get token via /{page_id}: {e}")
 
         raise ValueError(f"No access to page {page_id}. Make sure you have admin access to this Facebook Page.")
 
+    def _check_page_token_error(self, page_id: str, error_info: Dict[str, Any]):
+        """Drop the cached page token when Graph rejected it, so the next call fetches a fresh one"""
+        if is_token_error(error_info):
+            logger.info(f"Page token for {page_id} rejected ({error_info.get('code')}), invalidating cache")
+            page_token_cache.invalidate(user_cache_key(self.access_token), page_id)
+
     def _build_creative_params(self, page_id: str, creative, creative_name: str = None) -> Dict[str, Any]:
         """
         Shared logic for building AdCreative params.
@@ -248,7 +284,6 @@ class AdMutationService:
         Returns:
             Dict with form id and name
         """
-        import requests
 
         try:
             # Get page-specific access token
@@ -326,11 +361,12 @@ class AdMutationService:
             logger.info(f"Creating lead form with payload keys: {list(payload.keys())}")
             logger.info(f"Questions JSON being sent to Facebook: {payload.get('questions')}")
             logger.info(f"Full fb_questions list: {fb_questions}")
-            response = requests.post(url, data=payload, timeout=15)
+            response = self.graph.http.post(url, data=payload, timeout=15)
             data = response.json()
             logger.info(f"Lead form creation response: {data}")
 
             if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
                 error_info = data['error']
                 # Prefer user-friendly message from Facebook if available
                 error_message = error_info.get('error_user_msg') or error_info.get('message', 'Unknown error')
@@ -360,7 +396,6 @@ class AdMutationService:
         Returns:
             Dict with 'connected' boolean and 'whatsapp_business_account_id' if connected
         """
-        import requests
 
         try:
             url = f"https://graph.facebook.com/v24.0/{page_id}"
@@ -368,7 +403,7 @@ class AdMutationService:
                 'access_token': self.access_token,
                 'fields': 'whatsapp_business_account'
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             if 'error' in data:
@@ -389,7 +424,6 @@ class AdMutationService:
 
     def get_lead_forms(self, page_id: str, account_id: str = None) -> List[Dict[str, Any]]:
         """Fetch available lead gen forms for a page using Page Access Token"""
-        import requests
 
         try:
             # Get page-specific access token (required for leadgen_forms endpoint)
@@ -401,11 +435,12 @@ class AdMutationService:
                 'access_token': page_token,
                 'fields': 'id,name,status,created_time'
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             # Check for Facebook API error in response
             if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
                 error_info = data['error']
                 error_message = error_info.get('message', 'Unknown error')
                 raise ValueError(f"Facebook API error: {error_message}")
@@ -439,7 +474,6 @@ class AdMutationService:
         Returns:
             Dict with form details including questions, privacy policy, context card, thank you page
         """
-        import requests
 
         # Validate inputs
         if not form_id or not form_id.strip():
@@ -457,11 +491,12 @@ class AdMutationService:
                 'access_token': page_token,
                 'fields': 'id,name,status,questions,privacy_policy_url,context_card,thank_you_page,created_time'
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             # Check for Facebook API error
             if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
                 error_info = data['error']
                 error_message = error_info.get('message', 'Unknown error')
                 raise ValueError(f"Facebook API error: {error_message}")
@@ -534,106 +569,132 @@ class AdMutationService:
             logger.error(f"Failed to fetch lead form details for form {form_id}: {str(e)}", exc_info=True)
             raise ValueError(f"Unable to fetch lead form details: {str(e)}")
 
+    def _fetch_leads_from_graph(self, lead_form_id: str, page_id: str, account_id: str = None,
+                                since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Page through a form's leads, filtered server-side on time_created (UTC datetimes, since inclusive, until exclusive).
+
+        Returns:
+            [{"id", "created_time" (UTC datetime), "created_time_raw", "fields": {name: first value}}]
+        """
+        from datetime import timezone
+
+        # Get page-specific access token (required for leads endpoint)
+        page_token = self._get_page_access_token(page_id, account_id)
+
+        filtering = []
+        if since:
+            # GREATER_THAN is strict: compare against the previous second to include `since` itself
+            filtering.append({'field': 'time_created', 'operator': 'GREATER_THAN',
+                              'value': int(since.replace(tzinfo=timezone.utc).timestamp()) - 1})
+        if until:
+            filtering.append({'field': 'time_created', 'operator': 'LESS_THAN',
+                              'value': int(until.replace(tzinfo=timezone.utc).timestamp())})
+
+        url = f"https://graph.facebook.com/v24.0/{lead_form_id}/leads"
+        params = {
+            'access_token': page_token,
+            'fields': 'id,created_time,field_data',
+            'limit': 500
+        }
+        if filtering:
+            params['filtering'] = json.dumps(filtering)
+
+        leads = []
+        # Handle pagination
+        while url:
+            response = self.graph.http.get(url, params=params, timeout=15)
+            data = response.json()
+
+            if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
+                error_info = data['error']
+                error_message = error_info.get('message', 'Unknown error')
+                raise ValueError(f"Facebook API error: {error_message}")
+
+            for lead in data.get('data', []):
+                created_time = lead.get('created_time') or ''
+                try:
+                    # Facebook's ISO format, e.g. "2025-01-21T10:00:00+0000"
+                    created_dt = datetime.strptime(created_time, '%Y-%m-%dT%H:%M:%S%z').astimezone(timezone.utc).replace(tzinfo=None)
+                except ValueError:
+                    logger.warning(f"Could not parse lead date '{created_time}' for lead {lead.get('id')}")
+                    created_dt = datetime.utcnow()
+
+                # Flatten field_data array to key-value pairs
+                fields = {}
+                for field in lead.get('field_data', []):
+                    field_values = field.get('values', [])
+                    fields[field.get('name', '')] = field_values[0] if field_values else ''
+
+                leads.append({'id': lead['id'], 'created_time': created_dt, 'created_time_raw': created_time, 'fields': fields})
+
+            # Check for next page
+            paging = data.get('paging', {})
+            url = paging.get('next')
+            params = {}  # Next URL already includes params
+
+        return leads
+
+    def sync_leads(self, lead_form_id: str, page_id: str, db: Session, account_id: str = None) -> int:
+        """
+        Pull leads created since the form's stored cursor into form_leads.
+        The first sync downloads the form's full history; later ones only new leads.
+        Returns the number of new leads stored.
+        """
+        from backend.api.repositories.lead_funnel_repository import LeadFunnelRepository
+
+        repo = LeadFunnelRepository(db)
+        cursor = repo.get_lead_sync_cursor(lead_form_id)
+        leads = self._fetch_leads_from_graph(lead_form_id, page_id, account_id, since=cursor)
+
+        clean_account_id = int(account_id.replace("act_", "")) if account_id else None
+        inserted = repo.save_leads(lead_form_id, clean_account_id, leads)
+        logger.info(f"Synced leads for form {lead_form_id}: {inserted} new (cursor was {cursor})")
+        return inserted
+
     def get_leads(self, lead_form_id: str, page_id: str, account_id: str = None,
-                   start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
+                   start_date: str = None, end_date: str = None, db: Optional[Session] = None) -> List[Dict[str, Any]]:
         """Fetch leads submitted to a lead form.
 
+        With a db session the form is synced incrementally into form_leads and the
+        leads are read (and date filtered) locally. Without one, leads are read from
+        Graph with the date range applied server-side.
+
         Args:
             lead_form_id: The lead form ID to fetch leads from
             page_id: Facebook Page ID that owns the form
             account_id: Optional ad account ID for getting page token
             start_date: Optional start date filter (YYYY-MM-DD). Leads on or after this date.
             end_date: Optional end date filter (YYYY-MM-DD). Leads on or before this date (inclusive, includes today).
+            db: Optional database session for the local leads table
 
         Returns:
             List of leads with id, created_time, and field_data flattened to key-value pairs
         """
-        import requests
-        from datetime import datetime, timedelta
-
-        try:
-            # Get page-specific access token (required for leads endpoint)
-            page_token = self._get_page_access_token(page_id, account_id)
+        from datetime import timedelta
 
-            # Fetch leads from the form
-            url = f"https://graph.facebook.com/v24.0/{lead_form_id}/leads"
-            params = {
-                'access_token': page_token,
-                'fields': 'id,created_time,field_data'
-            }
+        start_dt = datetime.strptime(start_date, '%Y-%m-%d') if start_date and start_date != 'None' else None
+        # End date is inclusive - include the entire day (until end of day)
+        end_dt = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1) if end_date and end_date != 'None' else None
 
-            # Parse date filters for comparison
-            start_dt = None
-            end_dt = None
-            logger.info(f"get_leads called with start_date={repr(start_date)}, end_date={repr(end_date)}")
-            if start_date and start_date != 'None':
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                logger.info(f"Parsed start_dt: {start_dt} (date: {start_dt.date()})")
-            if end_date and end_date != 'None':
-                # End date is inclusive - include the entire day (until end of day)
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
-                logger.info(f"Parsed end_dt: {end_dt} (date: {end_dt.date()})")
-
-            all_leads = []
-
-            # Handle pagination
-            while url:
-                response = requests.get(url, params=params, timeout=15)
-                data = response.json()
-
-                if 'error' in data:
-                    error_info = data['error']
-                    error_message = error_info.get('message', 'Unknown error')
-                    raise ValueError(f"Facebook API error: {error_message}")
-
-                # Process leads and flatten field_data
-                for lead in data.get('data', []):
-                    # Filter by date if specified
-                    created_time = lead.get('created_time')
-                    logger.debug(f"Processing lead {lead.get('id')}, created_time={created_time}")
-
-                    # Only filter if we have date filters AND the lead has a created_time
-                    if (start_dt or end_dt) and created_time:
-                        try:
-                            # Parse Facebook's ISO format - handle various formats
-                            # Examples: "2025-01-21T10:00:00+0000", "2025-01-21T10:00:00+00:00"
-                            # First, try to extract just the date part (YYYY-MM-DD)
-                            lead_date_str = created_time[:10]  # Get "YYYY-MM-DD" part
-                            lead_date = datetime.strptime(lead_date_str, '%Y-%m-%d').date()
-
-                            logger.debug(f"Lead {lead['id']}: parsed date {lead_date} from {created_time}")
-
-                            if start_dt and lead_date < start_dt.date():
-                                logger.info(f"Skipping lead {lead['id']} - {lead_date} is before {start_dt.date()}")
-                                continue  # Skip leads before start_date
-                            if end_dt and lead_date >= end_dt.date():
-                                logger.info(f"Skipping lead {lead['id']} - {lead_date} is on/after {end_dt.date()}")
-                                continue  # Skip leads after end_date (end_dt is already +1 day)
-
-                            logger.debug(f"Including lead {lead['id']} - {lead_date} is within range")
-                        except (ValueError, AttributeError, IndexError) as e:
-                            # If date parsing fails, include the lead (don't filter it out)
-                            logger.warning(f"Could not parse lead date '{created_time}': {e}")
-
-                    lead_record = {
-                        'id': lead['id'],
-                        'created_time': created_time,
-                    }
-                    # Flatten field_data array to key-value pairs
-                    for field in lead.get('field_data', []):
-                        field_name = field.get('name', '')
-                        field_values = field.get('values', [])
-                        lead_record[field_name] = field_values[0] if field_values else ''
-
-                    all_leads.append(lead_record)
-
-                # Check for next page
-                paging = data.get('paging', {})
-                url = paging.get('next')
-                params = {}  # Next URL already includes params
+        try:
+            if db is not None:
+                from backend.api.repositories.lead_funnel_repository import LeadFunnelRepository
+
+                self.sync_leads(lead_form_id, page_id, db, account_id)
+                leads = LeadFunnelRepository(db).get_leads(
+                    lead_form_id,
+                    start_date=start_dt.date() if start_dt else None,
+                    end_date=(end_dt - timedelta(days=1)).date() if end_dt else None
+                )
+            else:
+                leads = [
+                    {'id': lead['id'], 'created_time': lead['created_time_raw'], **lead['fields']}
+                    for lead in self._fetch_leads_from_graph(lead_form_id, page_id, account_id, since=start_dt, until=end_dt)
+                ]
 
-            logger.info(f"Returning {len(all_leads)} leads after date filtering (start_dt={start_dt}, end_dt={end_dt})")
-            return all_leads
+            logger.info(f"Returning {len(leads)} leads for form {lead_form_id} (start_dt={start_dt}, end_dt={end_dt})")
+            return leads
 
         except ValueError:
             raise
@@ -642,121 +703,97 @@ class AdMutationService:
             raise ValueError(f"Unable to fetch leads. Details: {str(e)}")
 
     def get_pixels(self, account_id: str) -> List[Dict[str, Any]]:
-        """Fetch Facebook Pixels for an ad account"""
+        """Fetch Facebook Pixels for an ad account (cached per account)"""
         try:
-            # Handle both "act_123" and "123" formats
-            clean_id = account_id.replace("act_", "")
-            account = AdAccount(f"act_{clean_id}")
-            # Fetch pixels using the SDK
-            pixels = account.get_ads_pixels(fields=['id', 'name', 'code'])
-
-            results = []
-            for pixel in pixels:
-                results.append({
+            pixels = account_catalog_cache.get(
+                user_cache_key(self.access_token), PIXELS, account_id,
+                lambda: self._fetch_pixel_catalog(account_id)
+            )
+            return [
+                {
                     'id': pixel.get('id'),
                     'name': pixel.get('name'),
                     'code': pixel.get('code')  # Pixel code for reference
-                })
-            return results
+                }
+                for pixel in pixels
+            ]
         except Exception as e:
             logger.error(f"Failed to fetch pixels for account {account_id}: {e}")
             raise e
 
+    def _fetch_pixel_catalog(self, account_id: str) -> List[Dict[str, Any]]:
+        # Handle both "act_123" and "123" formats
+        clean_id = account_id.replace("act_", "")
+        account = AdAccount(f"act_{clean_id}", api=self.api)
+        return [pixel.export_all_data() for pixel in account.get_ads_pixels(fields=PIXEL_FIELDS)]
+
     def get_custom_audiences(self, account_id: str) -> List[Dict[str, Any]]:
-        """Fetch Custom Audiences (lookalikes, saved audiences) for an ad account"""
-        import requests
+        """Fetch Custom Audiences (lookalikes, saved audiences) for an ad account (cached per account)"""
 
         try:
-            # Handle both "act_123" and "123" formats
-            clean_id = account_id.replace("act_", "")
-
-            # Use direct API call instead of SDK (more reliable)
-            url = f"https://graph.facebook.com/v24.0/act_{clean_id}/customaudiences"
-            params = {
-                'access_token': self.access_token,
-                'fields': 'id,name,subtype,approximate_count_lower_bound,approximate_count_upper_bound'
-            }
-            logger.info(f"Fetching custom audiences from: {url}")
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
-            logger.info(f"Custom audiences API response: {data}")
-
-            if 'error' in data:
-                error_info = data['error']
-                logger.warning(f"Facebook API error fetching custom audiences: {error_info.get('message')}")
-                return []  # Return empty list instead of failing
-
-            results = []
-            for audience in data.get('data', []):
-                subtype = audience.get('subtype', '')
-                # Use average of lower and upper bounds for approximate count
-                lower = audience.get('approximate_count_lower_bound', 0) or 0
-                upper = audience.get('approximate_count_upper_bound', 0) or 0
-                approx_count = (lower + upper) // 2 if (lower or upper) else None
-
-                results.append({
-                    'id': audience.get('id'),
-                    'name': audience.get('name'),
-                    'subtype': subtype,  # LOOKALIKE, CUSTOM, etc.
-                    'approximate_count': approx_count,
-                    'type_label': 'Lookalike' if subtype == 'LOOKALIKE' else 'Custom Audience'
-                })
-
+            results = account_catalog_cache.get(
+                user_cache_key(self.access_token), CUSTOM_AUDIENCES, account_id,
+                lambda: self._fetch_custom_audiences(account_id)
+            )
             logger.info(f"Found {len(results)} custom audiences for account {account_id}")
             return results
+        except ValueError as e:
+            logger.warning(f"Facebook API error fetching custom audiences: {e}")
+            return []  # Return empty list instead of failing
         except Exception as e:
             logger.error(f"Failed to fetch custom audiences for account {account_id}: {e}")
             return []  # Return empty list instead of crashing
 
+    def _fetch_custom_audiences(self, account_id: str) -> List[Dict[str, Any]]:
+        # Handle both "act_123" and "123" formats
+        clean_id = account_id.replace("act_", "")
+
+        # Use direct API call instead of SDK (more reliable)
+        url = f"https://graph.facebook.com/v24.0/act_{clean_id}/customaudiences"
+        params = {
+            'access_token': self.access_token,
+            'fields': 'id,name,subtype,approximate_count_lower_bound,approximate_count_upper_bound'
+        }
+        logger.info(f"Fetching custom audiences from: {url}")
+        response = self.graph.http.get(url, params=params, timeout=15)
+        data = response.json()
+
+        if 'error' in data:
+            raise ValueError(data['error'].get('message', 'Unknown error'))
+
+        results = []
+        for audience in data.get('data', []):
+            subtype = audience.get('subtype', '')
+            # Use average of lower and upper bounds for approximate count
+            lower = audience.get('approximate_count_lower_bound', 0) or 0
+            upper = audience.get('approximate_count_upper_bound', 0) or 0
+            approx_count = (lower + upper) // 2 if (lower or upper) else None
+
+            results.append({
+                'id': audience.get('id'),
+                'name': audience.get('name'),
+                'subtype': subtype,  # LOOKALIKE, CUSTOM, etc.
+                'approximate_count': approx_count,
+                'type_label': 'Lookalike' if subtype == 'LOOKALIKE' else 'Custom Audience'
+            })
+        return results
+
     def search_targeting_locations(self, query: str, location_types: List[str] = None, locale: str = None) -> List[Dict[str, Any]]:
-        """Search for targeting locations (countries, cities, regions) via Facebook API."""
-        import requests
+        """Search for targeting locations (countries, cities, regions) via Facebook API (cached, see targeting_search_cache)."""
 
         if location_types is None:
             location_types = ["country", "region", "city"]
 
-        try:
-            url = "https://graph.facebook.com/v24.0/search"
-            params = {
-                'access_token': self.access_token,
-                'type': 'adgeolocation',
-                'q': query,
-                'location_types': json.dumps(location_types)
-            }
+        def fetch(q: str) -> List[Dict[str, Any]]:
+            params = {'location_types': json.dumps(location_types)}
             if locale:
                 params['locale'] = locale
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
-
-            if 'error' in data:
-                error_info = data['error']
-                raise ValueError(f"Facebook API error: {error_info.get('message', 'Unknown error')}")
+            return [self._location_result(item) for item in self._graph_search('adgeolocation', q, params)]
 
-            results = []
-            for item in data.get('data', []):
-                result = {
-                    'key': item.get('key'),
-                    'name': item.get('name'),
-                    'type': item.get('type'),
-                    'country_code': item.get('country_code'),
-                    'country_name': item.get('country_name'),
-                    'region': item.get('region'),
-                    'region_id': item.get('region_id'),
-                    'supports_city': item.get('supports_city', False),
-                    'supports_region': item.get('supports_region', False),
-                    'latitude': item.get('latitude'),
-                    'longitude': item.get('longitude'),
-                }
-                # Build display name
-                parts = [item.get('name')]
-                if item.get('region'):
-                    parts.append(item.get('region'))
-                if item.get('country_name') and item.get('type') != 'country':
-                    parts.append(item.get('country_name'))
-                result['display_name'] = ', '.join(filter(None, parts))
-                results.append(result)
-
-            return results
+        try:
+            return targeting_search_cache.search(
+                'adgeolocation', query, {'location_types': sorted(location_types), 'locale': locale}, fetch
+            )
         except ValueError:
             raise
         except Exception as e:
@@ -764,26 +801,11 @@ class AdMutationService:
             raise ValueError(f"Unable to search locations: {str(e)}")
 
     def search_interests(self, query: str) -> List[Dict[str, Any]]:
-        """Search for interest targeting options via Facebook API."""
-        import requests
-
-        try:
-            url = "https://graph.facebook.com/v24.0/search"
-            params = {
-                'access_token': self.access_token,
-                'type': 'adinterest',
-                'q': query
-            }
-            response = requests.get(url, params=params, timeout=15)
-            data = response.json()
-
-            if 'error' in data:
-                error_info = data['error']
-                logger.warning(f"Facebook API error searching interests: {error_info.get('message')}")
-                return []
+        """Search for interest targeting options via Facebook API (cached, see targeting_search_cache)."""
 
+        def fetch(q: str) -> List[Dict[str, Any]]:
             results = []
-            for item in data.get('data', []):
+            for item in self._graph_search('adinterest', q):
                 results.append({
                     'id': item.get('id'),
                     'name': item.get('name'),
@@ -792,13 +814,59 @@ class AdMutationService:
                     'path': item.get('path', []),
                     'topic': item.get('topic', '')
                 })
-
-            logger.info(f"Found {len(results)} interests for query '{query}'")
+            logger.info(f"Found {len(results)} interests for query '{q}'")
             return results
+
+        try:
+            return targeting_search_cache.search('adinterest', query, None, fetch)
+        except ValueError as e:
+            logger.warning(f"Facebook API error searching interests: {e}")
+            return []
         except Exception as e:
             logger.error(f"Failed to search interests: {str(e)}", exc_info=True)
             return []
 
+    def _graph_search(self, search_type: str, query: str, extra_params: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """One Graph /search call; raises ValueError on a Graph error"""
+        params = {
+            'access_token': self.access_token,
+            'type': search_type,
+            'q': query,
+            'limit': settings.TARGETING_SEARCH_RESULT_LIMIT,
+            **(extra_params or {})
+        }
+        response = self.graph.http.get("https://graph.facebook.com/v24.0/search", params=params, timeout=15)
+        data = response.json()
+
+        if 'error' in data:
+            error_info = data['error']
+            raise ValueError(f"Facebook API error: {error_info.get('message', 'Unknown error')}")
+        return data.get('data', [])
+
+    @staticmethod
+    def _location_result(item: Dict[str, Any]) -> Dict[str, Any]:
+        result = {
+            'key': item.get('key'),
+            'name': item.get('name'),
+            'type': item.get('type'),
+            'country_code': item.get('country_code'),
+            'country_name': item.get('country_name'),
+            'region': item.get('region'),
+            'region_id': item.get('region_id'),
+            'supports_city': item.get('supports_city', False),
+            'supports_region': item.get('supports_region', False),
+            'latitude': item.get('latitude'),
+            'longitude': item.get('longitude'),
+        }
+        # Build display name
+        parts = [item.get('name')]
+        if item.get('region'):
+            parts.append(item.get('region'))
+        if item.get('country_name') and item.get('type') != 'country':
+            parts.append(item.get('country_name'))
+        result['display_name'] = ', '.join(filter(None, parts))
+        return result
+
     def create_smart_campaign(self, request: SmartCampaignRequest) -> Dict[str, Any]:
         """
         Orchestrates the creation of:
@@ -807,7 +875,7 @@ class AdMutationService:
         3. AdCreative (Image/Video + Text)
         4. Ad (PAUSED)
         """
-        account = AdAccount(f"act_{request.account_id}")
+        account = AdAccount(f"act_{request.account_id}", api=self.api)
 
         # 1. Map Objective -> Campaign Params
         campaign_params = {
@@ -1006,7 +1074,7 @@ class AdMutationService:
         """
         Calculates creative params and adds it to an existing adset
         """
-        account = AdAccount(f"act_{request.account_id}")
+        account = AdAccount(f"act_{request.account_id}", api=self.api)
 
         # 1. Create Creative (using shared method)
         creative_params = self._build_creative_params(
@@ -1035,29 +1103,113 @@ class AdMutationService:
             "creative_id": creative_id
         }
 
-    def upload_media(self, account_id: str, file_content: bytes, filename: str, is_video: bool = False) -> Dict[str, str]:
-        """Uploads image or video to Facebook Asset Library"""
-        account = AdAccount(f"act_{account_id}")
+    def upload_media(self, account_id: str, file_obj: BinaryIO, filename: str, is_video: bool = False) -> Dict[str, str]:
+        """Uploads image or video to Facebook Asset Library (file_obj is copied to disk in chunks)"""
+        # Temp file via context manager for safe cleanup
+        with self._temp_file_for_upload(file_obj, filename) as tmp_path:
+            if is_video:
+                return {"video_id": self._upload_video_resumable(account_id, tmp_path, filename)}
+            return self._upload_image(account_id, tmp_path)
 
-        if is_video:
-            # Video Upload (uses context manager for safe cleanup)
-            with self._temp_file_for_upload(file_content, filename) as tmp_path:
-                video = account.create_ad_video(params={
-                    'name': filename,
-                    'file_url': tmp_path
-                })
-                return {"video_id": video.get_id()}
+    def transfer_media_upload(self, upload: MediaUpload) -> Dict[str, str]:
+        """
+        Graph side of a chunked upload (runs in the media upload worker pool).
+        Video chunks are sent to Graph as soon as the client has uploaded them.
+        """
+        if upload.is_video:
+            video_id = self._upload_video_resumable(
+                upload.account_id, upload.path, upload.filename,
+                file_size=upload.file_size,
+                wait_for_bytes=upload.wait_for_bytes,
+                on_progress=upload.set_transferred
+            )
+            return {"video_id": video_id}
 
-        else:
-            # Image Upload (uses context manager for safe cleanup)
-            with self._temp_file_for_upload(file_content, filename) as tmp_path:
-                image = account.create_ad_image(params={
-                    'filename': tmp_path
-                })
-                # Image Create returns list of images or dictionary
-                if isinstance(image, list) and len(image) > 0:
-                    return {"image_hash": image[0][AdImage.Field.hash]}
-                return {"image_hash": image[AdImage.Field.hash]}
+        upload.wait_for_bytes(upload.file_size)
+        result = self._upload_image(upload.account_id, upload.path)
+        upload.set_transferred(upload.file_size)
+        return result
+
+    def _upload_image(self, account_id: str, path: str) -> Dict[str, str]:
+        clean_id = account_id.replace("act_", "")
+        account = AdAccount(f"act_{clean_id}", api=self.api)
+        image = account.create_ad_image(params={
+            'filename': path
+        })
+        # Image Create returns list of images or dictionary
+        if isinstance(image, list) and len(image) > 0:
+            return {"image_hash": image[0][AdImage.Field.hash]}
+        return {"image_hash": image[AdImage.Field.hash]}
+
+    def _upload_video_resumable(self, account_id: str, path: str, filename: str, file_size: Optional[int] = None,
+                                wait_for_bytes: Optional[Callable[[int], None]] = None,
+                                on_progress: Optional[Callable[[int], None]] = None) -> str:
+        """
+        Graph resumable video upload (upload_phase start / transfer / finish).
+
+        Each chunk is read from disk at the offsets Graph returns, so memory holds
+        one chunk at a time. wait_for_bytes(end_offset) blocks until a chunk is on
+        disk (uploads still arriving from the client); on_progress(offset) reports
+        the bytes Graph has accepted.
+
+        Returns:
+            The new video ID
+        """
+        import os
+
+        clean_id = account_id.replace("act_", "")
+        edge = (f"act_{clean_id}", "advideos")
+        if file_size is None:
+            file_size = os.path.getsize(path)
+
+        start = self.api.call('POST', edge, params={
+            'upload_phase': 'start',
+            'file_size': file_size
+        }).json()
+        session_id = start['upload_session_id']
+        video_id = start['video_id']
+        start_offset, end_offset = int(start['start_offset']), int(start['end_offset'])
+        logger.info(f"Video upload session {session_id} started for account {clean_id} ({file_size} bytes)")
+
+        with open(path, 'rb') as video_file:
+            while start_offset < end_offset:
+                if wait_for_bytes:
+                    wait_for_bytes(end_offset)
+                video_file.seek(start_offset)
+                chunk = video_file.read(end_offset - start_offset)
+
+                response = self._transfer_video_chunk(edge, session_id, start_offset, chunk, filename)
+                start_offset, end_offset = int(response['start_offset']), int(response['end_offset'])
+                if on_progress:
+                    on_progress(start_offset)
+
+        self.api.call('POST', edge, params={
+            'upload_phase': 'finish',
+            'upload_session_id': session_id,
+            'title': filename
+        })
+        logger.info(f"Video upload session {session_id} finished: video {video_id}")
+        return video_id
+
+    def _transfer_video_chunk(self, edge, session_id: str, start_offset: int, chunk: bytes, filename: str) -> Dict[str, Any]:
+        """Send one chunk; transient errors (and Graph's "retry this chunk" subcode) are retried"""
+        import time
+
+        for attempt in range(1, settings.MEDIA_UPLOAD_TRANSFER_RETRIES + 1):
+            try:
+                return self.api.call('POST', edge, params={
+                    'upload_phase': 'transfer',
+                    'upload_session_id': session_id,
+                    'start_offset': start_offset
+                }, files={
+                    'video_file_chunk': (filename, chunk, 'multipart/form-data')
+                }).json()
+            except FacebookRequestError as e:
+                retryable = e.api_transient_error() or e.api_error_subcode() == VIDEO_CHUNK_RETRY_SUBCODE
+                if not retryable or attempt == settings.MEDIA_UPLOAD_TRANSFER_RETRIES:
+                    raise
+                logger.warning(f"Video chunk at offset {start_offset} failed (attempt {attempt}), retrying: {e.api_error_message()}")
+                time.sleep(attempt)
 
     # --- Status & Budget Mutations ---
 
@@ -1071,7 +1223,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Updating campaign {campaign_id} status to {status}")
-            campaign = Campaign(campaign_id)
+            campaign = Campaign(campaign_id, api=self.api)
             campaign.api_update(params={Campaign.Field.status: status})
             logger.info(f"Campaign {campaign_id} status updated to {status}")
 
@@ -1081,6 +1233,7 @@ class AdMutationService:
                     text("UPDATE dim_campaign SET campaign_status = :status WHERE campaign_id = :id"),
                     {"status": status, "id": int(campaign_id)}
                 )
+                forget_dimension_members(db, 'dim_campaign', [campaign_id])
                 db.commit()
                 logger.info(f"Local DB synced for campaign {campaign_id}")
 
@@ -1099,7 +1252,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Updating adset {adset_id} status to {status}")
-            adset = AdSet(adset_id)
+            adset = AdSet(adset_id, api=self.api)
             adset.api_update(params={AdSet.Field.status: status})
             logger.info(f"AdSet {adset_id} status updated to {status}")
 
@@ -1109,6 +1262,7 @@ class AdMutationService:
                     text("UPDATE dim_adset SET adset_status = :status WHERE adset_id = :id"),
                     {"status": status, "id": int(adset_id)}
                 )
+                forget_dimension_members(db, 'dim_adset', [adset_id])
                 db.commit()
                 logger.info(f"Local DB synced for adset {adset_id}")
 
@@ -1127,7 +1281,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Updating ad {ad_id} status to {status}")
-            ad = Ad(ad_id)
+            ad = Ad(ad_id, api=self.api)
             ad.api_update(params={Ad.Field.status: status})
             logger.info(f"Ad {ad_id} status updated to {status}")
 
@@ -1137,6 +1291,7 @@ class AdMutationService:
                     text("UPDATE dim_ad SET ad_status = :status WHERE ad_id = :id"),
                     {"status": status, "id": int(ad_id)}
                 )
+                forget_dimension_members(db, 'dim_ad', [ad_id])
                 db.commit()
                 logger.info(f"Local DB synced for ad {ad_id}")
 
@@ -1154,7 +1309,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Updating adset {adset_id} budget to {daily_budget_cents} cents")
-            adset = AdSet(adset_id)
+            adset = AdSet(adset_id, api=self.api)
             adset.api_update(params={AdSet.Field.daily_budget: daily_budget_cents})
             logger.info(f"AdSet {adset_id} budget updated to {daily_budget_cents} cents")
             return {"status": "success", "adset_id": adset_id, "new_budget_cents": daily_budget_cents}
@@ -1171,7 +1326,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Updating campaign {campaign_id} budget to {daily_budget_cents} cents")
-            campaign = Campaign(campaign_id)
+            campaign = Campaign(campaign_id, api=self.api)
             campaign.api_update(params={Campaign.Field.daily_budget: daily_budget_cents})
             logger.info(f"Campaign {campaign_id} budget updated to {daily_budget_cents} cents")
             return {"status": "success", "campaign_id": campaign_id, "new_budget_cents": daily_budget_cents}
@@ -1181,58 +1336,120 @@ class AdMutationService:
 
     def get_campaign_budgets(self, campaign_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch budget info for multiple campaigns from Facebook API.
+        Fetch budget info for multiple campaigns from Facebook API (Graph batch requests).
         Returns dict mapping campaign_id to budget info.
         """
+        fields = [Campaign.Field.daily_budget, Campaign.Field.lifetime_budget]
+        responses = run_graph_batch(self.graph, [batch_get(cid, cid, fields) for cid in dict.fromkeys(campaign_ids)])
+
         result = {}
         for campaign_id in campaign_ids:
-            try:
-                campaign = Campaign(campaign_id)
-                fields = [Campaign.Field.daily_budget, Campaign.Field.lifetime_budget]
-                data = campaign.api_get(fields=fields)
+            response = responses.get(campaign_id)
+            if not response or not response["ok"]:
+                logger.warning(f"Failed to fetch budget for campaign {campaign_id}: {response and response['error']}")
+                result[campaign_id] = {"daily_budget_cents": None, "lifetime_budget_cents": None, "is_cbo": False}
+                continue
 
-                daily_budget = data.get(Campaign.Field.daily_budget)
-                lifetime_budget = data.get(Campaign.Field.lifetime_budget)
+            data = response["data"] or {}
+            daily_budget = data.get(Campaign.Field.daily_budget)
+            lifetime_budget = data.get(Campaign.Field.lifetime_budget)
 
-                # CBO campaigns have daily_budget set at campaign level
-                is_cbo = daily_budget is not None and int(daily_budget) > 0
+            # CBO campaigns have daily_budget set at campaign level
+            is_cbo = daily_budget is not None and int(daily_budget) > 0
 
-                result[campaign_id] = {
-                    "daily_budget_cents": int(daily_budget) if daily_budget else None,
-                    "lifetime_budget_cents": int(lifetime_budget) if lifetime_budget else None,
-                    "is_cbo": is_cbo
-                }
-            except Exception as e:
-                logger.warning(f"Failed to fetch budget for campaign {campaign_id}: {str(e)}")
-                result[campaign_id] = {"daily_budget_cents": None, "lifetime_budget_cents": None, "is_cbo": False}
+            result[campaign_id] = {
+                "daily_budget_cents": int(daily_budget) if daily_budget else None,
+                "lifetime_budget_cents": int(lifetime_budget) if lifetime_budget else None,
+                "is_cbo": is_cbo
+            }
 
         return result
 
     def get_adset_budgets(self, adset_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch budget info for multiple ad sets from Facebook API.
+        Fetch budget info for multiple ad sets from Facebook API (Graph batch requests).
         Returns dict mapping adset_id to budget info.
         """
+        fields = [AdSet.Field.daily_budget, AdSet.Field.lifetime_budget]
+        responses = run_graph_batch(self.graph, [batch_get(aid, aid, fields) for aid in dict.fromkeys(adset_ids)])
+
         result = {}
         for adset_id in adset_ids:
-            try:
-                adset = AdSet(adset_id)
-                fields = [AdSet.Field.daily_budget, AdSet.Field.lifetime_budget]
-                data = adset.api_get(fields=fields)
+            response = responses.get(adset_id)
+            if not response or not response["ok"]:
+                logger.warning(f"Failed to fetch budget for adset {adset_id}: {response and response['error']}")
+                result[adset_id] = {"daily_budget_cents": None, "lifetime_budget_cents": None}
+                continue
 
-                daily_budget = data.get(AdSet.Field.daily_budget)
-                lifetime_budget = data.get(AdSet.Field.lifetime_budget)
+            data = response["data"] or {}
+            daily_budget = data.get(AdSet.Field.daily_budget)
+            lifetime_budget = data.get(AdSet.Field.lifetime_budget)
 
-                result[adset_id] = {
-                    "daily_budget_cents": int(daily_budget) if daily_budget else None,
-                    "lifetime_budget_cents": int(lifetime_budget) if lifetime_budget else None
-                }
-            except Exception as e:
-                logger.warning(f"Failed to fetch budget for adset {adset_id}: {str(e)}")
-                result[adset_id] = {"daily_budget_cents": None, "lifetime_budget_cents": None}
+            result[adset_id] = {
+                "daily_budget_cents": int(daily_budget) if daily_budget else None,
+                "lifetime_budget_cents": int(lifetime_budget) if lifetime_budget else None
+            }
+
+        return result
+
+    # --- Bulk Methods (Graph batch requests) ---
+
+    @staticmethod
+    def _bulk_result(responses: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        updated = [key for key, r in responses.items() if r["ok"]]
+        failed = [{"id": key, "error": r["error"]} for key, r in responses.items() if not r["ok"]]
+        if not failed:
+            status = "success"
+        elif updated:
+            status = "partial"
+        else:
+            status = "failed"
+        return {"status": status, "updated": updated, "failed": failed}
+
+    def bulk_update_status(self, entity_type: str, object_ids: List[str], status: str,
+                           db: Optional[Session] = None) -> Dict[str, Any]:
+        """
+        Pause or activate many campaigns / ad sets / ads.
+        Args:
+            entity_type: 'campaign', 'adset' or 'ad'
+            object_ids: Facebook object IDs
+            status: 'PAUSED' or 'ACTIVE'
+            db: Optional database session for immediate local sync of the updated objects
+        Returns:
+            {"status": "success"|"partial"|"failed", "updated": [ids], "failed": [{"id", "error"}]}
+        """
+        table, status_column, id_column = _STATUS_TABLES[entity_type]
+        object_ids = list(dict.fromkeys(object_ids))
+        logger.info(f"Bulk updating {len(object_ids)} {entity_type}(s) status to {status}")
+
+        responses = run_graph_batch(self.graph, [batch_post(oid, oid, {"status": status}) for oid in object_ids])
+        result = self._bulk_result(responses)
+        result["new_status"] = status
+
+        if db and result["updated"]:
+            db.execute(
+                text(f"UPDATE {table} SET {status_column} = :status WHERE {id_column} = ANY(:ids)"),
+                {"status": status, "ids": [int(oid) for oid in result["updated"]]}
+            )
+            forget_dimension_members(db, table, result["updated"])
+            db.commit()
+            logger.info(f"Local DB synced for {len(result['updated'])} {entity_type}(s)")
 
         return result
 
+    def bulk_update_budgets(self, entity_type: str, budgets: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Update daily budgets of many campaigns (CBO) or ad sets (ABO).
+        Args:
+            entity_type: 'campaign' or 'adset'
+            budgets: Facebook object ID -> daily budget in cents
+        """
+        logger.info(f"Bulk updating {len(budgets)} {entity_type} budget(s)")
+        responses = run_graph_batch(self.graph, [
+            batch_post(oid, oid, {"daily_budget": cents}) for oid, cents in budgets.items()
+        ])
+        return self._bulk_result(responses)
+
     # --- Edit Methods ---
 
     def update_adset_targeting(self, adset_id: str, request: Any) -> Dict[str, Any]:
@@ -1242,7 +1459,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Updating adset {adset_id} targeting")
-            adset = AdSet(adset_id)
+            adset = AdSet(adset_id, api=self.api)
 
             update_params = {}
 
@@ -1322,7 +1539,7 @@ class AdMutationService:
             logger.info(f"Updating ad {ad_id} creative")
 
             # Get the ad to find its account
-            ad = Ad(ad_id)
+            ad = Ad(ad_id, api=self.api)
             ad_data = ad.api_get(fields=[Ad.Field.account_id, Ad.Field.creative])
             account_id = ad_data.get(Ad.Field.account_id)
             old_creative_id = ad_data.get(Ad.Field.creative, {}).get('id')
@@ -1338,7 +1555,7 @@ class AdMutationService:
             old_creative_type = 'link_data'  # default
 
             if old_creative_id:
-                old_creative = AdCreative(old_creative_id)
+                old_creative = AdCreative(old_creative_id, api=self.api)
                 old_data = old_creative.api_get(fields=[
                     AdCreative.Field.name,
                     AdCreative.Field.object_story_spec
@@ -1359,7 +1576,7 @@ class AdMutationService:
                 logger.info(f"Old creative type: {old_creative_type}, data keys: {old_link_data.keys() if old_link_data else 'None'}")
 
             # Build new creative with merged values
-            account = AdAccount(f"act_{request.account_id}")
+            account = AdAccount(f"act_{request.account_id}", api=self.api)
 
             # Determine lead form ID (location varies by creative type)
             lead_form_id = request.lead_form_id or old_link_data.get('lead_gen_form_id')
@@ -1485,7 +1702,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Fetching targeting for adset {adset_id}")
-            adset = AdSet(adset_id)
+            adset = AdSet(adset_id, api=self.api)
             data = adset.api_get(fields=[AdSet.Field.targeting])
 
             # Export data to dict for proper access
@@ -1561,7 +1778,7 @@ class AdMutationService:
         """
         try:
             logger.info(f"Fetching creative for ad {ad_id}")
-            ad = Ad(ad_id)
+            ad = Ad(ad_id, api=self.api)
             ad_data = ad.api_get(fields=[Ad.Field.creative])
             creative_ref = ad_data.get(Ad.Field.creative, {})
             creative_id = creative_ref.get('id')
@@ -1570,7 +1787,7 @@ class AdMutationService:
                 logger.warning(f"No creative ID found for ad {ad_id}")
                 return {}
 
-            creative = AdCreative(creative_id)
+            creative = AdCreative(creative_id, api=self.api)
             creative_data = creative.api_get(fields=[
                 AdCreative.Field.object_story_spec,
                 AdCreative.Field.thumbnail_url,
@@ -1637,13 +1854,12 @@ class AdMutationService:
         Fetch all data needed to clone a campaign.
         Returns campaign info, first adset targeting + budget, and all ad creatives.
         """
-        import requests
 
         try:
             logger.info(f"Fetching clone data for campaign {campaign_id}")
 
             # 1. Get campaign basic info and objective
-            campaign = Campaign(campaign_id)
+            campaign = Campaign(campaign_id, api=self.api)
             campaign_data = campaign.api_get(fields=[
                 Campaign.Field.name,
                 Campaign.Field.objective,
@@ -1741,7 +1957,7 @@ class AdMutationService:
                 result['conversion_event'] = promoted_object.get('custom_event_type', '')
 
                 # 3. Get all ads from this adset
-                adset_obj = AdSet(adset_id)
+                adset_obj = AdSet(adset_id, api=self.api)
                 ads = adset_obj.get_ads(fields=[Ad.Field.id, Ad.Field.name, Ad.Field.creative])
 
                 for ad in ads:
@@ -1783,7 +1999,6 @@ class AdMutationService:
         Returns:
             Dict with audience id and name
         """
-        import requests
 
         try:
             # Handle both "act_123" and "123" formats
@@ -1824,7 +2039,7 @@ class AdMutationService:
             }
 
             logger.info(f"Creating custom audience '{name}' from pixel {pixel_id} with event {event_type}")
-            response = requests.post(url, data=payload, timeout=15)
+            response = self.graph.http.post(url, data=payload, timeout=15)
             data = response.json()
 
             if 'error' in data:
@@ -1835,6 +2050,7 @@ class AdMutationService:
 
             audience_id = data.get('id')
             logger.info(f"Created custom audience {audience_id} from pixel {pixel_id}")
+            account_catalog_cache.invalidate(CUSTOM_AUDIENCES, clean_id)
 
             return {
                 'id': audience_id,
@@ -1871,7 +2087,6 @@ class AdMutationService:
         Returns:
             Dict with audience id and name
         """
-        import requests
 
         try:
             clean_id = account_id.replace("act_", "")
@@ -1918,7 +2133,7 @@ class AdMutationService:
             }
 
             logger.info(f"Creating page engagement audience '{name}' from page {page_id} with type {engagement_type}")
-            response = requests.post(url, data=payload, timeout=15)
+            response = self.graph.http.post(url, data=payload, timeout=15)
             data = response.json()
 
             if 'error' in data:
@@ -1929,6 +2144,7 @@ class AdMutationService:
 
             audience_id = data.get('id')
             logger.info(f"Created page engagement audience {audience_id} from page {page_id}")
+            account_catalog_cache.invalidate(CUSTOM_AUDIENCES, clean_id)
 
             return {
                 'id': audience_id,
@@ -1965,7 +2181,6 @@ class AdMutationService:
         Returns:
             Dict with audience id and name
         """
-        import requests
 
         try:
             clean_id = account_id.replace("act_", "")
@@ -1988,7 +2203,7 @@ class AdMutationService:
             }
 
             logger.info(f"Creating lookalike audience '{name}' from source {source_audience_id} in {country_code} at {ratio*100}%")
-            response = requests.post(url, data=payload, timeout=15)
+            response = self.graph.http.post(url, data=payload, timeout=15)
             data = response.json()
 
             if 'error' in data:
@@ -1999,6 +2214,7 @@ class AdMutationService:
 
             audience_id = data.get('id')
             logger.info(f"Created lookalike audience {audience_id}")
+            account_catalog_cache.invalidate(CUSTOM_AUDIENCES, clean_id)
 
             return {
                 'id': audience_id,
@@ -2020,7 +2236,6 @@ class AdMutationService:
 
         Returns posts that can be used as ad creatives via object_story_id.
         """
-        import requests
 
         try:
             page_token = self._get_page_access_token(page_id, account_id)
@@ -2031,10 +2246,11 @@ class AdMutationService:
                 'limit': limit,
                 'access_token': page_token
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
                 raise ValueError(data['error'].get('message', 'Unknown Facebook API error'))
 
             posts = []
@@ -2062,7 +2278,6 @@ class AdMutationService:
 
     def get_instagram_account_id(self, page_id: str, account_id: str = None) -> Optional[str]:
         """Get the Instagram Business account ID connected to a Facebook Page."""
-        import requests
 
         try:
             page_token = self._get_page_access_token(page_id, account_id)
@@ -2072,10 +2287,11 @@ class AdMutationService:
                 'fields': 'instagram_business_account',
                 'access_token': page_token
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
                 logger.warning(f"Error fetching IG account for page {page_id}: {data['error'].get('message')}")
                 return None
 
@@ -2093,7 +2309,6 @@ class AdMutationService:
 
         Returns posts that can be used as ad creatives.
         """
-        import requests
 
         try:
             # First get the Instagram account ID
@@ -2109,10 +2324,11 @@ class AdMutationService:
                 'limit': limit,
                 'access_token': page_token
             }
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             if 'error' in data:
+                self._check_page_token_error(page_id, data['error'])
                 logger.warning(f"Error fetching IG posts: {data['error'].get('message')}")
                 return []
 
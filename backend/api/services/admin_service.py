@@ -4,7 +4,10 @@ Admin Service - Business logic for admin analytics dashboard.
 
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
-from backend.api.repositories.admin_repository import AdminRepository
+from backend.config.base_config import settings
+from backend.api.repositories.admin_repository import (
+    AdminRepository, ACCOUNT_HEALTH_METRIC, TOTAL_SPEND_METRIC, FEATURE_USAGE_METRIC
+)
 
 
 class AdminService:
@@ -116,6 +119,22 @@ class AdminService:
             "total_active_users": total_active
         }
 
+    def refresh_metrics_snapshot(self, include_feature_usage: bool = True) -> int:
+        """
+        Recompute the admin metrics snapshot for every ADMIN_METRICS_PERIODS lookback.
+
+        Called after ETL loads (account metrics only) and by the periodic admin
+        metrics job (everything). Returns the number of snapshot rows written.
+        """
+        values = {(ACCOUNT_HEALTH_METRIC, 0): self.repository.compute_account_health_overview()}
+        for days in settings.ADMIN_METRICS_PERIODS:
+            values[(TOTAL_SPEND_METRIC, days)] = self.repository.compute_total_spend(days)
+            if include_feature_usage:
+                values[(FEATURE_USAGE_METRIC, days)] = self.repository.compute_feature_usage_stats(days)
+
+        self.repository.save_metrics_snapshot(values)
+        return len(values)
+
     def get_error_trends(self, days: int = 30) -> Dict[str, Any]:
         """Get error trends and summary"""
         return {
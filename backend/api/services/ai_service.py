@@ -3,7 +3,6 @@ backend/api/services/ai_service.py - AI Investigation Service
 Handles communication with Gemini for marketing data analysis.
 """
 
-import os
 import json
 import logging
 import hashlib
@@ -11,7 +10,7 @@ import time
 import pandas as pd
 from datetime import date, timedelta
 from typing import Dict, Any, List, Optional
-import google.genai as genai
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -80,18 +79,9 @@ class AIService:
         # Budget optimizer will be initialized with account_ids when needed
         self.budget_optimizer = None
 
-        # Initialize Gemini
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            self.client = None
-        else:
-            try:
-                self.client = genai.Client(api_key=api_key)
-                self.model = GEMINI_MODEL
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
-                self.client = None
+        # Initialize LLM provider (Gemini, or local stub when LLM_PROVIDER=stub)
+        self.client = get_llm_provider()
+        self.model = GEMINI_MODEL
 
     def _get_user_account_ids(self) -> Optional[List[int]]:
         """Get account IDs for current user (for data filtering)"""
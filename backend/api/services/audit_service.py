@@ -2,6 +2,7 @@ import json
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from backend.models.schema import AuditLog
+from backend.utils.event_buffer import record_event
 from backend.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,19 +19,18 @@ class AuditService:
     ):
         """
         Records a critical event in the database audit log.
+        The row is written by the background event buffer, outside the caller's transaction.
         """
         try:
-            audit_entry = AuditLog(
-                user_id=user_id,
-                event_type=event_type,
-                description=description,
-                metadata_json=json.dumps(metadata) if metadata else None,
-                ip_address=ip_address,
-                created_at=datetime.now(timezone.utc)
-            )
-            db.add(audit_entry)
-            db.commit()
-            
+            record_event(db, AuditLog.__table__, {
+                "user_id": user_id,
+                "event_type": event_type,
+                "description": description,
+                "metadata_json": json.dumps(metadata) if metadata else None,
+                "ip_address": ip_address,
+                "created_at": datetime.now(timezone.utc)
+            })
+
             logger.info(
                 f"AUDIT EVENT: {event_type} for user {user_id}",
                 extra={
@@ -41,5 +41,4 @@ class AuditService:
                 }
             )
         except Exception as e:
-            db.rollback()
             logger.error(f"Failed to save audit log: {e}", exc_info=True)
@@ -9,6 +9,8 @@ from datetime import date, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
+from backend.api.repositories.base_repository import date_id_between
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,9 +72,8 @@ class SmartBudgetOptimizer:
                     ELSE 0
                 END as cpa
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_campaign c ON f.campaign_id = c.campaign_id
-            WHERE d.date BETWEEN :start_date AND :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND c.campaign_name IS NOT NULL
                 {account_filter}
             GROUP BY c.campaign_name
@@ -145,10 +146,9 @@ class SmartBudgetOptimizer:
                     ELSE 0
                 END as ctr
             FROM fact_age_gender_metrics agm
-            JOIN dim_date d ON agm.date_id = d.date_id
             JOIN dim_age da ON agm.age_id = da.age_id
             JOIN dim_gender dg ON agm.gender_id = dg.gender_id
-            WHERE d.date BETWEEN :start_date AND :end_date
+            WHERE {date_id_between('agm.date_id')}
                 {account_filter}
             GROUP BY da.age_group, dg.gender
             HAVING SUM(agm.spend) > 50
@@ -192,9 +192,8 @@ class SmartBudgetOptimizer:
                     ELSE 0
                 END as ctr
             FROM fact_placement_metrics pm
-            JOIN dim_date d ON pm.date_id = d.date_id
             JOIN dim_placement p ON pm.placement_id = p.placement_id
-            WHERE d.date BETWEEN :start_date AND :end_date
+            WHERE {date_id_between('pm.date_id')}
                 AND p.placement_name IS NOT NULL
                 {account_filter.replace('f.account_id', 'pm.account_id')}
             GROUP BY p.placement_name
@@ -239,10 +238,9 @@ class SmartBudgetOptimizer:
                     ELSE 0
                 END as ctr
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             JOIN dim_ad ad ON f.ad_id = ad.ad_id
             JOIN dim_creative cr ON f.creative_id = cr.creative_id
-            WHERE d.date BETWEEN :start_date AND :end_date
+            WHERE {date_id_between('f.date_id')}
                 AND ad.ad_name IS NOT NULL
                 AND f.conversions > 0
                 {account_filter}
@@ -285,7 +283,7 @@ class SmartBudgetOptimizer:
                 SUM(f.conversions) as total_conversions
             FROM fact_core_metrics f
             JOIN dim_date d ON f.date_id = d.date_id
-            WHERE d.date BETWEEN :start_date AND :end_date
+            WHERE {date_id_between('f.date_id')}
                 {account_filter}
             GROUP BY day_of_week
             ORDER BY avg_roas DESC
@@ -3,17 +3,18 @@ Business profile service - Website crawling, AI analysis, social page analysis.
 Uses Google Gemini to extract structured business intelligence from websites and social pages.
 """
 
-import os
 import json
+import asyncio
 import logging
 import httpx
 from typing import Dict, Optional, List, Any
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
-import google.genai as genai
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 
 from backend.api.repositories.business_profile_repository import BusinessProfileRepository
+from backend.api.services.recommendation_service import invalidate_recommendation_cache
 from backend.config.settings import GEMINI_MODEL
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,14 @@ If you can't determine a field, use null.
 Website content:
 """
 
+# Per-stage timeouts (seconds) for build_full_profile
+STAGE_TIMEOUTS = {
+    'website_fetch': 20,
+    'website_analysis': 45,
+    'posts_fetch': 20,
+    'social_analysis': 45,
+}
+
 SOCIAL_ANALYSIS_PROMPT = """Analyze these social media posts and extract patterns for advertising.
 Return ONLY valid JSON:
 
@@ -61,12 +70,9 @@ class BusinessProfileService:
     def __init__(self, db: Session):
         self.db = db
         self.repo = BusinessProfileRepository(db)
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if api_key:
-            self.client = genai.Client(api_key=api_key)
-        else:
-            self.client = None
-            logger.warning("GEMINI_API_KEY not set - business analysis will not work")
+        self.client = get_llm_provider()
+        if not self.client:
+            logger.warning("LLM provider not configured - business analysis will not work")
 
     def save_profile(
         self,
@@ -75,11 +81,13 @@ class BusinessProfileService:
         business_description: Optional[str] = None
     ):
         """Save user input and return the profile."""
-        return self.repo.create_or_update(
+        profile = self.repo.create_or_update(
             account_id=account_id,
             website_url=website_url,
             business_description=business_description
         )
+        invalidate_recommendation_cache(account_id)
+        return profile
 
     def get_profile(self, account_id: int) -> Optional[Dict]:
         """Get the business profile as a dictionary."""
@@ -94,16 +102,19 @@ class BusinessProfileService:
             raise ValueError("Gemini API key not configured")
 
         # Fetch website HTML
-        content = await self._fetch_website_content(url)
+        content = await asyncio.wait_for(
+            self._fetch_website_content(url), timeout=STAGE_TIMEOUTS['website_fetch']
+        )
         if not content:
             raise ValueError(f"Could not fetch content from {url}")
 
         # Truncate to avoid token limits (keep first ~8000 chars of extracted text)
         content = content[:8000]
 
-        # Analyze with Gemini
+        # Analyze with Gemini (blocking client call runs in a worker thread)
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate(
+                STAGE_TIMEOUTS['website_analysis'],
                 model=GEMINI_MODEL,
                 contents=WEBSITE_ANALYSIS_PROMPT + content,
                 config=types.GenerateContentConfig(
@@ -151,7 +162,8 @@ class BusinessProfileService:
             return {}
 
         try:
-            response = self.client.models.generate_content(
+            response = await self._generate(
+                STAGE_TIMEOUTS['social_analysis'],
                 model=GEMINI_MODEL,
                 contents=SOCIAL_ANALYSIS_PROMPT + posts_text,
                 config=types.GenerateContentConfig(
@@ -182,46 +194,29 @@ class BusinessProfileService:
         website_url: Optional[str] = None,
         business_description: Optional[str] = None,
         fb_posts: Optional[List[Dict]] = None,
-        ig_posts: Optional[List[Dict]] = None
+        ig_posts: Optional[List[Dict]] = None,
+        page_id: Optional[str] = None,
+        access_token: Optional[str] = None
     ):
         """
         Full orchestrator: analyze website + social pages, merge results, save to DB.
         Called as a background task.
+
+        The website branch (crawl -> analysis) and the social branch (FB + IG post
+        fetch -> analysis) run concurrently, each stage bounded by STAGE_TIMEOUTS.
+        Each branch persists its result as soon as it finishes, so total time is
+        bounded by the slowest branch rather than the sum.
+
+        Posts are fetched here when page_id/access_token are given; pre-fetched
+        fb_posts/ig_posts are used as-is.
         """
         self.repo.set_status(account_id, 'analyzing')
 
         try:
-            # Step 1: Website analysis (if URL provided)
-            website_data = {}
-            if website_url:
-                try:
-                    website_data = await self.analyze_website(website_url)
-                except Exception as e:
-                    logger.error(f"Website analysis failed for {website_url}: {e}")
-                    # Fall through - we can still use description and social
-
-            # If no website data and we have a description, use it as-is
-            if not website_data and business_description:
-                website_data = {"business_description": business_description}
-
-            # Save website analysis
-            if website_data:
-                self.repo.update_analysis(account_id, website_data)
-
-            # Step 2: Social page analysis
-            all_posts = []
-            if fb_posts:
-                all_posts.extend(fb_posts)
-            if ig_posts:
-                all_posts.extend(ig_posts)
-
-            if all_posts:
-                try:
-                    social_data = await self.analyze_social_pages(all_posts)
-                    if social_data:
-                        self.repo.update_social_analysis(account_id, social_data)
-                except Exception as e:
-                    logger.error(f"Social analysis failed for account {account_id}: {e}")
+            await asyncio.gather(
+                self._website_stage(account_id, website_url, business_description),
+                self._social_stage(account_id, fb_posts, ig_posts, page_id, access_token),
+            )
 
             # Mark as completed
             self.repo.set_status(account_id, 'completed')
@@ -231,6 +226,96 @@ class BusinessProfileService:
             logger.error(f"Full profile analysis failed for account {account_id}: {e}")
             self.repo.set_status(account_id, 'failed')
 
+    async def _website_stage(
+        self,
+        account_id: int,
+        website_url: Optional[str],
+        business_description: Optional[str]
+    ) -> None:
+        """Crawl + analyze the website and persist the result."""
+        website_data = {}
+        if website_url:
+            try:
+                website_data = await self.analyze_website(website_url)
+            except asyncio.TimeoutError:
+                logger.error(f"Website analysis timed out for {website_url}")
+            except Exception as e:
+                logger.error(f"Website analysis failed for {website_url}: {e}")
+                # Fall through - we can still use description and social
+
+        # If no website data and we have a description, use it as-is
+        if not website_data and business_description:
+            website_data = {"business_description": business_description}
+
+        # Save website analysis (status stays 'analyzing' until all stages finish)
+        if website_data:
+            self.repo.update_analysis(account_id, website_data, mark_completed=False)
+
+    async def _social_stage(
+        self,
+        account_id: int,
+        fb_posts: Optional[List[Dict]],
+        ig_posts: Optional[List[Dict]],
+        page_id: Optional[str],
+        access_token: Optional[str]
+    ) -> None:
+        """Fetch FB/IG posts concurrently, analyze them and persist the result."""
+        if page_id and access_token and fb_posts is None and ig_posts is None:
+            fb_posts, ig_posts = await self._fetch_page_posts(page_id, access_token)
+
+        all_posts = []
+        if fb_posts:
+            all_posts.extend(fb_posts)
+        if ig_posts:
+            all_posts.extend(ig_posts)
+
+        if not all_posts:
+            return
+
+        try:
+            social_data = await self.analyze_social_pages(all_posts)
+            if social_data:
+                self.repo.update_social_analysis(account_id, social_data)
+        except asyncio.TimeoutError:
+            logger.error(f"Social analysis timed out for account {account_id}")
+        except Exception as e:
+            logger.error(f"Social analysis failed for account {account_id}: {e}")
+
+    async def _fetch_page_posts(self, page_id: str, access_token: str):
+        """Fetch Facebook page posts and Instagram posts in parallel. Failures yield []."""
+        from backend.api.services.ad_mutation_service import AdMutationService
+
+        try:
+            mutation_service = AdMutationService(access_token)
+        except Exception as e:
+            logger.error(f"Could not initialize Graph API for page {page_id}: {e}")
+            return [], []
+
+        async def fetch(fn, label):
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(fn, page_id, limit=25),
+                    timeout=STAGE_TIMEOUTS['posts_fetch']
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Fetching {label} posts timed out for page {page_id}")
+            except Exception as e:
+                logger.error(f"Fetching {label} posts failed for page {page_id}: {e}")
+            return []
+
+        fb_posts, ig_posts = await asyncio.gather(
+            fetch(mutation_service.get_page_posts, "Facebook"),
+            fetch(mutation_service.get_instagram_posts, "Instagram"),
+        )
+        return fb_posts, ig_posts
+
+    async def _generate(self, timeout: float, **kwargs):
+        """Run a blocking generate_content call in a worker thread with a timeout."""
+        return await asyncio.wait_for(
+            asyncio.to_thread(self.client.models.generate_content, **kwargs),
+            timeout=timeout
+        )
+
     async def _fetch_website_content(self, url: str) -> Optional[str]:
         """Fetch and extract text content from a website."""
         try:
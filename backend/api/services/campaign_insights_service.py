@@ -5,14 +5,13 @@ Analyzes campaign performance, categorized them by strategy (Scale, Optimize, Pa
 and provides budget allocation recommendations using Gemini AI.
 """
 
-import os
 import json
 import logging
 import hashlib
 import time
 from datetime import date
 from typing import Dict, Any, List, Optional
-import google.genai as genai
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 from sqlalchemy.orm import Session
 
@@ -67,18 +66,9 @@ class CampaignInsightsService:
         self.user_id = user_id
         self.repository = InsightsRepository(db)
 
-        # Initialize Gemini
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            self.client = None
-        else:
-            try:
-                self.client = genai.Client(api_key=api_key)
-                self.model = GEMINI_MODEL
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
-                self.client = None
+        # Initialize LLM provider (Gemini, or local stub when LLM_PROVIDER=stub)
+        self.client = get_llm_provider()
+        self.model = GEMINI_MODEL
 
     def _get_cache_key(
         self,
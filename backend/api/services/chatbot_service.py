@@ -3,12 +3,11 @@ Chatbot service for public-facing support chat.
 NO database access, NO user data - purely AI-powered FAQ/support.
 """
 
-import os
 import logging
 import hashlib
 import time
 from typing import Optional, List, Dict
-import google.genai as genai
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 from backend.config.settings import GEMINI_MODEL
 from backend.utils.cache_utils import TTLCache
@@ -61,17 +60,9 @@ class ChatbotService:
     """Stateless chatbot service for public support chat"""
 
     def __init__(self):
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found")
-            self.client = None
-        else:
-            try:
-                self.client = genai.Client(api_key=api_key)
-                self.model = GEMINI_MODEL
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
-                self.client = None
+        # Initialize LLM provider (Gemini, or local stub when LLM_PROVIDER=stub)
+        self.client = get_llm_provider()
+        self.model = GEMINI_MODEL
 
     def _get_cache_key(self, message: str) -> str:
         """Generate cache key for common questions"""
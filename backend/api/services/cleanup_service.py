@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import logging
+from backend.utils.dimension_cache import forget_account_dimensions
 from backend.models.schema import (
     DimCampaign, DimAdset, DimAd, DimInsightHistory,
     FactCoreMetrics, FactPlacementMetrics, FactAgeGenderMetrics,
-    FactCountryMetrics, FactActionMetrics
+    FactCountryMetrics, FactActionMetrics, AccountDataFreshness
 )
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,9 @@ class CleanupService:
                 deleted = self.db.query(table).filter(table.account_id == account_id).delete(synchronize_session=False)
                 logger.debug(f"Deleted {deleted} rows from {table.__tablename__}")
 
+            # No facts left, so no data range for the admin views
+            self.db.query(AccountDataFreshness).filter(AccountDataFreshness.account_id == account_id).delete(synchronize_session=False)
+
             # 2. Delete Insights
             deleted_insights = self.db.query(DimInsightHistory).filter(DimInsightHistory.account_id == account_id).delete(synchronize_session=False)
             logger.debug(f"Deleted {deleted_insights} rows from dim_insight_history")
@@ -86,6 +90,9 @@ class CleanupService:
 
             # C. Delete Campaigns
             deleted_campaigns = self.db.query(DimCampaign).filter(DimCampaign.account_id == account_id).delete(synchronize_session=False)
+
+            # D. Forget ETL dimension hashes, or a relinked account's dims would be skipped as unchanged
+            forget_account_dimensions(self.db, account_id)
             
             self.db.commit()
             logger.info(f"Successfully cleaned up data for account {account_id}. Deleted {deleted_campaigns} campaigns.")
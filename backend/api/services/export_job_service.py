@@ -0,0 +1,459 @@
+"""
+Background export jobs.
+
+Exports that do not fit in a request (ad-level daily rows, year-long ranges)
+are submitted as jobs: the request only stores an export_jobs row, and a small
+worker pool streams the query through a server-side cursor into a chunked
+CSV / XLSX / Parquet artifact in EXPORT_JOB_DIR - or writes it to Google Sheets
+in size-bounded chunks. Aggregated data types (campaign breakdown etc.) keep
+the same row limits as the synchronous export.
+Clients poll the job and download the artifact until it expires
+(EXPORT_JOB_TTL_HOURS).
+
+Artifacts live on the local disk of the API process that ran the job.
+"""
+
+import itertools
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.api.dependencies import SessionLocal
+from backend.api.repositories.metrics_repository import MetricsRepository
+from backend.api.repositories.user_repository import UserRepository
+from backend.api.schemas.requests import DataType, ExportJobFormat, ExportJobRequest
+from backend.api.services.export_service import ExportService, get_export_data
+from backend.config.base_config import settings
+from backend.models.user_schema import ExportJob, User
+
+logger = logging.getLogger(__name__)
+
+FILE_EXTENSIONS = {
+    ExportJobFormat.CSV: "csv",
+    ExportJobFormat.XLSX: "xlsx",
+    ExportJobFormat.PARQUET: "parquet",
+}
+
+MEDIA_TYPES = {
+    ExportJobFormat.CSV: "text/csv; charset=utf-8",
+    ExportJobFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportJobFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+# Parquet column types of ad_daily rows (MetricsRepository.iter_ad_daily_metrics); the LEFT JOINed
+# names and video_plays can be NULL for a whole batch, so their types are not inferred
+AD_DAILY_PARQUET_TYPES = {
+    "date": "date32",
+    "account_id": "int64",
+    "campaign_id": "int64",
+    "campaign_name": "string",
+    "adset_id": "int64",
+    "adset_name": "string",
+    "ad_id": "int64",
+    "ad_name": "string",
+    "spend": "float64",
+    "impressions": "int64",
+    "clicks": "int64",
+    "purchases": "int64",
+    "purchase_value": "float64",
+    "leads": "int64",
+    "add_to_cart": "int64",
+    "video_plays": "int64",
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+# Jobs submitted by this process and not finished yet (other API processes share export_jobs)
+_active_jobs: set = set()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.EXPORT_JOB_WORKERS),
+                thread_name_prefix="export-job"
+            )
+        return _executor
+
+
+def shutdown_export_workers():
+    """
+    Stop accepting jobs (application shutdown); running jobs are not waited for.
+    This process's queued and running jobs are marked failed, so clients polling
+    them see an error instead of a job that never finishes.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+        job_ids = list(_active_jobs)
+        _active_jobs.clear()
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+    if not job_ids:
+        return
+
+    try:
+        with SessionLocal() as db:
+            failed = db.query(ExportJob).filter(
+                ExportJob.id.in_(job_ids),
+                ExportJob.status.in_(('pending', 'running'))
+            ).update({
+                "status": 'failed',
+                "error": "Export interrupted by a server restart, please retry",
+                "completed_at": datetime.utcnow()
+            }, synchronize_session=False)
+            db.commit()
+        logger.info(f"Marked {failed} unfinished export job(s) as failed at shutdown")
+    except Exception as e:
+        logger.error(f"Failed to mark unfinished export jobs at shutdown: {e}")
+
+
+class ExportJobService:
+    """Submits, looks up and expires export jobs"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def submit_job(self, user_id: int, request: ExportJobRequest) -> ExportJob:
+        """Store a pending job and hand it to the worker pool"""
+        if request.end_date < request.start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        self.expire_jobs()
+
+        job_id = uuid.uuid4().hex
+        job = ExportJob(
+            id=job_id,
+            user_id=user_id,
+            data_type=request.data_type.value,
+            format=request.format.value,
+            params=request.model_dump_json(),
+            status='pending',
+            rows_exported=0,
+            filename=self._download_filename(request),
+            expires_at=datetime.utcnow() + timedelta(hours=settings.EXPORT_JOB_TTL_HOURS)
+        )
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+
+        with _executor_lock:
+            _active_jobs.add(job_id)
+        _get_executor().submit(run_export_job, job_id)
+        logger.info(f"Export job {job_id} queued for user {user_id}: {request.data_type.value} -> {request.format.value}")
+        return job
+
+    def get_job(self, user_id: int, job_id: str) -> Optional[ExportJob]:
+        return self.db.query(ExportJob).filter(
+            ExportJob.id == job_id,
+            ExportJob.user_id == user_id
+        ).first()
+
+    def list_jobs(self, user_id: int, limit: int = 20) -> List[ExportJob]:
+        return self.db.query(ExportJob).filter(
+            ExportJob.user_id == user_id
+        ).order_by(ExportJob.created_at.desc()).limit(limit).all()
+
+    def expire_jobs(self) -> int:
+        """Delete artifacts of jobs past expires_at and mark them expired"""
+        jobs = self.db.query(ExportJob).filter(
+            ExportJob.expires_at < datetime.utcnow(),
+            ExportJob.status != 'expired'
+        ).all()
+
+        for job in jobs:
+            _remove_file(job.file_path)
+            job.status = 'expired'
+            job.file_path = None
+        if jobs:
+            self.db.commit()
+            logger.info(f"Expired {len(jobs)} export job(s)")
+        return len(jobs)
+
+    @staticmethod
+    def to_response(job: ExportJob) -> Dict[str, Any]:
+        download_url = None
+        if job.status == 'completed' and job.file_path:
+            download_url = f"/api/v1/export/jobs/{job.id}/download"
+        return {
+            "job_id": job.id,
+            "status": job.status,
+            "data_type": job.data_type,
+            "format": job.format,
+            "rows_exported": job.rows_exported or 0,
+            "download_url": download_url,
+            "spreadsheet_url": job.spreadsheet_url,
+            "error": job.error,
+            "created_at": job.created_at,
+            "completed_at": job.completed_at,
+            "expires_at": job.expires_at
+        }
+
+    @staticmethod
+    def _download_filename(request: ExportJobRequest) -> Optional[str]:
+        extension = FILE_EXTENSIONS.get(request.format)
+        if extension is None:
+            return None
+        filename = os.path.basename(request.filename or "") or (
+            f"{request.data_type.value}_{request.start_date}_{request.end_date}"
+        )
+        if not filename.lower().endswith(f".{extension}"):
+            filename = f"{filename}.{extension}"
+        return filename
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+def run_export_job(job_id: str):
+    """
+    Run one job in a worker thread.
+
+    Uses two sessions: rows stream through a server-side cursor on one, while
+    status/progress commits go through short-lived sessions (a commit on the
+    cursor's session would close it).
+    """
+    try:
+        _run_export_job(job_id)
+    finally:
+        with _executor_lock:
+            _active_jobs.discard(job_id)
+
+
+def _run_export_job(job_id: str):
+    with SessionLocal() as db:
+        job = db.query(ExportJob).filter(ExportJob.id == job_id).first()
+        if job is None or job.status != 'pending':
+            return
+        job.status = 'running'
+        job.started_at = datetime.utcnow()
+        db.commit()
+        user_id = job.user_id
+        user = db.query(User).filter(User.id == user_id).first()
+        request = ExportJobRequest.model_validate_json(job.params)
+
+    file_path = None
+    try:
+        with SessionLocal() as stream_db:
+            rows = _ProgressRows(_iter_export_rows(stream_db, user_id, request), job_id)
+
+            if request.format == ExportJobFormat.GOOGLE_SHEETS:
+                spreadsheet_url, _ = _push_to_google_sheets(rows, request, user)
+                result = {"spreadsheet_url": spreadsheet_url}
+            else:
+                file_path = _artifact_path(job_id, FILE_EXTENSIONS[request.format])
+                _write_artifact(rows, request, file_path)
+                result = {"file_path": file_path}
+            row_count = rows.count
+
+        _update_job(job_id, status='completed', rows_exported=row_count, completed_at=datetime.utcnow(),
+                    expires_at=datetime.utcnow() + timedelta(hours=settings.EXPORT_JOB_TTL_HOURS), **result)
+        logger.info(f"Export job {job_id} completed: {row_count} rows ({request.format.value})")
+
+    except Exception as e:
+        logger.error(f"Export job {job_id} failed: {e}", exc_info=True)
+        _remove_file(file_path)
+        _update_job(job_id, status='failed', error=str(e), completed_at=datetime.utcnow())
+
+
+def _iter_export_rows(db: Session, user_id: int, request: ExportJobRequest) -> Iterator[Dict[str, Any]]:
+    """Rows of the requested data type; ad-level daily rows come from a server-side cursor"""
+    filters = request.filters or {}
+
+    if request.data_type == DataType.AD_DAILY:
+        account_ids = UserRepository(db).get_user_account_ids(user_id)
+        requested = filters.get("account_ids")
+        if requested:
+            account_ids = [aid for aid in account_ids if aid in {int(a) for a in requested}]
+        if not account_ids:
+            return
+
+        yield from MetricsRepository(db).iter_ad_daily_metrics(
+            start_date=request.start_date,
+            end_date=request.end_date,
+            account_ids=account_ids,
+            campaign_id=filters.get("campaign_id"),
+            batch_size=settings.EXPORT_JOB_BATCH_ROWS
+        )
+        return
+
+    # Aggregated data types are bounded by their own limits; jobs only lift the request timeout
+    yield from get_export_data(
+        db=db,
+        user_id=user_id,
+        data_type=request.data_type,
+        start_date=request.start_date,
+        end_date=request.end_date,
+        filters=filters
+    )
+
+
+class _ProgressRows:
+    """Row iterator wrapper that counts rows and records rows_exported every EXPORT_JOB_BATCH_ROWS rows"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], job_id: str):
+        self._rows = iter(rows)
+        self.job_id = job_id
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Dict[str, Any]:
+        row = next(self._rows)
+        self.count += 1
+        if self.count % settings.EXPORT_JOB_BATCH_ROWS == 0:
+            _update_job(self.job_id, rows_exported=self.count)
+        return row
+
+
+def _write_artifact(rows: Iterator[Dict[str, Any]], request: ExportJobRequest, file_path: str):
+    """Write rows to file_path (via a .part file renamed on success)"""
+    first = next(rows, None)
+    if first is None:
+        raise ValueError(f"No data found for {request.data_type.value} in the specified date range")
+    headers = list(first.keys())
+
+    all_rows = itertools.chain([first], rows)
+    part_path = f"{file_path}.part"
+    export_service = ExportService()
+
+    try:
+        if request.format == ExportJobFormat.PARQUET:
+            column_types = AD_DAILY_PARQUET_TYPES if request.data_type == DataType.AD_DAILY else None
+            _write_parquet(all_rows, headers, part_path, column_types)
+        else:
+            if request.format == ExportJobFormat.XLSX:
+                chunks = export_service.stream_excel(all_rows, headers=headers, sheet_name=request.sheet_name)
+            else:
+                chunks = export_service.stream_csv(all_rows, headers)
+            with open(part_path, "wb") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        os.replace(part_path, file_path)
+    except Exception:
+        _remove_file(part_path)
+        raise
+
+
+def _write_parquet(rows: Iterable[Dict[str, Any]], headers: List[str], file_path: str,
+                   column_types: Optional[Dict[str, str]] = None):
+    """
+    One Parquet row group per EXPORT_JOB_BATCH_ROWS rows.
+    Column types come from column_types (pyarrow aliases) or are inferred from the
+    first batch, with all-NULL columns written as strings and decimals as float64.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError(
+            "Parquet export dependencies not installed. "
+            "Run: pip install pyarrow"
+        )
+
+    writer = None
+    schema = None
+    batch: List[Dict[str, Any]] = []
+    try:
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= settings.EXPORT_JOB_BATCH_ROWS:
+                if schema is None:
+                    schema = _parquet_schema(pa, batch, headers, column_types or {})
+                    writer = pq.ParquetWriter(file_path, schema)
+                writer.write_table(_parquet_table(pa, batch, schema))
+                batch = []
+        if batch or writer is None:
+            if schema is None:
+                schema = _parquet_schema(pa, batch, headers, column_types or {})
+                writer = pq.ParquetWriter(file_path, schema)
+            writer.write_table(_parquet_table(pa, batch, schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _parquet_schema(pa, batch: List[Dict[str, Any]], headers: List[str], column_types: Dict[str, str]):
+    fields = []
+    for header in headers:
+        if header in column_types:
+            arrow_type = pa.type_for_alias(column_types[header])
+        else:
+            arrow_type = pa.array([row.get(header) for row in batch]).type
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.string()
+            elif pa.types.is_decimal(arrow_type):
+                arrow_type = pa.float64()
+        fields.append(pa.field(header, arrow_type))
+    return pa.schema(fields)
+
+
+def _parquet_table(pa, batch: List[Dict[str, Any]], schema):
+    """Batch as a table of the fixed schema (numbers and strings converted in Python, e.g. Decimal -> float)"""
+    arrays = []
+    for field in schema:
+        if pa.types.is_floating(field.type):
+            convert = float
+        elif pa.types.is_integer(field.type):
+            convert = int
+        elif pa.types.is_string(field.type):
+            convert = str
+        else:
+            convert = None
+        values = [row.get(field.name) for row in batch]
+        if convert is not None:
+            values = [None if value is None else convert(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _push_to_google_sheets(rows: Iterable[Dict[str, Any]], request: ExportJobRequest, user: Optional[User]):
+    if user is None or not user.google_access_token:
+        raise RuntimeError("Google account not connected. Please connect your Google account in settings.")
+
+    return ExportService().append_rows_to_google_sheets(
+        rows,
+        spreadsheet_id=request.spreadsheet_id,
+        sheet_name=request.sheet_name,
+        title=request.title,
+        access_token=user.decrypted_google_token,
+        refresh_token=user.decrypted_google_refresh_token,
+        client_id=os.getenv("GOOGLE_CLIENT_ID"),
+        client_secret=os.getenv("GOOGLE_CLIENT_SECRET")
+    )
+
+
+def _update_job(job_id: str, **values):
+    try:
+        with SessionLocal() as db:
+            db.query(ExportJob).filter(ExportJob.id == job_id).update(values, synchronize_session=False)
+            db.commit()
+    except Exception as e:
+        logger.error(f"Failed to update export job {job_id}: {e}")
+
+
+def _artifact_path(job_id: str, extension: str) -> str:
+    os.makedirs(settings.EXPORT_JOB_DIR, exist_ok=True)
+    return os.path.join(settings.EXPORT_JOB_DIR, f"{job_id}.{extension}")
+
+
+def _remove_file(path: Optional[str]):
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove export artifact {path}: {e}")
+
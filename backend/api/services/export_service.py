@@ -5,18 +5,35 @@ This module provides utilities for exporting analytics data to Google Sheets
 and Excel files with proper formatting.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from datetime import date
+import csv
+import io
+import itertools
 import os
 import logging
-from io import BytesIO
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from sqlalchemy.orm import Session
+
+from backend.api.schemas.requests import DataType
+from backend.api.services.metrics_service import MetricsService
+from backend.config.base_config import settings
+from backend.utils.sheets_client import SheetsClient, get_service_account_sheets_client, get_user_sheets_client
 
 logger = logging.getLogger(__name__)
 
 
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
 class ExportService:
     """Service for exporting data to various formats"""
 
+    WIDTH_SAMPLE_ROWS = 100          # rows buffered to size Excel columns
+    STREAM_CHUNK_BYTES = 64 * 1024
+
     def __init__(self, google_credentials_path: Optional[str] = None):
         """
         Initialize export service.
@@ -27,60 +44,40 @@ class ExportService:
         self.google_credentials_path = google_credentials_path or os.getenv(
             'GOOGLE_CREDENTIALS_PATH'
         )
-        self._sheets_service = None
 
-    def _get_sheets_service(
-        self, 
-        access_token: Optional[str] = None, 
+    def _get_sheets_client(
+        self,
+        access_token: Optional[str] = None,
         refresh_token: Optional[str] = None,
         client_id: Optional[str] = None,
-        client_secret: Optional[str] = None,
-        token_uri: Optional[str] = "https://oauth2.googleapis.com/token"
-    ):
+        client_secret: Optional[str] = None
+    ) -> SheetsClient:
         """
-        Get or create Google Sheets API service.
+        Get the shared Google Sheets client for the user's token (or the service account).
+
+        Clients are cached per token in utils.sheets_client, so the `sheets`
+        service is built once per user instead of once per export.
 
         Args:
            access_token: Optional OAuth access token
            refresh_token: Optional OAuth refresh token
            client_id: OAuth client ID (required for refresh)
            client_secret: OAuth client secret (required for refresh)
-           token_uri: Token URI for refreshing
 
         Returns:
-            Google Sheets API service instance
+            SheetsClient (`.service` builds requests, `.execute(request)` sends them)
 
         Raises:
             RuntimeError: If credentials are not configured
         """
-        # Note: If we have a refresh token (even if we have an existing service), 
-        # we might want to re-initialize to ensure we can refresh.
-        # But for simplicity, if we have a service initialized with user creds, reuse it?
-        # Ideally, we should check if the current service's creds match the requested ones.
-        # For now, let's just always rebuild if access_token is provided to be safe/stateless for this request scope.
-        
         try:
-            from google.oauth2.credentials import Credentials
-            from google.oauth2 import service_account
-            from googleapiclient.discovery import build
-
             if access_token:
-                # If we have refresh logic components
-                if refresh_token and client_id and client_secret:
-                    creds = Credentials(
-                        token=access_token,
-                        refresh_token=refresh_token,
-                        token_uri=token_uri,
-                        client_id=client_id,
-                        client_secret=client_secret
-                    )
-                else:
-                    # Access token only (might expire)
-                    creds = Credentials(token=access_token)
-                
-                service = build('sheets', 'v4', credentials=creds)
-                logger.info("✅ Google Sheets service initialized with User Token")
-                return service
+                return get_user_sheets_client(
+                    access_token,
+                    refresh_token=refresh_token,
+                    client_id=client_id,
+                    client_secret=client_secret
+                )
 
             if not self.google_credentials_path or not os.path.exists(self.google_credentials_path):
                 raise RuntimeError(
@@ -88,15 +85,7 @@ class ExportService:
                     "Set GOOGLE_CREDENTIALS_PATH environment variable or provide credentials_path"
                 )
 
-            credentials = service_account.Credentials.from_service_account_file(
-                self.google_credentials_path,
-                scopes=['https://www.googleapis.com/auth/spreadsheets',
-                       'https://www.googleapis.com/auth/drive.file']
-            )
-
-            self._sheets_service = build('sheets', 'v4', credentials=credentials)
-            logger.info("✅ Google Sheets service initialized with Service Account")
-            return self._sheets_service
+            return get_service_account_sheets_client(self.google_credentials_path)
 
         except ImportError:
             raise RuntimeError(
@@ -134,10 +123,46 @@ class ExportService:
         Returns:
             Spreadsheet URL
         """
-        if not data:
+        spreadsheet_url, _ = self.append_rows_to_google_sheets(
+            data,
+            spreadsheet_id=spreadsheet_id,
+            sheet_name=sheet_name,
+            title=title,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            client_id=client_id,
+            client_secret=client_secret
+        )
+        return spreadsheet_url
+
+    def append_rows_to_google_sheets(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        spreadsheet_id: Optional[str] = None,
+        sheet_name: str = "Facebook Ads Data",
+        title: str = "Facebook Ads Analytics Export",
+        access_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """
+        Write an iterable of rows to Google Sheets.
+
+        Values go out in chunks of at most SHEETS_WRITE_CHUNK_CELLS cells, up to
+        SHEETS_WRITE_CONCURRENCY at a time, and all formatting is one batchUpdate
+        afterwards - so neither the payload nor memory grows with the export.
+
+        Returns:
+            (spreadsheet URL, number of data rows written)
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
             raise ValueError("No data to export")
+        headers = list(first.keys())
 
-        service = self._get_sheets_service(
+        client = self._get_sheets_client(
             access_token=access_token,
             refresh_token=refresh_token,
             client_id=client_id,
@@ -147,32 +172,29 @@ class ExportService:
         try:
             # Create new spreadsheet or use existing
             if not spreadsheet_id:
-                spreadsheet_id = self._create_spreadsheet(service, title, sheet_name)
-
-            # Prepare data for sheets
-            headers = list(data[0].keys())
-            rows = [[self._format_cell_value(row.get(header, "")) for header in headers]
-                    for row in data]
+                spreadsheet_id, sheet_id = self._create_spreadsheet(client, title, sheet_name)
+            else:
+                sheet_id = self._get_sheet_id(client, spreadsheet_id, sheet_name)
 
-            # Write headers
-            self._write_to_sheet(service, spreadsheet_id, sheet_name, [headers], "A1")
-
-            # Write data
-            self._write_to_sheet(service, spreadsheet_id, sheet_name, rows, "A2")
+            values = (
+                [self._format_cell_value(row.get(header, "")) for header in headers]
+                for row in itertools.chain([first], rows)
+            )
+            row_count = self._write_rows_chunked(client, spreadsheet_id, sheet_name, headers, values)
 
             # Apply formatting
-            self._format_sheet(service, spreadsheet_id, sheet_name, headers, len(rows) + 1)
+            self._format_sheet(client, spreadsheet_id, sheet_id, sheet_name, headers, row_count + 1)
 
             spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
-            logger.info(f"✅ Data exported to Google Sheets: {spreadsheet_url}")
-            return spreadsheet_url
+            logger.info(f"✅ {row_count} rows exported to Google Sheets: {spreadsheet_url}")
+            return spreadsheet_url, row_count
 
         except Exception as e:
             logger.error(f"Failed to export to Google Sheets: {e}")
             raise RuntimeError(f"Google Sheets export failed: {str(e)}")
 
-    def _create_spreadsheet(self, service, title: str, sheet_title: str) -> str:
-        """Create a new Google Spreadsheet"""
+    def _create_spreadsheet(self, client: SheetsClient, title: str, sheet_title: str) -> Tuple[str, Optional[int]]:
+        """Create a new Google Spreadsheet; returns (spreadsheet ID, sheet ID of its tab)"""
         spreadsheet = {
             'properties': {
                 'title': title
@@ -185,18 +207,71 @@ class ExportService:
                 }
             ]
         }
-        spreadsheet = service.spreadsheets().create(
+        spreadsheet = client.execute(client.service.spreadsheets().create(
             body=spreadsheet,
-            fields='spreadsheetId'
-        ).execute()
+            fields='spreadsheetId,sheets.properties.sheetId'
+        ))
 
         spreadsheet_id = spreadsheet.get('spreadsheetId')
+        sheets = spreadsheet.get('sheets', [])
+        sheet_id = sheets[0].get('properties', {}).get('sheetId') if sheets else None
         logger.info(f"Created new spreadsheet: {spreadsheet_id}")
-        return spreadsheet_id
+        return spreadsheet_id, sheet_id
+
+    def _get_sheet_id(self, client: SheetsClient, spreadsheet_id: str, sheet_name: str) -> Optional[int]:
+        """Sheet ID of a tab in an existing spreadsheet (None if there is no such tab)"""
+        sheet_metadata = client.execute(client.service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets.properties(sheetId,title)'
+        ))
+        for sheet in sheet_metadata.get('sheets', []):
+            if sheet.get('properties', {}).get('title') == sheet_name:
+                return sheet.get('properties', {}).get('sheetId')
+        return None
+
+    def _write_rows_chunked(
+        self,
+        client: SheetsClient,
+        spreadsheet_id: str,
+        sheet_name: str,
+        headers: List[str],
+        rows: Iterable[List[Any]]
+    ) -> int:
+        """
+        Write the header row and rows from A1 down, in size-bounded chunks.
+
+        Each chunk targets its own range, so chunks can be in flight concurrently;
+        at most SHEETS_WRITE_CONCURRENCY chunks are held in memory at once.
+        Returns the number of data rows written.
+        """
+        rows_per_chunk = max(1, settings.SHEETS_WRITE_CHUNK_CELLS // max(1, len(headers)))
+        concurrency = max(1, settings.SHEETS_WRITE_CONCURRENCY)
+        all_rows = itertools.chain([headers], rows)
+        next_row = 1
+        pending = set()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                chunk = list(itertools.islice(all_rows, rows_per_chunk))
+                if not chunk:
+                    break
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(
+                    self._write_to_sheet, client, spreadsheet_id, sheet_name, chunk, f"A{next_row}"
+                ))
+                next_row += len(chunk)
+
+            for future in pending:
+                future.result()
+
+        return next_row - 2
 
     def _write_to_sheet(
         self,
-        service,
+        client: SheetsClient,
         spreadsheet_id: str,
         sheet_name: str,
         data: List[List[Any]],
@@ -213,39 +288,30 @@ class ExportService:
             'values': data
         }
 
-        service.spreadsheets().values().update(
+        client.execute(client.service.spreadsheets().values().update(
             spreadsheetId=spreadsheet_id,
             range=range_name,
             valueInputOption='RAW',
             body=body
-        ).execute()
+        ))
 
     def _format_sheet(
         self,
-        service,
+        client: SheetsClient,
         spreadsheet_id: str,
+        sheet_id: Optional[int],
         sheet_name: str,
         headers: List[str],
         num_rows: int
     ):
         """
-        Apply formatting to the sheet.
+        Apply formatting to the sheet in a single batchUpdate.
 
         - Bold headers
         - Freeze header row
         - Auto-resize columns
-        - Format currency/percentage columns
+        - Format currency/percentage columns (adjacent columns share one range)
         """
-        # Get sheet ID
-        sheet_metadata = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-        sheets = sheet_metadata.get('sheets', [])
-        sheet_id = None
-
-        for sheet in sheets:
-            if sheet.get('properties', {}).get('title') == sheet_name:
-                sheet_id = sheet.get('properties', {}).get('sheetId')
-                break
-
         if sheet_id is None:
             logger.warning(f"Sheet '{sheet_name}' not found for formatting")
             return
@@ -301,94 +367,116 @@ class ExportService:
             }
         })
 
-        # Apply number formatting for common metric columns
-        for col_idx, header in enumerate(headers):
-            header_lower = header.lower()
-
-            # Currency format
-            if any(term in header_lower for term in ['spend', 'cost', 'value', 'cpc', 'cpa', 'cpm']):
+        # Apply number formatting for common metric columns, one request per run of same-format columns
+        column_formats = [self._number_format(header) for header in headers]
+        run_start = 0
+        for col_idx in range(1, len(headers) + 1):
+            if col_idx < len(headers) and column_formats[col_idx] == column_formats[run_start]:
+                continue
+            number_format = column_formats[run_start]
+            if number_format:
                 requests.append({
                     'repeatCell': {
                         'range': {
                             'sheetId': sheet_id,
                             'startRowIndex': 1,
                             'endRowIndex': num_rows,
-                            'startColumnIndex': col_idx,
-                            'endColumnIndex': col_idx + 1
+                            'startColumnIndex': run_start,
+                            'endColumnIndex': col_idx
                         },
                         'cell': {
                             'userEnteredFormat': {
-                                'numberFormat': {
-                                    'type': 'CURRENCY',
-                                    'pattern': '"$"#,##0.00'
-                                }
-                            }
-                        },
-                        'fields': 'userEnteredFormat.numberFormat'
-                    }
-                })
-
-            # Percentage format
-            elif any(term in header_lower for term in ['ctr', 'rate', 'roas', 'change']):
-                requests.append({
-                    'repeatCell': {
-                        'range': {
-                            'sheetId': sheet_id,
-                            'startRowIndex': 1,
-                            'endRowIndex': num_rows,
-                            'startColumnIndex': col_idx,
-                            'endColumnIndex': col_idx + 1
-                        },
-                        'cell': {
-                            'userEnteredFormat': {
-                                'numberFormat': {
-                                    'type': 'NUMBER',
-                                    'pattern': '#,##0.00'
-                                }
+                                'numberFormat': number_format
                             }
                         },
                         'fields': 'userEnteredFormat.numberFormat'
                     }
                 })
+            run_start = col_idx
 
         # Execute all formatting requests
-        if requests:
-            body = {
-                'requests': requests
-            }
-            service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
+        body = {
+            'requests': requests
+        }
+        client.execute(client.service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=body
+        ))
+
+        logger.info(f"✅ Applied formatting to sheet '{sheet_name}'")
+
+    @staticmethod
+    def _number_format(header: str) -> Optional[Dict[str, str]]:
+        """Sheets number format for a metric column, by name"""
+        header_lower = header.lower()
+
+        # Currency format
+        if any(term in header_lower for term in ['spend', 'cost', 'value', 'cpc', 'cpa', 'cpm']):
+            return {'type': 'CURRENCY', 'pattern': '"$"#,##0.00'}
 
-            logger.info(f"✅ Applied formatting to sheet '{sheet_name}'")
+        # Percentage format
+        if any(term in header_lower for term in ['ctr', 'rate', 'roas', 'change']):
+            return {'type': 'NUMBER', 'pattern': '#,##0.00'}
 
-    def export_to_excel(
+        return None
+
+    def stream_csv(
         self,
-        data: List[Dict[str, Any]],
-        filename: str = "facebook_ads_export.xlsx",
+        rows: Iterable[Dict[str, Any]],
+        fieldnames: List[str],
+        rows_per_chunk: int = 500
+    ) -> Iterator[bytes]:
+        """
+        Encode rows as CSV chunks for a StreamingResponse.
+
+        Starts with a UTF-8 BOM (Excel needs it to read Hebrew/Arabic) and the header,
+        then yields one chunk per rows_per_chunk rows - only one chunk is held in memory.
+        Keys missing from a row are written empty; keys not in fieldnames are ignored.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction='ignore')
+
+        buffer.write('\ufeff')
+        writer.writeheader()
+        pending = 0
+        for row in rows:
+            writer.writerow(row)
+            pending += 1
+            if pending >= rows_per_chunk:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    def stream_excel(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        headers: Optional[List[str]] = None,
         sheet_name: str = "Data"
-    ) -> BytesIO:
+    ) -> Iterator[bytes]:
         """
-        Export data to Excel file (in-memory).
+        Export rows to an Excel file (.xlsx), yielded in chunks for a StreamingResponse.
+
+        Uses openpyxl's write-only workbook, which writes each row to a temp file
+        as it is appended instead of keeping every cell in memory. Column widths
+        are sized from the header and the first WIDTH_SAMPLE_ROWS rows.
 
         Args:
-            data: List of dicts to export
-            filename: Filename for the Excel file
+            rows: Iterable of dicts to export (e.g. a repository cursor)
+            headers: Column order; defaults to the keys of the first row
             sheet_name: Name of the Excel sheet
 
-        Returns:
-            BytesIO object containing the Excel file
-
         Example:
             ```python
-            excel_file = export_service.export_to_excel(data)
-            with open("export.xlsx", "wb") as f:
-                f.write(excel_file.getvalue())
+            return StreamingResponse(export_service.stream_excel(rows), media_type=XLSX_MEDIA_TYPE)
             ```
         """
         try:
             from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill, Alignment
             from openpyxl.utils import get_column_letter
 
@@ -398,49 +486,50 @@ class ExportService:
                 "Run: pip install openpyxl"
             )
 
-        if not data:
+        # Column widths must be set before the first row in write-only mode,
+        # so buffer a bounded sample of rows to size them
+        rows = iter(rows)
+        sample = list(itertools.islice(rows, self.WIDTH_SAMPLE_ROWS))
+        if not sample:
             raise ValueError("No data to export")
+        headers = headers or list(sample[0].keys())
 
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(title=sheet_name)
 
-        # Write headers
-        headers = list(data[0].keys())
         for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
+            max_length = max(
+                [len(str(header))] + [len(str(self._format_cell_value(row.get(header, "")))) for row in sample]
+            )
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(max_length + 2, 50)
+
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
             cell.font = Font(bold=True)
             cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
             cell.alignment = Alignment(horizontal="center")
+            header_cells.append(cell)
+        ws.append(header_cells)
 
-        # Write data
-        for row_idx, row_data in enumerate(data, 2):
-            for col_idx, header in enumerate(headers, 1):
-                value = self._format_cell_value(row_data.get(header, ""))
-                ws.cell(row=row_idx, column=col_idx, value=value)
+        def generate() -> Iterator[bytes]:
+            row_count = 0
+            with tempfile.TemporaryFile() as output:
+                for row_data in itertools.chain(sample, rows):
+                    ws.append([self._format_cell_value(row_data.get(header, "")) for header in headers])
+                    row_count += 1
+                wb.save(output)
 
-        # Auto-adjust column widths
-        for col_idx, header in enumerate(headers, 1):
-            column_letter = get_column_letter(col_idx)
-            max_length = len(str(header))
-            for row in ws.iter_rows(min_col=col_idx, max_col=col_idx, min_row=2):
-                try:
-                    cell_length = len(str(row[0].value))
-                    if cell_length > max_length:
-                        max_length = cell_length
-                except (TypeError, AttributeError):
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        # Save to BytesIO
-        excel_file = BytesIO()
-        wb.save(excel_file)
-        excel_file.seek(0)
-
-        logger.info(f"✅ Data exported to Excel: {len(data)} rows")
-        return excel_file
+                output.seek(0)
+                while True:
+                    chunk = output.read(self.STREAM_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    yield chunk
+
+            logger.info(f"✅ Data exported to Excel: {row_count} rows")
+
+        return generate()
 
     def _format_cell_value(self, value: Any) -> Any:
         """Format a cell value for export"""
@@ -454,3 +543,105 @@ class ExportService:
             import json
             return json.dumps(value)
         return str(value)
+
+
+def get_export_data(
+    db: Session,
+    user_id: int,
+    data_type: DataType,
+    start_date: date,
+    end_date: date,
+    filters: Dict[str, Any] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch data from database based on data type.
+
+    Args:
+        db: Database session
+        user_id: Current user ID for filtering
+        data_type: Type of data to export
+        start_date: Start date
+        end_date: End date
+        filters: Additional filters
+
+    Returns:
+        List of dictionaries containing the data
+    """
+    service = MetricsService(db, user_id)
+    filters = filters or {}
+
+    if data_type == DataType.CORE_METRICS:
+        # Get overview metrics
+        result = service.get_overview_metrics(
+            start_date=start_date,
+            end_date=end_date,
+            compare_to_previous=False
+        )
+        return [{
+            "metric": "Overall Performance",
+            "spend": result.current_period.spend,
+            "impressions": result.current_period.impressions,
+            "clicks": result.current_period.clicks,
+            "ctr": result.current_period.ctr,
+            "cpc": result.current_period.cpc,
+            "cpm": result.current_period.cpm,
+            "purchases": result.current_period.purchases,
+            "purchase_value": result.current_period.purchase_value,
+            "roas": result.current_period.roas,
+            "cpa": result.current_period.cpa
+        }]
+
+    elif data_type == DataType.CAMPAIGN_BREAKDOWN:
+        # Get campaign breakdown
+        campaigns = service.get_campaign_breakdown(
+            start_date=start_date,
+            end_date=end_date,
+            sort_by=filters.get("sort_by", "spend"),
+            limit=filters.get("limit", 100)
+        )
+        return [campaign.model_dump() for campaign in campaigns]
+
+    elif data_type == DataType.AGE_GENDER:
+        # Get age/gender breakdown
+        breakdown = service.get_age_gender_breakdown(
+            start_date=start_date,
+            end_date=end_date,
+            campaign_id=filters.get("campaign_id")
+        )
+        return [item.model_dump() for item in breakdown]
+
+    elif data_type == DataType.PLACEMENT:
+        # Get placement breakdown
+        breakdown = service.get_placement_breakdown(
+            start_date=start_date,
+            end_date=end_date,
+            campaign_id=filters.get("campaign_id")
+        )
+        return [item.model_dump() for item in breakdown]
+
+    elif data_type == DataType.COUNTRY:
+        # Get country breakdown
+        breakdown = service.get_country_breakdown(
+            start_date=start_date,
+            end_date=end_date,
+            campaign_id=filters.get("campaign_id"),
+            top_n=filters.get("top_n", 10)
+        )
+        return [item.model_dump() for item in breakdown]
+
+    elif data_type == DataType.CREATIVE_METRICS:
+        # Get creative metrics
+        creatives = service.get_creative_metrics(
+            start_date=start_date,
+            end_date=end_date,
+            is_video=filters.get("is_video"),
+            min_spend=filters.get("min_spend", 100),
+            sort_by=filters.get("sort_by", "spend")
+        )
+        return [creative.model_dump() for creative in creatives]
+
+    elif data_type == DataType.AD_DAILY:
+        raise ValueError("Ad-level daily data is only available as an export job (POST /api/v1/export/jobs)")
+
+    else:
+        raise ValueError(f"Unknown data type: {data_type}")
@@ -4,10 +4,13 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from facebook_business.api import FacebookAdsApi
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.adobjects.user import User as FBUser
 
+from backend.utils.graph_client import get_graph_client
+from backend.utils.page_token_cache import user_cache_key
+from backend.utils.account_catalog_cache import account_catalog_cache, PROMOTE_PAGES
+
 logger = logging.getLogger(__name__)
 
 class FacebookAuthService:
@@ -95,31 +98,38 @@ class FacebookAuthService:
 
     def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Get Facebook user details (id, name, email)"""
-        FacebookAdsApi.init(access_token=access_token)
-        me = FBUser(fbid='me')
+        api = get_graph_client(access_token, with_app_secret=False).api
+        me = FBUser(fbid='me', api=api)
         fields = ['id', 'name', 'email']
         user = me.api_get(fields=fields)
         return user.export_all_data()
 
     def _fetch_pages_for_account_http(self, account_id: str, access_token: str) -> Dict[str, Any]:
-        """Fetch promote pages using direct HTTP call for true parallel execution."""
+        """Fetch promote pages using direct HTTP call for true parallel execution (cached per account)."""
         try:
-            import requests
-            url = f"https://graph.facebook.com/v24.0/act_{account_id}/promote_pages"
-            params = {"access_token": access_token, "fields": "id,name"}
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json().get("data", [])
-                if data:
-                    return {"page_id": data[0]["id"], "page_name": data[0].get("name")}
+            return account_catalog_cache.get(
+                user_cache_key(access_token), PROMOTE_PAGES, account_id,
+                lambda: self._fetch_promote_page(account_id, access_token)
+            )
         except Exception as e:
             logger.warning(f"Could not fetch pages for account {account_id}: {e}")
         return {"page_id": None, "page_name": None}
 
+    def _fetch_promote_page(self, account_id: str, access_token: str) -> Dict[str, Any]:
+        http = get_graph_client(access_token, with_app_secret=False).http
+        url = f"https://graph.facebook.com/v24.0/act_{account_id}/promote_pages"
+        params = {"access_token": access_token, "fields": "id,name"}
+        response = http.get(url, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json().get("data", [])
+        if data:
+            return {"page_id": data[0]["id"], "page_name": data[0].get("name")}
+        return {"page_id": None, "page_name": None}
+
     def get_managed_accounts(self, access_token: str) -> List[Dict[str, Any]]:
         """List ad accounts reachable by the given user token with page info"""
-        FacebookAdsApi.init(access_token=access_token)
-        me = FBUser(fbid='me')
+        api = get_graph_client(access_token, with_app_secret=False).api
+        me = FBUser(fbid='me', api=api)
         accounts = me.get_ad_accounts(fields=[
             AdAccount.Field.account_id,
             AdAccount.Field.name,
@@ -3,22 +3,24 @@ Insights Service
 Generates AI-powered marketing insights and recommendations
 """
 
-import os
 import json
 import logging
 import hashlib
 import time
 from datetime import date, timedelta, datetime
 from typing import Dict, Any, List, Optional
-import google.genai as genai
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 from sqlalchemy.orm import Session
 
 from backend.api.repositories.insights_repository import InsightsRepository
 from backend.api.repositories.user_repository import UserRepository
 from backend.api.repositories.adset_repository import AdSetRepository
+from backend.api.repositories.insight_snapshot_repository import InsightSnapshotRepository
 from backend.api.services.comparison_service import ComparisonService
-from backend.config.settings import GEMINI_MODEL
+from backend.config.settings import (
+    GEMINI_MODEL, INSIGHT_SNAPSHOT_WINDOWS, INSIGHT_SNAPSHOT_PAGE_CONTEXTS, INSIGHT_SNAPSHOT_LOCALES
+)
 from backend.config.base_config import SUPPORTED_LANGUAGES
 from backend.utils.cache_utils import TTLCache
 
@@ -141,19 +143,11 @@ class InsightsService:
         self.user_id = user_id
         self.repository = InsightsRepository(db)
         self.adset_repository = AdSetRepository(db)
+        self.snapshot_repository = InsightSnapshotRepository(db)
 
-        # Initialize Gemini
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            self.client = None
-        else:
-            try:
-                self.client = genai.Client(api_key=api_key)
-                self.model = GEMINI_MODEL
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
-                self.client = None
+        # Initialize LLM provider (Gemini, or local stub when LLM_PROVIDER=stub)
+        self.client = get_llm_provider()
+        self.model = GEMINI_MODEL
 
     def _get_cache_key(
         self,
@@ -358,9 +352,6 @@ class InsightsService:
             logger.info(f"Returning cached summary insights for {page_context}")
             return cached
 
-        # Determine comparison period
-        prev_start, prev_end = ComparisonService.calculate_previous_period(start_date, end_date)
-
         # Get linked accounts if user_id provided
         if user_id:
             user_accounts = self._get_user_account_ids(user_id)
@@ -372,6 +363,45 @@ class InsightsService:
         else:
             account_ids = None
 
+        # Default windows without filters are precomputed after each ETL run
+        if not (campaign_filter or breakdown_type or breakdown_group_by):
+            snapshot = self._get_snapshot(
+                'summary', account_ids, start_date, end_date, page_context, locale
+            )
+            if snapshot:
+                logger.info(f"Returning precomputed summary insights for {page_context}")
+                INSIGHTS_CACHE.set(cache_key, snapshot)
+                return snapshot
+
+        result = self._build_summary_insights(
+            start_date, end_date, page_context,
+            campaign_filter=campaign_filter,
+            breakdown_type=breakdown_type,
+            breakdown_group_by=breakdown_group_by,
+            account_ids=account_ids,
+            locale=locale
+        )
+
+        # Cache the result
+        INSIGHTS_CACHE.set(cache_key, result)
+
+        return result
+
+    def _build_summary_insights(
+        self,
+        start_date: date,
+        end_date: date,
+        page_context: str,
+        campaign_filter: Optional[str] = None,
+        breakdown_type: Optional[str] = None,
+        breakdown_group_by: Optional[str] = None,
+        account_ids: Optional[List[int]] = None,
+        locale: str = "en"
+    ) -> Dict[str, Any]:
+        """Fetch data and generate summary insights (uncached)."""
+        # Determine comparison period
+        prev_start, prev_end = ComparisonService.calculate_previous_period(start_date, end_date)
+
         # Fetch data with filters
         data = self.repository.get_insights_data(
             start_date=start_date,
@@ -390,14 +420,12 @@ class InsightsService:
         if not overview or (overview.get('spend', 0) == 0 and overview.get('impressions', 0) == 0):
             # No data available yet - return empty insights
             logger.info(f"No data available for insights (user may be new or data is still syncing)")
-            result = {
+            return {
                 "insights": [],
                 "context": page_context,
                 "period": f"{start_date} to {end_date}",
                 "message": "Your data is being synced. Insights will appear once your Facebook ad data is loaded."
             }
-            INSIGHTS_CACHE.set(cache_key, result)
-            return result
 
         # Prepare data summary for AI with filter context
         data_summary = self._prepare_data_summary(
@@ -445,16 +473,11 @@ class InsightsService:
                 logger.error(f"AI generation failed: {e}")
                 insights = self._generate_fallback_insights(data, page_context)
 
-        result = {
+        return {
             'insights': insights,
             'generated_at': datetime.utcnow().isoformat()
         }
 
-        # Cache the result
-        INSIGHTS_CACHE.set(cache_key, result)
-
-        return result
-
     def get_deep_analysis(
         self,
         start_date: date,
@@ -1246,6 +1269,23 @@ class InsightsService:
             logger.info("Returning cached overview summary")
             return cached
 
+        snapshot = self._get_snapshot('overview', account_ids, None, today, None, locale)
+        if snapshot:
+            logger.info("Returning precomputed overview summary")
+            INSIGHTS_CACHE.set(cache_key, snapshot)
+            return snapshot
+
+        result = self._build_overview_summary(account_ids, locale)
+
+        # Cache result
+        INSIGHTS_CACHE.set(cache_key, result)
+
+        return result
+
+    def _build_overview_summary(self, account_ids: Optional[List[int]], locale: str = "en") -> Dict[str, Any]:
+        """Generate daily/weekly/monthly insights, checks and TL;DR (uncached)."""
+        today = date.today()
+
         # Generate all insights
         daily_insight = self._generate_period_insight(
             period_type="daily",
@@ -1286,7 +1326,7 @@ class InsightsService:
             improvement_checks, account_ids, locale
         )
 
-        result = {
+        return {
             'daily': daily_insight,
             'weekly': weekly_insight,
             'monthly': monthly_insight,
@@ -1295,10 +1335,102 @@ class InsightsService:
             'generated_at': datetime.utcnow().isoformat()
         }
 
-        # Cache result
-        INSIGHTS_CACHE.set(cache_key, result)
+    # =========================================================================
+    # PRECOMPUTED SNAPSHOTS
+    # =========================================================================
 
-        return result
+    def _snapshot_key(
+        self,
+        start_date: Optional[date],
+        end_date: date,
+        page_context: Optional[str],
+        locale: str
+    ) -> str:
+        """Key identifying a snapshot window. Dates are absolute, so yesterday's snapshots never match today."""
+        return f"{page_context or 'overview'}|{start_date or ''}|{end_date}|{locale}"
+
+    def _get_snapshot(
+        self,
+        kind: str,
+        account_ids: Optional[List[int]],
+        start_date: Optional[date],
+        end_date: date,
+        page_context: Optional[str],
+        locale: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a precomputed snapshot for a single-account default window."""
+        # Snapshots are per account; multi-account aggregates are generated on demand
+        if not account_ids or len(account_ids) != 1:
+            return None
+
+        if kind == 'summary':
+            yesterday = date.today() - timedelta(days=1)
+            window_days = (end_date - start_date).days + 1
+            if (end_date != yesterday
+                    or window_days not in INSIGHT_SNAPSHOT_WINDOWS
+                    or page_context not in INSIGHT_SNAPSHOT_PAGE_CONTEXTS):
+                return None
+
+        try:
+            return self.snapshot_repository.get_snapshot(
+                int(account_ids[0]), kind, self._snapshot_key(start_date, end_date, page_context, locale)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read insight snapshot: {e}")
+            self.db.rollback()
+            return None
+
+    def precompute_snapshots(self, account_id: int, locales: Optional[List[str]] = None) -> int:
+        """
+        Precompute summary (default windows) and overview insights for one account.
+
+        Called after ETL completes. Returns the number of snapshots written.
+        """
+        today = date.today()
+        yesterday = today - timedelta(days=1)
+        account_ids = [account_id]
+        written = 0
+
+        for locale in locales or INSIGHT_SNAPSHOT_LOCALES:
+            for page_context in INSIGHT_SNAPSHOT_PAGE_CONTEXTS:
+                for days in INSIGHT_SNAPSHOT_WINDOWS:
+                    start_date = yesterday - timedelta(days=days - 1)
+                    try:
+                        result = self._build_summary_insights(
+                            start_date, yesterday, page_context,
+                            account_ids=account_ids, locale=locale
+                        )
+                        self.snapshot_repository.save_snapshot(
+                            account_id, 'summary',
+                            self._snapshot_key(start_date, yesterday, page_context, locale),
+                            result
+                        )
+                        written += 1
+                    except Exception as e:
+                        logger.error(f"Failed to precompute {days}d {page_context} insights for account {account_id}: {e}")
+                        self.db.rollback()
+
+            try:
+                result = self._build_overview_summary(account_ids, locale)
+                self.snapshot_repository.save_snapshot(
+                    account_id, 'overview', self._snapshot_key(None, today, None, locale), result
+                )
+                written += 1
+            except Exception as e:
+                logger.error(f"Failed to precompute overview insights for account {account_id}: {e}")
+                self.db.rollback()
+
+        # Snapshots from earlier days can never be served again
+        try:
+            self.snapshot_repository.delete_stale_snapshots(
+                account_id, datetime.combine(today, datetime.min.time())
+            )
+        except Exception as e:
+            logger.warning(f"Failed to clean up stale insight snapshots for account {account_id}: {e}")
+            self.db.rollback()
+
+        logger.info(f"Precomputed {written} insight snapshot(s) for account {account_id}")
+        return written
 
     def _generate_period_insight(
         self,
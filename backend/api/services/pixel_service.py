@@ -7,18 +7,22 @@ to provide an optimization summary for campaign building.
 
 import logging
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
-from facebook_business.api import FacebookAdsApi
 from facebook_business.adobjects.adaccount import AdAccount
 
 from backend.config.base_config import settings
+from backend.utils.graph_client import get_graph_client
+from backend.utils.page_token_cache import user_cache_key
+from backend.utils.account_catalog_cache import account_catalog_cache, PIXELS, PIXEL_FIELDS, LEAD_FORMS
 
 logger = logging.getLogger(__name__)
 
+SUMMARY_FETCH_WORKERS = 8  # Concurrent Graph calls per optimization summary (pixel stats, lead forms)
+
 # Maps business_type to expected pixel events
 BUSINESS_EVENT_EXPECTATIONS = {
     "ecommerce": {
@@ -47,15 +51,14 @@ class PixelService:
         self.access_token = access_token
         self.app_id = settings.FACEBOOK_APP_ID
         self.app_secret = settings.FACEBOOK_APP_SECRET
-        FacebookAdsApi.init(self.app_id, self.app_secret, self.access_token)
+        self.graph = get_graph_client(self.access_token)
 
     def get_account_pixels(self, account_id: str) -> List[Dict[str, Any]]:
-        """Fetch pixels for an ad account with health info."""
+        """Fetch pixels for an ad account with health info (pixel list cached per account)."""
         try:
-            clean_id = account_id.replace("act_", "")
-            account = AdAccount(f"act_{clean_id}")
-            pixels = account.get_ads_pixels(
-                fields=['id', 'name', 'is_unavailable', 'last_fired_time']
+            pixels = account_catalog_cache.get(
+                user_cache_key(self.access_token), PIXELS, account_id,
+                lambda: self._fetch_pixel_catalog(account_id)
             )
 
             results = []
@@ -89,6 +92,11 @@ class PixelService:
             logger.error(f"Failed to fetch pixels for account {account_id}: {e}")
             return []
 
+    def _fetch_pixel_catalog(self, account_id: str) -> List[Dict[str, Any]]:
+        clean_id = account_id.replace("act_", "")
+        account = AdAccount(f"act_{clean_id}", api=self.graph.api)
+        return [pixel.export_all_data() for pixel in account.get_ads_pixels(fields=PIXEL_FIELDS)]
+
     def get_pixel_event_stats(self, pixel_id: str, days: int = 30) -> List[Dict[str, Any]]:
         """Get event breakdown for a specific pixel over the last N days."""
         try:
@@ -103,7 +111,7 @@ class PixelService:
                 'end_time': end_time,
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            response = self.graph.http.get(url, params=params, timeout=15)
             data = response.json()
 
             if 'error' in data:
@@ -125,46 +133,58 @@ class PixelService:
             return []
 
     def get_lead_forms_summary(self, page_id: str) -> List[Dict[str, Any]]:
-        """Fetch lead forms for a page (separate from pixel events)."""
+        """Fetch lead forms for a page (separate from pixel events, cached per page)."""
         if not page_id:
             return []
         try:
-            # Get page access token first
-            url = f"https://graph.facebook.com/v24.0/{page_id}"
-            params = {
-                'access_token': self.access_token,
-                'fields': 'access_token',
-            }
-            resp = requests.get(url, params=params, timeout=10)
-            page_data = resp.json()
-            page_token = page_data.get('access_token')
-
-            if not page_token:
-                logger.warning(f"No page access token for page {page_id}")
-                return []
-
-            # Fetch lead forms
-            url = f"https://graph.facebook.com/v24.0/{page_id}/leadgen_forms"
-            params = {
-                'access_token': page_token,
-                'fields': 'id,name,status,leads_count',
-            }
-            resp = requests.get(url, params=params, timeout=10)
-            data = resp.json()
-
-            forms = []
-            for form in data.get('data', []):
-                forms.append({
-                    'id': form.get('id'),
-                    'name': form.get('name'),
-                    'status': form.get('status'),
-                    'leads_count': form.get('leads_count', 0),
-                })
-            return forms
+            return account_catalog_cache.get(
+                user_cache_key(self.access_token), LEAD_FORMS, page_id,
+                lambda: self._fetch_lead_forms(page_id)
+            )
+        except ValueError as e:
+            logger.warning(f"Could not fetch lead forms for page {page_id}: {e}")
+            return []
         except Exception as e:
             logger.error(f"Failed to fetch lead forms for page {page_id}: {e}")
             return []
 
+    def _fetch_lead_forms(self, page_id: str) -> List[Dict[str, Any]]:
+        # Get page access token first
+        url = f"https://graph.facebook.com/v24.0/{page_id}"
+        params = {
+            'access_token': self.access_token,
+            'fields': 'access_token',
+        }
+        resp = self.graph.http.get(url, params=params, timeout=10)
+        page_data = resp.json()
+        page_token = page_data.get('access_token')
+
+        if not page_token:
+            # Raised, not returned as [], so the empty result is not cached
+            raise ValueError(f"No page access token for page {page_id}")
+
+        # Fetch lead forms
+        url = f"https://graph.facebook.com/v24.0/{page_id}/leadgen_forms"
+        params = {
+            'access_token': page_token,
+            'fields': 'id,name,status,leads_count',
+        }
+        resp = self.graph.http.get(url, params=params, timeout=10)
+        data = resp.json()
+
+        if 'error' in data:
+            raise ValueError(data['error'].get('message', 'Unknown error'))
+
+        forms = []
+        for form in data.get('data', []):
+            forms.append({
+                'id': form.get('id'),
+                'name': form.get('name'),
+                'status': form.get('status'),
+                'leads_count': form.get('leads_count', 0),
+            })
+        return forms
+
     def get_optimization_summary(
         self,
         account_id: str,
@@ -180,12 +200,16 @@ class PixelService:
         """
         clean_id = account_id.replace("act_", "")
 
-        # 1. Get pixels and their events
-        pixels = self.get_account_pixels(account_id)
+        # 1. Get pixels and their events, with the lead forms (step 3) fetched alongside
+        with ThreadPoolExecutor(max_workers=SUMMARY_FETCH_WORKERS) as executor:
+            lead_forms_future = executor.submit(self.get_lead_forms_summary, page_id) if page_id else None
+            pixels = self.get_account_pixels(account_id)
+            pixel_events = list(executor.map(lambda pixel: self.get_pixel_event_stats(pixel['id']), pixels))
+            lead_forms = lead_forms_future.result() if lead_forms_future else []
+
         all_events = []
         pixel_details = []
-        for pixel in pixels:
-            events = self.get_pixel_event_stats(pixel['id'])
+        for pixel, events in zip(pixels, pixel_events):
             pixel_details.append({**pixel, 'events': events})
             all_events.extend(events)
 
@@ -215,10 +239,7 @@ class PixelService:
         except Exception as e:
             logger.error(f"Failed to fetch active objectives: {e}")
 
-        # 3. Get lead forms
-        lead_forms = self.get_lead_forms_summary(page_id) if page_id else []
-
-        # 4. Smart warnings
+        # 3. Smart warnings
         warnings = self._build_warnings(clean_id, db, merged_events, lead_forms)
 
         return {
@@ -5,23 +5,26 @@ This service automatically generates AI-powered insights without being asked,
 like a 24/7 CMO monitoring your ad account.
 """
 
-import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta, datetime, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text, func
 
-import google.genai as genai
+from backend.api.repositories.base_repository import date_id_between
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 
 try:
     from backend.models.schema import DimInsightHistory
     from backend.config.settings import GEMINI_MODEL
+    from backend.api.repositories.insight_snapshot_repository import SNAPSHOT_INSIGHT_TYPE
 except ModuleNotFoundError:
     from models.schema import DimInsightHistory
     from config.settings import GEMINI_MODEL
+    from api.repositories.insight_snapshot_repository import SNAPSHOT_INSIGHT_TYPE
 
 logger = logging.getLogger(__name__)
 
@@ -74,18 +77,9 @@ class ProactiveAnalysisService:
         self.db = db
         self.user_id = user_id
 
-        # Initialize Gemini
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            logger.error("GEMINI_API_KEY not found in environment")
-            self.client = None
-        else:
-            try:
-                self.client = genai.Client(api_key=api_key)
-                self.model = GEMINI_MODEL
-            except Exception as e:
-                logger.error(f"Failed to initialize Gemini: {e}")
-                self.client = None
+        # Initialize LLM provider (Gemini, or local stub when LLM_PROVIDER=stub)
+        self.client = get_llm_provider()
+        self.model = GEMINI_MODEL
 
     def _get_user_account_ids(self) -> Optional[List[int]]:
         """Get account IDs for current user (for data filtering)"""
@@ -111,7 +105,6 @@ class ProactiveAnalysisService:
         try:
             yesterday = date.today() - timedelta(days=1)
             week_ago = yesterday - timedelta(days=7)
-            two_weeks_ago = yesterday - timedelta(days=14)
 
             # Get yesterday's metrics
             yesterday_metrics = self._get_daily_metrics(yesterday, yesterday, account_id)
@@ -123,56 +116,14 @@ class ProactiveAnalysisService:
                 logger.info("No data available for daily insights")
                 return []
 
-            # Calculate changes
-            changes = self._calculate_changes(yesterday_metrics, week_metrics)
-
-            # Determine priority based on magnitude of changes
-            priority = self._determine_priority(changes)
-
-            # Prepare context for AI
-            context = {
-                'yesterday': yesterday.isoformat(),
-                'yesterday_metrics': yesterday_metrics,
-                'week_average': week_metrics,
-                'changes': changes
-            }
-
-            context_json = json.dumps(context, indent=2, default=str, ensure_ascii=False)
-
-            # Call Gemini
-            response = self.client.generate_content(
-                context_json,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3
-                )
-            )
-
-            analysis_text = response.text.strip()
-
-            # Store insight in database
-            insight = DimInsightHistory(
-                account_id=account_id,
-                generated_at=datetime.now(timezone.utc),
-                insight_type='daily',
-                priority=priority,
-                category='performance',
-                title=f"Daily Performance Update - {yesterday.strftime('%B %d, %Y')}",
-                message=analysis_text,
-                data_json=context_json,
-                is_read=False
-            )
+            priority, context_json = self._build_daily_context(yesterday, yesterday_metrics, week_metrics)
+            analysis_text = self._generate_analysis(DAILY_INSIGHT_PROMPT, context_json)
 
-            self.db.add(insight)
-            self.db.commit()
-
-            logger.info(f"Generated daily insight (priority: {priority})")
-
-            return [{
-                'insight_id': insight.insight_id,
-                'priority': priority,
-                'title': insight.title,
-                'message': analysis_text
-            }]
+            return [self._store_insight(
+                account_id, 'daily', priority,
+                f"Daily Performance Update - {yesterday.strftime('%B %d, %Y')}",
+                analysis_text, context_json
+            )]
 
         except Exception as e:
             logger.error(f"Error generating daily insights: {e}")
@@ -193,13 +144,7 @@ class ProactiveAnalysisService:
             return []
 
         try:
-            # Get last 7 days
-            end_date = date.today() - timedelta(days=1)
-            start_date = end_date - timedelta(days=6)
-
-            # Get previous week for comparison
-            prev_end = start_date - timedelta(days=1)
-            prev_start = prev_end - timedelta(days=6)
+            (start_date, end_date), (prev_start, prev_end) = self._weekly_windows()
 
             # Get current week metrics
             current_week = self._get_daily_metrics(start_date, end_date, account_id)
@@ -211,63 +156,228 @@ class ProactiveAnalysisService:
                 logger.info("No data available for weekly insights")
                 return []
 
-            # Calculate week-over-week changes
-            changes = self._calculate_changes(current_week, previous_week) if previous_week else {}
+            priority, context_json = self._build_weekly_context(start_date, end_date, current_week, previous_week)
+            analysis_text = self._generate_analysis(WEEKLY_INSIGHT_PROMPT, context_json)
 
-            # Determine priority
-            priority = self._determine_priority(changes) if changes else 'info'
+            return [self._store_insight(
+                account_id, 'weekly', priority,
+                f"Weekly Summary - {start_date.strftime('%b %d')} to {end_date.strftime('%b %d')}",
+                analysis_text, context_json
+            )]
 
-            # Prepare context
-            context = {
-                'week_start': start_date.isoformat(),
-                'week_end': end_date.isoformat(),
-                'current_week_metrics': current_week,
-                'previous_week_metrics': previous_week,
-                'week_over_week_changes': changes
-            }
-
-            context_json = json.dumps(context, indent=2, default=str, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"Error generating weekly insights: {e}")
+            self.db.rollback()
+            return []
 
-            # Call Gemini
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=context_json,
-                config=types.GenerateContentConfig(
-                    temperature=0.3
-                )
-            )
+    def generate_insights_for_all_accounts(
+        self,
+        insight_type: str,
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Generate daily or weekly insights for every account with new data.
 
-            analysis_text = response.text.strip()
-
-            # Store insight
-            insight = DimInsightHistory(
-                account_id=account_id,
-                generated_at=datetime.now(timezone.utc),
-                insight_type='weekly',
-                priority=priority,
-                category='performance',
-                title=f"Weekly Summary - {start_date.strftime('%b %d')} to {end_date.strftime('%b %d')}",
-                message=analysis_text,
-                data_json=context_json,
-                is_read=False
-            )
+        Metrics for all accounts are fetched in one grouped query, LLM calls are
+        fanned out over a bounded thread pool, and results are written back on
+        the calling thread (the Session is not thread-safe).
 
-            self.db.add(insight)
-            self.db.commit()
+        Returns run stats: accounts considered/skipped, insights generated,
+        duration and throughput.
+        """
+        started = datetime.now(timezone.utc)
+        stats = {
+            'insight_type': insight_type,
+            'accounts_total': 0,
+            'accounts_skipped': 0,
+            'insights_generated': 0,
+            'failures': 0,
+            'insights': [],
+        }
 
-            logger.info(f"Generated weekly insight (priority: {priority})")
+        if not self.client:
+            logger.error(f"Gemini client not available - skipping {insight_type} insights")
+            return self._finish_run_stats(stats, started)
 
-            return [{
-                'insight_id': insight.insight_id,
-                'priority': priority,
-                'title': insight.title,
-                'message': analysis_text
-            }]
+        if insight_type == 'daily':
+            yesterday = date.today() - timedelta(days=1)
+            current_window = (yesterday, yesterday)
+            previous_window = (yesterday - timedelta(days=6), yesterday - timedelta(days=1))
+        elif insight_type == 'weekly':
+            current_window, previous_window = self._weekly_windows()
+        else:
+            raise ValueError("insight_type must be 'daily' or 'weekly'")
 
+        try:
+            metrics_by_account = self._get_metrics_by_account({
+                'current': current_window,
+                'previous': previous_window,
+            })
+            freshness = self._get_account_freshness(insight_type)
         except Exception as e:
-            logger.error(f"Error generating weekly insights: {e}")
+            logger.error(f"Error loading batched metrics for {insight_type} insights: {e}")
             self.db.rollback()
-            return []
+            return self._finish_run_stats(stats, started)
+
+        stats['accounts_total'] = len(metrics_by_account)
+
+        # Build contexts for accounts that have something new to say
+        jobs = []
+        for acc_id, periods in metrics_by_account.items():
+            current = periods.get('current')
+            previous = periods.get('previous')
+            latest_date_id, last_generated = freshness.get(acc_id, (None, None))
+
+            has_new_data = (
+                last_generated is None
+                or latest_date_id is None
+                or int(last_generated.strftime('%Y%m%d')) <= latest_date_id
+            )
+            if not current or not has_new_data or (insight_type == 'daily' and not previous):
+                stats['accounts_skipped'] += 1
+                continue
+
+            if insight_type == 'daily':
+                priority, context_json = self._build_daily_context(current_window[0], current, previous)
+                title = f"Daily Performance Update - {current_window[0].strftime('%B %d, %Y')}"
+                prompt = DAILY_INSIGHT_PROMPT
+            else:
+                priority, context_json = self._build_weekly_context(current_window[0], current_window[1], current, previous)
+                title = f"Weekly Summary - {current_window[0].strftime('%b %d')} to {current_window[1].strftime('%b %d')}"
+                prompt = WEEKLY_INSIGHT_PROMPT
+
+            jobs.append((acc_id, priority, title, prompt, context_json))
+
+        # LLM calls with bounded concurrency
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                (job, executor.submit(self._generate_analysis, job[3], job[4]))
+                for job in jobs
+            ]
+
+            for (acc_id, priority, title, _prompt, context_json), future in futures:
+                try:
+                    analysis_text = future.result()
+                    insight = self._store_insight(
+                        acc_id, insight_type, priority, title, analysis_text, context_json
+                    )
+                    insight['account_id'] = acc_id
+                    stats['insights'].append(insight)
+                    stats['insights_generated'] += 1
+                except Exception as e:
+                    logger.error(f"Error generating {insight_type} insight for account {acc_id}: {e}")
+                    self.db.rollback()
+                    stats['failures'] += 1
+
+        return self._finish_run_stats(stats, started)
+
+    def _finish_run_stats(self, stats: Dict[str, Any], started: datetime) -> Dict[str, Any]:
+        """Attach duration/throughput to a fan-out run and log it"""
+        duration = (datetime.now(timezone.utc) - started).total_seconds()
+        processed = stats['accounts_total'] - stats['accounts_skipped']
+        stats['duration_seconds'] = round(duration, 3)
+        stats['accounts_per_second'] = round(processed / duration, 2) if duration > 0 else 0.0
+
+        logger.info(
+            f"{stats['insight_type'].capitalize()} insights run: "
+            f"{stats['insights_generated']} generated, {stats['accounts_skipped']} skipped, "
+            f"{stats['failures']} failed across {stats['accounts_total']} accounts "
+            f"in {stats['duration_seconds']}s ({stats['accounts_per_second']} accounts/s)"
+        )
+        return stats
+
+    def _weekly_windows(self) -> Tuple[Tuple[date, date], Tuple[date, date]]:
+        """Last 7 full days and the 7 days before that"""
+        end_date = date.today() - timedelta(days=1)
+        start_date = end_date - timedelta(days=6)
+
+        prev_end = start_date - timedelta(days=1)
+        prev_start = prev_end - timedelta(days=6)
+
+        return (start_date, end_date), (prev_start, prev_end)
+
+    def _build_daily_context(
+        self,
+        yesterday: date,
+        yesterday_metrics: Dict[str, float],
+        week_metrics: Dict[str, float]
+    ) -> Tuple[str, str]:
+        """Return (priority, context_json) for a daily insight"""
+        changes = self._calculate_changes(yesterday_metrics, week_metrics)
+        priority = self._determine_priority(changes)
+
+        context = {
+            'yesterday': yesterday.isoformat(),
+            'yesterday_metrics': yesterday_metrics,
+            'week_average': week_metrics,
+            'changes': changes
+        }
+        return priority, json.dumps(context, indent=2, default=str, ensure_ascii=False)
+
+    def _build_weekly_context(
+        self,
+        start_date: date,
+        end_date: date,
+        current_week: Dict[str, float],
+        previous_week: Optional[Dict[str, float]]
+    ) -> Tuple[str, str]:
+        """Return (priority, context_json) for a weekly insight"""
+        changes = self._calculate_changes(current_week, previous_week) if previous_week else {}
+        priority = self._determine_priority(changes) if changes else 'info'
+
+        context = {
+            'week_start': start_date.isoformat(),
+            'week_end': end_date.isoformat(),
+            'current_week_metrics': current_week,
+            'previous_week_metrics': previous_week,
+            'week_over_week_changes': changes
+        }
+        return priority, json.dumps(context, indent=2, default=str, ensure_ascii=False)
+
+    def _generate_analysis(self, prompt_template: str, context_json: str) -> str:
+        """Call Gemini with the given prompt template. Safe to run from worker threads."""
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=prompt_template.format(context=context_json),
+            config=types.GenerateContentConfig(
+                temperature=0.3
+            )
+        )
+        return response.text.strip()
+
+    def _store_insight(
+        self,
+        account_id: Optional[int],
+        insight_type: str,
+        priority: str,
+        title: str,
+        analysis_text: str,
+        context_json: str
+    ) -> Dict[str, Any]:
+        """Persist a generated insight and return its summary"""
+        insight = DimInsightHistory(
+            account_id=account_id,
+            generated_at=datetime.now(timezone.utc),
+            insight_type=insight_type,
+            priority=priority,
+            category='performance',
+            title=title,
+            message=analysis_text,
+            data_json=context_json,
+            is_read=False
+        )
+
+        self.db.add(insight)
+        self.db.commit()
+
+        logger.info(f"Generated {insight_type} insight (priority: {priority})")
+
+        return {
+            'insight_id': insight.insight_id,
+            'priority': priority,
+            'title': insight.title,
+            'message': analysis_text
+        }
 
     def _get_daily_metrics(
         self,
@@ -294,7 +404,6 @@ class ProactiveAnalysisService:
                      THEN SUM(f.spend) / COALESCE(SUM(conv.action_count), 0)
                      ELSE 0 END as cpa
             FROM fact_core_metrics f
-            JOIN dim_date d ON f.date_id = d.date_id
             LEFT JOIN (
                 SELECT date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
                        SUM(action_count) as action_count
@@ -308,8 +417,7 @@ class ProactiveAnalysisService:
                   AND f.adset_id = conv.adset_id
                   AND f.ad_id = conv.ad_id
                   AND f.creative_id = conv.creative_id
-            WHERE d.date >= :start_date
-                AND d.date <= :end_date
+            WHERE {date_id_between('f.date_id')}
                 {account_filter}
         """)
 
@@ -332,6 +440,118 @@ class ProactiveAnalysisService:
             'cpa': float(result.cpa or 0)
         }
 
+    def _get_metrics_by_account(
+        self,
+        periods: Dict[str, Tuple[date, date]]
+    ) -> Dict[int, Dict[str, Optional[Dict[str, float]]]]:
+        """
+        Get aggregated metrics for every account and every named period in one query.
+
+        Returns {account_id: {period_name: metrics or None}}.
+        """
+        params = {}
+        case_parts = []
+        for i, (name, (start, end)) in enumerate(periods.items()):
+            params[f'period_{i}'] = name
+            params[f'start_{i}'] = int(start.strftime('%Y%m%d'))
+            params[f'end_{i}'] = int(end.strftime('%Y%m%d'))
+            case_parts.append(f"WHEN f.date_id BETWEEN :start_{i} AND :end_{i} THEN :period_{i}")
+
+        params['min_date_id'] = min(v for k, v in params.items() if k.startswith('start_'))
+        params['max_date_id'] = max(v for k, v in params.items() if k.startswith('end_'))
+        period_case = "CASE " + " ".join(case_parts) + " END"
+
+        query = text(f"""
+            WITH conv AS (
+                SELECT fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id,
+                       SUM(fam.action_count) as action_count
+                FROM fact_action_metrics fam
+                JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
+                WHERE dat.is_conversion = TRUE
+                    AND fam.date_id BETWEEN :min_date_id AND :max_date_id
+                GROUP BY 1, 2, 3, 4, 5, 6
+            ),
+            scoped AS (
+                SELECT f.*, {period_case} as period
+                FROM fact_core_metrics f
+                WHERE f.date_id BETWEEN :min_date_id AND :max_date_id
+            )
+            SELECT
+                f.account_id,
+                f.period,
+                COUNT(DISTINCT f.date_id) as days,
+                SUM(f.spend) as spend,
+                SUM(f.impressions) as impressions,
+                SUM(f.clicks) as clicks,
+                CASE WHEN SUM(f.impressions) > 0
+                     THEN (SUM(f.clicks)::float / SUM(f.impressions)) * 100
+                     ELSE 0 END as ctr,
+                COALESCE(SUM(conv.action_count), 0) as conversions,
+                CASE WHEN SUM(f.spend) > 0 AND SUM(f.purchases) > 0
+                     THEN SUM(f.purchase_value) / SUM(f.spend)
+                     ELSE 0 END as roas,
+                CASE WHEN COALESCE(SUM(conv.action_count), 0) > 0
+                     THEN SUM(f.spend) / COALESCE(SUM(conv.action_count), 0)
+                     ELSE 0 END as cpa
+            FROM scoped f
+            LEFT JOIN conv ON f.date_id = conv.date_id
+                  AND f.account_id = conv.account_id
+                  AND f.campaign_id = conv.campaign_id
+                  AND f.adset_id = conv.adset_id
+                  AND f.ad_id = conv.ad_id
+                  AND f.creative_id = conv.creative_id
+            WHERE f.period IS NOT NULL
+                AND f.account_id != 0
+            GROUP BY f.account_id, f.period
+        """)
+
+        results: Dict[int, Dict[str, Optional[Dict[str, float]]]] = {}
+        for row in self.db.execute(query, params).fetchall():
+            account_periods = results.setdefault(int(row.account_id), {name: None for name in periods})
+            if not row.spend:
+                continue
+            account_periods[row.period] = {
+                'spend': float(row.spend or 0),
+                'impressions': int(row.impressions or 0),
+                'clicks': int(row.clicks or 0),
+                'ctr': float(row.ctr or 0),
+                'conversions': int(row.conversions or 0),
+                'roas': float(row.roas or 0),
+                'cpa': float(row.cpa or 0)
+            }
+
+        return results
+
+    def _get_account_freshness(self, insight_type: str) -> Dict[int, Tuple[Optional[int], Optional[datetime]]]:
+        """
+        Latest loaded date_id and last generated insight time, per account.
+
+        Used to skip accounts whose data hasn't moved since the last run.
+        """
+        query = text("""
+            SELECT a.account_id, data.latest_date_id, hist.last_generated
+            FROM dim_account a
+            LEFT JOIN (
+                SELECT account_id, MAX(date_id) as latest_date_id
+                FROM fact_core_metrics
+                GROUP BY account_id
+            ) data ON data.account_id = a.account_id
+            LEFT JOIN (
+                SELECT account_id, MAX(generated_at) as last_generated
+                FROM dim_insight_history
+                WHERE insight_type = :insight_type
+                GROUP BY account_id
+            ) hist ON hist.account_id = a.account_id
+        """)
+
+        return {
+            int(row.account_id): (
+                int(row.latest_date_id) if row.latest_date_id is not None else None,
+                row.last_generated
+            )
+            for row in self.db.execute(query, {'insight_type': insight_type}).fetchall()
+        }
+
     def _calculate_changes(
         self,
         current: Dict[str, float],
@@ -382,7 +602,9 @@ class ProactiveAnalysisService:
         Returns:
             List of insights (filtered by user's accounts)
         """
-        query = self.db.query(DimInsightHistory)
+        query = self.db.query(DimInsightHistory).filter(
+            DimInsightHistory.insight_type != SNAPSHOT_INSIGHT_TYPE
+        )
 
         # Filter by user's accounts for data isolation
         if account_id:
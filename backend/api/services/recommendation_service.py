@@ -3,24 +3,45 @@ Recommendation service - AI-powered recommendations for audience targeting, ad c
 Uses BusinessProfile data to provide personalized recommendations.
 """
 
-import os
 import json
+import hashlib
 import logging
 from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-import google.genai as genai
+from backend.api.services.llm_provider import get_llm_provider
 from google.genai import types
 
 from backend.api.repositories.business_profile_repository import BusinessProfileRepository
 from backend.config.settings import GEMINI_MODEL
+from backend.config.base_config import SUPPORTED_LANGUAGES
+from backend.utils.cache_utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Generated recommendations, keyed by account:profile_version:kind:objective:locale
+RECOMMENDATION_CACHE = TTLCache(ttl_seconds=6 * 3600, max_size=500)
 
-AUDIENCE_RECOMMENDATIONS_PROMPT = """Based on this business profile, recommend Facebook/Instagram ad targeting parameters.
+# Provider-side context cache handles for the profile preamble, keyed by account:profile_version.
+# Kept slightly shorter than the provider TTL so we never reference an expired cache.
+PROFILE_CONTEXT_TTL_SECONDS = 3600
+PROFILE_CONTEXT_CACHE = TTLCache(ttl_seconds=PROFILE_CONTEXT_TTL_SECONDS - 300, max_size=200)
+
+
+def invalidate_recommendation_cache(account_id: int) -> None:
+    """Drop cached recommendations and profile context handles for an account."""
+    RECOMMENDATION_CACHE.delete_prefix(f"{account_id}:")
+    PROFILE_CONTEXT_CACHE.delete_prefix(f"{account_id}:")
+
+
+# Shared prefix for every recommendation prompt (cached provider-side where possible)
+PROFILE_PREAMBLE = """You are a Facebook/Instagram advertising strategist. Use this business profile for the task below.
 
 Business Profile:
 {profile}
+"""
+
+
+AUDIENCE_RECOMMENDATIONS_PROMPT = """Based on this business profile, recommend Facebook/Instagram ad targeting parameters.
 
 Provide JSON recommendations with this structure:
 {{
@@ -33,13 +54,11 @@ Provide JSON recommendations with this structure:
 }}
 
 Be specific and practical. Focus on Facebook interest targeting that actually exists.
+Write the rationale in {target_lang}; keep JSON keys and country/language codes as shown.
 """
 
 AD_COPY_RECOMMENDATIONS_PROMPT = """Generate ad copy recommendations for this business that match their brand tone.
 
-Business Profile:
-{profile}
-
 Campaign Objective: {objective}
 
 Provide 3 ad copy variants in JSON:
@@ -56,13 +75,11 @@ Provide 3 ad copy variants in JSON:
 }}
 
 Match the business's tone of voice: {tone}
+Write all ad copy and tips in {target_lang}; keep JSON keys and CTA values as shown.
 """
 
 CREATIVE_DIRECTION_PROMPT = """Suggest creative direction for Facebook/Instagram ads for this business.
 
-Business Profile:
-{profile}
-
 Provide recommendations in JSON:
 {{
   "visual_style": "Description of recommended visual style",
@@ -73,6 +90,7 @@ Provide recommendations in JSON:
 }}
 
 Be specific to their industry and audience.
+Write all text values in {target_lang}; keep JSON keys and ad format values as shown.
 """
 
 
@@ -82,14 +100,11 @@ class RecommendationService:
     def __init__(self, db: Session):
         self.db = db
         self.profile_repo = BusinessProfileRepository(db)
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if api_key:
-            self.client = genai.Client(api_key=api_key)
-        else:
-            self.client = None
-            logger.warning("GEMINI_API_KEY not set - recommendations will not work")
+        self.client = get_llm_provider()
+        if not self.client:
+            logger.warning("LLM provider not configured - recommendations will not work")
 
-    def get_audience_recommendations(self, account_id: int) -> Dict:
+    def get_audience_recommendations(self, account_id: int, locale: str = "en") -> Dict:
         """Generate audience targeting recommendations based on business profile."""
         if not self.client:
             return {"error": "AI service not configured"}
@@ -98,22 +113,12 @@ class RecommendationService:
         if not profile:
             return {"error": "No business profile found. Please complete business profile setup."}
 
-        profile_summary = self._format_profile_for_prompt(profile)
-        prompt = AUDIENCE_RECOMMENDATIONS_PROMPT.format(profile=profile_summary)
-
         try:
-            response = self.client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.7,
-                    max_output_tokens=1500,
-                )
+            return self._generate_recommendation(
+                account_id, profile, "audience", AUDIENCE_RECOMMENDATIONS_PROMPT,
+                temperature=0.7, max_output_tokens=1500, locale=locale
             )
 
-            result_text = self._clean_json_response(response.text)
-            return json.loads(result_text)
-
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse audience recommendations: {e}")
             return {"error": "Failed to generate recommendations"}
@@ -121,7 +126,7 @@ class RecommendationService:
             logger.error(f"Audience recommendation error: {e}")
             return {"error": str(e)}
 
-    def get_ad_copy_recommendations(self, account_id: int, objective: str = "SALES") -> Dict:
+    def get_ad_copy_recommendations(self, account_id: int, objective: str = "SALES", locale: str = "en") -> Dict:
         """Generate ad copy recommendations matching the brand's tone."""
         if not self.client:
             return {"error": "AI service not configured"}
@@ -130,28 +135,15 @@ class RecommendationService:
         if not profile:
             return {"error": "No business profile found"}
 
-        profile_summary = self._format_profile_for_prompt(profile)
         tone = profile.tone_of_voice or "professional and friendly"
 
-        prompt = AD_COPY_RECOMMENDATIONS_PROMPT.format(
-            profile=profile_summary,
-            objective=objective,
-            tone=tone
-        )
-
         try:
-            response = self.client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.8,
-                    max_output_tokens=2000,
-                )
+            return self._generate_recommendation(
+                account_id, profile, "ad_copy", AD_COPY_RECOMMENDATIONS_PROMPT,
+                temperature=0.8, max_output_tokens=2000, locale=locale,
+                objective=objective, tone=tone
             )
 
-            result_text = self._clean_json_response(response.text)
-            return json.loads(result_text)
-
         except json.JSONDecodeError:
             logger.error("Failed to parse ad copy recommendations")
             return {"error": "Failed to generate ad copy"}
@@ -159,7 +151,7 @@ class RecommendationService:
             logger.error(f"Ad copy recommendation error: {e}")
             return {"error": str(e)}
 
-    def get_creative_direction(self, account_id: int) -> Dict:
+    def get_creative_direction(self, account_id: int, locale: str = "en") -> Dict:
         """Generate creative direction recommendations."""
         if not self.client:
             return {"error": "AI service not configured"}
@@ -168,22 +160,12 @@ class RecommendationService:
         if not profile:
             return {"error": "No business profile found"}
 
-        profile_summary = self._format_profile_for_prompt(profile)
-        prompt = CREATIVE_DIRECTION_PROMPT.format(profile=profile_summary)
-
         try:
-            response = self.client.models.generate_content(
-                model=GEMINI_MODEL,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.7,
-                    max_output_tokens=1500,
-                )
+            return self._generate_recommendation(
+                account_id, profile, "creative_direction", CREATIVE_DIRECTION_PROMPT,
+                temperature=0.7, max_output_tokens=1500, locale=locale
             )
 
-            result_text = self._clean_json_response(response.text)
-            return json.loads(result_text)
-
         except json.JSONDecodeError:
             logger.error("Failed to parse creative direction")
             return {"error": "Failed to generate creative direction"}
@@ -191,6 +173,89 @@ class RecommendationService:
             logger.error(f"Creative direction error: {e}")
             return {"error": str(e)}
 
+    def _generate_recommendation(
+        self,
+        account_id: int,
+        profile,
+        kind: str,
+        prompt_template: str,
+        temperature: float,
+        max_output_tokens: int,
+        locale: str = "en",
+        objective: Optional[str] = None,
+        **prompt_kwargs
+    ) -> Dict:
+        """
+        Generate (or return cached) JSON recommendations.
+
+        Cache key is (account, profile version, kind, objective, locale); the profile
+        version is a hash of the rendered profile, so any profile change misses.
+        The profile preamble is sent through provider-side context caching when
+        available, otherwise prepended to the prompt.
+        """
+        profile_summary = self._format_profile_for_prompt(profile)
+        profile_version = hashlib.md5(profile_summary.encode()).hexdigest()[:12]
+
+        cache_key = f"{account_id}:{profile_version}:{kind}:{objective or ''}:{locale}"
+        cached = RECOMMENDATION_CACHE.get(cache_key)
+        if cached:
+            logger.info(f"Returning cached {kind} recommendations for account {account_id}")
+            return cached
+
+        task_prompt = prompt_template.format(
+            target_lang=SUPPORTED_LANGUAGES.get(locale, 'English'),
+            objective=objective,
+            **prompt_kwargs
+        )
+        preamble = PROFILE_PREAMBLE.format(profile=profile_summary)
+        context_key = f"{account_id}:{profile_version}"
+        cached_content = self._get_profile_context(context_key, preamble)
+
+        try:
+            response = self._call_model(task_prompt, preamble, cached_content, temperature, max_output_tokens)
+        except Exception as e:
+            if not cached_content:
+                raise
+            # Provider cache may have been evicted early - retry with the inline preamble
+            logger.warning(f"Cached profile context failed ({e}), retrying without it")
+            PROFILE_CONTEXT_CACHE.set(context_key, "")
+            response = self._call_model(task_prompt, preamble, None, temperature, max_output_tokens)
+
+        result = json.loads(self._clean_json_response(response.text))
+        RECOMMENDATION_CACHE.set(cache_key, result)
+        return result
+
+    def _call_model(
+        self,
+        task_prompt: str,
+        preamble: str,
+        cached_content: Optional[str],
+        temperature: float,
+        max_output_tokens: int
+    ):
+        config_kwargs = {"temperature": temperature, "max_output_tokens": max_output_tokens}
+        if cached_content:
+            config_kwargs["cached_content"] = cached_content
+            contents = task_prompt
+        else:
+            contents = preamble + "\n" + task_prompt
+
+        return self.client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=contents,
+            config=types.GenerateContentConfig(**config_kwargs)
+        )
+
+    def _get_profile_context(self, context_key: str, preamble: str) -> Optional[str]:
+        """Provider-side cache handle for the profile preamble ("" = not cacheable)."""
+        handle = PROFILE_CONTEXT_CACHE.get(context_key)
+        if handle is None:
+            handle = self.client.create_context_cache(
+                GEMINI_MODEL, preamble, PROFILE_CONTEXT_TTL_SECONDS
+            ) or ""
+            PROFILE_CONTEXT_CACHE.set(context_key, handle)
+        return handle or None
+
     def _format_profile_for_prompt(self, profile) -> str:
         """Format business profile into a readable summary for prompts."""
         parts = []
@@ -8,6 +8,8 @@ from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 import logging
 
+from backend.api.repositories.base_repository import date_id_between
+from backend.api.repositories.query_filters import QueryFilters
 from backend.api.repositories.metrics_repository import MetricsRepository
 from backend.api.repositories.campaign_repository import CampaignRepository
 from backend.api.repositories.adset_repository import AdSetRepository
@@ -698,9 +700,11 @@ class ReportsService:
         joins = []
         added_tables = set()
 
-        # dim_date is always needed
-        joins.append("JOIN dim_date d ON f.date_id = d.date_id")
-        added_tables.add('d')
+        # dim_date only for date/week/month breakdowns - the range filter is on f.date_id
+        dim_exprs = [primary_expr, secondary_expr, tertiary_expr or '']
+        if any('d.date' in expr for expr in dim_exprs):
+            joins.append("JOIN dim_date d ON f.date_id = d.date_id")
+            added_tables.add('d')
 
         # Helper to add a join if not already present
         def add_join(join_table, join_cond):
@@ -715,25 +719,18 @@ class ReportsService:
         if tertiary_join_table:
             add_join(tertiary_join_table, tertiary_join_cond)
 
-        # Build WHERE clause
-        where_clauses = [
-            "d.date >= :start_date",
-            "d.date <= :end_date"
-        ]
-
-        # Add account filter if specified
-        if account_ids:
-            where_clauses.append("f.account_id = ANY(:account_ids)")
+        # Build WHERE clause - dates are bound per period, the other filters are shared
+        filters = QueryFilters().any_id('f.account_id', 'account_ids', account_ids)
 
         # Add filters (only if the required joins exist)
         if campaign_filter and 'c' in added_tables:
-            where_clauses.append("c.campaign_name ILIKE :campaign_filter")
+            filters.where("c.campaign_name ILIKE :campaign_filter", campaign_filter=f"%{campaign_filter}%")
         if ad_set_filter and 'a' in added_tables:
-            where_clauses.append("a.adset_name ILIKE :ad_set_filter")
+            filters.where("a.adset_name ILIKE :ad_set_filter", ad_set_filter=f"%{ad_set_filter}%")
         if ad_filter and 'ad' in added_tables:
-            where_clauses.append("ad.ad_name ILIKE :ad_filter")
+            filters.where("ad.ad_name ILIKE :ad_filter", ad_filter=f"%{ad_filter}%")
 
-        where_clause = " AND ".join(where_clauses)
+        where_clause = f"{date_id_between('f.date_id')} {filters.sql}"
 
         # Build SELECT and GROUP BY based on 2D or 3D
         if tertiary_breakdown != 'none':
@@ -785,10 +782,8 @@ class ReportsService:
                         SUM(fam.action_value) as action_value
                     FROM fact_action_metrics fam
                     JOIN dim_action_type dat ON fam.action_type_id = dat.action_type_id
-                    JOIN dim_date d2 ON fam.date_id = d2.date_id
                     WHERE dat.is_conversion = TRUE
-                        AND d2.date >= :start_date
-                        AND d2.date <= :end_date
+                        AND {date_id_between('fam.date_id')}
                     GROUP BY fam.date_id, fam.account_id, fam.campaign_id, fam.adset_id, fam.ad_id, fam.creative_id
                 ) conv ON f.date_id = conv.date_id
                     AND f.account_id = conv.account_id
@@ -804,17 +799,10 @@ class ReportsService:
 
         # Build params dict
         params = {
+            **filters.params,
             'start_date': period1_start,
             'end_date': period1_end
         }
-        if account_ids:
-            params['account_ids'] = [int(aid) for aid in account_ids]
-        if campaign_filter and 'c' in added_tables:
-            params['campaign_filter'] = f"%{campaign_filter}%"
-        if ad_set_filter and 'a' in added_tables:
-            params['ad_set_filter'] = f"%{ad_set_filter}%"
-        if ad_filter and 'ad' in added_tables:
-            params['ad_filter'] = f"%{ad_filter}%"
 
         # Execute for period 1
         period1_results = self.db.execute(query, params).fetchall()
@@ -823,17 +811,10 @@ class ReportsService:
         period2_lookup = {}
         if period2_start and period2_end:
             params2 = {
+                **filters.params,
                 'start_date': period2_start,
                 'end_date': period2_end
             }
-            if account_ids:
-                params2['account_ids'] = [int(aid) for aid in account_ids]
-            if campaign_filter and 'c' in added_tables:
-                params2['campaign_filter'] = f"%{campaign_filter}%"
-            if ad_set_filter and 'a' in added_tables:
-                params2['ad_set_filter'] = f"%{ad_set_filter}%"
-            if ad_filter and 'ad' in added_tables:
-                params2['ad_filter'] = f"%{ad_filter}%"
 
             period2_results = self.db.execute(query, params2).fetchall()
 
@@ -39,6 +39,58 @@ class Settings(BaseSettings):
     FACEBOOK_ACCESS_TOKEN: Optional[str] = None
     FACEBOOK_AD_ACCOUNT_ID: Optional[str] = None
     FB_REDIRECT_URI: str = "http://localhost:8002/api/v1/auth/facebook/callback"
+    GRAPH_CLIENT_MAX_CLIENTS: int = 200  # Pooled Graph clients (one per user token) kept open
+    GRAPH_CLIENT_IDLE_SECONDS: int = 600  # Idle clients are closed after this long
+    GRAPH_CLIENT_POOL_SIZE: int = 20  # Keep-alive connections per client (>= extractor worker threads)
+    PAGE_TOKEN_CACHE_TTL_SECONDS: int = 3600  # Cached page access tokens (per user/page)
+    PAGE_TOKEN_CACHE_MAX_ENTRIES: int = 5000
+    ACCOUNT_CATALOG_TTL_SECONDS: int = 300  # Pixels, custom audiences, promote pages, lead forms (per user/account)
+    ACCOUNT_CATALOG_STALE_SECONDS: int = 86400  # Older entries are served while refreshed in the background
+    ACCOUNT_CATALOG_MAX_ENTRIES: int = 5000
+
+    # ETL Settings
+    ETL_TRANSFORM_WORKERS: int = 1  # Transform processes; >1 transforms breakdown groups / core date ranges in parallel
+
+    # Event Buffer (page views / audit log written in background batches)
+    EVENT_BUFFER_ENABLED: bool = True
+    EVENT_BUFFER_MAX_BATCH: int = 500  # Rows per INSERT
+    EVENT_BUFFER_FLUSH_SECONDS: float = 2.0  # Max age of a queued row before it is written
+    EVENT_BUFFER_MAX_PENDING: int = 10000  # Queue bound; beyond it rows are written synchronously
+
+    # Admin Metrics Snapshot (admin dashboard reads precomputed values)
+    ADMIN_METRICS_PERIODS: List[int] = [7, 30, 90]  # Lookbacks kept in the snapshot; others are computed live
+    ADMIN_METRICS_REFRESH_MINUTES: int = 15
+    ADMIN_METRICS_MAX_AGE_MINUTES: int = 60  # Older snapshots are ignored and the metric is computed live
+
+    # Export Jobs (background exports for large date ranges)
+    EXPORT_JOB_DIR: str = "exports"  # Local artifact storage (created on first use)
+    EXPORT_JOB_WORKERS: int = 2  # Concurrent export jobs per API process
+    EXPORT_JOB_TTL_HOURS: int = 24  # Artifacts (and job records) expire after this long
+    EXPORT_JOB_BATCH_ROWS: int = 5000  # Rows fetched per cursor batch / written per chunk
+
+    # Google Sheets Export
+    SHEETS_CLIENT_MAX_CLIENTS: int = 100  # Cached Sheets API clients (one per user token)
+    SHEETS_CLIENT_IDLE_SECONDS: int = 1800
+    SHEETS_WRITE_CHUNK_CELLS: int = 50000  # Cells per values.update call (keeps payloads under Sheets limits)
+    SHEETS_WRITE_CONCURRENCY: int = 4  # Value chunks in flight per export
+
+    # Media Uploads (chunked, spooled to disk, resumable Graph video upload)
+    MEDIA_UPLOAD_DIR: str = "uploads"  # Spool directory (created on first use)
+    MEDIA_UPLOAD_MAX_BYTES: int = 4 * 1024 ** 3  # Graph ad video limit (4GB)
+    MEDIA_UPLOAD_CHUNK_BYTES: int = 8 * 1024 ** 2  # Max client chunk (request size limit is 10MB)
+    MEDIA_UPLOAD_WORKERS: int = 4  # Concurrent Graph transfers per API process
+    MEDIA_UPLOAD_MAX_PER_USER: int = 3  # Uploads in progress per user
+    MEDIA_UPLOAD_MAX_SPOOL_BYTES_PER_USER: int = 8 * 1024 ** 3  # Declared size of a user's uploads in progress
+    MEDIA_UPLOAD_IDLE_SECONDS: int = 900  # Uploads with no new chunk for this long are failed
+    MEDIA_UPLOAD_TTL_SECONDS: int = 3600  # Upload status kept for polling after the last change
+    MEDIA_UPLOAD_TRANSFER_RETRIES: int = 3  # Attempts per Graph video chunk
+
+    # Targeting Search (shared cache for location / interest typeahead)
+    TARGETING_SEARCH_TTL_SECONDS: int = 86400  # Fresh results
+    TARGETING_SEARCH_STALE_SECONDS: int = 7 * 86400  # Older results are served while refreshed in the background
+    TARGETING_SEARCH_MAX_ENTRIES: int = 20000
+    TARGETING_SEARCH_RESULT_LIMIT: int = 25  # Graph results per search (returned to the client)
+    TARGETING_SEED_PATH: Optional[str] = None  # JSON seed loaded on first search, rewritten at shutdown
 
     # Security Settings
     # SECURITY: JWT secret MUST be set via .env file - weak default only for development
@@ -90,6 +142,7 @@ class Settings(BaseSettings):
 
     # AI Settings
     GEMINI_API_KEY: Optional[str] = None
+    INSIGHT_JOB_MAX_WORKERS: int = 4  # Concurrent LLM calls per scheduled insights run
 
     # Email Settings (Resend)
     RESEND_API_KEY: Optional[str] = None
@@ -130,6 +130,10 @@ TOP_COUNTRIES_LIMIT = 10  # Keep top 10 countries by spend, aggregate rest as "O
 # Legacy alias for backward compatibility
 FIRST_PULL_DAYS = QUICK_PULL_DAYS
 
+# dim_date is a static calendar, populated once from DATE_CALENDAR_START to today + DATE_CALENDAR_DAYS_AHEAD
+DATE_CALENDAR_START = '2015-01-01'
+DATE_CALENDAR_DAYS_AHEAD = 730
+
 # ==============================================================================
 # DATABASE CONSTANTS
 # ==============================================================================
@@ -268,3 +272,8 @@ UNKNOWN_MEMBER_DEFAULTS = {
 # ==============================================================================
 
 GEMINI_MODEL = "gemini-2.0-flash"
+
+# Precomputed insight snapshots (written after each ETL run, served from dim_insight_history)
+INSIGHT_SNAPSHOT_WINDOWS = [7, 30, 90]  # Matches dashboard "last N days" presets (ending yesterday)
+INSIGHT_SNAPSHOT_PAGE_CONTEXTS = ['dashboard']
+INSIGHT_SNAPSHOT_LOCALES = ['en']
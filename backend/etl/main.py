@@ -20,30 +20,29 @@ from typing import Dict, List, Optional
 import threading
 
 # Configuration
+from backend.config.base_config import settings
 from backend.config.settings import (
     QUICK_PULL_DAYS, FULL_PULL_DAYS, BREAKDOWN_PULL_DAYS, DAILY_PULL_DAYS,
     ACTIVE_BREAKDOWN_GROUPS, STATIC_AGE_GROUPS, STATIC_GENDER_GROUPS,
-    UNKNOWN_MEMBER_DEFAULTS, FACT_TABLE_PKS, DIMENSION_PKS
+    UNKNOWN_MEMBER_DEFAULTS, FACT_TABLE_PKS, DIMENSION_PKS,
+    DATE_CALENDAR_START, DATE_CALENDAR_DAYS_AHEAD
 )
 
 # Database
 from backend.models.schema import create_schema
 from backend.utils.db_utils import (
     get_db_engine, get_latest_date_in_db, ensure_unknown_members,
-    save_dataframe, load_lookup_cache, clear_fact_data, LOOKUP_CACHE
+    save_dataframe, clear_fact_data, ensure_date_calendar, update_account_freshness
 )
+from backend.utils.lookup_service import ATTRIBUTE_DIMENSIONS, get_lookup_service
+from backend.utils.dimension_cache import DimensionHashCache
 
 # Extractors
 from backend.extractors.fb_api import FacebookExtractor
 
 # Transformers
-from backend.transformers.core_transformer import clean_and_transform
-from backend.transformers.action_parser import (
-    parse_actions_dataframe, extract_top_conversions_for_fact_core,
-    parse_video_actions
-)
-from backend.transformers.fact_builder import build_fact_tables
-from backend.transformers.dimension_builder import extract_dimensions, prepare_dimension_for_load
+from backend.transformers.partitioned_transform import transform_frame, build_partitions, transform_partitions
+from backend.transformers.dimension_builder import prepare_dimension_for_load
 
 # Set up logging
 from backend.utils.logging_utils import setup_logging, get_logger
@@ -52,12 +51,23 @@ logger = get_logger(__name__)
 
 MAIN_FACT_TABLE = 'fact_core_metrics'
 
+# Static dimensions (age, gender) never change - written once per process
+_static_dimensions_loaded = False
+
 
 class ETLPipeline:
     """Main ETL orchestrator"""
     
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers: Transform processes. 1 runs the transform serially in-process;
+                more splits it per breakdown group / core date range (see partitioned_transform).
+                Defaults to settings.ETL_TRANSFORM_WORKERS.
+        """
         self.engine = get_db_engine()
+        self.lookups = get_lookup_service(self.engine)
+        self.workers = max(1, workers or settings.ETL_TRANSFORM_WORKERS)
         self.extractor = FacebookExtractor()
         self.logger = get_logger(self.__class__.__name__)
         self.stats = {
@@ -119,11 +129,14 @@ class ETLPipeline:
             
             # Step 5: Load facts
             start_load_fact = time.time()
-            self._load_facts(transformed_data)
+            self._load_facts(transformed_data, start_date, end_date, skip_breakdowns=skip_breakdowns)
             self.stats["durations"]["load_facts"] = round(time.time() - start_load_fact, 2)
 
             # Step 6: Validate data quality
             self._validate_loaded_data()
+
+            # Step 7: Admin dashboard snapshot (account health / spend)
+            self._refresh_admin_metrics()
             
             if user_id: update_sync_status(user_id, "completed", 100) # 100%: Done
 
@@ -240,6 +253,8 @@ class ETLPipeline:
                         self.run(start_date, end_date, user_id=user_id, skip_breakdowns=False)
                         self.logger.info(f"✅ Incremental sync completed for account {account_id}")
 
+                    self._precompute_insight_snapshots(account_id)
+
                 except Exception as e:
                     self.logger.error(f"❌ ETL failed for user {user_id}, account {account_id}: {e}")
                     update_sync_status(user_id, "failed", 0, str(e))
@@ -267,6 +282,43 @@ class ETLPipeline:
 
         self.logger.info(f"✅ Full sync completed for account {account_id}")
 
+        self._precompute_insight_snapshots(account_id)
+
+    def _precompute_insight_snapshots(self, account_id: int):
+        """
+        ETL completion hook: precompute default-window summary/overview insights
+        so the dashboard can serve them from dim_insight_history.
+        Failures are logged and never fail the sync.
+        """
+        from sqlalchemy.orm import Session
+        from backend.api.services.insights_service import InsightsService
+
+        start = time.time()
+        try:
+            with Session(self.engine) as session:
+                written = InsightsService(session).precompute_snapshots(int(account_id))
+            self.stats["durations"]["insight_snapshots"] = round(time.time() - start, 2)
+            self.logger.info(f"🧠 Precomputed {written} insight snapshot(s) for account {account_id}")
+        except Exception as e:
+            self.logger.error(f"Failed to precompute insight snapshots for account {account_id}: {e}")
+
+    def _refresh_admin_metrics(self):
+        """
+        ETL completion hook: refresh the account-derived admin metrics snapshot.
+        Feature usage (page views) is left to the periodic admin metrics job.
+        Failures are logged and never fail the run.
+        """
+        from sqlalchemy.orm import Session
+        from backend.api.services.admin_service import AdminService
+
+        start = time.time()
+        try:
+            with Session(self.engine) as session:
+                AdminService(session).refresh_metrics_snapshot(include_feature_usage=False)
+            self.stats["durations"]["admin_metrics"] = round(time.time() - start, 2)
+        except Exception as e:
+            self.logger.error(f"Failed to refresh admin metrics snapshot: {e}")
+
     def _trigger_full_sync_background(self, user_id: int, account_id: int, access_token: str):
         """Trigger full sync in a background thread"""
 
@@ -276,7 +328,7 @@ class ETLPipeline:
                 end_date = date.today() - timedelta(days=1)
 
                 # Create new pipeline instance for background thread
-                bg_pipeline = ETLPipeline()
+                bg_pipeline = ETLPipeline(workers=self.workers)
                 bg_pipeline._run_full_sync(user_id, account_id, access_token, end_date)
 
                 self.logger.info(f"✅ Background full sync completed for account {account_id}")
@@ -297,6 +349,10 @@ class ETLPipeline:
         self.logger.info("Ensuring unknown members (ID=0) exist...")
         for table_name in UNKNOWN_MEMBER_DEFAULTS.keys():
             ensure_unknown_members(self.engine, table_name, UNKNOWN_MEMBER_DEFAULTS[table_name])
+        
+        # Static calendar for dim_date (no-op once populated in this process)
+        calendar_start = datetime.strptime(DATE_CALENDAR_START, '%Y-%m-%d').date()
+        ensure_date_calendar(self.engine, calendar_start, date.today() + timedelta(days=DATE_CALENDAR_DAYS_AHEAD))
     
     def _extract_data(self, start_date: date, end_date: date, skip_breakdowns: bool = False) -> Dict[str, pd.DataFrame]:
         """
@@ -402,35 +458,29 @@ class ETLPipeline:
             breakdown_df['_data_source'] = breakdown_type
             dfs_to_combine.append(breakdown_df)
         
-        df_combined = pd.concat(dfs_to_combine, ignore_index=True)
-        
-        # Clean and transform
-        self.logger.info("3.1: Cleaning and standardizing data...")
-        df_clean = clean_and_transform(df_combined, raw_data.get('metadata'))
-        
-        # Parse actions into fact_action_metrics
-        self.logger.info("3.2: Parsing actions for granular conversion tracking...")
-        df_actions = parse_actions_dataframe(df_clean)
-        
-        # Extract top conversions for fact_core
-        self.logger.info("3.3: Extracting top conversions for fact_core_metrics...")
-        df_clean = extract_top_conversions_for_fact_core(df_clean)
-        
-        # Parse video metrics
-        self.logger.info("3.4: Parsing video metrics...")
-        df_clean = parse_video_actions(df_clean)
-        
-        # Build fact tables
-        self.logger.info("3.5: Building fact tables...")
-        fact_tables = build_fact_tables(df_clean)
-        
-        # Extract dimensions
-        self.logger.info("3.6: Extracting dimension members...")
-        dimensions = extract_dimensions(df_clean, df_actions, raw_data.get('creatives'), raw_data.get('account_info'))
+        if self.workers > 1:
+            # Parallel mode: each breakdown group + date-chunked core slices in a process pool
+            partitions = build_partitions(raw_data['core'], raw_data['breakdowns'], core_chunks=self.workers)
+            self.logger.info(f"3.0: Transforming {len(partitions)} partitions with {self.workers} workers...")
+            combined_rows = sum(len(df) for df in partitions)
+            result = transform_partitions(
+                partitions, raw_data.get('metadata'), raw_data.get('creatives'),
+                raw_data.get('account_info'), workers=self.workers
+            )
+        else:
+            df_combined = pd.concat(dfs_to_combine, ignore_index=True)
+            combined_rows = len(df_combined)
+            result = transform_frame(
+                df_combined, raw_data.get('metadata'), raw_data.get('creatives'), raw_data.get('account_info')
+            )
+
+        fact_tables = result['facts']
+        df_actions = result['actions']
+        dimensions = result['dimensions']
 
         self.stats["transform"] = {
-            "combined_rows": len(df_combined),
-            "clean_rows": len(df_clean),
+            "combined_rows": combined_rows,
+            "clean_rows": result['clean_rows'],
             "action_rows": len(df_actions),
             "fact_tables": {k: len(v) for k, v in fact_tables.items()}
         }
@@ -455,6 +505,10 @@ class ETLPipeline:
         self.logger.info("4.1: Loading date dimension...")
         self._load_dates(transformed_data.get('facts', {}))
         
+        # Row hashes of members written by previous runs: only new/changed members are upserted
+        hash_cache = DimensionHashCache(self.engine, self._account_key()).load()
+        written = set()
+        
         # Load entity dimensions in order (respecting FK dependencies)
         # Order matters: account → campaign → adset → ad → creative
         load_order = [
@@ -482,113 +536,98 @@ class ETLPipeline:
             # Prepare for load (cast types, etc.)
             df_prepared = prepare_dimension_for_load(df_dim, dim_name)
             
+            df_changed = hash_cache.changed_rows(dim_name, df_prepared, pk_cols)
+            if df_changed.empty:
+                self.logger.info(f"⏭️ {dim_name}: {len(df_prepared)} rows unchanged")
+                self.stats["load"]["dimensions"][dim_name] = 0
+                continue
+            
             # Save
             success = save_dataframe(
                 self.engine,
-                df_prepared,
+                df_changed.drop(columns=['_member_key', '_row_hash']),
                 dim_name,
                 pk_cols,
                 is_fact=False
             )
             
             if success:
-                self.logger.info(f"✅ Loaded {dim_name}: {len(df_prepared)} rows")
-                self.stats["load"]["dimensions"][dim_name] = len(df_prepared)
+                hash_cache.commit(dim_name, df_changed)
+                written.add(dim_name)
+                self.logger.info(f"✅ Loaded {dim_name}: {len(df_changed)} new/changed of {len(df_prepared)} rows")
+                self.stats["load"]["dimensions"][dim_name] = len(df_changed)
             else:
                 self.logger.error(f"❌ Failed to load {dim_name}")
                 self.stats["load"]["dimensions"][dim_name] = "FAILED"
         
-        # Reload lookup cache
-        self.logger.info("4.5: Reloading lookup cache...")
-        load_lookup_cache(self.engine)
+        # Refresh lookups for attribute dimensions that gained members
+        refreshed = written & set(ATTRIBUTE_DIMENSIONS)
+        if refreshed:
+            self.logger.info("4.5: Refreshing attribute lookups...")
+            self.lookups.refresh(refreshed)
+    
+    def _account_key(self) -> int:
+        """Numeric id of the account this pipeline syncs (scopes the dimension hash cache)"""
+        try:
+            return int(str(self.extractor.account_id).replace('act_', ''))
+        except (TypeError, ValueError):
+            return 0
     
     def _load_dates(self, fact_dfs: Dict[str, pd.DataFrame]):
         """
-        Load all unique dates from fact tables into dim_date
-        
-        This ensures all date_ids in facts have corresponding entries in dim_date
+        Make sure dim_date covers every date_id in the fact tables
+
+        dim_date is a static calendar (see _ensure_schema); this only extends it
+        when facts fall outside the range already populated.
         """
         
         if not fact_dfs:
             return
         
-        # Extract all unique date_ids from all fact tables
-        all_date_ids = set()
-        
-        for fact_name, df_fact in fact_dfs.items():
-            if 'date_id' in df_fact.columns:
-                date_ids = df_fact['date_id'].unique()
-                all_date_ids.update(date_ids)
-        
-        # Remove unknown member (0)
-        if 0 in all_date_ids:
-            all_date_ids.remove(0)
-        
-        if not all_date_ids:
-            self.logger.warning("No dates to load")
+        date_columns = [df_fact['date_id'] for df_fact in fact_dfs.values() if 'date_id' in df_fact.columns]
+        if not date_columns:
             return
+        date_ids = pd.Series(pd.concat(date_columns, ignore_index=True).unique())
         
-        # Convert date_ids to dates and create dim_date DataFrame
+        # Remove unknown member (0) and anything that isn't a YYYYMMDD key
+        dates = pd.to_datetime(date_ids[date_ids != 0].astype(str), format='%Y%m%d', errors='coerce').dropna()
         
-        date_rows = []
-        for date_id in all_date_ids:
-            try:
-                # Convert YYYYMMDD to date
-                date_str = str(int(date_id))
-                if len(date_str) == 8:
-                    year = int(date_str[:4])
-                    month = int(date_str[4:6])
-                    day = int(date_str[6:8])
-                    
-                    dt = datetime(year, month, day)
-                    
-                    date_rows.append({
-                        'date_id': int(date_id),
-                        'date': dt.date(),
-                        'year': year,
-                        'month': month,
-                        'day_of_week': dt.strftime('%A'),
-                    })
-            except Exception as e:
-                self.logger.warning(f"Invalid date_id: {date_id} - {e}")
-        
-        if not date_rows:
-            self.logger.warning("No valid dates to load")
+        if dates.empty:
+            self.logger.warning("No dates to load")
             return
         
-        df_dates = pd.DataFrame(date_rows)
-        
-        # Save to dim_date
-        success = save_dataframe(
-            self.engine,
-            df_dates,
-            'dim_date',
-            ['date_id'],
-            is_fact=False
-        )
-        
-        if success:
-            self.logger.info(f"✅ Loaded dim_date: {len(df_dates)} dates")
+        if ensure_date_calendar(self.engine, dates.min().date(), dates.max().date()):
+            self.logger.info(f"✅ dim_date covers {dates.min().date()} to {dates.max().date()}")
         else:
             self.logger.error("❌ Failed to load dim_date")
     
     def _load_static_dimensions(self):
-        """Load static dimensions (age, gender) with unknown members"""
+        """Load static dimensions (age, gender) with unknown members - once per process"""
+        global _static_dimensions_loaded
+        
+        if _static_dimensions_loaded:
+            return
         
         # Age - with unknown member (ID=0)
         age_groups = ['Unknown Age'] + STATIC_AGE_GROUPS  # Add unknown member first
         df_age = pd.DataFrame({'age_group': age_groups})
-        save_dataframe(self.engine, df_age, 'dim_age', ['age_group'], is_fact=False)
+        age_saved = save_dataframe(self.engine, df_age, 'dim_age', ['age_group'], is_fact=False)
         
         # Gender - with unknown member (ID=0)
         genders = ['Unknown'] + STATIC_GENDER_GROUPS  # Add unknown member first
         df_gender = pd.DataFrame({'gender': genders})
-        save_dataframe(self.engine, df_gender, 'dim_gender', ['gender'], is_fact=False)
+        gender_saved = save_dataframe(self.engine, df_gender, 'dim_gender', ['gender'], is_fact=False)
+        
+        if not (age_saved and gender_saved):
+            # Leave the flag unset so the next run retries
+            self.logger.error("❌ Failed to load static dimensions (age, gender)")
+            return
         
+        _static_dimensions_loaded = True
         self.logger.info("✅ Loaded static dimensions (age, gender)")
     
-    def _load_facts(self, transformed_data: Dict):
-        """Load fact tables"""
+    def _load_facts(self, transformed_data: Dict, start_date: date, end_date: date, skip_breakdowns: bool = False):
+        """Load fact tables (replacing existing facts for the extraction window start_date..end_date)"""
         
         self.logger.info("STEP 5: Loading fact tables...")
         
@@ -596,20 +635,26 @@ class ETLPipeline:
         actions = transformed_data.get('actions', pd.DataFrame())
         
         # 5.0: Clear existing data for the processed date range to ensure accuracy
-        # This prevents duplication and allows re-attribution of "Unknown" rows
-        if facts:
-            # Get date range from fact_core_metrics or any fact table
-            # Assuming all facts in this run cover the same range
-            fact_tables = list(facts.keys())
-            if actions is not None and not actions.empty:
-                fact_tables.append('fact_action_metrics')
-                
-            first_fact = next(iter(facts.values()))
-            if not first_fact.empty and 'date_id' in first_fact.columns:
-                start_id = int(first_fact['date_id'].min())
-                end_id = int(first_fact['date_id'].max())
-                self.logger.info(f"5.0: Clearing existing fact data for range {start_id} to {end_id}...")
-                clear_fact_data(self.engine, fact_tables, start_id, end_id)
+        # This prevents duplication and allows re-attribution of "Unknown" rows.
+        # Range and tables follow what was extracted, not the loaded rows: the transform
+        # drops all-zero rows, and dates/tables that became all zero must be cleared too.
+        # Only this account's rows, and only tables this run reloads (breakdown tables
+        # keep their data in a quick sync).
+        fact_tables = ['fact_core_metrics', 'fact_action_metrics']
+        if not skip_breakdowns:
+            fact_tables += [group['fact_table'] for group in ACTIVE_BREAKDOWN_GROUPS]
+        fact_tables += [name for name in facts if name not in fact_tables]
+
+        account_id = self._account_key()
+        if not account_id:
+            self.logger.error("5.0: Unknown account id, not clearing existing fact data")
+        else:
+            start_id = int(start_date.strftime('%Y%m%d'))
+            end_id = int(end_date.strftime('%Y%m%d'))
+            self.logger.info(
+                f"5.0: Clearing existing fact data for account {account_id}, range {start_id} to {end_id}..."
+            )
+            clear_fact_data(self.engine, fact_tables, start_id, end_id, account_id)
 
         # Load regular fact tables
         for fact_name, df_fact in facts.items():
@@ -660,6 +705,8 @@ class ETLPipeline:
             if success:
                 self.logger.info(f"✅ Loaded {fact_name}: {len(df_prepared)} rows")
                 self.stats["load"]["facts"][fact_name] = len(df_prepared)
+                if fact_name == MAIN_FACT_TABLE:
+                    update_account_freshness(self.engine, df_prepared)
             else:
                 self.logger.error(f"❌ Failed to load {fact_name}")
                 self.stats["load"]["facts"][fact_name] = "FAILED"
@@ -692,101 +739,12 @@ class ETLPipeline:
         
         df_prep = df.copy()
         
-        # Get lookup cache
-        # Use global cache
-        
-        # Perform lookups based on fact table
-        if 'placement_name' in df_prep.columns:
-            # Clean placement_name before lookup
-            df_prep['placement_name'] = df_prep['placement_name'].astype(str).str.strip()
-            df_prep.loc[df_prep['placement_name'].isin(['N/A', 'nan', 'None', '']), 'placement_name'] = 'Unknown'
-            
-            df_prep['placement_id'] = df_prep['placement_name'].map(
-                LOOKUP_CACHE.get('dim_placement', {})
-            )
-            
-            # If lookup failed, try to get the 'Unknown' ID
-            unknown_placement_id = LOOKUP_CACHE.get('dim_placement', {}).get('Unknown')
-            if unknown_placement_id is not None:
-                df_prep['placement_id'].fillna(unknown_placement_id, inplace=True)
-            else:
-                df_prep['placement_id'].fillna(0, inplace=True)
-            
-            df_prep['placement_id'] = df_prep['placement_id'].astype(int)
-            df_prep.drop(columns=['placement_name'], inplace=True)
-        
-        if 'age_group' in df_prep.columns:
-            # Clean age_group before lookup
-            df_prep['age_group'] = df_prep['age_group'].astype(str).str.strip()
-            df_prep.loc[df_prep['age_group'].isin(['N/A', 'nan', 'None', '']), 'age_group'] = 'Unknown'
-            
-            df_prep['age_id'] = df_prep['age_group'].map(
-                LOOKUP_CACHE.get('dim_age', {})
-            )
-            
-            # If lookup failed, try to get the 'Unknown' ID
-            unknown_age_id = LOOKUP_CACHE.get('dim_age', {}).get('Unknown')
-            if unknown_age_id is not None:
-                df_prep['age_id'].fillna(unknown_age_id, inplace=True)
-            else:
-                self.logger.warning(f"Could not find 'Unknown Age' in lookup cache. Available: {list(LOOKUP_CACHE.get('dim_age', {}).keys())}")
-                df_prep['age_id'].fillna(0, inplace=True)
-            
-            df_prep['age_id'] = df_prep['age_id'].astype(int)
-            df_prep.drop(columns=['age_group'], inplace=True)
-        
-        if 'gender' in df_prep.columns:
-            # Clean gender before lookup
-            df_prep['gender'] = df_prep['gender'].astype(str).str.strip()
-            df_prep.loc[df_prep['gender'].isin(['N/A', 'nan', 'None', '']), 'gender'] = 'Unknown'
-            
-            # Debug: Show unique gender values before lookup
-            unique_genders = df_prep['gender'].unique()
-            self.logger.debug(f"Unique genders before lookup: {unique_genders}")
-            self.logger.debug(f"Gender lookup cache: {LOOKUP_CACHE.get('dim_gender', {})}")
-            
-            df_prep['gender_id'] = df_prep['gender'].map(
-                LOOKUP_CACHE.get('dim_gender', {})
-            )
-            
-            # If lookup failed, try to get the 'Unknown' ID
-            unknown_gender_id = LOOKUP_CACHE.get('dim_gender', {}).get('Unknown')
-            if unknown_gender_id is not None:
-                df_prep['gender_id'].fillna(unknown_gender_id, inplace=True)
-            else:
-                self.logger.warning(f"Could not find 'Unknown' in gender lookup cache. Available: {list(LOOKUP_CACHE.get('dim_gender', {}).keys())}")
-                df_prep['gender_id'].fillna(0, inplace=True)
-            
-            df_prep['gender_id'] = df_prep['gender_id'].astype(int)
-            
-            # Debug: Check if any gender_id is still 0
-            zero_count = (df_prep['gender_id'] == 0).sum()
-            if zero_count > 0:
-                self.logger.warning(f"Found {zero_count} rows with gender_id=0 after lookup")
-                problematic_genders = df_prep[df_prep['gender_id'] == 0]['gender'].unique() if 'gender' in df_prep.columns else []
-                if len(problematic_genders) > 0:
-                    self.logger.warning(f"Problematic gender values: {problematic_genders}")
-            
-            df_prep.drop(columns=['gender'], inplace=True, errors='ignore')
-        
-        if 'country' in df_prep.columns:
-            # Clean country before lookup
-            df_prep['country'] = df_prep['country'].astype(str).str.strip()
-            df_prep.loc[df_prep['country'].isin(['N/A', 'nan', 'None', '']), 'country'] = 'Unknown'
-            
-            df_prep['country_id'] = df_prep['country'].map(
-                LOOKUP_CACHE.get('dim_country', {})
-            )
-            
-            # If lookup failed, try to get the 'Unknown' ID
-            unknown_country_id = LOOKUP_CACHE.get('dim_country', {}).get('Unknown')
-            if unknown_country_id is not None:
-                df_prep['country_id'].fillna(unknown_country_id, inplace=True)
-            else:
-                df_prep['country_id'].fillna(0, inplace=True)
-            
-            df_prep['country_id'] = df_prep['country_id'].astype(int)
-            df_prep.drop(columns=['country'], inplace=True)
+        # Perform lookups based on fact table (unseen members are inserted, not mapped to 0)
+        for table_name in ('dim_placement', 'dim_age', 'dim_gender', 'dim_country'):
+            name_col, id_col = ATTRIBUTE_DIMENSIONS[table_name]
+            if name_col in df_prep.columns:
+                df_prep[id_col] = self.lookups.get_ids(table_name, df_prep[name_col])
+                df_prep.drop(columns=[name_col], inplace=True)
         
         return df_prep
     
@@ -795,12 +753,12 @@ class ETLPipeline:
 
         df_prep = df.copy()
 
-        # Lookup action_type → action_type_id
-        # Use global cache
+        # e.g. lead_website reduced to 0 after lead_form de-duplication - nothing to store
+        non_zero = df_prep[['action_count', 'action_value']].fillna(0).ne(0).any(axis=1)
+        df_prep = df_prep[non_zero]
 
-        df_prep['action_type_id'] = df_prep['action_type'].map(
-            LOOKUP_CACHE.get('dim_action_type', {})
-        ).fillna(0).astype(int)
+        # Lookup action_type → action_type_id
+        df_prep['action_type_id'] = self.lookups.get_ids('dim_action_type', df_prep['action_type'])
 
         df_prep.drop(columns=['action_type'], inplace=True)
 
@@ -890,6 +848,12 @@ class ETLPipeline:
 def main():
     """Main entry point for standalone ETL runs"""
 
+    import argparse
+    parser = argparse.ArgumentParser(description="Run the Facebook Ads ETL")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Transform processes (default: ETL_TRANSFORM_WORKERS, 1 = serial)")
+    args = parser.parse_args()
+
     # Get date range
     engine = get_db_engine()
     latest_date_str = get_latest_date_in_db(engine, MAIN_FACT_TABLE)
@@ -913,7 +877,7 @@ def main():
     logger.info(f"📅 Pull range: {start_date} to {end_date} (Forced: {force_historical})")
 
     # Run ETL (standalone mode uses full sync)
-    pipeline = ETLPipeline()
+    pipeline = ETLPipeline(workers=args.workers)
     pipeline.run(start_date, end_date)
 
 
@@ -18,7 +18,6 @@ from typing import List, Dict, Any, Union
 from datetime import date, timedelta
 import concurrent.futures
 
-from facebook_business.api import FacebookAdsApi
 from facebook_business.adobjects.adaccount import AdAccount
 from facebook_business.adobjects.adsinsights import AdsInsights
 from facebook_business.adobjects.adcreative import AdCreative
@@ -31,6 +30,7 @@ from facebook_business.exceptions import FacebookRequestError
 # Import config
 from backend.config.settings import BASE_FIELDS_TO_PULL, CHUNK_DAYS
 from backend.config.base_config import settings
+from backend.utils.graph_client import get_graph_client
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +62,7 @@ class FacebookExtractor:
         self.app_id = settings.FACEBOOK_APP_ID
         self.app_secret = settings.FACEBOOK_APP_SECRET
         self.user_id = user_id
+        self.api = None  # Pooled per-token FacebookAdsApi (set by initialize)
         self.initialized = False
         self.logger = logging.getLogger(self.__class__.__name__)
         self._video_cache = {}  # Cache for AdVideo data
@@ -75,7 +76,7 @@ class FacebookExtractor:
             return False
 
         try:
-            FacebookAdsApi.init(self.app_id, self.app_secret, self.access_token)
+            self.api = get_graph_client(self.access_token).api
             self.initialized = True
             self.logger.info(f"✅ Facebook API initialized for account {self.account_id}")
             return True
@@ -93,7 +94,7 @@ class FacebookExtractor:
 
         try:
             account_id_with_prefix = f"act_{self.account_id}" if not str(self.account_id).startswith('act_') else str(self.account_id)
-            account = AdAccount(account_id_with_prefix)
+            account = AdAccount(account_id_with_prefix, api=self.api)
             account_data = account.api_get(fields=['id', 'name', 'currency', 'account_status'])
 
             result = {
@@ -199,9 +200,6 @@ class FacebookExtractor:
         if count_ids == 0:
             return pd.DataFrame()
 
-        # Re-init for freshness
-        FacebookAdsApi.init(self.app_id, self.app_secret, self.access_token)
-
         if count_ids < BULK_FETCH_THRESHOLD:
             self.logger.info(f"Targeted Fetch: Optimizing metadata pull for {count_ids} Ads (Batch Mode)...")
             
@@ -317,7 +315,7 @@ class FacebookExtractor:
 
     def _fetch_single_batch(self, batch_ids: List[str], entity_class, fields: List[str], entity_type: str) -> List[Dict]:
         """Fetch a single batch of 50 IDs using the efficient ?ids= endpoint"""
-        api = FacebookAdsApi.init(self.app_id, self.app_secret, self.access_token)
+        api = self.api
         
         try:
             # Direct API call to avoid SDK module issues
@@ -368,7 +366,7 @@ class FacebookExtractor:
             try:
                 # Simulate mini-batching or just single calls
                 # Here we do single call safely
-                entity = entity_class(eid)
+                entity = entity_class(eid, api=self.api)
                 data = self._fetch_with_retry(entity.api_get, fields=fields, max_attempts=2) # Fewer retries for fallback
                 if data:
                     processed = self._process_entity_data(data.export_all_data(), entity_type)
@@ -492,7 +490,7 @@ class FacebookExtractor:
     def _fetch_entire_account_metadata(self) -> pd.DataFrame:
         """Legacy bulk dump method for very large accounts"""
         try:
-            account = AdAccount(f'act_{self.account_id}')
+            account = AdAccount(f'act_{self.account_id}', api=self.api)
             meta_parts = []
             all_statuses = ['ACTIVE', 'PAUSED', 'DELETED', 'ARCHIVED']
             filtering = [{'field': 'effective_status', 'operator': 'IN', 'value': all_statuses}]
@@ -585,8 +583,7 @@ class FacebookExtractor:
         return chunks
     
     def _fetch_chunk(self, chunk: Dict, fields: List[str], breakdowns: List[str], total_chunks: int = 0) -> tuple:
-        FacebookAdsApi.init(self.app_id, self.app_secret, self.access_token)
-        account = AdAccount(f'act_{self.account_id}')
+        account = AdAccount(f'act_{self.account_id}', api=self.api)
         
         log_prefix = f"[{self.account_id}] Chunk {chunk['index']}/{total_chunks} ({chunk['start_date']} to {chunk['end_date']})"
         self.logger.info(f"{log_prefix}: Starting fetch...")
@@ -4,16 +4,20 @@ Insight Scheduler - Background job scheduler for auto-generating insights
 Schedules:
 - Daily insights: Every day at 8:00 AM
 - Weekly insights: Every Monday at 9:00 AM
+- Admin metrics snapshot: Every ADMIN_METRICS_REFRESH_MINUTES minutes
 """
 
 import logging
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
 
 from backend.config.base_config import Settings
+from backend.utils.db_utils import register_numeric_as_float
 from backend.api.services.proactive_analysis_service import ProactiveAnalysisService
+from backend.api.services.admin_service import AdminService
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,57 +25,66 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler = None
 
+# Duration/throughput of the most recent run per insight type
+last_run_stats = {}
 
-def generate_daily_insights_job():
-    """Job function for daily insights generation"""
-    logger.info("Starting daily insights generation job...")
+
+def _run_insights_job(insight_type: str):
+    """Fan out insight generation across all accounts and record run stats"""
+    logger.info(f"Starting {insight_type} insights generation job...")
 
     settings = Settings()
     engine = create_engine(settings.DATABASE_URL)
+    register_numeric_as_float(engine)
     SessionLocal = sessionmaker(bind=engine)
     db = SessionLocal()
 
     try:
         service = ProactiveAnalysisService(db)
-        insights = service.generate_daily_insights(account_id=None)
-
-        if insights:
-            logger.info(f"✅ Generated {len(insights)} daily insight(s)")
-            for insight in insights:
-                logger.info(f"  - {insight['priority'].upper()}: {insight['title']}")
+        stats = service.generate_insights_for_all_accounts(
+            insight_type,
+            max_workers=settings.INSIGHT_JOB_MAX_WORKERS
+        )
+        last_run_stats[insight_type] = {k: v for k, v in stats.items() if k != 'insights'}
+
+        if stats['insights']:
+            logger.info(f"✅ Generated {len(stats['insights'])} {insight_type} insight(s)")
+            for insight in stats['insights']:
+                logger.info(f"  - [{insight['account_id']}] {insight['priority'].upper()}: {insight['title']}")
         else:
-            logger.info("No daily insights generated (no data or error)")
+            logger.info(f"No {insight_type} insights generated (no new data or error)")
 
     except Exception as e:
-        logger.error(f"❌ Daily insights job failed: {e}")
+        logger.error(f"❌ {insight_type.capitalize()} insights job failed: {e}")
 
     finally:
         db.close()
         engine.dispose()
 
 
+def generate_daily_insights_job():
+    """Job function for daily insights generation"""
+    _run_insights_job('daily')
+
+
 def generate_weekly_insights_job():
     """Job function for weekly insights generation"""
-    logger.info("Starting weekly insights generation job...")
+    _run_insights_job('weekly')
+
 
+def refresh_admin_metrics_job():
+    """Job function for the admin dashboard metrics snapshot"""
     settings = Settings()
     engine = create_engine(settings.DATABASE_URL)
+    register_numeric_as_float(engine)
     SessionLocal = sessionmaker(bind=engine)
     db = SessionLocal()
 
     try:
-        service = ProactiveAnalysisService(db)
-        insights = service.generate_weekly_insights(account_id=None)
-
-        if insights:
-            logger.info(f"✅ Generated {len(insights)} weekly insight(s)")
-            for insight in insights:
-                logger.info(f"  - {insight['priority'].upper()}: {insight['title']}")
-        else:
-            logger.info("No weekly insights generated (no data or error)")
-
+        written = AdminService(db).refresh_metrics_snapshot()
+        logger.info(f"✅ Refreshed {written} admin metric(s)")
     except Exception as e:
-        logger.error(f"❌ Weekly insights job failed: {e}")
+        logger.error(f"❌ Admin metrics refresh failed: {e}")
 
     finally:
         db.close()
@@ -109,10 +122,21 @@ def start_scheduler():
         replace_existing=True
     )
 
+    # Admin metrics snapshot: every few minutes
+    refresh_minutes = Settings().ADMIN_METRICS_REFRESH_MINUTES
+    scheduler.add_job(
+        refresh_admin_metrics_job,
+        trigger=IntervalTrigger(minutes=refresh_minutes),
+        id='admin_metrics',
+        name='Refresh Admin Metrics Snapshot',
+        replace_existing=True
+    )
+
     scheduler.start()
     logger.info("✅ Insight scheduler started")
     logger.info("  - Daily insights: Every day at 8:00 AM UTC")
     logger.info("  - Weekly insights: Every Monday at 9:00 AM UTC")
+    logger.info(f"  - Admin metrics snapshot: Every {refresh_minutes} minutes")
 
     return scheduler
 
@@ -0,0 +1,22 @@
+-- Migration: ETL dimension row hashes
+-- Created: 2026-10-18
+-- Description: The ETL keeps a hash of each dimension member as last loaded
+--              per account, so a run only upserts new or changed members.
+--              Dimension writes outside the ETL delete the affected hashes
+--              by (dim_name, member_key).
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS etl_dimension_hashes (
+    account_id BIGINT NOT NULL,
+    dim_name VARCHAR(50) NOT NULL,
+    member_key VARCHAR(255) NOT NULL,
+    row_hash BIGINT NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now()),
+    PRIMARY KEY (account_id, dim_name, member_key)
+);
+
+CREATE INDEX IF NOT EXISTS idx_etl_dimension_hashes_member
+    ON etl_dimension_hashes (dim_name, member_key);
+
+COMMIT;
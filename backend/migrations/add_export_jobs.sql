@@ -0,0 +1,30 @@
+-- Migration: Background export jobs
+-- Created: 2026-10-18
+-- Description: Exports too large for a request (ad-level daily rows, long date
+--              ranges) are submitted as jobs, run by a worker pool and polled;
+--              artifacts are written to local storage and expire.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS export_jobs (
+    id VARCHAR(36) PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    data_type VARCHAR(50) NOT NULL,
+    format VARCHAR(20) NOT NULL,
+    params TEXT NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    rows_exported INTEGER NOT NULL DEFAULT 0,
+    filename VARCHAR(255),
+    file_path VARCHAR(1024),
+    spreadsheet_url VARCHAR(500),
+    error TEXT,
+    created_at TIMESTAMP DEFAULT now(),
+    started_at TIMESTAMP,
+    completed_at TIMESTAMP,
+    expires_at TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_export_jobs_user_id ON export_jobs (user_id);
+CREATE INDEX IF NOT EXISTS ix_export_jobs_expires_at ON export_jobs (expires_at);
+
+COMMIT;
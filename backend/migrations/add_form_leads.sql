@@ -0,0 +1,26 @@
+-- Migration: Local lead form submissions
+-- Created: 2026-10-18
+-- Description: Leads are synced incrementally from the Graph API (filtering on
+--              time_created from a per-form cursor) into form_leads, and lead
+--              listing, stage counts and CSV export read the local table.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS form_leads (
+    fb_lead_id VARCHAR(100) PRIMARY KEY,
+    lead_form_id VARCHAR(100) NOT NULL,
+    account_id BIGINT,
+    created_time TIMESTAMP NOT NULL,
+    field_data TEXT NOT NULL DEFAULT '{}',
+    synced_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now())
+);
+
+CREATE INDEX IF NOT EXISTS idx_form_leads_form_created ON form_leads (lead_form_id, created_time);
+
+CREATE TABLE IF NOT EXISTS lead_form_sync_state (
+    lead_form_id VARCHAR(100) PRIMARY KEY,
+    last_created_time TIMESTAMP,
+    last_synced_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now())
+);
+
+COMMIT;
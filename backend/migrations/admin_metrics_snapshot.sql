@@ -0,0 +1,42 @@
+-- Migration: Admin metrics snapshot and per-account data freshness
+-- Created: 2026-10-18
+-- Description: Admin dashboard account health, spend and feature adoption are
+--              read from precomputed rows instead of scanning fact_core_metrics
+--              and page_view on every page load.
+--
+-- account_data_freshness is maintained by the ETL on each fact_core_metrics
+-- load; the backfill below is the only full scan of the fact table.
+-- admin_metrics_snapshot is filled by the ETL and the periodic admin metrics
+-- job (jobs/insight_scheduler.py); until then the API computes metrics live.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS account_data_freshness (
+    account_id BIGINT PRIMARY KEY,
+    first_date_id BIGINT NOT NULL,
+    last_date_id BIGINT NOT NULL,
+    last_loaded_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now())
+);
+
+CREATE INDEX IF NOT EXISTS ix_account_data_freshness_last_date_id
+    ON account_data_freshness (last_date_id);
+
+CREATE TABLE IF NOT EXISTS admin_metrics_snapshot (
+    metric_key VARCHAR(50) NOT NULL,
+    period_days INTEGER NOT NULL,
+    value_json TEXT NOT NULL,
+    refreshed_at TIMESTAMP NOT NULL DEFAULT timezone('utc', now()),
+    PRIMARY KEY (metric_key, period_days)
+);
+
+-- Backfill freshness from existing facts
+INSERT INTO account_data_freshness (account_id, first_date_id, last_date_id)
+SELECT account_id, MIN(date_id), MAX(date_id)
+FROM fact_core_metrics
+WHERE date_id <> 0
+GROUP BY account_id
+ON CONFLICT (account_id) DO UPDATE SET
+    first_date_id = LEAST(account_data_freshness.first_date_id, EXCLUDED.first_date_id),
+    last_date_id = GREATEST(account_data_freshness.last_date_id, EXCLUDED.last_date_id);
+
+COMMIT;
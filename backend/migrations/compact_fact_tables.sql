@@ -0,0 +1,87 @@
+-- Migration: Compact fact table storage
+-- Created: 2026-10-18
+-- Description: Narrower metric types, drop unique constraints that duplicate
+--              the primary key, and remove all-zero fact rows.
+--
+-- Money columns become NUMERIC(14,2) (exact, and smaller than FLOAT8 for
+-- typical ad spend values), counters become INTEGER. Each table is rewritten
+-- once (all ALTER COLUMNs in a single statement), so run this in a maintenance
+-- window. The application engine returns NUMERIC as float
+-- (db_utils.register_numeric_as_float), so readers are unaffected.
+
+BEGIN;
+
+-- ============================================================================
+-- DUPLICATE UNIQUE CONSTRAINTS (same columns as the primary key)
+-- ============================================================================
+
+ALTER TABLE fact_core_metrics DROP CONSTRAINT IF EXISTS uq_fact_core;
+ALTER TABLE fact_placement_metrics DROP CONSTRAINT IF EXISTS uq_fact_placement;
+ALTER TABLE fact_age_gender_metrics DROP CONSTRAINT IF EXISTS uq_fact_age_gender;
+ALTER TABLE fact_country_metrics DROP CONSTRAINT IF EXISTS uq_fact_country;
+ALTER TABLE fact_action_metrics DROP CONSTRAINT IF EXISTS uq_fact_action;
+
+-- ============================================================================
+-- ALL-ZERO ROWS (ETL no longer writes them)
+-- ============================================================================
+
+DELETE FROM fact_core_metrics
+WHERE spend = 0 AND impressions = 0 AND clicks = 0
+  AND purchases = 0 AND purchase_value = 0 AND leads = 0 AND add_to_cart = 0
+  AND lead_website = 0 AND lead_form = 0
+  AND COALESCE(video_plays, 0) = 0 AND COALESCE(video_p25_watched, 0) = 0
+  AND COALESCE(video_p50_watched, 0) = 0 AND COALESCE(video_p75_watched, 0) = 0
+  AND COALESCE(video_p100_watched, 0) = 0 AND COALESCE(video_avg_time_watched, 0) = 0;
+
+DELETE FROM fact_placement_metrics WHERE spend = 0 AND impressions = 0 AND clicks = 0;
+DELETE FROM fact_age_gender_metrics WHERE spend = 0 AND impressions = 0 AND clicks = 0;
+DELETE FROM fact_country_metrics WHERE spend = 0 AND impressions = 0 AND clicks = 0;
+DELETE FROM fact_action_metrics WHERE action_count = 0 AND action_value = 0;
+
+-- ============================================================================
+-- NARROWER METRIC TYPES
+-- ============================================================================
+
+ALTER TABLE fact_core_metrics
+    ALTER COLUMN spend TYPE NUMERIC(14, 2) USING ROUND(spend::numeric, 2),
+    ALTER COLUMN purchase_value TYPE NUMERIC(14, 2) USING ROUND(purchase_value::numeric, 2),
+    ALTER COLUMN impressions TYPE INTEGER,
+    ALTER COLUMN clicks TYPE INTEGER,
+    ALTER COLUMN purchases TYPE INTEGER,
+    ALTER COLUMN leads TYPE INTEGER,
+    ALTER COLUMN add_to_cart TYPE INTEGER,
+    ALTER COLUMN lead_website TYPE INTEGER,
+    ALTER COLUMN lead_form TYPE INTEGER,
+    ALTER COLUMN video_plays TYPE INTEGER,
+    ALTER COLUMN video_p25_watched TYPE INTEGER,
+    ALTER COLUMN video_p50_watched TYPE INTEGER,
+    ALTER COLUMN video_p75_watched TYPE INTEGER,
+    ALTER COLUMN video_p100_watched TYPE INTEGER;
+
+ALTER TABLE fact_placement_metrics
+    ALTER COLUMN spend TYPE NUMERIC(14, 2) USING ROUND(spend::numeric, 2),
+    ALTER COLUMN impressions TYPE INTEGER,
+    ALTER COLUMN clicks TYPE INTEGER;
+
+ALTER TABLE fact_age_gender_metrics
+    ALTER COLUMN spend TYPE NUMERIC(14, 2) USING ROUND(spend::numeric, 2),
+    ALTER COLUMN impressions TYPE INTEGER,
+    ALTER COLUMN clicks TYPE INTEGER;
+
+ALTER TABLE fact_country_metrics
+    ALTER COLUMN spend TYPE NUMERIC(14, 2) USING ROUND(spend::numeric, 2),
+    ALTER COLUMN impressions TYPE INTEGER,
+    ALTER COLUMN clicks TYPE INTEGER;
+
+ALTER TABLE fact_action_metrics
+    ALTER COLUMN action_value TYPE NUMERIC(14, 2) USING ROUND(action_value::numeric, 2),
+    ALTER COLUMN action_count TYPE INTEGER;
+
+COMMIT;
+
+-- Refresh planner statistics after the rewrite
+ANALYZE fact_core_metrics;
+ANALYZE fact_placement_metrics;
+ANALYZE fact_age_gender_metrics;
+ANALYZE fact_country_metrics;
+ANALYZE fact_action_metrics;
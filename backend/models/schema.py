@@ -3,7 +3,7 @@ models/schema.py - Complete Database Schema (Lean & Efficient)
 """
 
 from sqlalchemy import (
-    Column, Integer, String, Float, Date, BigInteger, Boolean, Text,
+    Column, Integer, String, Float, Numeric, Date, BigInteger, Boolean, Text,
     ForeignKey, UniqueConstraint, Index, DateTime
 )
 from sqlalchemy.orm import declarative_base
@@ -183,29 +183,27 @@ class FactCoreMetrics(Base):
     creative_id = Column(BigInteger, ForeignKey('dim_creative.creative_id'), primary_key=True, nullable=False)
     
     # Core metrics (raw)
-    spend = Column(Float, nullable=False, default=0.0)
-    impressions = Column(BigInteger, nullable=False, default=0)
-    clicks = Column(BigInteger, nullable=False, default=0)
+    spend = Column(Numeric(14, 2, asdecimal=False), nullable=False, default=0)
+    impressions = Column(Integer, nullable=False, default=0)
+    clicks = Column(Integer, nullable=False, default=0)
     
     # Top conversions (7d_click attribution) - for query speed
-    purchases = Column(BigInteger, nullable=False, default=0)
-    purchase_value = Column(Float, nullable=False, default=0.0)
-    leads = Column(BigInteger, nullable=False, default=0)
-    add_to_cart = Column(BigInteger, nullable=False, default=0)
-    lead_website = Column(BigInteger, nullable=False, default=0)  
-    lead_form = Column(BigInteger, nullable=False, default=0)    
+    purchases = Column(Integer, nullable=False, default=0)
+    purchase_value = Column(Numeric(14, 2, asdecimal=False), nullable=False, default=0)
+    leads = Column(Integer, nullable=False, default=0)
+    add_to_cart = Column(Integer, nullable=False, default=0)
+    lead_website = Column(Integer, nullable=False, default=0)  
+    lead_form = Column(Integer, nullable=False, default=0)    
     
     # Video metrics (optional)
-    video_plays = Column(BigInteger, default=0)
-    video_p25_watched = Column(BigInteger, default=0)
-    video_p50_watched = Column(BigInteger, default=0)
-    video_p75_watched = Column(BigInteger, default=0)
-    video_p100_watched = Column(BigInteger, default=0)
+    video_plays = Column(Integer, default=0)
+    video_p25_watched = Column(Integer, default=0)
+    video_p50_watched = Column(Integer, default=0)
+    video_p75_watched = Column(Integer, default=0)
+    video_p100_watched = Column(Integer, default=0)
     video_avg_time_watched = Column(Float, default=0.0)
     
     __table_args__ = (
-        UniqueConstraint('date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id',
-                        name='uq_fact_core'),
         Index('idx_fact_core_date', 'date_id'),
         Index('idx_fact_core_account', 'account_id'),
         Index('idx_fact_core_account_date', 'account_id', 'date_id'),
@@ -231,13 +229,11 @@ class FactPlacementMetrics(Base):
     creative_id = Column(BigInteger, ForeignKey('dim_creative.creative_id'), primary_key=True, nullable=False)
     placement_id = Column(Integer, ForeignKey('dim_placement.placement_id'), primary_key=True, nullable=False)
     
-    spend = Column(Float, nullable=False, default=0.0)
-    impressions = Column(BigInteger, nullable=False, default=0)
-    clicks = Column(BigInteger, nullable=False, default=0)
+    spend = Column(Numeric(14, 2, asdecimal=False), nullable=False, default=0)
+    impressions = Column(Integer, nullable=False, default=0)
+    clicks = Column(Integer, nullable=False, default=0)
     
     __table_args__ = (
-        UniqueConstraint('date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id', 'placement_id',
-                        name='uq_fact_placement'),
         Index('idx_fact_placement_date', 'date_id'),
         Index('idx_fact_placement_account', 'account_id'),
         Index('idx_fact_placement_campaign', 'campaign_id'),
@@ -258,13 +254,11 @@ class FactAgeGenderMetrics(Base):
     age_id = Column(Integer, ForeignKey('dim_age.age_id'), primary_key=True, nullable=False)
     gender_id = Column(Integer, ForeignKey('dim_gender.gender_id'), primary_key=True, nullable=False)
     
-    spend = Column(Float, nullable=False, default=0.0)
-    impressions = Column(BigInteger, nullable=False, default=0)
-    clicks = Column(BigInteger, nullable=False, default=0)
+    spend = Column(Numeric(14, 2, asdecimal=False), nullable=False, default=0)
+    impressions = Column(Integer, nullable=False, default=0)
+    clicks = Column(Integer, nullable=False, default=0)
     
     __table_args__ = (
-        UniqueConstraint('date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id',
-                        'age_id', 'gender_id', name='uq_fact_age_gender'),
         Index('idx_fact_age_gender_date', 'date_id'),
         Index('idx_fact_age_gender_account', 'account_id'),
         Index('idx_fact_age_gender_campaign', 'campaign_id'),
@@ -285,13 +279,11 @@ class FactCountryMetrics(Base):
     creative_id = Column(BigInteger, ForeignKey('dim_creative.creative_id'), primary_key=True, nullable=False)
     country_id = Column(Integer, ForeignKey('dim_country.country_id'), primary_key=True, nullable=False)
     
-    spend = Column(Float, nullable=False, default=0.0)
-    impressions = Column(BigInteger, nullable=False, default=0)
-    clicks = Column(BigInteger, nullable=False, default=0)
+    spend = Column(Numeric(14, 2, asdecimal=False), nullable=False, default=0)
+    impressions = Column(Integer, nullable=False, default=0)
+    clicks = Column(Integer, nullable=False, default=0)
     
     __table_args__ = (
-        UniqueConstraint('date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id', 'country_id',
-                        name='uq_fact_country'),
         Index('idx_fact_country_date', 'date_id'),
         Index('idx_fact_country_account', 'account_id'),
         Index('idx_fact_country_campaign', 'campaign_id'),
@@ -313,12 +305,10 @@ class FactActionMetrics(Base):
     action_type_id = Column(Integer, ForeignKey('dim_action_type.action_type_id'), primary_key=True, nullable=False)
     attribution_window = Column(String(20), primary_key=True, nullable=False)
     
-    action_count = Column(BigInteger, nullable=False, default=0)
-    action_value = Column(Float, nullable=False, default=0.0)
+    action_count = Column(Integer, nullable=False, default=0)
+    action_value = Column(Numeric(14, 2, asdecimal=False), nullable=False, default=0)
     
     __table_args__ = (
-        UniqueConstraint('date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id',
-                        'action_type_id', 'attribution_window', name='uq_fact_action'),
         Index('idx_fact_action_type', 'action_type_id'),
         Index('idx_fact_action_date', 'date_id'),
         Index('idx_fact_action_account', 'account_id'),
@@ -422,6 +412,69 @@ class LeadStageAssignment(Base):
     )
 
 
+class FormLead(Base):
+    """Local copy of lead form submissions, synced incrementally from the Graph API"""
+    __tablename__ = 'form_leads'
+
+    fb_lead_id = Column(String(100), primary_key=True)
+    lead_form_id = Column(String(100), nullable=False)
+    account_id = Column(BigInteger, nullable=True)
+    created_time = Column(DateTime, nullable=False)  # UTC
+    field_data = Column(Text, nullable=False, default='{}')  # JSON object of question name -> first answer
+    synced_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        Index('idx_form_leads_form_created', 'lead_form_id', 'created_time'),
+    )
+
+
+class LeadFormSyncState(Base):
+    """Per-form incremental sync cursor (newest created_time stored locally)"""
+    __tablename__ = 'lead_form_sync_state'
+
+    lead_form_id = Column(String(100), primary_key=True)
+    last_created_time = Column(DateTime, nullable=True)  # UTC; None = never synced
+    last_synced_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+# ==============================================================================
+# ETL BOOKKEEPING
+# ==============================================================================
+
+class EtlDimensionHash(Base):
+    """Row hash of each dimension member as last loaded, so ETL runs only upsert new/changed members"""
+    __tablename__ = 'etl_dimension_hashes'
+    __table_args__ = (
+        Index('idx_etl_dimension_hashes_member', 'dim_name', 'member_key'),  # invalidation by member
+    )
+
+    account_id = Column(BigInteger, primary_key=True)
+    dim_name = Column(String(50), primary_key=True)
+    member_key = Column(String(255), primary_key=True)
+    row_hash = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+class AccountDataFreshness(Base):
+    """Date range of fact_core_metrics per account, updated by the ETL as facts are loaded"""
+    __tablename__ = 'account_data_freshness'
+
+    account_id = Column(BigInteger, primary_key=True)
+    first_date_id = Column(BigInteger, nullable=False)
+    last_date_id = Column(BigInteger, nullable=False, index=True)
+    last_loaded_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+class AdminMetricsSnapshot(Base):
+    """Precomputed admin dashboard metrics (written by AdminService.refresh_metrics_snapshot), one row per metric and lookback"""
+    __tablename__ = 'admin_metrics_snapshot'
+
+    metric_key = Column(String(50), primary_key=True)
+    period_days = Column(Integer, primary_key=True)  # 0 = not period based
+    value_json = Column(Text, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
 def create_schema(engine):
     """Create all tables"""
     Base.metadata.create_all(engine)
@@ -215,3 +215,30 @@ class UserReportPreferences(Base):
 
     # Relationships
     user = relationship("User", backref="report_preferences")
+
+
+class ExportJob(Base):
+    """
+    Background export job (large date ranges / row-level exports).
+    The artifact is written to EXPORT_JOB_DIR on the API host and deleted at expires_at.
+    """
+    __tablename__ = 'export_jobs'
+
+    id = Column(String(36), primary_key=True)  # uuid4 hex
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
+
+    data_type = Column(String(50), nullable=False)
+    format = Column(String(20), nullable=False)  # csv, xlsx, parquet, google_sheets
+    params = Column(Text, nullable=False, default='{}')  # JSON of the submitted request
+
+    status = Column(String(20), nullable=False, default='pending')  # pending, running, completed, failed, expired
+    rows_exported = Column(Integer, nullable=False, default=0)
+    filename = Column(String(255))
+    file_path = Column(String(1024))
+    spreadsheet_url = Column(String(500))
+    error = Column(Text)
+
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    expires_at = Column(DateTime, index=True)
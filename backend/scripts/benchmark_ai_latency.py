@@ -0,0 +1,204 @@
+"""
+Benchmark: AI endpoint latency breakdown under concurrent load.
+
+Runs each AI service entry point against the local database with the
+deterministic stub LLM provider and reports, per endpoint, how wall time splits
+between data fetch (SQL), LLM and post-processing (everything else).
+
+Usage:
+    python backend/scripts/benchmark_ai_latency.py --user-id 1 --account-id 123 \
+        --concurrency 8 --requests 40 --llm-latency-ms 800
+
+Pass --provider gemini to measure against the real model instead of the stub.
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="AI endpoint latency benchmark")
+    parser.add_argument("--user-id", type=int, required=True, help="User whose accounts are analysed")
+    parser.add_argument("--account-id", type=int, required=True, help="Ad account used for per-account endpoints")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent workers")
+    parser.add_argument("--requests", type=int, default=40, help="Requests per endpoint")
+    parser.add_argument("--provider", choices=["stub", "gemini"], default="stub")
+    parser.add_argument("--llm-latency-ms", type=int, default=800, help="Simulated latency for the stub provider")
+    parser.add_argument("--only", nargs="*", help="Run only these endpoints")
+    return parser.parse_args()
+
+
+args = _parse_args()
+
+# Provider selection must happen before services are imported/instantiated
+os.environ["LLM_PROVIDER"] = args.provider
+os.environ["LLM_STUB_LATENCY_MS"] = str(args.llm_latency_ms)
+
+from sqlalchemy import event
+from backend.api.dependencies import SessionLocal, engine
+from backend.api.services.llm_provider import reset_llm_timing
+from backend.api.services import insights_service, ai_service, chatbot_service
+from backend.api.services.insights_service import InsightsService
+from backend.api.services.ai_service import AIService
+from backend.api.services.chatbot_service import ChatbotService
+from backend.api.services.recommendation_service import RecommendationService
+from backend.api.services.business_profile_service import BusinessProfileService
+from backend.api.services.proactive_analysis_service import ProactiveAnalysisService, DAILY_INSIGHT_PROMPT
+from backend.scripts import stub_llm_fixtures
+
+# Stub outputs in the shapes the services parse, so they run their normal path
+stub_llm_fixtures.register_all()
+
+# --- SQL time accounting -----------------------------------------------------
+
+# One mutable list per request, so queries run in copied contexts (asyncio.run) still count
+_db_seconds: ContextVar[list] = ContextVar("db_seconds", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("bench_start", []).append(time.perf_counter())
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["bench_start"].pop(-1)
+    db_seconds = _db_seconds.get()
+    if db_seconds is not None:
+        db_seconds[0] += time.perf_counter() - started
+
+
+# --- Endpoints ---------------------------------------------------------------
+
+def _clear_caches():
+    insights_service.INSIGHTS_CACHE.clear()
+    ai_service.QUERY_CACHE.clear()
+    chatbot_service.CHAT_CACHE.clear()
+
+
+def _summary_insights(db, i):
+    end = date.today() - timedelta(days=1)
+    InsightsService(db, args.user_id)._build_summary_insights(
+        end - timedelta(days=29), end, "dashboard", account_ids=[args.account_id]
+    )
+
+
+def _overview_summary(db, i):
+    InsightsService(db, args.user_id)._build_overview_summary([args.account_id])
+
+
+def _ai_query(db, i):
+    AIService(db, args.user_id).query_data(f"Which campaigns had the best ROAS? ({i})", str(args.account_id))
+
+
+def _audience_recommendations(db, i):
+    RecommendationService(db).get_audience_recommendations(args.account_id)
+
+
+def _chatbot(db, i):
+    ChatbotService().chat(f"How do I improve my CTR? ({i})")
+
+
+def _social_analysis(db, i):
+    posts = [{"message": f"Post {n} about our summer collection", "source": "facebook"} for n in range(20)]
+    asyncio.run(BusinessProfileService(db).analyze_social_pages(posts))
+
+
+def _proactive_daily(db, i):
+    # Fetch + generate without persisting, so the benchmark doesn't write insights
+    service = ProactiveAnalysisService(db)
+    yesterday = date.today() - timedelta(days=1)
+    periods = service._get_metrics_by_account({
+        "current": (yesterday, yesterday),
+        "previous": (yesterday - timedelta(days=6), yesterday - timedelta(days=1)),
+    }).get(args.account_id, {})
+    if periods.get("current") and periods.get("previous"):
+        _, context_json = service._build_daily_context(yesterday, periods["current"], periods["previous"])
+        service._generate_analysis(DAILY_INSIGHT_PROMPT, context_json)
+
+
+ENDPOINTS = {
+    "insights_summary": _summary_insights,
+    "insights_overview": _overview_summary,
+    "ai_query": _ai_query,
+    "recommendations_audience": _audience_recommendations,
+    "chatbot": _chatbot,
+    "business_profile_social": _social_analysis,
+    "proactive_daily": _proactive_daily,
+}
+
+
+# --- Runner ------------------------------------------------------------------
+
+def _timed_call(fn, i):
+    """Run one request in its own session and split its wall time."""
+    db_seconds = [0.0]
+    _db_seconds.set(db_seconds)
+    timing = reset_llm_timing()
+    db = SessionLocal()
+    start = time.perf_counter()
+    error = None
+    try:
+        fn(db, i)
+    except Exception as e:
+        error = str(e)
+    finally:
+        total = time.perf_counter() - start
+        db.close()
+
+    db_time = db_seconds[0]
+    llm_time = timing.seconds
+    return {
+        "total": total,
+        "db": db_time,
+        "llm": llm_time,
+        "post": max(total - db_time - llm_time, 0.0),
+        "error": error,
+    }
+
+
+def _pct(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def run_benchmark():
+    selected = {k: v for k, v in ENDPOINTS.items() if not args.only or k in args.only}
+
+    print(f"Provider: {args.provider}"
+          + (f" ({args.llm_latency_ms}ms simulated)" if args.provider == "stub" else "")
+          + f" | concurrency={args.concurrency} | requests={args.requests}\n")
+    print(f"{'endpoint':<26} {'rps':>7} {'p50':>8} {'p95':>8} {'db avg':>8} {'llm avg':>8} {'post avg':>9} {'errors':>7}")
+
+    for name, fn in selected.items():
+        _clear_caches()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(lambda i: _timed_call(fn, i), range(args.requests)))
+        elapsed = time.perf_counter() - started
+
+        totals = [r["total"] for r in results]
+        errors = [r["error"] for r in results if r["error"]]
+        print(
+            f"{name:<26} {len(results) / elapsed:>7.1f} "
+            f"{_pct(totals, 50) * 1000:>6.0f}ms {_pct(totals, 95) * 1000:>6.0f}ms "
+            f"{statistics.mean(r['db'] for r in results) * 1000:>6.0f}ms "
+            f"{statistics.mean(r['llm'] for r in results) * 1000:>6.0f}ms "
+            f"{statistics.mean(r['post'] for r in results) * 1000:>7.0f}ms "
+            f"{len(errors):>7}"
+        )
+        if errors:
+            print(f"  first error: {errors[0]}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
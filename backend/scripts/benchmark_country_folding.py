@@ -0,0 +1,116 @@
+"""
+Benchmark: top-N country folding in FactBuilder._filter_top_countries.
+
+Builds a synthetic country breakdown (the groupby output _build_fact_country
+feeds into the fold), runs the previous rank + split + re-aggregate
+implementation and the current one (keys hashed once, grouped by integer
+code), checks that both produce identical output and reports timings.
+
+Usage:
+    python backend/scripts/benchmark_country_folding.py --ads 2000 --days 90 --countries 40
+"""
+import sys
+import os
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from backend.config.settings import TOP_COUNTRIES_LIMIT
+from backend.transformers.fact_builder import FactBuilder
+
+GROUP_COLS = ['date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id']
+
+
+def legacy_filter_top_countries(df: pd.DataFrame, top_n: int) -> pd.DataFrame:
+    """The implementation _filter_top_countries replaced, kept for comparison"""
+    df = df.copy()
+    df['_rank'] = df.groupby(GROUP_COLS)['spend'].rank(method='first', ascending=False)
+
+    df_top = df[df['_rank'] <= top_n].copy()
+    df_other = df[df['_rank'] > top_n].copy()
+
+    if df_other.empty:
+        return df_top.drop(columns=['_rank'])
+
+    df_other_agg = df_other.groupby(GROUP_COLS, as_index=False).agg({
+        'spend': 'sum',
+        'impressions': 'sum',
+        'clicks': 'sum',
+    })
+    df_other_agg['country'] = 'Other'
+    return pd.concat([df_top.drop(columns=['_rank']), df_other_agg], ignore_index=True)
+
+
+def build_country_breakdown(ads: int, days: int, countries: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2025-01-01', periods=days).strftime('%Y%m%d').astype(np.int64)
+    names = [f"Country {i:03d}" for i in range(countries)]
+
+    n = ads * days * countries
+    ad_ids = np.repeat(np.arange(ads, dtype=np.int64) + 120000000000, days * countries)
+    df = pd.DataFrame({
+        'date_id': np.tile(np.repeat(dates, countries), ads),
+        'account_id': 1000,
+        'campaign_id': ad_ids // 100,
+        'adset_id': ad_ids // 10,
+        'ad_id': ad_ids,
+        'creative_id': ad_ids + 1,
+        'country': np.tile(names, ads * days),
+        # Rounded spends so ties (broken by input order) actually occur
+        'spend': rng.gamma(0.5, 20.0, n).round(0),
+        'impressions': rng.integers(0, 5000, n),
+        'clicks': rng.integers(0, 100, n),
+    })
+
+    # Same shape _build_fact_country hands over: aggregated and sorted by key
+    df['country'] = df['country'].astype('category')
+    return df.groupby(GROUP_COLS + ['country'], as_index=False, observed=True).agg({
+        'spend': 'sum',
+        'impressions': 'sum',
+        'clicks': 'sum',
+    })
+
+
+def _best_of(fn, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def run_benchmark(args):
+    df = build_country_breakdown(args.ads, args.days, args.countries, args.seed)
+    builder = FactBuilder()
+
+    legacy_time, expected = _best_of(lambda: legacy_filter_top_countries(df, args.top_n), args.repeat)
+    current_time, actual = _best_of(lambda: builder._filter_top_countries(df.copy(), args.top_n), args.repeat)
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    identical = actual.to_csv(index=True).encode() == expected.to_csv(index=True).encode()
+
+    print(f"Input rows: {len(df):,} | output rows: {len(actual):,} | top_n={args.top_n}")
+    print(f"legacy:      {legacy_time * 1000:>9.1f}ms")
+    print(f"current:     {current_time * 1000:>9.1f}ms  ({legacy_time / current_time:.1f}x)")
+    print(f"byte-identical output: {identical}")
+
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Country top-N folding benchmark")
+    parser.add_argument("--ads", type=int, default=500)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--countries", type=int, default=40)
+    parser.add_argument("--top-n", type=int, default=TOP_COUNTRIES_LIMIT)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    run_benchmark(parser.parse_args())
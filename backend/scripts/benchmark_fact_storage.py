@@ -0,0 +1,191 @@
+"""
+Benchmark: fact_core_metrics storage layout - legacy vs compact.
+
+Creates two synthetic copies of fact_core_metrics in a scratch schema:
+  legacy  - FLOAT8 money, BIGINT counters, unique constraint duplicating the PK,
+            all-zero rows included
+  compact - NUMERIC(14,2) money, INTEGER counters, PK only, all-zero rows dropped
+and reports table/index size and the time of typical dashboard scans.
+
+Usage:
+    python backend/scripts/benchmark_fact_storage.py --rows 50000000 --zero-fraction 0.3
+
+Generating 50M rows takes a while and needs ~15GB of free disk; use --rows
+for a quicker run. The scratch schema is dropped afterwards unless --keep.
+"""
+import sys
+import os
+import time
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from sqlalchemy import create_engine, text
+from backend.config.base_config import settings
+
+SCHEMA = "bench_fact_storage"
+BATCH_ROWS = 5_000_000
+
+LAYOUTS = {
+    "legacy": {
+        "money": "DOUBLE PRECISION",
+        "counter": "BIGINT",
+        "extra": ", CONSTRAINT uq_{table} UNIQUE (date_id, account_id, campaign_id, adset_id, ad_id, creative_id)",
+        "keep_zero_rows": True,
+    },
+    "compact": {
+        "money": "NUMERIC(14, 2)",
+        "counter": "INTEGER",
+        "extra": "",
+        "keep_zero_rows": False,
+    },
+}
+
+COUNTERS = [
+    "impressions", "clicks", "purchases", "leads", "add_to_cart", "lead_website", "lead_form",
+    "video_plays", "video_p25_watched", "video_p50_watched", "video_p75_watched", "video_p100_watched",
+]
+
+QUERIES = {
+    "account_30d_totals": """
+        SELECT SUM(spend), SUM(impressions), SUM(clicks), SUM(purchases), SUM(purchase_value)
+        FROM {table}
+        WHERE account_id = 7 AND date_id BETWEEN 20250601 AND 20250630
+    """,
+    "account_90d_by_campaign": """
+        SELECT campaign_id, SUM(spend), SUM(clicks)
+        FROM {table}
+        WHERE account_id = 7 AND date_id BETWEEN 20250401 AND 20250630
+        GROUP BY campaign_id
+    """,
+    "full_scan_daily": """
+        SELECT date_id, SUM(spend), SUM(impressions)
+        FROM {table}
+        GROUP BY date_id
+    """,
+}
+
+
+def _create_table(conn, name, layout):
+    counters = ",\n".join(f"{c} {layout['counter']} NOT NULL DEFAULT 0" for c in COUNTERS)
+    conn.execute(text(f"""
+        CREATE TABLE {SCHEMA}.{name} (
+            date_id BIGINT NOT NULL,
+            account_id BIGINT NOT NULL,
+            campaign_id BIGINT NOT NULL,
+            adset_id BIGINT NOT NULL,
+            ad_id BIGINT NOT NULL,
+            creative_id BIGINT NOT NULL,
+            spend {layout['money']} NOT NULL DEFAULT 0,
+            purchase_value {layout['money']} NOT NULL DEFAULT 0,
+            video_avg_time_watched DOUBLE PRECISION DEFAULT 0,
+            {counters},
+            PRIMARY KEY (date_id, account_id, campaign_id, adset_id, ad_id, creative_id)
+            {layout['extra'].format(table=name)}
+        )
+    """))
+
+
+def _fill_table(engine, name, layout, rows, zero_fraction):
+    """Deterministic synthetic rows: row n is the same in both layouts"""
+    zero_filter = "" if layout["keep_zero_rows"] else "WHERE NOT is_zero"
+    counters = ", ".join(COUNTERS)
+    counter_values = ", ".join(
+        f"CASE WHEN is_zero THEN 0 ELSE (abs(hashint4(n::int + {i})) % 5000) END" for i in range(len(COUNTERS))
+    )
+
+    for start in range(0, rows, BATCH_ROWS):
+        stop = min(start + BATCH_ROWS, rows)
+        with engine.begin() as conn:
+            conn.execute(text(f"""
+                INSERT INTO {SCHEMA}.{name} (
+                    date_id, account_id, campaign_id, adset_id, ad_id, creative_id,
+                    spend, purchase_value, video_avg_time_watched, {counters}
+                )
+                SELECT
+                    to_char(DATE '2025-01-01' + (n % 365)::int, 'YYYYMMDD')::bigint,
+                    (n / 365) % 50,
+                    120000000000 + (n / 365) / 200,
+                    120100000000 + (n / 365) / 20,
+                    120200000000 + n / 365,
+                    120300000000 + n / 365,
+                    CASE WHEN is_zero THEN 0 ELSE round((abs(hashint4(n::int)) % 100000) / 100.0, 2) END,
+                    CASE WHEN is_zero THEN 0 ELSE round((abs(hashint4(n::int + 99)) % 500000) / 100.0, 2) END,
+                    CASE WHEN is_zero THEN 0 ELSE (abs(hashint4(n::int + 7)) % 600) / 10.0 END,
+                    {counter_values}
+                FROM (
+                    SELECT n, (abs(hashint4(n::int + 13)) % 1000 < {int(zero_fraction * 1000)}) AS is_zero
+                    FROM generate_series(CAST(:start AS BIGINT), CAST(:stop AS BIGINT) - 1) AS n
+                ) s
+                {zero_filter}
+            """), {"start": start, "stop": stop})
+        print(f"  {name}: {stop:,}/{rows:,} source rows", end="\r")
+    print()
+
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE INDEX ON {SCHEMA}.{name} (account_id, date_id)"))
+        conn.execute(text(f"ANALYZE {SCHEMA}.{name}"))
+
+
+def _sizes(conn, name):
+    row = conn.execute(text("""
+        SELECT
+            pg_relation_size(CAST(:t AS regclass)),
+            pg_indexes_size(CAST(:t AS regclass)),
+            pg_total_relation_size(CAST(:t AS regclass)),
+            (SELECT COUNT(*) FROM """ + f"{SCHEMA}.{name}" + """)
+    """), {"t": f"{SCHEMA}.{name}"}).fetchone()
+    return {"heap": row[0], "indexes": row[1], "total": row[2], "rows": row[3]}
+
+
+def _time_query(conn, sql, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(text(sql)).fetchall()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_benchmark(args):
+    engine = create_engine(settings.DATABASE_URL)
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        for name, layout in LAYOUTS.items():
+            _create_table(conn, name, layout)
+
+    try:
+        for name, layout in LAYOUTS.items():
+            print(f"Filling {name}...")
+            _fill_table(engine, name, layout, args.rows, args.zero_fraction)
+
+        mb = 1024 * 1024
+        print(f"\n{'layout':<10} {'rows':>14} {'heap MB':>10} {'index MB':>10} {'total MB':>10}")
+        with engine.connect() as conn:
+            sizes = {name: _sizes(conn, name) for name in LAYOUTS}
+        for name, s in sizes.items():
+            print(f"{name:<10} {s['rows']:>14,} {s['heap'] / mb:>10.0f} {s['indexes'] / mb:>10.0f} {s['total'] / mb:>10.0f}")
+        print(f"compact/legacy total size: {sizes['compact']['total'] / sizes['legacy']['total']:.2f}")
+
+        print(f"\n{'query':<26} {'legacy':>10} {'compact':>10}")
+        with engine.connect() as conn:
+            for query_name, sql in QUERIES.items():
+                timings = {name: _time_query(conn, sql.format(table=f"{SCHEMA}.{name}"), args.repeat) for name in LAYOUTS}
+                print(f"{query_name:<26} {timings['legacy'] * 1000:>8.0f}ms {timings['compact'] * 1000:>8.0f}ms")
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fact table storage layout benchmark")
+    parser.add_argument("--rows", type=int, default=50_000_000, help="Synthetic source rows (before zero-row filtering)")
+    parser.add_argument("--zero-fraction", type=float, default=0.3, help="Share of rows with all-zero metrics")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query (best is reported)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema")
+    run_benchmark(parser.parse_args())
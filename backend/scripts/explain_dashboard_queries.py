@@ -0,0 +1,150 @@
+"""
+Regression check: dashboard queries must use indexes on the fact tables.
+
+Runs the top dashboard repository calls against the configured database with
+a session wrapper that EXPLAINs every statement before executing it, then
+fails if any plan reads a fact_* table with a sequential scan (e.g. because a
+date filter went back to `d.date` on dim_date instead of `f.date_id`).
+
+Usage:
+    python backend/scripts/explain_dashboard_queries.py --account-id 123 --days 30
+
+Run it against a database with realistic data volumes: on a near-empty fact
+table the planner rightly prefers a Seq Scan. Exits with status 1 on failure.
+"""
+import sys
+import os
+import json
+import argparse
+from datetime import timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from backend.config.base_config import settings
+from backend.api.repositories.metrics_repository import MetricsRepository
+from backend.api.repositories.campaign_repository import CampaignRepository
+from backend.api.repositories.adset_repository import AdSetRepository
+from backend.api.repositories.ad_repository import AdRepository
+from backend.api.repositories.creative_repository import CreativeRepository
+from backend.api.repositories.breakdown_repository import BreakdownRepository
+from backend.api.repositories.timeseries_repository import TimeSeriesRepository
+from backend.api.repositories.historical_repository import HistoricalRepository
+from backend.api.repositories.creative_analysis_repository import CreativeAnalysisRepository
+
+# name -> call(db, account_ids, start_date, end_date)
+DASHBOARD_QUERIES = {
+    "metrics.aggregated": lambda db, acc, s, e: MetricsRepository(db).get_aggregated_metrics(s, e, account_ids=acc),
+    "campaigns.breakdown": lambda db, acc, s, e: CampaignRepository(db).get_campaign_breakdown(s, e, account_ids=acc),
+    "campaigns.manage": lambda db, acc, s, e: CampaignRepository(db).get_campaigns_for_manage(s, e, account_ids=acc),
+    "adsets.breakdown": lambda db, acc, s, e: AdSetRepository(db).get_adset_breakdown(s, e, account_ids=acc),
+    "ads.breakdown": lambda db, acc, s, e: AdRepository(db).get_ad_breakdown(s, e, account_ids=acc),
+    "creatives.metrics": lambda db, acc, s, e: CreativeRepository(db).get_creative_metrics(s, e, account_ids=acc),
+    "creatives.video_insights": lambda db, acc, s, e: CreativeRepository(db).get_video_insights(s, e, account_ids=acc),
+    "breakdown.age_gender": lambda db, acc, s, e: BreakdownRepository(db).get_age_gender_breakdown(s, e, account_ids=acc),
+    "breakdown.placement": lambda db, acc, s, e: BreakdownRepository(db).get_placement_breakdown(s, e, account_ids=acc),
+    "breakdown.platform": lambda db, acc, s, e: BreakdownRepository(db).get_platform_breakdown(s, e, account_ids=acc),
+    "breakdown.country": lambda db, acc, s, e: BreakdownRepository(db).get_country_breakdown(s, e, account_ids=acc),
+    "breakdown.placement_by_campaign": lambda db, acc, s, e: BreakdownRepository(db).get_placement_by_entity(s, e, 'campaign', account_ids=acc),
+    "breakdown.demographics_by_adset": lambda db, acc, s, e: BreakdownRepository(db).get_demographics_by_entity(s, e, 'adset', account_ids=acc),
+    "breakdown.country_by_ad": lambda db, acc, s, e: BreakdownRepository(db).get_country_by_entity(s, e, 'ad', account_ids=acc),
+    "timeseries.daily": lambda db, acc, s, e: TimeSeriesRepository(db).get_time_series(s, e, account_ids=acc),
+    "timeseries.weekly": lambda db, acc, s, e: TimeSeriesRepository(db).get_time_series(s, e, granularity="week", account_ids=acc),
+    "historical.weekly_trends": lambda db, acc, s, e: HistoricalRepository(db).get_weekly_trends(account_ids=acc),
+    "historical.day_of_week": lambda db, acc, s, e: HistoricalRepository(db).get_day_of_week_breakdown(s, e, account_ids=acc),
+    "creative_analysis.performance": lambda db, acc, s, e: CreativeAnalysisRepository(db).get_creative_performance(s, e, account_ids=acc),
+    "creative_analysis.format": lambda db, acc, s, e: CreativeAnalysisRepository(db).get_format_performance(s, e, account_ids=acc),
+}
+
+
+class ExplainingSession:
+    """Session stand-in that records EXPLAIN (FORMAT JSON) for every statement, then runs it"""
+
+    def __init__(self, session):
+        self.session = session
+        self.plans = []
+
+    def execute(self, statement, params=None, *args, **kwargs):
+        sql = statement.text if hasattr(statement, "text") else str(statement)
+        plan = self.session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params or {}).scalar()
+        self.plans.append(json.loads(plan) if isinstance(plan, str) else plan)
+        return self.session.execute(statement, params, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+
+def _walk(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk(child)
+
+
+def fact_scans(plan):
+    """(node type, relation, index) for every plan node that reads a fact table"""
+    return [
+        (node["Node Type"], node["Relation Name"], node.get("Index Name"))
+        for node in _walk(plan[0]["Plan"])
+        if node.get("Relation Name", "").startswith("fact_")
+    ]
+
+
+def _busiest_account(session):
+    return session.execute(text("""
+        SELECT account_id FROM fact_core_metrics
+        GROUP BY account_id ORDER BY COUNT(*) DESC LIMIT 1
+    """)).scalar()
+
+
+def run_check(args):
+    engine = create_engine(settings.DATABASE_URL)
+    session = sessionmaker(bind=engine)()
+    failures = 0
+
+    try:
+        account_id = args.account_id or _busiest_account(session)
+        end_date = session.execute(text("""
+            SELECT MAX(d.date) FROM fact_core_metrics f
+            JOIN dim_date d ON f.date_id = d.date_id
+            WHERE f.account_id = :account_id
+        """), {"account_id": account_id}).scalar()
+        if end_date is None:
+            print(f"No fact data for account {account_id}")
+            return 1
+        start_date = end_date - timedelta(days=args.days - 1)
+        print(f"Account {account_id}, {start_date} .. {end_date}\n")
+
+        for name, call in DASHBOARD_QUERIES.items():
+            db = ExplainingSession(session)
+            try:
+                call(db, [account_id], start_date, end_date)
+            except Exception as e:
+                session.rollback()
+                print(f"ERROR {name}: {e}")
+                failures += 1
+                continue
+
+            scans = [scan for plan in db.plans for scan in fact_scans(plan)]
+            seq_scans = [scan for scan in scans if scan[0] == "Seq Scan"]
+            status = "FAIL" if seq_scans else "ok"
+            failures += bool(seq_scans)
+            print(f"{status:<5} {name}")
+            if args.verbose or seq_scans:
+                for node_type, relation, index in scans:
+                    print(f"        {node_type:<20} {relation:<26} {index or ''}")
+    finally:
+        session.close()
+        engine.dispose()
+
+    print(f"\n{len(DASHBOARD_QUERIES) - failures}/{len(DASHBOARD_QUERIES)} queries use fact table indexes")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EXPLAIN dashboard queries and check fact table index usage")
+    parser.add_argument("--account-id", type=int, help="Account to query (default: the one with most fact rows)")
+    parser.add_argument("--days", type=int, default=30, help="Date range length ending at the account's last data date")
+    parser.add_argument("--verbose", action="store_true", help="Print every fact table scan")
+    sys.exit(run_check(parser.parse_args()))
@@ -0,0 +1,94 @@
+"""
+Stub LLM outputs for benchmarks (LLM_PROVIDER=stub).
+
+Services that parse model output (JSON, sectioned markdown) would fall back to
+their parse-failure path on the stub's default insight lines. register_all()
+gives StubLLMProvider a payload of the shape each of them expects, keyed by the
+first line of its prompt. Imported by benchmark_ai_latency.py only.
+"""
+from backend.api.services.llm_provider import register_stub_response
+from backend.api.services.insights_service import DEEP_ANALYSIS_PROMPT
+from backend.api.services.recommendation_service import (
+    AUDIENCE_RECOMMENDATIONS_PROMPT, AD_COPY_RECOMMENDATIONS_PROMPT, CREATIVE_DIRECTION_PROMPT
+)
+from backend.api.services.business_profile_service import WEBSITE_ANALYSIS_PROMPT, SOCIAL_ANALYSIS_PROMPT
+
+# Sections InsightsService._parse_deep_insights extracts
+DEEP_ANALYSIS = """## Executive Summary
+Stub analysis: performance is stable versus the previous period.
+
+## Key Findings
+- 📊 Stub finding: spend and ROAS are flat.
+
+## Performance Trends
+- 📈 Stub trend: CTR moved by 0.0%.
+
+## Strategic Recommendations
+- 🎯 High Priority: keep the current budget allocation.
+
+## Opportunity Detection
+- 🚀 Stub opportunity: test a new creative.
+"""
+
+AUDIENCE_RECOMMENDATIONS = {
+    "interests": ["Online shopping", "Small business", "Entrepreneurship"],
+    "age_range": {"min": 25, "max": 54},
+    "genders": ["all"],
+    "countries": ["US"],
+    "languages": ["en"],
+    "rationale": "Stub recommendation: broad interests matching the business profile."
+}
+
+AD_COPY_RECOMMENDATIONS = {
+    "variants": [
+        {
+            "headline": f"Stub headline {i}",
+            "primary_text": "Stub primary text for benchmarking.",
+            "description": "Stub description",
+            "cta": "LEARN_MORE"
+        }
+        for i in range(1, 4)
+    ],
+    "tips": ["Stub tip 1", "Stub tip 2", "Stub tip 3"]
+}
+
+CREATIVE_DIRECTION = {
+    "visual_style": "Stub visual style",
+    "content_angles": ["Stub angle 1", "Stub angle 2", "Stub angle 3"],
+    "ad_formats": ["single_image", "video", "carousel"],
+    "messaging_themes": ["Stub theme 1", "Stub theme 2"],
+    "best_practices": ["Stub practice 1", "Stub practice 2", "Stub practice 3"]
+}
+
+WEBSITE_ANALYSIS = {
+    "business_type": "ecommerce",
+    "business_model": "b2c",
+    "target_audience": "Stub audience description",
+    "tone_of_voice": "friendly",
+    "products_services": ["Stub product"],
+    "geographic_focus": ["US"],
+    "industry": "Stub industry",
+    "value_propositions": ["Stub value proposition"],
+    "visual_style_notes": "Stub visual style",
+    "business_description": "Stub business description."
+}
+
+SOCIAL_ANALYSIS = {
+    "content_themes": ["Stub theme"],
+    "tone_of_voice": "friendly",
+    "posting_style": "Stub posting style",
+    "engagement_patterns": "Stub engagement patterns"
+}
+
+
+def register_all():
+    """Register every fixture with StubLLMProvider"""
+    for prompt, payload in (
+        (DEEP_ANALYSIS_PROMPT, DEEP_ANALYSIS),
+        (AUDIENCE_RECOMMENDATIONS_PROMPT, AUDIENCE_RECOMMENDATIONS),
+        (AD_COPY_RECOMMENDATIONS_PROMPT, AD_COPY_RECOMMENDATIONS),
+        (CREATIVE_DIRECTION_PROMPT, CREATIVE_DIRECTION),
+        (WEBSITE_ANALYSIS_PROMPT, WEBSITE_ANALYSIS),
+        (SOCIAL_ANALYSIS_PROMPT, SOCIAL_ANALYSIS),
+    ):
+        register_stub_response(prompt.splitlines()[0], payload)
@@ -5,7 +5,8 @@ transformers/core_transformer.py - Core Data Transformation Logic
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Sequence
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,101 @@ from backend.config.settings import (
 from backend.utils.mapping_utils import map_country_code
 
 
+_EMPTY_DIM_LABELS = {'nan', 'None', ''}
+_EMPTY_PLACEMENT_LABELS = {'nan - nan', 'None - None', 'nan', 'None', '', f'{MISSING_DIM_VALUE} - {MISSING_DIM_VALUE}'}
+
+
+def _clean_dim_label(val) -> str:
+    """str() a raw breakdown value, mapping empties to MISSING_DIM_VALUE"""
+    label = str(val)
+    return MISSING_DIM_VALUE if label in _EMPTY_DIM_LABELS else label
+
+
+def _categorical_from_labels(labels: Sequence[str], codes: np.ndarray, index: pd.Index) -> pd.Series:
+    """
+    Build a category Series from per-code labels. Codes whose labels collide
+    are merged into one category; code -1 stays missing.
+    """
+    labels = pd.Index(labels, dtype=object)
+    categories = labels.unique().sort_values()
+    lookup = np.append(categories.get_indexer(labels), -1)
+    return pd.Series(pd.Categorical.from_codes(lookup[codes], categories=categories), index=index)
+
+
+def recode_categories(series: pd.Series, mapper: Callable[[str], str]) -> pd.Series:
+    """Apply mapper to each category of a category Series (not to each row)"""
+    return _categorical_from_labels(
+        [mapper(c) for c in series.cat.categories],
+        series.cat.codes.to_numpy(),
+        series.index
+    ).rename(series.name)
+
+
+def encode_dimension(series: pd.Series, mapper: Optional[Callable[[str], str]] = None) -> pd.Series:
+    """
+    Dictionary-encode a breakdown column.
+
+    Equivalent to astype(str) + empty -> MISSING_DIM_VALUE + mapper applied per
+    row, but works on the distinct values only and returns a category Series.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    labels = [_clean_dim_label(u) for u in uniques]
+    if mapper is not None:
+        labels = [mapper(label) for label in labels]
+    return _categorical_from_labels(labels, codes, series.index).rename(series.name)
+
+
+@lru_cache(maxsize=None)
+def _clean_placement_label(label: str) -> str:
+    return MISSING_DIM_VALUE if label in _EMPTY_PLACEMENT_LABELS else label
+
+
+@lru_cache(maxsize=None)
+def _placement_name(p: str, pos: str) -> str:
+    """
+    Readable placement name from publisher_platform + platform_position.
+    Avoid redundant naming (e.g., 'instagram - instagram_stories' -> 'instagram - stories')
+    """
+    if p == MISSING_DIM_VALUE or pos == MISSING_DIM_VALUE:
+        if p != MISSING_DIM_VALUE: return _clean_placement_label(p.title())
+        return MISSING_DIM_VALUE
+    
+    p_lower = p.lower()
+    pos_lower = pos.lower()
+    
+    # Remove platform prefix from position if present
+    clean_pos = pos_lower
+    if pos_lower.startswith(p_lower + "_"):
+        clean_pos = pos_lower.replace(p_lower + "_", "", 1)
+    
+    # Mapping logic for clean names
+    name = clean_pos.replace('_', ' ').title()
+    
+    if p_lower == 'facebook':
+        if 'story' in pos_lower: return 'Facebook Stories'
+        if 'reel' in pos_lower: return 'Facebook Reels'
+        if 'search' in pos_lower: return 'Facebook Search'
+        if 'marketplace' in pos_lower: return 'Facebook Marketplace'
+        if 'instain_article' in pos_lower: return 'Facebook Instant Articles'
+        if 'video' in pos_lower: return 'Facebook Video Feeds'
+        return f"Facebook {name}" if name != 'Feed' else 'Facebook Feed'
+    
+    if p_lower == 'instagram':
+        if 'story' in pos_lower: return 'Instagram Stories'
+        if 'reel' in pos_lower: return 'Instagram Reels'
+        if 'explore' in pos_lower: return 'Instagram Explore'
+        return f"Instagram {name}"
+    
+    if p_lower == 'messenger':
+        if 'story' in pos_lower: return 'Messenger Stories'
+        return 'Messenger Inbox'
+    
+    if p_lower == 'audience_network':
+        return f"Audience Network {name}"
+
+    return _clean_placement_label(f"{p.title()} {name}")
+
+
 class CoreTransformer:
     """טרנספורמר מרכזי לניקוי והכנת נתוני פייסבוק לטבלאות העובדות (Fact Tables)"""
     
@@ -111,18 +207,19 @@ class CoreTransformer:
         return df
     
     def _handle_breakdown_columns(self, df: pd.DataFrame) -> pd.DataFrame:
-        """טיפול בעמודות פילוח והחלפת ערכים ריקים בערך ברירת מחדל (N/A)"""
+        """
+        טיפול בעמודות פילוח והחלפת ערכים ריקים בערך ברירת מחדל (N/A)
+
+        Breakdown columns are dictionary-encoded (category dtype): cleaning and
+        mapping run once per distinct value instead of once per row.
+        """
         
         breakdown_cols = ['country', 'age', 'gender', 'placement_name', 'publisher_platform']
         
         for col in breakdown_cols:
             if col in df.columns:
-                df[col] = df[col].astype(str).replace(['nan', 'None', '', 'None'], MISSING_DIM_VALUE)
-                df[col].fillna(MISSING_DIM_VALUE, inplace=True)
-                
                 # Apply Mapping for country
-                if col == 'country':
-                    df['country'] = df['country'].apply(map_country_code)
+                df[col] = encode_dimension(df[col], map_country_code if col == 'country' else None)
         
         # התאמה לשמות הממדים ב-Schema
         if 'age' in df.columns:
@@ -131,59 +228,24 @@ class CoreTransformer:
             
         if 'publisher_platform' in df.columns:
             # Clean base columns first
-            df['publisher_platform'] = df['publisher_platform'].astype(str).replace(['nan', 'None', '', 'None'], MISSING_DIM_VALUE)
+            platform = encode_dimension(df['publisher_platform'])
             
             if 'platform_position' in df.columns:
-                df['platform_position'] = df['platform_position'].astype(str).replace(['nan', 'None', '', 'None'], MISSING_DIM_VALUE)
+                position = encode_dimension(df['platform_position'])
                 
                 # Logic: Combine Platform + Position
-                # Avoid redundant naming (e.g., 'instagram - instagram_stories' -> 'instagram - stories')
-                def clean_v(p, pos):
-                    if p == MISSING_DIM_VALUE or pos == MISSING_DIM_VALUE:
-                        if p != MISSING_DIM_VALUE: return p.title()
-                        return MISSING_DIM_VALUE
-                    
-                    p_lower = p.lower()
-                    pos_lower = pos.lower()
-                    
-                    # Remove platform prefix from position if present
-                    clean_pos = pos_lower
-                    if pos_lower.startswith(p_lower + "_"):
-                        clean_pos = pos_lower.replace(p_lower + "_", "", 1)
-                    
-                    # Mapping logic for clean names
-                    name = clean_pos.replace('_', ' ').title()
-                    
-                    if p_lower == 'facebook':
-                        if 'story' in pos_lower: return 'Facebook Stories'
-                        if 'reel' in pos_lower: return 'Facebook Reels'
-                        if 'search' in pos_lower: return 'Facebook Search'
-                        if 'marketplace' in pos_lower: return 'Facebook Marketplace'
-                        if 'instain_article' in pos_lower: return 'Facebook Instant Articles'
-                        if 'video' in pos_lower: return 'Facebook Video Feeds'
-                        return f"Facebook {name}" if name != 'Feed' else 'Facebook Feed'
-                    
-                    if p_lower == 'instagram':
-                        if 'story' in pos_lower: return 'Instagram Stories'
-                        if 'reel' in pos_lower: return 'Instagram Reels'
-                        if 'explore' in pos_lower: return 'Instagram Explore'
-                        return f"Instagram {name}"
-                    
-                    if p_lower == 'messenger':
-                        if 'story' in pos_lower: return 'Messenger Stories'
-                        return 'Messenger Inbox'
-                    
-                    if p_lower == 'audience_network':
-                        return f"Audience Network {name}"
-
-                    return f"{p.title()} {name}"
-                
-                df['placement_name'] = df.apply(lambda x: clean_v(x['publisher_platform'], x['platform_position']), axis=1)
+                # Each distinct (platform, position) pair is named once, not once per row
+                n_positions = len(position.cat.categories)
+                pair_codes, pair_uniques = pd.factorize(
+                    platform.cat.codes.to_numpy(np.int64) * n_positions + position.cat.codes.to_numpy(np.int64)
+                )
+                labels = [
+                    _placement_name(platform.cat.categories[u // n_positions], position.cat.categories[u % n_positions])
+                    for u in pair_uniques
+                ]
+                df['placement_name'] = _categorical_from_labels(labels, pair_codes, df.index)
             else:
-                df['placement_name'] = df['publisher_platform']
-            
-            # Final cleanup of N/A values
-            df['placement_name'] = df['placement_name'].replace(['nan - nan', 'None - None', 'nan', 'None', '', f'{MISSING_DIM_VALUE} - {MISSING_DIM_VALUE}'], MISSING_DIM_VALUE)
+                df['placement_name'] = recode_categories(platform, _clean_placement_label)
             
             # Drop the original columns to keep fact tables clean
             df.drop(columns=['publisher_platform', 'platform_position'], errors='ignore', inplace=True)
@@ -503,7 +503,8 @@ def _extract_dim_country(df: pd.DataFrame) -> pd.DataFrame:
     if 'country' not in df.columns:
         return pd.DataFrame()
     
-    df_dim = df[['country']].drop_duplicates()
+    # Breakdown columns arrive dictionary-encoded; load plain strings
+    df_dim = df[['country']].drop_duplicates().astype(object)
     df_dim = df_dim[df_dim['country'].notna()]
     
     # Ensure all names are full names (handled in CoreTransformer, but keep here for safety)
@@ -527,7 +528,7 @@ def _extract_dim_placement(df: pd.DataFrame) -> pd.DataFrame:
     if 'placement_name' not in df.columns:
         return pd.DataFrame()
     
-    df_dim = df[['placement_name']].drop_duplicates()
+    df_dim = df[['placement_name']].drop_duplicates().astype(object)
     df_dim = df_dim[df_dim['placement_name'].notna()]
     
     return df_dim.reset_index(drop=True)
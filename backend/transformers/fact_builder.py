@@ -10,6 +10,30 @@ from typing import Dict
 logger = logging.getLogger(__name__)
 
 from backend.config.settings import UNKNOWN_MEMBER_ID, MISSING_DIM_VALUE, TOP_COUNTRIES_LIMIT
+from backend.transformers.core_transformer import recode_categories
+
+
+def _replace_label(series: pd.Series, old: str, new: str) -> pd.Series:
+    """Series.replace that keeps category dtype (breakdown columns are dictionary-encoded)"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return recode_categories(series, lambda label: new if label == old else label)
+    return series.replace(old, new)
+
+
+# Metric columns per fact table (a row where all of them are zero is not stored)
+FACT_METRIC_COLUMNS = {
+    'fact_core_metrics': [
+        'spend', 'impressions', 'clicks',
+        'purchases', 'purchase_value', 'leads', 'add_to_cart',
+        'lead_website', 'lead_form',
+        'video_plays', 'video_p25_watched', 'video_p50_watched',
+        'video_p75_watched', 'video_p100_watched', 'video_avg_time_watched'
+    ],
+    'fact_action_metrics': ['action_count', 'action_value'],
+    'fact_placement_metrics': ['spend', 'impressions', 'clicks'],
+    'fact_age_gender_metrics': ['spend', 'impressions', 'clicks'],
+    'fact_country_metrics': ['spend', 'impressions', 'clicks'],
+}
 
 
 class FactBuilder:
@@ -74,8 +98,28 @@ class FactBuilder:
                 facts['fact_country_metrics'] = country_df
                 self.logger.info(f"Built fact_country_metrics: {len(country_df)} rows")
         
+        # Rows where every metric is zero carry no information - don't store them
+        for fact_name in list(facts):
+            facts[fact_name] = self._drop_zero_rows(facts[fact_name], fact_name)
+            if facts[fact_name].empty:
+                del facts[fact_name]
+        
         return facts
     
+    def _drop_zero_rows(self, df: pd.DataFrame, fact_name: str) -> pd.DataFrame:
+        """Drop rows whose metric columns are all zero"""
+        
+        metric_cols = [col for col in FACT_METRIC_COLUMNS.get(fact_name, []) if col in df.columns]
+        if not metric_cols or df.empty:
+            return df
+        
+        non_zero = df[metric_cols].fillna(0).ne(0).any(axis=1)
+        dropped = int((~non_zero).sum())
+        if dropped:
+            self.logger.info(f"{fact_name}: dropped {dropped} all-zero rows ({dropped / len(df) * 100:.1f}%)")
+            return df[non_zero].reset_index(drop=True)
+        return df
+    
     def _build_fact_core(self, df: pd.DataFrame) -> pd.DataFrame:
         """Build fact_core_metrics (no breakdowns)"""
         
@@ -183,7 +227,8 @@ class FactBuilder:
                 df_fact[col] = 0.0 if col == 'spend' else 0
         
         # Group and aggregate
-        df_fact = df_fact.groupby(required_cols, as_index=False).agg({
+        # observed=True: placement_name is categorical, only group on combinations present
+        df_fact = df_fact.groupby(required_cols, as_index=False, observed=True).agg({
             'spend': 'sum',
             'impressions': 'sum',
             'clicks': 'sum',
@@ -214,8 +259,8 @@ class FactBuilder:
             df_age_gender['gender'] = 'Unknown'
         
         # Replace N/A with proper unknown values
-        df_age_gender['age_group'] = df_age_gender['age_group'].replace('N/A', 'Unknown Age')
-        df_age_gender['gender'] = df_age_gender['gender'].replace('N/A', 'Unknown')
+        df_age_gender['age_group'] = _replace_label(df_age_gender['age_group'], 'N/A', 'Unknown Age')
+        df_age_gender['gender'] = _replace_label(df_age_gender['gender'], 'N/A', 'Unknown')
         
         cols_to_select = required_cols + metric_cols
         df_fact = df_age_gender[cols_to_select].copy()
@@ -226,7 +271,7 @@ class FactBuilder:
                 df_fact[col] = 0.0 if col == 'spend' else 0
         
         # Group and aggregate
-        df_fact = df_fact.groupby(required_cols, as_index=False).agg({
+        df_fact = df_fact.groupby(required_cols, as_index=False, observed=True).agg({
             'spend': 'sum',
             'impressions': 'sum',
             'clicks': 'sum',
@@ -265,7 +310,7 @@ class FactBuilder:
                 df_fact[col] = 0.0 if col == 'spend' else 0
 
         # Group and aggregate first
-        df_fact = df_fact.groupby(required_cols, as_index=False).agg({
+        df_fact = df_fact.groupby(required_cols, as_index=False, observed=True).agg({
             'spend': 'sum',
             'impressions': 'sum',
             'clicks': 'sum',
@@ -279,7 +324,16 @@ class FactBuilder:
         return df_fact
 
     def _filter_top_countries(self, df: pd.DataFrame, top_n: int) -> pd.DataFrame:
-        """Keep top N countries by spend per (ad_id, date_id), aggregate rest as 'Other'"""
+        """
+        Keep top N countries by spend per (ad_id, date_id), aggregate rest as 'Other'
+
+        The six key columns are hashed once (ngroup); ranking and the 'Other'
+        aggregation then work on the integer group code. Ranks come from one
+        stable sort by (group, spend desc), so ties keep input order like
+        rank(method='first'). Output: top rows in input order, then the
+        'Other' rows in key order - the same as ranking + re-aggregating
+        (scripts/benchmark_country_folding.py).
+        """
 
         if df.empty:
             return df
@@ -287,25 +341,32 @@ class FactBuilder:
         group_cols = ['date_id', 'account_id', 'campaign_id', 'adset_id', 'ad_id', 'creative_id']
 
         # Rank countries by spend within each ad/date group
-        df['_rank'] = df.groupby(group_cols)['spend'].rank(method='first', ascending=False)
-
-        # Split into top N and "other"
-        df_top = df[df['_rank'] <= top_n].copy()
-        df_other = df[df['_rank'] > top_n].copy()
-
-        # Aggregate "other" countries
-        if not df_other.empty:
-            df_other_agg = df_other.groupby(group_cols, as_index=False).agg({
-                'spend': 'sum',
-                'impressions': 'sum',
-                'clicks': 'sum',
-            })
-            df_other_agg['country'] = 'Other'
-
-            # Combine top N + aggregated "Other"
-            df_result = pd.concat([df_top.drop(columns=['_rank']), df_other_agg], ignore_index=True)
-        else:
-            df_result = df_top.drop(columns=['_rank'])
+        codes = df.groupby(group_cols, sort=True).ngroup().to_numpy()
+        order = np.lexsort((-df['spend'].to_numpy(), codes))
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        group_sizes = np.diff(np.r_[starts, len(df)])
+        rank = np.empty(len(df), dtype=np.int64)
+        rank[order] = np.arange(len(df)) - np.repeat(starts, group_sizes)
+        is_other = rank >= top_n
+
+        if not is_other.any():
+            self.logger.info(f"Country optimization: {len(df)} rows → {len(df)} rows (top {top_n} + Other)")
+            return df
+
+        # Aggregate "other" countries by group code (keys taken from the group's first row)
+        df_other_agg = df.loc[is_other, group_cols + ['spend', 'impressions', 'clicks']].groupby(
+            codes[is_other], sort=True
+        ).agg({
+            **{col: 'first' for col in group_cols},
+            'spend': 'sum',
+            'impressions': 'sum',
+            'clicks': 'sum'
+        }).reset_index(drop=True)
+        df_other_agg['country'] = 'Other'
+
+        # Combine top N + aggregated "Other"
+        df_result = pd.concat([df.loc[~is_other], df_other_agg], ignore_index=True)
 
         self.logger.info(f"Country optimization: {len(df)} rows → {len(df_result)} rows (top {top_n} + Other)")
 
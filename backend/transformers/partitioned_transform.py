@@ -0,0 +1,149 @@
+"""
+transformers/partitioned_transform.py - Transform step, serial or across processes
+
+Core rows and each breakdown group go through the same cleaning / action
+parsing / fact building independently: fact tables are keyed by date_id and
+filtered by _data_source, so nothing crosses group boundaries. That lets the
+transform run per partition (each breakdown group plus date-chunked slices of
+core) in a process pool, merging only the resulting fact, action and dimension
+frames.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.config.settings import DIMENSION_PKS
+from backend.transformers.core_transformer import clean_and_transform
+from backend.transformers.action_parser import (
+    parse_actions_dataframe, extract_top_conversions_for_fact_core,
+    parse_video_actions
+)
+from backend.transformers.fact_builder import build_fact_tables
+from backend.transformers.dimension_builder import extract_dimensions
+
+logger = logging.getLogger(__name__)
+
+
+def transform_frame(df: pd.DataFrame, metadata_df: Optional[pd.DataFrame] = None,
+                    df_creatives: Optional[pd.DataFrame] = None,
+                    account_info: Optional[Dict] = None) -> Dict:
+    """
+    Run the full transform on one frame (tagged with _data_source)
+
+    Returns:
+        Dictionary with keys: 'facts', 'actions', 'dimensions', 'clean_rows'
+    """
+
+    # Clean and transform
+    logger.info("3.1: Cleaning and standardizing data...")
+    df_clean = clean_and_transform(df, metadata_df)
+
+    # Parse actions into fact_action_metrics
+    logger.info("3.2: Parsing actions for granular conversion tracking...")
+    df_actions = parse_actions_dataframe(df_clean)
+
+    # Extract top conversions for fact_core
+    logger.info("3.3: Extracting top conversions for fact_core_metrics...")
+    df_clean = extract_top_conversions_for_fact_core(df_clean)
+
+    # Parse video metrics
+    logger.info("3.4: Parsing video metrics...")
+    df_clean = parse_video_actions(df_clean)
+
+    # Build fact tables
+    logger.info("3.5: Building fact tables...")
+    fact_tables = build_fact_tables(df_clean)
+
+    # Extract dimensions
+    logger.info("3.6: Extracting dimension members...")
+    dimensions = extract_dimensions(df_clean, df_actions, df_creatives, account_info)
+
+    return {
+        'facts': fact_tables,
+        'actions': df_actions,
+        'dimensions': dimensions,
+        'clean_rows': len(df_clean)
+    }
+
+
+def build_partitions(df_core: pd.DataFrame, breakdowns: Dict[str, pd.DataFrame], core_chunks: int) -> List[pd.DataFrame]:
+    """
+    Split raw data into independently transformable frames:
+    core split into `core_chunks` contiguous date ranges, then one frame per breakdown group.
+    """
+
+    partitions = []
+
+    # Contiguous date ranges; rows without a date (code -1) go with the first chunk
+    codes, dates = pd.factorize(df_core['date_start'], sort=True)
+    n_chunks = max(1, min(core_chunks, len(dates)))
+    chunk_ids = np.maximum(codes, 0) * n_chunks // max(len(dates), 1)
+    for chunk_id in range(n_chunks):
+        chunk = df_core[chunk_ids == chunk_id]
+        if not chunk.empty:
+            partitions.append(chunk.assign(_data_source='core'))
+
+    for breakdown_type, breakdown_df in breakdowns.items():
+        partitions.append(breakdown_df.assign(_data_source=breakdown_type))
+
+    return partitions
+
+
+def _transform_partition(args) -> Dict:
+    """Process pool entry point (module level so it can be pickled)"""
+    df, metadata_df, df_creatives, account_info = args
+    return transform_frame(df.reset_index(drop=True), metadata_df, df_creatives, account_info)
+
+
+def merge_results(results: List[Dict]) -> Dict:
+    """Concatenate per-partition facts/actions and de-duplicate dimension members"""
+
+    facts: Dict[str, List[pd.DataFrame]] = {}
+    dimensions: Dict[str, List[pd.DataFrame]] = {}
+    actions = []
+
+    for result in results:
+        for name, df in result['facts'].items():
+            facts.setdefault(name, []).append(df)
+        for name, df in result['dimensions'].items():
+            if df is not None and not df.empty:
+                dimensions.setdefault(name, []).append(df)
+        if not result['actions'].empty:
+            actions.append(result['actions'])
+
+    merged_dimensions = {}
+    for name, frames in dimensions.items():
+        df = pd.concat(frames, ignore_index=True)
+        pk_cols = [c for c in DIMENSION_PKS.get(name, []) if c in df.columns]
+        merged_dimensions[name] = df.drop_duplicates(subset=pk_cols or None).reset_index(drop=True)
+
+    return {
+        'facts': {name: pd.concat(frames, ignore_index=True) for name, frames in facts.items()},
+        'actions': pd.concat(actions, ignore_index=True) if actions else pd.DataFrame(),
+        'dimensions': merged_dimensions,
+        'clean_rows': sum(r['clean_rows'] for r in results)
+    }
+
+
+def transform_partitions(partitions: List[pd.DataFrame], metadata_df: Optional[pd.DataFrame],
+                         df_creatives: Optional[pd.DataFrame], account_info: Optional[Dict],
+                         workers: int) -> Dict:
+    """
+    Transform partitions in a process pool and merge the results.
+
+    Uses the spawn start method: the ETL runs from background threads, and
+    forking a threaded process is unsafe.
+    """
+
+    tasks = [(df, metadata_df, df_creatives, account_info) for df in partitions]
+    context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=context) as executor:
+        results = list(executor.map(_transform_partition, tasks))
+
+    return merge_results(results)
@@ -0,0 +1,151 @@
+"""
+utils/account_catalog_cache.py - Per-account cache of slowly changing Graph catalogs
+
+Pixels, custom audiences, promote pages and page lead forms were fetched from
+Graph every time a wizard or settings screen opened. Entries are keyed by
+(user key, catalog, account/page id) - what a token can see differs per user:
+
+- fresh for ACCOUNT_CATALOG_TTL_SECONDS
+- up to ACCOUNT_CATALOG_STALE_SECONDS old: served at once and refreshed in the
+  background (stale-while-revalidate)
+- concurrent loads of the same entry share one Graph call
+
+Fetch functions raise on Graph errors, so failures are never cached. Writes
+that change a catalog (e.g. creating an audience) call invalidate().
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.config.base_config import settings
+
+logger = logging.getLogger(__name__)
+
+# Catalog names
+PIXELS = "pixels"
+CUSTOM_AUDIENCES = "custom_audiences"
+PROMOTE_PAGES = "promote_pages"
+LEAD_FORMS = "lead_forms"
+
+# One pixel entry serves both the wizard (code) and the optimization summary (health)
+PIXEL_FIELDS = ['id', 'name', 'code', 'is_unavailable', 'last_fired_time']
+
+CatalogKey = Tuple[str, str, str]  # (user key, catalog, account or page id)
+
+
+def scope_id(account_or_page_id: str) -> str:
+    """Account ids are stored without the act_ prefix"""
+    return str(account_or_page_id).replace("act_", "")
+
+
+class AccountCatalogCache:
+    """Thread-safe LRU of catalog lists with stale-while-revalidate and load coalescing"""
+
+    def __init__(self, ttl_seconds: float = 300, stale_seconds: float = 86400,
+                 max_entries: int = 5000, refresh_workers: int = 4):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.refresh_workers = refresh_workers
+        self._entries: "OrderedDict[CatalogKey, Tuple[Any, float]]" = OrderedDict()  # key -> (value, loaded_at)
+        # In-flight loads; invalidate() removes a key's load, which then is not stored
+        self._loading: Dict[CatalogKey, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get(self, user_key: str, catalog: str, scope: str, fetch: Callable[[], Any]) -> Any:
+        """Cached value of fetch() for this user/catalog/scope; fetch exceptions reach every waiting caller"""
+        key = (user_key, catalog, scope_id(scope))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, loaded_at = entry
+                age = now - loaded_at
+                if age < self.stale_seconds:
+                    self._entries.move_to_end(key)
+                    if age >= self.ttl_seconds and key not in self._loading:
+                        self._start_refresh(key, fetch)
+                    return value
+
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = self._loading[key] = Future()
+
+        if not owner:
+            return future.result()
+        return self._load(key, fetch, future)
+
+    def _load(self, key: CatalogKey, fetch: Callable[[], Any], future: Future) -> Any:
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            # Only a load still registered for its key is stored (not one invalidated meanwhile)
+            if self._loading.get(key) is future:
+                del self._loading[key]
+                self._entries[key] = (value, time.monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def _start_refresh(self, key: CatalogKey, fetch: Callable[[], Any]):
+        """Reload a stale entry in the refresh pool (caller holds the lock)"""
+        future = self._loading[key] = Future()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.refresh_workers, thread_name_prefix="catalog-refresh")
+
+        def refresh():
+            try:
+                self._load(key, fetch, future)
+            except Exception as e:
+                logger.warning(f"Background refresh of {key[1]} for {key[2]} failed: {e}")
+
+        self._executor.submit(refresh)
+
+    def invalidate(self, catalog: str, scope: str):
+        """Drop a catalog for an account/page for every user (after a write changed it)"""
+        scope = scope_id(scope)
+        with self._lock:
+            for key in [k for k in self._entries if k[1] == catalog and k[2] == scope]:
+                del self._entries[key]
+            # Loads in flight may have read the old catalog; the next get starts a new one
+            for key in [k for k in self._loading if k[1] == catalog and k[2] == scope]:
+                del self._loading[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._loading.clear()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+account_catalog_cache = AccountCatalogCache(
+    ttl_seconds=settings.ACCOUNT_CATALOG_TTL_SECONDS,
+    stale_seconds=settings.ACCOUNT_CATALOG_STALE_SECONDS,
+    max_entries=settings.ACCOUNT_CATALOG_MAX_ENTRIES
+)
+
+
+def stop_catalog_refresh():
+    """Stop background catalog refreshes (application shutdown)"""
+    account_catalog_cache.shutdown()
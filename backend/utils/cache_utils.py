@@ -52,6 +52,13 @@ class TTLCache:
         if key in self._cache:
             del self._cache[key]
 
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove all keys starting with prefix. Returns count of removed entries."""
+        keys = [key for key in self._cache if key.startswith(prefix)]
+        for key in keys:
+            del self._cache[key]
+        return len(keys)
+
     def clear(self) -> None:
         """Clear all cache entries."""
         self._cache.clear()
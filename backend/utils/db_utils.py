@@ -1,5 +1,6 @@
 """
-utils/db_utils.py - Database utilities (connection, UPSERT, lookups)
+utils/db_utils.py - Database utilities (connection, UPSERT, calendar)
+Attribute dimension lookups live in utils/lookup_service.py
 FIXED: Properly handle unknown members for auto-increment dimension tables
 """
 
@@ -10,15 +11,14 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.exc import OperationalError, IntegrityError
 from dotenv import load_dotenv
 import logging
+import threading
+from datetime import date
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
 from backend.config.base_config import settings
 
-# Global lookup cache
-LOOKUP_CACHE: Dict[str, Dict[str, int]] = {}
-
 def get_db_engine():
     """Create and return SQLAlchemy engine with optimized pool settings"""
 
@@ -35,6 +35,8 @@ def get_db_engine():
             }
         )
 
+        register_numeric_as_float(engine)
+
         # Enable slow query logging in production
         if settings.ENVIRONMENT == "production":
             from sqlalchemy import event
@@ -61,6 +63,27 @@ def get_db_engine():
         raise
 
 
+def register_numeric_as_float(engine):
+    """
+    Return NUMERIC values as float instead of Decimal on this engine's connections.
+
+    Money columns in the fact tables are NUMERIC; repositories, pandas frames and
+    JSON responses all expect floats, as they got when those columns were FLOAT.
+    """
+    import psycopg2.extensions
+    from sqlalchemy import event
+
+    numeric_as_float = psycopg2.extensions.new_type(
+        psycopg2.extensions.DECIMAL.values,
+        'NUMERIC_AS_FLOAT',
+        lambda value, cursor: float(value) if value is not None else None
+    )
+
+    @event.listens_for(engine, "connect")
+    def _register_numeric_as_float(dbapi_connection, connection_record):
+        psycopg2.extensions.register_type(numeric_as_float, dbapi_connection)
+
+
 def get_latest_date_in_db(engine, table_name: str) -> Optional[str]:
     """Get the latest date in a fact table"""
     
@@ -145,10 +168,105 @@ def ensure_unknown_members(engine, table_name: str, default_values: Dict[str, An
         logger.error(f"Error ensuring unknown member in {table_name}: {e}")
 
 
-def clear_fact_data(engine, table_names: list, start_date_id: int, end_date_id: int):
+_calendar_lock = threading.Lock()
+_calendar_bounds: Optional[tuple] = None  # (start, end) already present in dim_date for this process
+
+
+def ensure_date_calendar(engine, start: date, end: date) -> bool:
+    """
+    Make sure dim_date covers [start, end].
+
+    dim_date is a static calendar generated in SQL (one statement, ON CONFLICT DO NOTHING).
+    The covered range is remembered per process, so calls inside it cost nothing.
+    """
+    global _calendar_bounds
+
+    with _calendar_lock:
+        if _calendar_bounds and _calendar_bounds[0] <= start and end <= _calendar_bounds[1]:
+            return True
+
+        if _calendar_bounds:
+            start, end = min(start, _calendar_bounds[0]), max(end, _calendar_bounds[1])
+
+        try:
+            with engine.begin() as conn:
+                result = conn.execute(text("""
+                    INSERT INTO dim_date (date_id, date, year, month, day_of_week)
+                    SELECT
+                        CAST(to_char(d, 'YYYYMMDD') AS BIGINT),
+                        CAST(d AS DATE),
+                        CAST(EXTRACT(YEAR FROM d) AS INTEGER),
+                        CAST(EXTRACT(MONTH FROM d) AS INTEGER),
+                        to_char(d, 'FMDay')
+                    FROM generate_series(CAST(:start AS DATE), CAST(:end AS DATE), INTERVAL '1 day') AS d
+                    ON CONFLICT (date_id) DO NOTHING
+                """), {"start": start, "end": end})
+            _calendar_bounds = (start, end)
+            logger.info(f"📅 dim_date calendar covers {start} to {end} ({result.rowcount} new dates)")
+            return True
+        except Exception as e:
+            logger.error(f"Error populating dim_date calendar: {e}")
+            return False
+
+
+def update_account_freshness(engine, df_fact: pd.DataFrame) -> bool:
+    """
+    Widen account_data_freshness to the date_ids just loaded for each account.
+
+    Called after a fact_core_metrics load so admin views can read each
+    account's data range without aggregating the fact table.
+    """
+    if df_fact.empty or 'account_id' not in df_fact.columns or 'date_id' not in df_fact.columns:
+        return True
+
+    known = df_fact[df_fact['date_id'] != 0]
+    ranges = known.groupby('account_id')['date_id'].agg(['min', 'max']).reset_index()
+    rows = [
+        {"account_id": int(r.account_id), "first_date_id": int(r.min), "last_date_id": int(r.max)}
+        for r in ranges.itertuples(index=False)
+    ]
+    if not rows:
+        return True
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("""
+                INSERT INTO account_data_freshness (account_id, first_date_id, last_date_id, last_loaded_at)
+                VALUES (:account_id, :first_date_id, :last_date_id, timezone('utc', now()))
+                ON CONFLICT (account_id) DO UPDATE SET
+                    first_date_id = LEAST(account_data_freshness.first_date_id, EXCLUDED.first_date_id),
+                    last_date_id = GREATEST(account_data_freshness.last_date_id, EXCLUDED.last_date_id),
+                    last_loaded_at = EXCLUDED.last_loaded_at
+            """), rows)
+        return True
+    except Exception as e:
+        logger.error(f"Error updating account freshness: {e}")
+        return False
+
+
+def reset_account_freshness(conn, account_id: int):
     """
-    Delete data from fact tables for a specific date range.
-    This ensures idempotency when re-running the ETL.
+    Recompute one account's account_data_freshness row from fact_core_metrics
+    (deleted when no facts remain). update_account_freshness only widens the
+    range, so this runs whenever facts are deleted.
+    """
+    conn.execute(text("""
+        DELETE FROM account_data_freshness WHERE account_id = :account_id
+    """), {"account_id": account_id})
+    conn.execute(text("""
+        INSERT INTO account_data_freshness (account_id, first_date_id, last_date_id, last_loaded_at)
+        SELECT account_id, MIN(date_id), MAX(date_id), timezone('utc', now())
+        FROM fact_core_metrics
+        WHERE account_id = :account_id AND date_id <> 0
+        GROUP BY account_id
+    """), {"account_id": account_id})
+
+
+def clear_fact_data(engine, table_names: list, start_date_id: int, end_date_id: int, account_id: int):
+    """
+    Delete one account's data from fact tables for a specific date range.
+    This ensures idempotency when re-running the ETL; other accounts' facts
+    in the same tables are left untouched.
     """
     if not table_names:
         return True
@@ -158,10 +276,20 @@ def clear_fact_data(engine, table_names: list, start_date_id: int, end_date_id:
             for table in table_names:
                 query = text(f"""
                     DELETE FROM "{table}" 
-                    WHERE date_id >= :start_id AND date_id <= :end_id
+                    WHERE account_id = :account_id
+                      AND date_id >= :start_id AND date_id <= :end_id
                 """)
-                result = conn.execute(query, {"start_id": start_date_id, "end_id": end_date_id})
-                logger.info(f"🗑️ Cleared {result.rowcount} rows from {table} for range {start_date_id}-{end_date_id}")
+                result = conn.execute(query, {
+                    "account_id": account_id,
+                    "start_id": start_date_id,
+                    "end_id": end_date_id
+                })
+                logger.info(
+                    f"🗑️ Cleared {result.rowcount} rows from {table} for account {account_id}, "
+                    f"range {start_date_id}-{end_date_id}"
+                )
+            if 'fact_core_metrics' in table_names:
+                reset_account_freshness(conn, account_id)
         return True
     except Exception as e:
         logger.error(f"Error clearing fact data: {e}")
@@ -277,48 +405,6 @@ def save_dataframe(engine, df: pd.DataFrame, table_name: str, pk_columns: list,
         return False
 
 
-def load_lookup_cache(engine):
-    """
-    Load attribute dimension lookups into memory cache
-    
-    This maps dimension names to IDs for fast fact table loading
-    
-    IMPORTANT: For auto-increment dimensions, Unknown member will have ID=1, not ID=0
-    """
-    
-    global LOOKUP_CACHE
-    LOOKUP_CACHE.clear()
-    
-    lookups = {
-        'dim_age': ('age_group', 'age_id'),
-        'dim_gender': ('gender', 'gender_id'),
-        'dim_country': ('country', 'country_id'),
-        'dim_placement': ('placement_name', 'placement_id'),
-        'dim_action_type': ('action_type', 'action_type_id'),
-    }
-    
-    for table_name, (name_col, id_col) in lookups.items():
-        try:
-            query = text(f'SELECT "{id_col}", "{name_col}" FROM "{table_name}"')
-            
-            with engine.connect() as conn:
-                df = pd.read_sql(query, conn)
-            
-            if not df.empty:
-                # Create lookup dict: {name: id}
-                lookup = dict(zip(df[name_col], df[id_col]))
-                LOOKUP_CACHE[table_name] = lookup
-                logger.info(f"Loaded {len(lookup)} mappings for {table_name}")
-            else:
-                LOOKUP_CACHE[table_name] = {}
-        
-        except Exception as e:
-            logger.warning(f"Could not load lookup for {table_name}: {e}")
-            LOOKUP_CACHE[table_name] = {}
-    
-    logger.info(f"✅ Lookup cache loaded: {len(LOOKUP_CACHE)} dimensions")
-
-
 def _convert_numpy_types(df: pd.DataFrame) -> pd.DataFrame:
     """Convert numpy types to native Python types"""
     
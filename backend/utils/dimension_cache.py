@@ -0,0 +1,143 @@
+"""
+utils/dimension_cache.py - Per-account dimension row hashes for delta-only dimension loads
+
+Every ETL run extracts all campaigns/adsets/ads/creatives seen in the batch.
+Most of them are unchanged since the previous run, so instead of re-upserting
+them we keep a hash of each member's row (etl_dimension_hashes) and only write
+members whose hash is new or different.
+
+Anything else that writes dimension rows (status changes from the API, account
+cleanup) must drop the affected hashes, or the next run would skip the member
+and keep the local edit.
+"""
+
+import logging
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+def _member_keys(df: pd.DataFrame, pk_cols: List[str]) -> pd.Series:
+    keys = df[pk_cols[0]].astype(str)
+    for col in pk_cols[1:]:
+        keys = keys + '|' + df[col].astype(str)
+    return keys
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Stable 64-bit hash per row (values compared as strings, column order independent)"""
+    as_str = df[sorted(df.columns)].astype(str)
+    return pd.util.hash_pandas_object(as_str, index=False).to_numpy().view(np.int64)
+
+
+def forget_dimension_members(conn, dim_name: str, member_keys: List[str]):
+    """
+    Drop stored hashes of members whose dim row was written outside the ETL,
+    so the next run rewrites them from Graph. Runs in the caller's transaction.
+    """
+    if not member_keys:
+        return
+    conn.execute(
+        text("""
+            DELETE FROM etl_dimension_hashes
+            WHERE dim_name = :dim_name AND member_key = ANY(:member_keys)
+        """),
+        {"dim_name": dim_name, "member_keys": [str(key) for key in member_keys]}
+    )
+
+
+def forget_account_dimensions(conn, account_id: int):
+    """Drop all stored hashes of an account (its dim rows were deleted). Runs in the caller's transaction."""
+    conn.execute(
+        text("DELETE FROM etl_dimension_hashes WHERE account_id = :account_id"),
+        {"account_id": int(account_id)}
+    )
+
+
+class DimensionHashCache:
+    """
+    Hashes of dimension rows as last loaded for one account.
+
+    Load once per run with load(), filter each prepared dimension frame with
+    changed_rows(), and call commit() after the upsert succeeded.
+    """
+
+    def __init__(self, engine, account_id: int):
+        self.engine = engine
+        self.account_id = int(account_id)
+        self._hashes: Dict[str, Dict[str, int]] = {}
+
+    def load(self) -> "DimensionHashCache":
+        """Read all stored hashes for the account (one query)"""
+        self._hashes = {}
+        try:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    text("""
+                        SELECT dim_name, member_key, row_hash
+                        FROM etl_dimension_hashes
+                        WHERE account_id = :account_id
+                    """),
+                    {"account_id": self.account_id}
+                ).fetchall()
+            for dim_name, member_key, row_hash in rows:
+                self._hashes.setdefault(dim_name, {})[member_key] = row_hash
+            logger.info(f"Loaded {len(rows)} dimension hashes for account {self.account_id}")
+        except Exception as e:
+            # Without hashes every member counts as changed - same as a full upsert
+            logger.warning(f"Could not load dimension hashes for account {self.account_id}: {e}")
+        return self
+
+    def changed_rows(self, dim_name: str, df: pd.DataFrame, pk_cols: List[str]) -> pd.DataFrame:
+        """
+        Rows of df that are new or differ from the last load.
+        The returned frame carries _member_key/_row_hash columns for commit().
+        """
+        if df.empty:
+            return df
+
+        known = self._hashes.get(dim_name, {})
+        keys = _member_keys(df, pk_cols)
+        hashes = _row_hashes(df)
+
+        # Compared in Python: mapping through pandas would turn the int64 hashes into floats
+        changed = np.fromiter(
+            (known.get(key) != int(row_hash) for key, row_hash in zip(keys, hashes)),
+            dtype=bool, count=len(df)
+        )
+
+        df_changed = df.loc[changed].copy()
+        df_changed['_member_key'] = keys.to_numpy()[changed]
+        df_changed['_row_hash'] = hashes[changed]
+        return df_changed
+
+    def commit(self, dim_name: str, df_changed: pd.DataFrame):
+        """Persist hashes of rows returned by changed_rows() once they have been written"""
+        if df_changed.empty:
+            return
+
+        rows = [
+            {"account_id": self.account_id, "dim_name": dim_name, "member_key": key, "row_hash": int(row_hash)}
+            for key, row_hash in zip(df_changed['_member_key'], df_changed['_row_hash'])
+        ]
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    text("""
+                        INSERT INTO etl_dimension_hashes (account_id, dim_name, member_key, row_hash, updated_at)
+                        VALUES (:account_id, :dim_name, :member_key, :row_hash, NOW())
+                        ON CONFLICT (account_id, dim_name, member_key)
+                        DO UPDATE SET row_hash = EXCLUDED.row_hash, updated_at = EXCLUDED.updated_at
+                    """),
+                    rows
+                )
+            self._hashes.setdefault(dim_name, {}).update(
+                (r["member_key"], r["row_hash"]) for r in rows
+            )
+        except Exception as e:
+            # Stale hashes only cost a redundant upsert next run
+            logger.warning(f"Could not store dimension hashes for {dim_name}: {e}")
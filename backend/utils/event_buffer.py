@@ -0,0 +1,181 @@
+"""
+utils/event_buffer.py - Batched background writes for high-volume event rows
+
+Page views, audit log entries and feature-usage events used to be an
+INSERT + COMMIT inside the request. They are append-only and nobody reads
+them back in the same request, so requests now enqueue the row and a
+background thread writes batches (flushed by size or age) as multi-row
+INSERTs.
+
+Backpressure: the queue is bounded. When it is full, enqueue() blocks
+briefly and then falls back to writing the row synchronously - slower
+requests, but no lost events. stop() (FastAPI shutdown / atexit) drains
+the queue before the process exits.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Table
+
+from backend.config.base_config import settings
+
+logger = logging.getLogger(__name__)
+
+# How long enqueue() waits for space before writing synchronously
+_PUT_TIMEOUT_SECONDS = 0.05
+_WRITE_ATTEMPTS = 3
+
+
+class EventBuffer:
+    """Bounded in-process queue of (table, row) pairs written in batches by one daemon thread"""
+
+    def __init__(self, engine, max_batch: int = 500, flush_interval: float = 2.0, max_pending: int = 10000):
+        self.engine = engine
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Tuple[Table, Dict[str, Any]]]" = queue.Queue(maxsize=max_pending)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, table: Table, row: Dict[str, Any]):
+        """Queue one row for insertion into table (returns immediately unless the buffer is full)"""
+        if self._stop.is_set():
+            self.write(table, [row])
+            return
+
+        self._ensure_started()
+        try:
+            self._queue.put((table, row), timeout=_PUT_TIMEOUT_SECONDS)
+        except queue.Full:
+            logger.warning(f"Event buffer full ({self._queue.maxsize}), writing {table.name} row synchronously")
+            self.write(table, [row])
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the writer thread after it has flushed everything queued so far"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        # Anything enqueued while stopping (or if the thread never started)
+        self._flush(self._drain_nowait())
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-buffer-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._flush(batch)
+        self._flush(self._drain_nowait())
+
+    def _collect_batch(self) -> List[Tuple[Table, Dict[str, Any]]]:
+        """Block for the first item, then gather until max_batch or flush_interval has passed"""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch and not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain_nowait(self) -> List[Tuple[Table, Dict[str, Any]]]:
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _flush(self, batch: List[Tuple[Table, Dict[str, Any]]]):
+        # executemany needs the same keys in every row of one statement
+        groups: Dict[Tuple[Table, frozenset], List[Dict[str, Any]]] = {}
+        for table, row in batch:
+            groups.setdefault((table, frozenset(row)), []).append(row)
+        for (table, _), rows in groups.items():
+            for start in range(0, len(rows), self.max_batch):
+                self.write(table, rows[start:start + self.max_batch])
+
+    def write(self, table: Table, rows: List[Dict[str, Any]]):
+        """
+        Insert rows now, in their own transaction.
+        SQLAlchemy turns the executemany into INSERT ... VALUES (...), (...) batches.
+        """
+        for attempt in range(1, _WRITE_ATTEMPTS + 1):
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(table.insert(), rows)
+                return
+            except Exception as e:
+                if attempt == _WRITE_ATTEMPTS:
+                    logger.error(f"Dropped {len(rows)} {table.name} row(s) after {attempt} attempts: {e}", exc_info=True)
+                else:
+                    logger.warning(f"Writing {len(rows)} {table.name} row(s) failed (attempt {attempt}): {e}")
+                    time.sleep(0.5 * attempt)
+
+
+_buffers: Dict[str, EventBuffer] = {}
+_buffers_lock = threading.Lock()
+
+
+def get_event_buffer(engine) -> EventBuffer:
+    """Shared EventBuffer per database (engines for the same URL share one writer thread)"""
+    key = str(engine.url)
+    with _buffers_lock:
+        buffer = _buffers.get(key)
+        if buffer is None:
+            buffer = _buffers[key] = EventBuffer(
+                engine,
+                max_batch=settings.EVENT_BUFFER_MAX_BATCH,
+                flush_interval=settings.EVENT_BUFFER_FLUSH_SECONDS,
+                max_pending=settings.EVENT_BUFFER_MAX_PENDING
+            )
+        return buffer
+
+
+def record_event(db, table: Table, row: Dict[str, Any]):
+    """
+    Insert an event row through the shared buffer of the session's database,
+    or immediately (own transaction) when EVENT_BUFFER_ENABLED is off.
+    """
+    buffer = get_event_buffer(db.get_bind())
+    if settings.EVENT_BUFFER_ENABLED:
+        buffer.enqueue(table, row)
+    else:
+        buffer.write(table, [row])
+
+
+def stop_event_buffers(timeout: float = 10.0):
+    """Flush and stop all buffers (application shutdown)"""
+    with _buffers_lock:
+        buffers = list(_buffers.values())
+    for buffer in buffers:
+        try:
+            buffer.stop(timeout)
+        except Exception as e:
+            logger.error(f"Event buffer shutdown flush failed: {e}", exc_info=True)
+
+
+atexit.register(stop_event_buffers)
@@ -0,0 +1,126 @@
+"""
+utils/graph_batch.py - Graph API batch requests
+
+Packs up to 50 reads/mutations into one POST to the Graph root (`batch=[...]`)
+and sends the batches concurrently over the client's pooled connection, so
+multi-select actions cost len(ids) / 50 round trips instead of len(ids).
+
+Each operation carries a caller key (usually the object ID); results come back
+keyed the same way, with per-item errors instead of one failure for the batch.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+from backend.utils.graph_client import GraphClient
+
+logger = logging.getLogger(__name__)
+
+GRAPH_URL = "https://graph.facebook.com/v24.0/"
+MAX_BATCH_SIZE = 50         # Graph API limit per batch request
+MAX_CONCURRENT_BATCHES = 4
+BATCH_TIMEOUT = 60
+
+
+def batch_get(key: str, object_id: str, fields: List[str]) -> Dict[str, Any]:
+    """Operation reading fields of one object"""
+    return {"key": key, "method": "GET", "relative_url": f"{object_id}?fields={','.join(fields)}"}
+
+
+def batch_post(key: str, object_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Operation updating one object (same params as api_update)"""
+    return {"key": key, "method": "POST", "relative_url": object_id, "body": params}
+
+
+def _appsecret_proof(client: GraphClient) -> Optional[str]:
+    app_secret = getattr(client.session, "app_secret", None)
+    if not app_secret:
+        return None
+    return hmac.new(app_secret.encode(), client.access_token.encode(), hashlib.sha256).hexdigest()
+
+
+def _error_message(data: Any, code: Optional[int]) -> str:
+    if isinstance(data, dict) and isinstance(data.get("error"), dict):
+        error = data["error"]
+        return error.get("error_user_msg") or error.get("message") or "Unknown error"
+    return f"HTTP {code}"
+
+
+def _send_batch(client: GraphClient, operations: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """One batch request; every operation gets a result even if the whole request fails"""
+    batch = []
+    for op in operations:
+        item = {"method": op["method"], "relative_url": op["relative_url"]}
+        if op.get("body"):
+            item["body"] = urlencode({k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in op["body"].items()})
+        batch.append(item)
+
+    payload = {"access_token": client.access_token, "batch": json.dumps(batch), "include_headers": "false"}
+    proof = _appsecret_proof(client)
+    if proof:
+        payload["appsecret_proof"] = proof
+
+    try:
+        response = client.http.post(GRAPH_URL, data=payload, timeout=BATCH_TIMEOUT)
+        items = response.json()
+    except Exception as e:
+        logger.error(f"Graph batch request failed ({len(operations)} operations): {e}")
+        return {op["key"]: {"ok": False, "data": None, "error": str(e)} for op in operations}
+
+    if not isinstance(items, list):
+        message = _error_message(items, response.status_code)
+        logger.error(f"Graph batch rejected ({len(operations)} operations): {message}")
+        return {op["key"]: {"ok": False, "data": None, "error": message} for op in operations}
+
+    if len(items) != len(operations):
+        logger.error(f"Graph batch returned {len(items)} responses for {len(operations)} operations")
+
+    results = {}
+    for op in operations[len(items):]:
+        # Responses are positional; operations without one are failed, not dropped
+        results[op["key"]] = {"ok": False, "data": None, "error": "No response in batch result"}
+    for op, item in zip(operations, items):
+        if item is None:
+            # Graph returns null for operations it did not get to before timing out
+            results[op["key"]] = {"ok": False, "data": None, "error": "No response (batch timed out)"}
+            continue
+
+        code = item.get("code")
+        try:
+            data = json.loads(item.get("body") or "null")
+        except ValueError:
+            data = item.get("body")
+
+        if code is not None and code < 400 and not (isinstance(data, dict) and "error" in data):
+            results[op["key"]] = {"ok": True, "data": data, "error": None}
+        else:
+            results[op["key"]] = {"ok": False, "data": data, "error": _error_message(data, code)}
+    return results
+
+
+def run_graph_batch(client: GraphClient, operations: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Execute operations (see batch_get / batch_post) in batches of MAX_BATCH_SIZE.
+
+    Returns {key: {"ok": bool, "data": parsed response body, "error": message or None}}.
+    Operations inside one batch are independent: a failing item does not fail the others.
+    """
+    if not operations:
+        return {}
+
+    chunks = [operations[i:i + MAX_BATCH_SIZE] for i in range(0, len(operations), MAX_BATCH_SIZE)]
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BATCHES, len(chunks))) as executor:
+        for chunk_results in executor.map(lambda chunk: _send_batch(client, chunk), chunks):
+            results.update(chunk_results)
+
+    failed = sum(1 for r in results.values() if not r["ok"])
+    if failed:
+        logger.warning(f"Graph batch: {failed}/{len(operations)} operations failed")
+    return results
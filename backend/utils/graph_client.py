@@ -0,0 +1,137 @@
+"""
+utils/graph_client.py - Pooled Facebook Graph API clients, one per user token
+
+FacebookAdsApi.init() replaces the process-global default API, so concurrent
+requests for different users raced on it, and every init (once per insights
+chunk / ID batch) threw away the HTTP session and its TLS connections.
+
+The registry keeps one GraphClient per (access token, app): a FacebookAdsApi
+bound to its own FacebookSession, whose requests.Session has a connection pool
+sized for the extractor's worker threads. Callers pass `client.api` to SDK
+objects (AdAccount(..., api=client.api)) and use `client.http` - a separate
+pooled requests.Session without the SDK's default params - for raw Graph
+requests. Clients idle for GRAPH_CLIENT_IDLE_SECONDS are closed, and the
+registry never holds more than GRAPH_CLIENT_MAX_CLIENTS.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import requests
+from facebook_business.api import FacebookAdsApi
+from facebook_business.session import FacebookSession
+from requests.adapters import HTTPAdapter
+
+from backend.config.base_config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class GraphClient:
+    """FacebookAdsApi + keep-alive HTTP session for one access token"""
+
+    def __init__(self, access_token: str, app_id: Optional[str] = None,
+                 app_secret: Optional[str] = None, pool_size: int = 20):
+        self.access_token = access_token
+        self.session = FacebookSession(app_id, app_secret, access_token)
+        self.session.requests.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_size))
+        self.api = FacebookAdsApi(self.session)
+
+        # Raw Graph calls get their own keep-alive session: the SDK session sends the
+        # user token (and appsecret_proof) as default params, which must not leak into
+        # calls made with a page token.
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_size))
+        self.last_used = time.monotonic()
+
+    def close(self):
+        self.session.requests.close()
+        self.http.close()
+
+
+class GraphClientRegistry:
+    """Thread-safe LRU of GraphClients with idle eviction"""
+
+    def __init__(self, max_clients: int = 200, idle_seconds: float = 600, pool_size: int = 20):
+        self.max_clients = max_clients
+        self.idle_seconds = idle_seconds
+        self.pool_size = pool_size
+        self._clients: "OrderedDict[Tuple[str, Optional[str]], GraphClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(access_token: str, app_id: Optional[str]) -> Tuple[str, Optional[str]]:
+        # Tokens are not kept as dict keys (they show up in debug dumps)
+        return hashlib.sha256(access_token.encode()).hexdigest(), app_id
+
+    def get(self, access_token: str, app_id: Optional[str] = None, app_secret: Optional[str] = None) -> GraphClient:
+        """Client for this token/app, created on first use"""
+        if not access_token:
+            raise ValueError("Facebook access token is required")
+
+        key = self._key(access_token, app_id)
+        now = time.monotonic()
+        evicted = []
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = GraphClient(access_token, app_id, app_secret, pool_size=self.pool_size)
+                self._clients[key] = client
+            else:
+                self._clients.move_to_end(key)
+            client.last_used = now
+
+            # Least recently used first: stop at the first client still in use
+            while self._clients:
+                oldest_key, oldest = next(iter(self._clients.items()))
+                if oldest_key == key:
+                    break
+                if len(self._clients) <= self.max_clients and now - oldest.last_used < self.idle_seconds:
+                    break
+                evicted.append(self._clients.pop(oldest_key))
+
+        for old in evicted:
+            old.close()
+        if evicted:
+            logger.debug(f"Closed {len(evicted)} idle Graph client(s), {len(self._clients)} open")
+
+        return client
+
+    def close_all(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+_registry = GraphClientRegistry(
+    max_clients=settings.GRAPH_CLIENT_MAX_CLIENTS,
+    idle_seconds=settings.GRAPH_CLIENT_IDLE_SECONDS,
+    pool_size=settings.GRAPH_CLIENT_POOL_SIZE
+)
+
+
+def get_graph_client(access_token: str, with_app_secret: bool = True) -> GraphClient:
+    """
+    Shared GraphClient for a user token.
+
+    with_app_secret signs SDK calls with appsecret_proof (FACEBOOK_APP_ID/SECRET);
+    pass False for flows that used FacebookAdsApi.init(access_token=...) alone.
+    """
+    if with_app_secret:
+        return _registry.get(access_token, settings.FACEBOOK_APP_ID, settings.FACEBOOK_APP_SECRET)
+    return _registry.get(access_token)
+
+
+def close_graph_clients():
+    """Close all pooled connections (application shutdown)"""
+    _registry.close_all()
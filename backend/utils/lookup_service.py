@@ -0,0 +1,167 @@
+"""
+utils/lookup_service.py - Attribute dimension lookups (name → surrogate ID)
+
+Each attribute dimension is held as an immutable (names Index, ids array)
+snapshot that is swapped atomically under a lock, so the API process and
+background sync threads can map values concurrently while another thread
+refreshes or extends a dimension. Mapping is vectorized (factorize + Index.get_indexer), and members that don't exist yet
+are inserted in one batched statement instead of being dropped as id=0.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+
+from backend.config.settings import UNKNOWN_MEMBER_DEFAULTS
+
+logger = logging.getLogger(__name__)
+
+# table → (name column, id column)
+ATTRIBUTE_DIMENSIONS: Dict[str, Tuple[str, str]] = {
+    'dim_age': ('age_group', 'age_id'),
+    'dim_gender': ('gender', 'gender_id'),
+    'dim_country': ('country', 'country_id'),
+    'dim_placement': ('placement_name', 'placement_id'),
+    'dim_action_type': ('action_type', 'action_type_id'),
+}
+
+# Column values for members inserted on the fly (columns whose default is client-side only)
+_INSERT_DEFAULTS: Dict[str, Dict[str, object]] = {
+    'dim_action_type': {'is_conversion': False},
+}
+
+_EMPTY_VALUES = {'N/A', 'nan', 'None', ''}
+
+
+class LookupService:
+    """Thread-safe, versioned name → ID mapping for attribute dimensions"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.RLock()
+        self._snapshots: Dict[str, Tuple[pd.Index, np.ndarray]] = {}
+        self._versions: Dict[str, int] = {}
+
+    def version(self, table_name: str) -> int:
+        """Incremented every time the table's snapshot changes"""
+        return self._versions.get(table_name, 0)
+
+    def refresh(self, table_names: Optional[Iterable[str]] = None):
+        """Reload snapshots from the database (all attribute dimensions by default)"""
+        for table_name in (table_names or ATTRIBUTE_DIMENSIONS):
+            name_col, id_col = ATTRIBUTE_DIMENSIONS[table_name]
+            try:
+                with self.engine.connect() as conn:
+                    rows = conn.execute(text(f'SELECT "{id_col}", "{name_col}" FROM "{table_name}"')).fetchall()
+                self._swap(table_name, {name: member_id for member_id, name in rows})
+                logger.info(f"Loaded {len(rows)} mappings for {table_name}")
+            except Exception as e:
+                logger.warning(f"Could not load lookup for {table_name}: {e}")
+
+    def get_id(self, table_name: str, name: str) -> Optional[int]:
+        """Single-value lookup from the current snapshot (no insert)"""
+        names, ids = self._snapshot(table_name)
+        position = names.get_indexer([name])[0]
+        return int(ids[position]) if position != -1 else None
+
+    def get_ids(self, table_name: str, values: pd.Series, insert_missing: bool = True) -> np.ndarray:
+        """
+        Map a column of member names to IDs.
+
+        Values are stripped and empty markers ('N/A', 'nan', ...) become the table's
+        Unknown member. Names not in the dimension are inserted (insert_missing) -
+        anything that still can't be resolved maps to the Unknown member, or 0.
+        """
+        name_col, _ = ATTRIBUTE_DIMENSIONS[table_name]
+        unknown = UNKNOWN_MEMBER_DEFAULTS[table_name][name_col]
+
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        labels = pd.Index([self._clean(u, unknown) for u in uniques], dtype=object)
+
+        names, ids = self._snapshot(table_name)
+        positions = names.get_indexer(labels)
+
+        if insert_missing and (positions == -1).any():
+            self._add_members(table_name, labels[positions == -1].unique())
+            names, ids = self._snapshot(table_name)
+            positions = names.get_indexer(labels)
+
+        unknown_position = names.get_indexer([unknown])[0]
+        fallback = ids[unknown_position] if unknown_position != -1 else 0
+
+        unresolved = positions == -1
+        if unresolved.any():
+            logger.warning(f"{table_name}: {list(labels[unresolved][:10])} not found, mapped to Unknown")
+
+        label_ids = np.where(unresolved, fallback, ids[positions] if len(ids) else fallback)
+        return label_ids.astype(np.int64)[codes]
+
+    @staticmethod
+    def _clean(value, unknown: str) -> str:
+        label = str(value).strip()
+        return unknown if label in _EMPTY_VALUES else label
+
+    def _snapshot(self, table_name: str) -> Tuple[pd.Index, np.ndarray]:
+        snapshot = self._snapshots.get(table_name)
+        if snapshot is None:
+            with self._lock:
+                if table_name not in self._snapshots:
+                    self.refresh([table_name])
+                snapshot = self._snapshots.get(table_name, (pd.Index([], dtype=object), np.array([], dtype=np.int64)))
+        return snapshot
+
+    def _swap(self, table_name: str, mapping: Dict[str, int]):
+        names = pd.Index(list(mapping.keys()), dtype=object)
+        ids = np.fromiter(mapping.values(), dtype=np.int64, count=len(mapping))
+        with self._lock:
+            self._snapshots[table_name] = (names, ids)
+            self._versions[table_name] = self._versions.get(table_name, 0) + 1
+
+    def _add_members(self, table_name: str, new_names: pd.Index):
+        """Insert unseen members in one statement and merge their IDs into the snapshot"""
+        name_col, id_col = ATTRIBUTE_DIMENSIONS[table_name]
+        defaults = _INSERT_DEFAULTS.get(table_name, {})
+
+        insert_cols = ', '.join(f'"{c}"' for c in [name_col, *defaults])
+        select_cols = ', '.join(['name', *(f':{c}' for c in defaults)])
+        params = {'names': list(new_names), **defaults}
+
+        with self._lock:
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text(f"""
+                        INSERT INTO "{table_name}" ({insert_cols})
+                        SELECT {select_cols} FROM unnest(CAST(:names AS TEXT[])) AS name
+                        ON CONFLICT ("{name_col}") DO NOTHING
+                    """), params)
+                    rows = conn.execute(
+                        text(f'SELECT "{id_col}", "{name_col}" FROM "{table_name}" WHERE "{name_col}" = ANY(:names)'),
+                        {'names': list(new_names)}
+                    ).fetchall()
+            except Exception as e:
+                logger.error(f"Could not insert new members into {table_name}: {e}")
+                return
+
+            names, ids = self._snapshots.get(table_name, (pd.Index([], dtype=object), np.array([], dtype=np.int64)))
+            mapping = dict(zip(names, ids.tolist()))
+            mapping.update({name: member_id for member_id, name in rows})
+            self._swap(table_name, mapping)
+            logger.info(f"➕ {table_name}: added {len(rows)} new member(s)")
+
+
+_services: Dict[str, LookupService] = {}
+_services_lock = threading.Lock()
+
+
+def get_lookup_service(engine) -> LookupService:
+    """Shared LookupService per database (engines for the same URL share snapshots)"""
+    key = str(engine.url)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = LookupService(engine)
+        return service
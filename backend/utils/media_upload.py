@@ -0,0 +1,281 @@
+"""
+utils/media_upload.py - Chunked, resumable media uploads spooled to disk
+
+Clients start an upload with the file size, then PUT the file in chunks of at
+most MEDIA_UPLOAD_CHUNK_BYTES (each under the 10MB request limit). Chunk
+bodies are streamed straight into a file in MEDIA_UPLOAD_DIR, so nothing is
+held in memory. A chunk must start at the current received offset; after a
+dropped connection the client reads `bytes_received` from the status endpoint
+and resumes from there.
+
+The Graph upload runs in a worker pool, submitted only once there is data for
+it: a video transfer starts with the first chunk and then follows the client
+(wait_for_bytes), reporting progress (bytes_transferred) for the polling
+endpoint; an image is sent once fully received. Uploads that get no chunk for
+MEDIA_UPLOAD_IDLE_SECONDS are failed. Each user may have at most
+MEDIA_UPLOAD_MAX_PER_USER uploads in progress, reserving at most
+MEDIA_UPLOAD_MAX_SPOOL_BYTES_PER_USER of spool disk (their declared sizes).
+Upload records and files are dropped MEDIA_UPLOAD_TTL_SECONDS after they last
+changed.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from backend.config.base_config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class UploadFailed(Exception):
+    """The upload was failed or abandoned while a transfer was waiting for data"""
+
+
+class UploadLimitExceeded(Exception):
+    """The user already has too many uploads, or too much spooled data, in progress"""
+
+
+class MediaUpload:
+    """State of one chunked upload (shared by the request handlers and the transfer worker)"""
+
+    def __init__(self, upload_id: str, user_id: int, account_id: str, filename: str,
+                 file_size: int, is_video: bool, path: str):
+        self.upload_id = upload_id
+        self.user_id = user_id
+        self.account_id = account_id
+        self.filename = filename
+        self.file_size = file_size
+        self.is_video = is_video
+        self.path = path
+
+        self.status = 'receiving'  # receiving, uploading, completed, failed
+        self.bytes_received = 0
+        self.bytes_transferred = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.updated_at = time.monotonic()
+
+        self.write_lock = threading.Lock()  # one chunk request at a time
+        self._changed = threading.Condition()
+        # Set by MediaUploadRegistry.run; submitted to the pool once ready_to_transfer
+        self.transfer: Optional[Callable[["MediaUpload"], Dict[str, Any]]] = None
+        self.transfer_started = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('completed', 'failed')
+
+    @property
+    def fully_received(self) -> bool:
+        return self.bytes_received >= self.file_size
+
+    @property
+    def ready_to_transfer(self) -> bool:
+        """Videos are sent chunk by chunk as they arrive; images are sent whole"""
+        return self.bytes_received > 0 if self.is_video else self.fully_received
+
+    def add_received(self, byte_count: int):
+        with self._changed:
+            self.bytes_received += byte_count
+            self.updated_at = time.monotonic()
+            self._changed.notify_all()
+
+    def set_transferred(self, byte_count: int):
+        self.bytes_transferred = byte_count
+        self.updated_at = time.monotonic()
+
+    def set_status(self, status: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        with self._changed:
+            self.status = status
+            if result is not None:
+                self.result = result
+            if error is not None:
+                self.error = error
+            self.updated_at = time.monotonic()
+            self._changed.notify_all()
+
+    def wait_for_bytes(self, end_offset: int):
+        """
+        Block until the file holds end_offset bytes (capped at file_size).
+        Raises UploadFailed if the upload fails or no chunk arrives for MEDIA_UPLOAD_IDLE_SECONDS.
+        """
+        needed = min(end_offset, self.file_size)
+        with self._changed:
+            last_received = self.bytes_received
+            deadline = time.monotonic() + settings.MEDIA_UPLOAD_IDLE_SECONDS
+            while self.bytes_received < needed:
+                if self.status == 'failed':
+                    raise UploadFailed(self.error or "Upload failed")
+                if self.bytes_received != last_received:
+                    last_received = self.bytes_received
+                    deadline = time.monotonic() + settings.MEDIA_UPLOAD_IDLE_SECONDS
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise UploadFailed("Upload abandoned: no data received")
+                self._changed.wait(timeout=remaining)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "upload_id": self.upload_id,
+            "status": self.status,
+            "filename": self.filename,
+            "is_video": self.is_video,
+            "file_size": self.file_size,
+            "bytes_received": self.bytes_received,
+            "bytes_transferred": self.bytes_transferred,
+            "chunk_size": settings.MEDIA_UPLOAD_CHUNK_BYTES,
+            "result": self.result,
+            "error": self.error
+        }
+
+
+class MediaUploadRegistry:
+    """In-process uploads by ID, with their spool files and the transfer worker pool"""
+
+    def __init__(self, upload_dir: str, ttl_seconds: float = 3600, max_workers: int = 4,
+                 idle_seconds: float = 900, max_per_user: int = 3, max_spool_bytes_per_user: int = 8 * 1024 ** 3):
+        self.upload_dir = upload_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+        self.idle_seconds = idle_seconds
+        self.max_per_user = max_per_user
+        self.max_spool_bytes_per_user = max_spool_bytes_per_user
+        self._uploads: Dict[str, MediaUpload] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def create(self, user_id: int, account_id: str, filename: str, file_size: int, is_video: bool) -> MediaUpload:
+        """Register an upload; raises UploadLimitExceeded when the user's limits would be exceeded"""
+        self.expire()
+        os.makedirs(self.upload_dir, exist_ok=True)
+
+        upload_id = uuid.uuid4().hex
+        path = os.path.join(self.upload_dir, f"{upload_id}{os.path.splitext(filename)[1]}")
+        upload = MediaUpload(upload_id, user_id, account_id, filename, file_size, is_video, path)
+
+        with self._lock:
+            active = [u for u in self._uploads.values() if u.user_id == user_id and not u.finished]
+            if len(active) >= self.max_per_user:
+                raise UploadLimitExceeded(
+                    f"Too many uploads in progress (maximum {self.max_per_user}). "
+                    f"Wait for one to finish and try again."
+                )
+            if sum(u.file_size for u in active) + file_size > self.max_spool_bytes_per_user:
+                raise UploadLimitExceeded(
+                    f"Uploads in progress exceed {self.max_spool_bytes_per_user // (1024 ** 2)}MB. "
+                    f"Wait for one to finish and try again."
+                )
+            self._uploads[upload_id] = upload
+
+        open(path, 'wb').close()
+        return upload
+
+    def get(self, upload_id: str, user_id: int) -> Optional[MediaUpload]:
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+        if upload is None or upload.user_id != user_id:
+            return None
+        return upload
+
+    def run(self, upload: MediaUpload, transfer: Callable[[MediaUpload], Dict[str, Any]]):
+        """
+        Run transfer(upload) in the worker pool once the upload is ready_to_transfer
+        (see add_chunk); its return value becomes upload.result
+        """
+        upload.transfer = transfer
+        self._start_if_ready(upload)
+
+    def add_chunk(self, upload: MediaUpload, byte_count: int):
+        """Record a chunk written to the spool file, starting the transfer when it has enough data"""
+        upload.add_received(byte_count)
+        self._start_if_ready(upload)
+
+    def _start_if_ready(self, upload: MediaUpload):
+        with self._lock:
+            if upload.transfer is None or upload.transfer_started or upload.finished or not upload.ready_to_transfer:
+                return
+            upload.transfer_started = True
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="media-upload")
+            executor = self._executor
+        executor.submit(self._run_transfer, upload, upload.transfer)
+
+    def _run_transfer(self, upload: MediaUpload, transfer: Callable[[MediaUpload], Dict[str, Any]]):
+        try:
+            upload.set_status('uploading')
+            result = transfer(upload)
+            upload.set_status('completed', result=result)
+            logger.info(f"Media upload {upload.upload_id} completed: {result}")
+        except Exception as e:
+            logger.error(f"Media upload {upload.upload_id} failed: {e}", exc_info=True)
+            upload.set_status('failed', error=str(e))
+        finally:
+            _remove_file(upload.path)
+
+    def expire(self):
+        """
+        Forget uploads unchanged for ttl_seconds (failing any still in progress) and
+        delete their files. Uploads still waiting for data to start their transfer are
+        failed after idle_seconds without a chunk (a started transfer fails itself).
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [u for u in self._uploads.values() if u.updated_at < now - self.ttl_seconds]
+            for upload in expired:
+                del self._uploads[upload.upload_id]
+            # Failed under the lock, so a chunk arriving meanwhile cannot start the transfer
+            idle = [
+                u for u in self._uploads.values()
+                if not u.transfer_started and not u.finished and u.updated_at < now - self.idle_seconds
+            ]
+            for upload in idle:
+                upload.set_status('failed', error="Upload abandoned: no data received")
+
+        for upload in idle:
+            _remove_file(upload.path)
+
+        for upload in expired:
+            if not upload.finished:
+                upload.set_status('failed', error="Upload expired")
+            _remove_file(upload.path)
+        if expired:
+            logger.info(f"Expired {len(expired)} media upload(s)")
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            uploads = list(self._uploads.values())
+        for upload in uploads:
+            if not upload.finished:
+                upload.set_status('failed', error="Server shutting down")
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove upload file {path}: {e}")
+
+
+media_uploads = MediaUploadRegistry(
+    upload_dir=settings.MEDIA_UPLOAD_DIR,
+    ttl_seconds=settings.MEDIA_UPLOAD_TTL_SECONDS,
+    max_workers=settings.MEDIA_UPLOAD_WORKERS,
+    idle_seconds=settings.MEDIA_UPLOAD_IDLE_SECONDS,
+    max_per_user=settings.MEDIA_UPLOAD_MAX_PER_USER,
+    max_spool_bytes_per_user=settings.MEDIA_UPLOAD_MAX_SPOOL_BYTES_PER_USER
+)
+
+
+def stop_media_uploads():
+    """Fail in-progress uploads and stop the worker pool (application shutdown)"""
+    media_uploads.shutdown()
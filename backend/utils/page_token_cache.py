@@ -0,0 +1,97 @@
+"""
+utils/page_token_cache.py - In-process cache of Facebook Page access tokens
+
+Lead form, lead and post endpoints need a Page token, and looking one up took
+up to three Graph calls (promote_pages, /me/accounts, /{page_id}) on every
+request. Tokens are cached per (user token, page) for PAGE_TOKEN_CACHE_TTL_SECONDS,
+filled in bulk from one /me/accounts listing, and stored Fernet-encrypted
+(TokenEncryption) so a memory dump does not expose usable tokens.
+
+Callers invalidate an entry when Graph rejects the token (OAuthException).
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from backend.config.base_config import settings
+from backend.utils.encryption_utils import TokenEncryption
+
+# Graph error codes meaning the access token itself is no longer valid
+TOKEN_ERROR_CODES = {102, 190, 463, 467}
+
+
+def user_cache_key(access_token: str) -> str:
+    """Cache namespace for a user token (a new token after re-auth starts empty)"""
+    return hashlib.sha256(access_token.encode()).hexdigest()
+
+
+def is_token_error(error: Dict) -> bool:
+    """Whether a Graph error payload may be caused by the token used (invalid, expired, lacking access)"""
+    return error.get("code") in TOKEN_ERROR_CODES or error.get("type") == "OAuthException"
+
+
+class PageTokenCache:
+    """LRU of encrypted page tokens keyed by (user key, page id), each with an expiry"""
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 5000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._tokens: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._listed_at: Dict[str, float] = {}  # user key -> last full /me/accounts listing
+        self._lock = threading.Lock()
+
+    def get(self, user_key: str, page_id: str) -> Optional[str]:
+        key = (user_key, str(page_id))
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry is None:
+                return None
+            encrypted, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+        return TokenEncryption.decrypt_token(encrypted)
+
+    def put_many(self, user_key: str, tokens: Dict[str, str], listed: bool = False):
+        """
+        Cache page tokens for one user.
+        listed=True records that `tokens` is the user's complete page list.
+        """
+        encrypted = {str(page_id): TokenEncryption.encrypt_token(token) for page_id, token in tokens.items() if token}
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            for page_id, value in encrypted.items():
+                key = (user_key, page_id)
+                self._tokens[key] = (value, expires_at)
+                self._tokens.move_to_end(key)
+            while len(self._tokens) > self.max_entries:
+                self._tokens.popitem(last=False)
+            if listed:
+                self._listed_at[user_key] = time.monotonic()
+
+    def recently_listed(self, user_key: str) -> bool:
+        """Whether the user's pages were listed within the TTL (no point listing again)"""
+        with self._lock:
+            listed_at = self._listed_at.get(user_key)
+        return listed_at is not None and time.monotonic() - listed_at < self.ttl_seconds
+
+    def invalidate(self, user_key: str, page_id: str):
+        """Drop a rejected token and force the next lookup to list pages again"""
+        with self._lock:
+            self._tokens.pop((user_key, str(page_id)), None)
+            self._listed_at.pop(user_key, None)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+            self._listed_at.clear()
+
+
+page_token_cache = PageTokenCache(
+    ttl_seconds=settings.PAGE_TOKEN_CACHE_TTL_SECONDS,
+    max_entries=settings.PAGE_TOKEN_CACHE_MAX_ENTRIES
+)
@@ -0,0 +1,149 @@
+"""
+utils/sheets_client.py - Shared Google Sheets API clients, one per user token
+
+Building the `sheets` service (discovery document + credentials) on every
+export was a fixed cost per request. The registry keeps one SheetsClient per
+(access token, OAuth client) - or per service account file - and closes
+clients idle for SHEETS_CLIENT_IDLE_SECONDS.
+
+googleapiclient's default httplib2 transport is not thread-safe, so requests
+built from `client.service` are sent with `client.execute(request)`, which uses
+an authorized HTTP object of the calling thread. That lets one export write
+value chunks from several threads.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from backend.config.base_config import settings
+
+logger = logging.getLogger(__name__)
+
+SHEETS_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive.file'
+]
+EXECUTE_RETRIES = 3  # googleapiclient retries 429/5xx with exponential backoff
+
+
+class SheetsClient:
+    """Sheets v4 service + per-thread authorized HTTP for one set of credentials"""
+
+    def __init__(self, credentials):
+        from googleapiclient.discovery import build
+
+        self.credentials = credentials
+        self.service = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
+        self._local = threading.local()
+        self.last_used = time.monotonic()
+
+    def execute(self, request) -> Any:
+        """Execute a request built from self.service on this thread's own connection"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            import google_auth_httplib2
+            from googleapiclient.http import build_http
+
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=build_http())
+        return request.execute(http=http, num_retries=EXECUTE_RETRIES)
+
+    def close(self):
+        self.service.close()
+
+
+class SheetsClientRegistry:
+    """Thread-safe LRU of SheetsClients with idle eviction"""
+
+    def __init__(self, max_clients: int = 100, idle_seconds: float = 1800):
+        self.max_clients = max_clients
+        self.idle_seconds = idle_seconds
+        self._clients: "OrderedDict[Tuple[str, Optional[str]], SheetsClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, Optional[str]], credentials_factory) -> SheetsClient:
+        """Client for key, created with credentials_factory() on first use"""
+        now = time.monotonic()
+        evicted = []
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = SheetsClient(credentials_factory())
+                self._clients[key] = client
+            else:
+                self._clients.move_to_end(key)
+            client.last_used = now
+
+            while self._clients:
+                oldest_key, oldest = next(iter(self._clients.items()))
+                if oldest_key == key:
+                    break
+                if len(self._clients) <= self.max_clients and now - oldest.last_used < self.idle_seconds:
+                    break
+                evicted.append(self._clients.pop(oldest_key))
+
+        for old in evicted:
+            old.close()
+        return client
+
+    def close_all(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+_registry = SheetsClientRegistry(
+    max_clients=settings.SHEETS_CLIENT_MAX_CLIENTS,
+    idle_seconds=settings.SHEETS_CLIENT_IDLE_SECONDS
+)
+
+
+def get_user_sheets_client(
+    access_token: str,
+    refresh_token: Optional[str] = None,
+    client_id: Optional[str] = None,
+    client_secret: Optional[str] = None,
+    token_uri: str = "https://oauth2.googleapis.com/token"
+) -> SheetsClient:
+    """
+    Shared client for a user's OAuth token.
+    With refresh_token/client_id/client_secret the credentials refresh themselves
+    when the access token expires (the cached client keeps the refreshed token).
+    """
+    def credentials_factory():
+        from google.oauth2.credentials import Credentials
+
+        if refresh_token and client_id and client_secret:
+            return Credentials(
+                token=access_token,
+                refresh_token=refresh_token,
+                token_uri=token_uri,
+                client_id=client_id,
+                client_secret=client_secret
+            )
+        # Access token only (might expire)
+        return Credentials(token=access_token)
+
+    key = (hashlib.sha256(access_token.encode()).hexdigest(), client_id)
+    return _registry.get(key, credentials_factory)
+
+
+def get_service_account_sheets_client(credentials_path: str) -> SheetsClient:
+    """Shared client for a service account credentials file"""
+    def credentials_factory():
+        from google.oauth2 import service_account
+
+        return service_account.Credentials.from_service_account_file(credentials_path, scopes=SHEETS_SCOPES)
+
+    return _registry.get(("service_account", credentials_path), credentials_factory)
+
+
+def close_sheets_clients():
+    """Close all cached clients (application shutdown)"""
+    _registry.close_all()
@@ -0,0 +1,238 @@
+"""
+utils/targeting_search_cache.py - Shared cache for Graph targeting typeahead searches
+
+The campaign wizard searches locations (adgeolocation) and interests
+(adinterest) on every keystroke. Results are global (not per user), so one
+process-wide cache serves everyone:
+
+- exact hits: (kind, query, params) cached for TARGETING_SEARCH_TTL_SECONDS;
+  stale entries (up to TARGETING_SEARCH_STALE_SECONDS) are served at once and
+  refreshed in the background
+- coalescing: concurrent identical searches share one Graph call; when that
+  call fails, each waiter retries with its own fetch (token)
+- seeding: TARGETING_SEED_PATH (optional JSON) preloads entries - country and
+  region lists, popular interests - and the hottest entries are written back
+  at shutdown, so a restart does not start cold
+
+Longer queries are not narrowed locally from a shorter cached prefix: Graph
+folds accents, matches aliases and ranks by relevance, so a local filter of
+"sao" results would not reproduce "sao p".
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.config.base_config import settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]  # (kind, params key, normalized query)
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).casefold()
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(params or {}, sort_keys=True)
+
+
+class _Entry:
+    __slots__ = ("results", "fetched_at", "hits")
+
+    def __init__(self, results: List[Dict[str, Any]], fetched_at: float, hits: int = 0):
+        self.results = results
+        self.fetched_at = fetched_at  # wall clock, so seeded entries keep their age
+        self.hits = hits
+
+
+class TargetingSearchCache:
+    """LRU of targeting search results with stale refresh and in-flight coalescing"""
+
+    def __init__(self, ttl_seconds: float = 86400, stale_seconds: float = 7 * 86400,
+                 max_entries: int = 20000, seed_path: Optional[str] = None):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.seed_path = seed_path
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._in_flight: Dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self._seeded = False
+
+    def search(
+        self,
+        kind: str,
+        query: str,
+        params: Optional[Dict[str, Any]],
+        fetch: Callable[[str], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Results for query, from the cache when possible.
+
+        fetch(query) calls Graph with the caller's token; errors are not cached,
+        and a caller whose coalesced load failed retries with its own fetch.
+        """
+        self._ensure_seeded()
+        normalized = normalize_query(query)
+        key = (kind, _params_key(params), normalized)
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.fetched_at
+                if age < self.stale_seconds:
+                    entry.hits += 1
+                    self._entries.move_to_end(key)
+                    if age >= self.ttl_seconds:
+                        self._refresh_in_background(key, query, fetch)
+                    return entry.results
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            try:
+                return future.result()
+            except Exception as e:
+                # The shared load used another caller's token; its error (expired token,
+                # missing permission) says nothing about ours, so retry with our own fetch
+                logger.info(f"Coalesced targeting search for '{query}' failed ({e}), retrying")
+                results = fetch(query)
+                self._store(key, results)
+                return results
+
+        try:
+            results = fetch(query)
+            self._store(key, results)
+            future.set_result(results)
+            return results
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def _refresh_in_background(self, key: CacheKey, query: str, fetch):
+        """Refetch a stale entry once (caller holds the lock); readers keep the stale results meanwhile"""
+        if key in self._in_flight:
+            return
+        future = self._in_flight[key] = Future()
+
+        def refresh():
+            try:
+                results = fetch(query)
+                self._store(key, results)
+                future.set_result(results)
+            except Exception as e:
+                logger.warning(f"Targeting search refresh failed for '{query}': {e}")
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._in_flight.pop(key, None)
+
+        threading.Thread(target=refresh, name="targeting-search-refresh", daemon=True).start()
+
+    def _store(self, key: CacheKey, results: List[Dict[str, Any]]):
+        entry = _Entry(results, time.time())
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                entry.hits = max(entry.hits, previous.hits)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # --- Seed file ---
+
+    def _ensure_seeded(self):
+        if self._seeded:
+            return
+        with self._lock:
+            if self._seeded:
+                return
+            self._seeded = True
+        if self.seed_path and os.path.exists(self.seed_path):
+            self.load_seed(self.seed_path)
+
+    def load_seed(self, path: str) -> int:
+        """
+        Preload entries from a JSON list of
+        {"kind", "params", "query", "results", "fetched_at"}.
+        Entries keep their fetched_at, so old seeds are served stale and refreshed.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                items = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load targeting search seed {path}: {e}")
+            return 0
+
+        loaded = 0
+        now = time.time()
+        for item in items:
+            fetched_at = float(item.get("fetched_at") or 0)
+            if now - fetched_at >= self.stale_seconds:
+                continue
+            key = (item["kind"], _params_key(item.get("params")), normalize_query(item["query"]))
+            entry = _Entry(item.get("results") or [], fetched_at, int(item.get("hits") or 0))
+            with self._lock:
+                self._entries[key] = entry
+            loaded += 1
+        logger.info(f"Loaded {loaded} targeting search entries from {path}")
+        return loaded
+
+    def save_seed(self, path: str, limit: int = 2000) -> int:
+        """Write the most used entries (up to limit) for the next start"""
+        with self._lock:
+            ranked = sorted(self._entries.items(), key=lambda item: item[1].hits, reverse=True)[:limit]
+        items = [
+            {
+                "kind": kind,
+                "params": json.loads(params_key),
+                "query": query,
+                "results": entry.results,
+                "fetched_at": entry.fetched_at,
+                "hits": entry.hits
+            }
+            for (kind, params_key, query), entry in ranked
+        ]
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(items, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        logger.info(f"Saved {len(items)} targeting search entries to {path}")
+        return len(items)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+targeting_search_cache = TargetingSearchCache(
+    ttl_seconds=settings.TARGETING_SEARCH_TTL_SECONDS,
+    stale_seconds=settings.TARGETING_SEARCH_STALE_SECONDS,
+    max_entries=settings.TARGETING_SEARCH_MAX_ENTRIES,
+    seed_path=settings.TARGETING_SEED_PATH
+)
+
+
+def save_targeting_search_seed():
+    """Persist popular searches to TARGETING_SEED_PATH (application shutdown)"""
+    if not settings.TARGETING_SEED_PATH:
+        return
+    try:
+        targeting_search_cache.save_seed(settings.TARGETING_SEED_PATH)
+    except Exception as e:
+        logger.error(f"Failed to save targeting search seed: {e}")